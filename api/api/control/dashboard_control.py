@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from flask import request, jsonify
+from api.service.dashboard_service import DashboardService
+from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+"""
+Classe responsável por controlar o endpoint de resumo do dashboard.
+
+Substitui as várias chamadas que o SPA fazia (usuários, projetos, tarefas)
+por uma única resposta pequena, montada com consultas agregadas.
+"""
+class DashboardControl:
+    def __init__(self, dashboard_service: DashboardService):
+        """
+        Construtor da classe DashboardControl
+
+        :param dashboard_service: Instância do DashboardService
+        """
+        logger.debug("⬆️  DashboardControl.__init__()")
+        self.__dashboard_service = dashboard_service
+
+    def index(self, usuario_id: int):
+        """Resumo do dashboard do usuário autenticado"""
+        logger.debug("🔵 DashboardControl.index()")
+        try:
+            resumo = self.__dashboard_service.getResumo(usuario_id, request.args.get("recentes"))
+            return jsonify({
+                "success": True,
+                "message": "Executado com sucesso",
+                "data": resumo
+            }), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.error("❌ Erro inesperado em index", exc_info=True)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+from flask import request, jsonify, Response
+from api.service.tarefa_service import TarefaService
+from api.service.projeto_service import ProjetoService
+from api.service.usuario_service import UsuarioService
+from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+"""
+Classe responsável por controlar os endpoints de exportação CSV.
+
+Substitui o static/js/csvGenerator.js: em vez de o navegador baixar todos os
+usuários, projetos e tarefas e cruzar os nomes em JavaScript, o servidor lê
+as linhas do banco (nomes resolvidos por JOIN) e envia o CSV em blocos.
+"""
+class ExportacaoControl:
+    def __init__(self, tarefa_service: TarefaService, projeto_service: ProjetoService,
+                 usuario_service: UsuarioService):
+        """
+        Construtor da classe ExportacaoControl
+
+        :param tarefa_service: Instância do TarefaService
+        :param projeto_service: Instância do ProjetoService
+        :param usuario_service: Instância do UsuarioService
+        """
+        logger.debug("⬆️  ExportacaoControl.__init__()")
+        self.__tarefa_service = tarefa_service
+        self.__projeto_service = projeto_service
+        self.__usuario_service = usuario_service
+
+    def tarefas(self, usuario_id: int):
+        """CSV das tarefas do usuário autenticado (aceita os filtros das listagens)"""
+        logger.debug("🔵 ExportacaoControl.tarefas()")
+        if not usuario_id:
+            return self._usuario_nao_identificado()
+        return self._responder_csv("tarefas", lambda: self.__tarefa_service.exportarCsv(usuario_id, request.args))
+
+    def projetos(self, usuario_id: int):
+        """CSV dos projetos do usuário autenticado (?status= opcional)"""
+        logger.debug("🔵 ExportacaoControl.projetos()")
+        if not usuario_id:
+            return self._usuario_nao_identificado()
+        return self._responder_csv("projetos", lambda: self.__projeto_service.exportarCsv(usuario_id, request.args))
+
+    def usuarios(self):
+        """CSV dos usuários"""
+        logger.debug("🔵 ExportacaoControl.usuarios()")
+        return self._responder_csv("usuarios", self.__usuario_service.exportarCsv)
+
+    def _usuario_nao_identificado(self):
+        # Sem usuário as consultas exportariam os dados de todos
+        return jsonify({
+            "success": False,
+            "error": {
+                "message": "Não foi possível identificar o usuário",
+                "code": 401
+            }
+        }), 401
+
+    def _responder_csv(self, nome: str, gerar_blocos):
+        """
+        Envia o CSV em streaming. O primeiro bloco é gerado antes de responder,
+        para que erros de validação ou de banco ainda virem 400/500.
+        """
+        try:
+            blocos = gerar_blocos()
+            primeiro = next(blocos, "")
+
+            def gerar():
+                yield primeiro
+                try:
+                    yield from blocos
+                except Exception:
+                    logger.error("❌ Erro durante a exportação de %s", nome, exc_info=True)
+                    raise
+
+            arquivo = f"{nome}_{date.today().isoformat()}.csv"
+            return Response(gerar(), status=200, mimetype="text/csv", headers={
+                "Content-Disposition": f'attachment; filename="{arquivo}"'
+            })
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.error("❌ Erro inesperado na exportação de %s", nome, exc_info=True)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
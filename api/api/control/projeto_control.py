@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 from flask import request, jsonify
-import traceback
 from api.service.projeto_service import ProjetoService
 from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 
 """
@@ -18,12 +20,12 @@ class ProjetoControl:
         Construtor da classe ProjetoControl
         :param projeto_service: Instância do ProjetoService (injeção de dependência)
         """
-        print("⬆️  ProjetoControl.constructor()")
+        logger.debug("⬆️  ProjetoControl.constructor()")
         self.__projeto_service = projeto_service
 
     def store(self, usuario_id: int = None):
         """Cria um novo projeto para o usuário autenticado"""
-        print("🔵 ProjetoControl.store()")
+        logger.debug("🔵 ProjetoControl.store()")
         try:
             json_projeto = request.json.get("projeto")
             if not json_projeto:
@@ -63,7 +65,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em store: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em store", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -74,10 +76,10 @@ class ProjetoControl:
 
     def index(self, usuario_id: int = None):
         """Lista todos os projetos do usuário autenticado"""
-        print("🔵 ProjetoControl.index()")
+        logger.debug("🔵 ProjetoControl.index()")
         try:
             # ✅ CORREÇÃO: Passa o usuario_id para buscar apenas projetos do usuário
-            lista_projetos = self.__projeto_service.findAll(usuario_id)
+            lista_projetos = self.__projeto_service.findAll(usuario_id, request.args.get("fields"))
             return jsonify({
                 "success": True,
                 "message": "Executado com sucesso",
@@ -93,7 +95,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em index: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em index", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -104,7 +106,7 @@ class ProjetoControl:
 
     def show(self, id, usuario_id: int = None):
         """Busca um projeto pelo ID (só retorna se pertencer ao usuário)"""
-        print("🔵 ProjetoControl.show()")
+        logger.debug("🔵 ProjetoControl.show()")
         try:
             # ✅ CORREÇÃO: Passa o usuario_id para verificar permissão
             projeto = self.__projeto_service.findById(id, usuario_id)
@@ -123,7 +125,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em show", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -134,7 +136,7 @@ class ProjetoControl:
 
     def update(self, id, usuario_id: int = None):
         """Atualiza os dados de um projeto existente (só se pertencer ao usuário)"""
-        print("🔵 ProjetoControl.update()")
+        logger.debug("🔵 ProjetoControl.update()")
         try:
             # ✅ CORREÇÃO: Passa o usuario_id para verificar permissão
             projeto_atualizado = self.__projeto_service.updateProjeto(id, request.json, usuario_id)
@@ -164,7 +166,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em update: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em update", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -175,7 +177,7 @@ class ProjetoControl:
 
     def destroy(self, id, usuario_id: int = None):
         """Remove um projeto pelo ID (só se pertencer ao usuário)"""
-        print("🔵 ProjetoControl.destroy()")
+        logger.debug("🔵 ProjetoControl.destroy()")
         try:
             # ✅ CORREÇÃO: Passa o usuario_id para verificar permissão
             excluiu = self.__projeto_service.deleteProjeto(id, usuario_id)
@@ -193,7 +195,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em destroy: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em destroy", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -204,7 +206,7 @@ class ProjetoControl:
 
     def show_by_usuario(self, usuario_id):
         """Lista todos os projetos de um usuário específico"""
-        print("🔵 ProjetoControl.show_by_usuario()")
+        logger.debug("🔵 ProjetoControl.show_by_usuario()")
         try:
             projetos = self.__projeto_service.findByUsuarioId(usuario_id)
             return jsonify({
@@ -222,7 +224,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show_by_usuario: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em show_by_usuario", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -233,7 +235,7 @@ class ProjetoControl:
 
     def show_meus_projetos(self, usuario_id: int):
         """Lista todos os projetos do usuário autenticado"""
-        print("🔵 ProjetoControl.show_meus_projetos()")
+        logger.debug("🔵 ProjetoControl.show_meus_projetos()")
         try:
             projetos = self.__projeto_service.findByUsuarioId(usuario_id)
             return jsonify({
@@ -251,7 +253,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show_meus_projetos: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em show_meus_projetos", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -262,7 +264,7 @@ class ProjetoControl:
 
     def count_projetos(self, usuario_id: int = None):
         """Retorna a contagem de projetos do usuário"""
-        print("🔵 ProjetoControl.count_projetos()")
+        logger.debug("🔵 ProjetoControl.count_projetos()")
         try:
             if usuario_id:
                 projetos = self.__projeto_service.findByUsuarioId(usuario_id)
@@ -296,7 +298,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em count_projetos: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em count_projetos", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -307,7 +309,7 @@ class ProjetoControl:
 
     def update_status(self, id, usuario_id: int = None):
         """Atualiza apenas o status de um projeto"""
-        print("🔵 ProjetoControl.update_status()")
+        logger.debug("🔵 ProjetoControl.update_status()")
         try:
             json_data = request.json.get("projeto", {})
             novo_status = json_data.get("status")
@@ -366,7 +368,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em update_status: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em update_status", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -377,30 +379,14 @@ class ProjetoControl:
 
     def search_projetos(self, usuario_id: int = None):
         """Busca projetos por termo (nome ou descrição)"""
-        print("🔵 ProjetoControl.search_projetos()")
+        logger.debug("🔵 ProjetoControl.search_projetos()")
         try:
             termo = request.args.get('q', '').strip()
-            if not termo:
-                return jsonify({
-                    "success": False,
-                    "error": {
-                        "message": "Termo de busca não fornecido",
-                        "code": 400
-                    }
-                }), 400
 
-            # Busca todos os projetos do usuário
-            projetos = self.__projeto_service.findAll(usuario_id)
-            
-            # Filtra por termo
-            projetos_filtrados = []
-            for projeto in projetos:
-                nome = projeto.get('nome', '').lower()
-                descricao = projeto.get('descricao', '').lower()
-                termo_lower = termo.lower()
-                
-                if termo_lower in nome or termo_lower in descricao:
-                    projetos_filtrados.append(projeto)
+            # ✅ OTIMIZAÇÃO: Busca no índice FULLTEXT, já ordenada e limitada
+            projetos_filtrados = self.__projeto_service.searchProjetos(
+                usuario_id, termo, request.args.get('limite')
+            )
 
             return jsonify({
                 "success": True,
@@ -421,7 +407,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em search_projetos: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em search_projetos", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -430,18 +416,14 @@ class ProjetoControl:
                 }
             }), 500
 
-    def get_projetos_recentes(self, usuario_id: int = None, limite: int = 5):
+    def get_projetos_recentes(self, usuario_id: int = None, limite: int = None):
         """Retorna os projetos mais recentes do usuário"""
-        print("🔵 ProjetoControl.get_projetos_recentes()")
+        logger.debug("🔵 ProjetoControl.get_projetos_recentes()")
         try:
-            projetos = self.__projeto_service.findAll(usuario_id)
-            
-            # Ordena por data de criação (mais recentes primeiro) e limita
-            projetos_ordenados = sorted(
-                projetos, 
-                key=lambda x: x.get('data_criacao', ''), 
-                reverse=True
-            )[:limite]
+            # ✅ OTIMIZAÇÃO: ORDER BY data_criacao DESC LIMIT no banco, em vez de ordenar tudo em Python
+            projetos_ordenados = self.__projeto_service.findRecentes(
+                usuario_id, request.args.get('limite', limite)
+            )
 
             return jsonify({
                 "success": True,
@@ -461,7 +443,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em get_projetos_recentes: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em get_projetos_recentes", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -473,21 +455,11 @@ class ProjetoControl:
     # ✅ NOVO: Método para obter estatísticas do usuário
     def get_estatisticas(self, usuario_id: int):
         """Retorna estatísticas completas do usuário"""
-        print("🔵 ProjetoControl.get_estatisticas()")
+        logger.debug("🔵 ProjetoControl.get_estatisticas()")
         try:
-            projetos = self.__projeto_service.findByUsuarioId(usuario_id)
-            
-            estatisticas = {
-                "total_projetos": len(projetos),
-                "projetos_por_status": {},
-                "projetos_recentes": projetos[:3]  # Últimos 3 projetos
-            }
-            
-            # Contar por status
-            for projeto in projetos:
-                status = projeto.get('status', 'pendente')
-                estatisticas["projetos_por_status"][status] = estatisticas["projetos_por_status"].get(status, 0) + 1
-            
+            # ✅ OTIMIZAÇÃO: Contagem por status com GROUP BY e só os 3 projetos mais recentes
+            estatisticas = self.__projeto_service.getEstatisticas(usuario_id)
+
             return jsonify({
                 "success": True,
                 "message": "Estatísticas recuperadas com sucesso",
@@ -503,7 +475,7 @@ class ProjetoControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em get_estatisticas: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em get_estatisticas", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
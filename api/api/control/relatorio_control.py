@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+from flask import request, jsonify, Response, url_for
+from api.service.relatorio_service import RelatorioService
+from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+"""
+Classe responsável por controlar os endpoints de relatórios PDF.
+
+O POST só cria o job e responde na hora (202); o PDF é renderizado em
+segundo plano pelo RelatorioService. O cliente consulta o status e, quando
+concluído, baixa o arquivo.
+"""
+class RelatorioControl:
+    def __init__(self, relatorio_service: RelatorioService):
+        """
+        Construtor da classe RelatorioControl
+
+        :param relatorio_service: Instância do RelatorioService
+        """
+        logger.debug("⬆️  RelatorioControl.__init__()")
+        self.__relatorio_service = relatorio_service
+
+    def store(self, usuario_id: int):
+        """Cria um job de relatório ({"tipo": ..., "parametros": {...}})"""
+        logger.debug("🔵 RelatorioControl.store()")
+        try:
+            corpo = request.get_json(silent=True) or {}
+            job = self.__relatorio_service.enfileirar(usuario_id, corpo.get("tipo"), corpo.get("parametros"))
+            job = self._com_links(job)
+            # Já em cache: pronto para baixar
+            status = 200 if job["status"] == "concluido" else 202
+            resposta = jsonify({
+                "success": True,
+                "message": "Relatório disponível" if status == 200 else "Relatório em geração",
+                "data": {"relatorio": job}
+            })
+            resposta.headers["Location"] = job["links"]["status"]
+            return resposta, status
+        except ErrorResponse as e:
+            return self._erro(e)
+        except Exception as e:
+            logger.error("❌ Erro inesperado em store", exc_info=True)
+            return self._erro_interno()
+
+    def show(self, usuario_id: int, job_id: str):
+        """Status do job"""
+        logger.debug("🔵 RelatorioControl.show()")
+        try:
+            job = self._com_links(self.__relatorio_service.consultar(usuario_id, job_id))
+            return jsonify({
+                "success": True,
+                "message": "Executado com sucesso",
+                "data": {"relatorio": job}
+            }), 200
+        except ErrorResponse as e:
+            return self._erro(e)
+        except Exception as e:
+            logger.error("❌ Erro inesperado em show", exc_info=True)
+            return self._erro_interno()
+
+    def arquivo(self, usuario_id: int, job_id: str):
+        """PDF do job concluído"""
+        logger.debug("🔵 RelatorioControl.arquivo()")
+        try:
+            conteudo, nome = self.__relatorio_service.arquivo(usuario_id, job_id)
+            return Response(conteudo, status=200, mimetype="application/pdf", headers={
+                "Content-Disposition": f'attachment; filename="{nome}"',
+                "Cache-Control": "private, max-age=0"
+            })
+        except ErrorResponse as e:
+            return self._erro(e)
+        except Exception as e:
+            logger.error("❌ Erro inesperado em arquivo", exc_info=True)
+            return self._erro_interno()
+
+    def _com_links(self, job: dict) -> dict:
+        job["links"] = {
+            "status": url_for("relatorio.show", job_id=job["id"]),
+            "arquivo": url_for("relatorio.arquivo", job_id=job["id"]) if job["status"] == "concluido" else None
+        }
+        return job
+
+    def _erro(self, e: ErrorResponse):
+        return jsonify({
+            "success": False,
+            "error": {
+                "message": e.message,
+                "details": e.details,
+                "code": e.status_code
+            }
+        }), e.status_code, e.headers
+
+    def _erro_interno(self):
+        return jsonify({
+            "success": False,
+            "error": {
+                "message": "Erro interno no servidor",
+                "code": 500
+            }
+        }), 500
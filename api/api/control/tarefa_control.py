@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-from flask import request, jsonify
-import traceback
+from flask import request, jsonify, current_app, Response
 from api.service.tarefa_service import TarefaService
 from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Tarefa.
@@ -17,12 +19,59 @@ class TarefaControl:
         Construtor da classe TarefaControl
         :param tarefa_service: Instância do TarefaService (injeção de dependência)
         """
-        print("⬆️  TarefaControl.constructor()")
+        logger.debug("⬆️  TarefaControl.constructor()")
         self.__tarefa_service = tarefa_service
 
+    def _paginacao_solicitada(self) -> bool:
+        """Indica se o cliente pediu paginação por cursor (?limite= ou ?cursor=)"""
+        return "limite" in request.args or "cursor" in request.args
+
+    def _filtros_solicitados(self) -> bool:
+        """✅ NOVO: Indica se o cliente pediu filtros ou ordenação (?status=, ?ordenar=, ...)"""
+        return any(parametro in request.args for parametro in TarefaService.PARAMETROS_FILTRO)
+
+    def _stream_solicitado(self) -> bool:
+        """✅ NOVO: Indica se o cliente pediu NDJSON (Accept: application/x-ndjson ou ?stream=1)"""
+        if request.args.get("stream", "").lower() in ("1", "true"):
+            return True
+        return request.accept_mimetypes.best_match(
+            ["application/json", "application/x-ndjson"]
+        ) == "application/x-ndjson"
+
+    def stream_tarefas(self, usuario_id: int = None, linhas_por_bloco: int = 200):
+        """
+        ✅ NOVO: Lista as tarefas em NDJSON (uma tarefa por linha), lendo do
+        banco e enviando aos poucos: memória constante e primeiro byte logo.
+
+        A primeira linha é lida antes de responder, para que erros de banco
+        ainda virem 500. Um erro no meio do envio só pode ser registrado no log.
+        """
+        logger.debug("🔵 TarefaControl.stream_tarefas()")
+        tarefas = self.__tarefa_service.streamAll(usuario_id)
+        primeira = next(tarefas, None)
+        json_provider = current_app.json
+
+        def gerar():
+            if primeira is None:
+                return
+            bloco = [json_provider.dumps(primeira)]
+            try:
+                for tarefa in tarefas:
+                    bloco.append(json_provider.dumps(tarefa))
+                    if len(bloco) >= linhas_por_bloco:
+                        yield "\n".join(bloco) + "\n"
+                        bloco = []
+                if bloco:
+                    yield "\n".join(bloco) + "\n"
+            except Exception:
+                logger.error("❌ Erro durante o streaming de tarefas", exc_info=True)
+                raise
+
+        return Response(gerar(), status=200, mimetype="application/x-ndjson")
+
     def store(self, usuario_id: int = None):
         """Cria uma nova tarefa para o usuário autenticado"""
-        print("🔵 TarefaControl.store()")
+        logger.debug("🔵 TarefaControl.store()")
         try:
             json_tarefa = request.json.get("tarefa")
             if not json_tarefa:
@@ -67,7 +116,36 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em store: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em store", exc_info=True)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
+
+    def bulk(self, usuario_id: int = None):
+        """✅ NOVO: Aplica um lote de criações, atualizações e exclusões de tarefas"""
+        logger.debug("🔵 TarefaControl.bulk()")
+        try:
+            resultados = self.__tarefa_service.bulk(usuario_id, request.get_json(silent=True))
+            return jsonify({
+                "success": True,
+                "message": f"{len(resultados)} operação(ões) aplicada(s) com sucesso",
+                "data": {"resultados": resultados}
+            }), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.error("❌ Erro inesperado em bulk", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -78,10 +156,43 @@ class TarefaControl:
 
     def index(self, usuario_id: int = None):
         """Lista todas as tarefas onde o usuário é RESPONSÁVEL"""
-        print("🔵 TarefaControl.index()")
+        logger.debug("🔵 TarefaControl.index()")
         try:
-            # ✅ CORREÇÃO: Passa o usuario_id para buscar apenas tarefas onde usuário é RESPONSÁVEL
-            lista_tarefas = self.__tarefa_service.findAll(usuario_id)
+            # ✅ NOVO: ?ids=1,2,3 resolve várias tarefas em uma única consulta
+            if "ids" in request.args:
+                lista_tarefas = self.__tarefa_service.findManyByIds(
+                    usuario_id, request.args.get("ids"), request.args
+                )
+                return jsonify({
+                    "success": True,
+                    "message": "Executado com sucesso",
+                    "data": {"tarefas": lista_tarefas}
+                }), 200
+
+            # ✅ NOVO: ?limite=&cursor= ativa a paginação por cursor
+            if self._paginacao_solicitada():
+                pagina = self.__tarefa_service.findPage(
+                    usuario_id,
+                    limite=request.args.get("limite"),
+                    cursor=request.args.get("cursor"),
+                    parametros=request.args
+                )
+                return jsonify({
+                    "success": True,
+                    "message": "Executado com sucesso",
+                    "data": pagina
+                }), 200
+
+            # ✅ NOVO: ?status=&prioridade=&...&ordenar= filtram e ordenam no banco
+            # ✅ NOVO: Accept: application/x-ndjson (ou ?stream=1) -> uma tarefa por linha, em streaming
+            if self._stream_solicitado() and not self._filtros_solicitados():
+                return self.stream_tarefas(usuario_id)
+
+            if self._filtros_solicitados():
+                lista_tarefas = self.__tarefa_service.findFiltered(usuario_id, request.args)
+            else:
+                # ✅ CORREÇÃO: Passa o usuario_id para buscar apenas tarefas onde usuário é RESPONSÁVEL
+                lista_tarefas = self.__tarefa_service.findAll(usuario_id)
             return jsonify({
                 "success": True,
                 "message": "Executado com sucesso",
@@ -97,7 +208,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em index: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em index", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -108,7 +219,7 @@ class TarefaControl:
 
     def show(self, id, usuario_id: int = None):
         """Busca uma tarefa pelo ID (só retorna se usuário for RESPONSÁVEL)"""
-        print("🔵 TarefaControl.show()")
+        logger.debug("🔵 TarefaControl.show()")
         try:
             # ✅ CORREÇÃO: Passa o usuario_id para verificar se usuário é RESPONSÁVEL
             tarefa = self.__tarefa_service.findById(id, usuario_id)
@@ -127,7 +238,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em show", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -138,7 +249,7 @@ class TarefaControl:
 
     def update(self, id, usuario_id: int = None):
         """Atualiza os dados de uma tarefa existente (só se usuário for RESPONSÁVEL)"""
-        print("🔵 TarefaControl.update()")
+        logger.debug("🔵 TarefaControl.update()")
         try:
             # ✅ CORREÇÃO: Agora verifica se o usuário é o RESPONSÁVEL pela tarefa
             tarefa_atualizada = self.__tarefa_service.updateTarefa(id, request.json, usuario_id)
@@ -163,7 +274,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em update: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em update", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -174,7 +285,7 @@ class TarefaControl:
 
     def destroy(self, id, usuario_id: int = None):
         """Remove uma tarefa pelo ID (só se usuário for RESPONSÁVEL)"""
-        print("🔵 TarefaControl.destroy()")
+        logger.debug("🔵 TarefaControl.destroy()")
         try:
             # ✅ CORREÇÃO: Passa o usuario_id para verificar se usuário é RESPONSÁVEL
             excluiu = self.__tarefa_service.deleteTarefa(id, usuario_id)
@@ -192,7 +303,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em destroy: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em destroy", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -203,8 +314,21 @@ class TarefaControl:
 
     def show_by_projeto(self, projeto_id, usuario_id: int = None):
         """Lista todas as tarefas de um projeto específico (só se usuário for RESPONSÁVEL)"""
-        print("🔵 TarefaControl.show_by_projeto()")
+        logger.debug("🔵 TarefaControl.show_by_projeto()")
         try:
+            if self._paginacao_solicitada():
+                pagina = self.__tarefa_service.findPage(
+                    usuario_id,
+                    limite=request.args.get("limite"),
+                    cursor=request.args.get("cursor"),
+                    projeto_id=projeto_id
+                )
+                return jsonify({
+                    "success": True,
+                    "message": "Executado com sucesso",
+                    "data": pagina
+                }), 200
+
             # ✅ CORREÇÃO: Passa o usuario_id para verificar se usuário é RESPONSÁVEL
             tarefas = self.__tarefa_service.findByProjetoId(projeto_id, usuario_id)
             return jsonify({
@@ -222,7 +346,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em show_by_projeto: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em show_by_projeto", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -233,7 +357,7 @@ class TarefaControl:
 
     def marcar_concluida(self, id, usuario_id: int = None):
         """Marca uma tarefa como concluída (só se usuário for RESPONSÁVEL)"""
-        print("🔵 TarefaControl.marcar_concluida()")
+        logger.debug("🔵 TarefaControl.marcar_concluida()")
         try:
             # ✅ CORREÇÃO CRÍTICA: Corrigido o método chamado
             # O método correto é updateTarefaConcluida, não marcarConcluida
@@ -266,7 +390,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em marcar_concluida: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em marcar_concluida", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -277,43 +401,26 @@ class TarefaControl:
 
     def count_tarefas(self, usuario_id: int = None):
         """Retorna estatísticas das tarefas onde usuário é RESPONSÁVEL"""
-        print("🔵 TarefaControl.count_tarefas()")
+        logger.debug("🔵 TarefaControl.count_tarefas()")
         try:
-            # ✅ CORREÇÃO: Busca tarefas onde o usuário é RESPONSÁVEL
-            tarefas = self.__tarefa_service.findAll(usuario_id)
-            
-            total = len(tarefas)
-            concluidas = len([t for t in tarefas if t.get('concluida')])
-            pendentes = total - concluidas
-            
-            # Contar por prioridade
-            prioridades = {
-                "alta": 0,
-                "media": 0,
-                "baixa": 0
-            }
-            
-            for tarefa in tarefas:
-                prioridade = tarefa.get('prioridade', 'media')
-                if prioridade in prioridades:
-                    prioridades[prioridade] += 1
-
-            # Contar por status
-            status_count = {}
-            for tarefa in tarefas:
-                status = tarefa.get('status', 'pendente')
-                status_count[status] = status_count.get(status, 0) + 1
+            # ✅ CORREÇÃO: Contagens agregadas no banco (GROUP BY) em vez de carregar todas as tarefas
+            estatisticas = self.__tarefa_service.getEstatisticas(
+                usuario_id,
+                projeto_id=request.args.get("projeto_id"),
+                data_inicio=request.args.get("data_inicio"),
+                data_fim=request.args.get("data_fim")
+            )
 
             return jsonify({
                 "success": True,
                 "message": "Estatísticas calculadas com sucesso",
                 "data": {
-                    "total": total,
-                    "concluidas": concluidas,
-                    "pendentes": pendentes,
-                    "por_prioridade": prioridades,
-                    "por_status": status_count,
-                    "taxa_conclusao": round((concluidas / total * 100), 2) if total > 0 else 0,
+                    "total": estatisticas["total"],
+                    "concluidas": estatisticas["concluidas"],
+                    "pendentes": estatisticas["pendentes"],
+                    "por_prioridade": estatisticas["por_prioridade"],
+                    "por_status": estatisticas["por_status"],
+                    "taxa_conclusao": estatisticas["taxa_conclusao"],
                     "contexto": "Tarefas onde você é responsável"
                 }
             }), 200
@@ -327,7 +434,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em count_tarefas: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em count_tarefas", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -338,10 +445,26 @@ class TarefaControl:
         
     def minhas_tarefas_responsavel(self, usuario_id: int = None):
         """Lista todas as tarefas onde o usuário é o RESPONSÁVEL"""
-        print("🔵 TarefaControl.minhas_tarefas_responsavel()")
+        logger.debug("🔵 TarefaControl.minhas_tarefas_responsavel()")
         try:
-            # ✅ CORREÇÃO: Usa o método que busca por usuario_responsavel_id
-            lista_tarefas = self.__tarefa_service.findAll(usuario_id)
+            if self._paginacao_solicitada():
+                pagina = self.__tarefa_service.findPage(
+                    usuario_id,
+                    limite=request.args.get("limite"),
+                    cursor=request.args.get("cursor"),
+                    parametros=request.args
+                )
+                return jsonify({
+                    "success": True,
+                    "message": "Tarefas onde você é responsável",
+                    "data": pagina
+                }), 200
+
+            if self._filtros_solicitados():
+                lista_tarefas = self.__tarefa_service.findFiltered(usuario_id, request.args)
+            else:
+                # ✅ CORREÇÃO: Usa o método que busca por usuario_responsavel_id
+                lista_tarefas = self.__tarefa_service.findAll(usuario_id)
             return jsonify({
                 "success": True,
                 "message": "Tarefas onde você é responsável",
@@ -357,7 +480,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em minhas_tarefas_responsavel: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em minhas_tarefas_responsavel", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -368,8 +491,30 @@ class TarefaControl:
 
     def tarefas_atribuidas(self, usuario_id: int = None):
         """Lista todas as tarefas que o usuário ATRIBUIU para outros"""
-        print("🔵 TarefaControl.tarefas_atribuidas()")
+        logger.debug("🔵 TarefaControl.tarefas_atribuidas()")
         try:
+            if self._paginacao_solicitada():
+                pagina = self.__tarefa_service.findPage(
+                    limite=request.args.get("limite"),
+                    cursor=request.args.get("cursor"),
+                    atribuidor_id=usuario_id,
+                    parametros=request.args
+                )
+                return jsonify({
+                    "success": True,
+                    "message": "Tarefas que você atribuiu para outros",
+                    "data": pagina
+                }), 200
+
+            if self._filtros_solicitados():
+                return jsonify({
+                    "success": True,
+                    "message": "Tarefas que você atribuiu para outros",
+                    "data": {"tarefas": self.__tarefa_service.findFiltered(
+                        parametros=request.args, atribuidor_id=usuario_id
+                    )}
+                }), 200
+
             # ✅ CORREÇÃO: Busca tarefas onde usuario_atribuidor_id = usuario_id
             # Mas usuario_responsavel_id != usuario_id (tarefas atribuídas para outros)
             lista_tarefas = self.__tarefa_service.findByField("usuario_atribuidor_id", usuario_id)
@@ -392,7 +537,7 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em tarefas_atribuidas: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em tarefas_atribuidas", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -403,38 +548,17 @@ class TarefaControl:
 
     def toggle_concluida(self, id, usuario_id: int = None):
         """Alterna o status de conclusão da tarefa (só se usuário for RESPONSÁVEL)"""
-        print("🔵 TarefaControl.toggle_concluida()")
+        logger.debug("🔵 TarefaControl.toggle_concluida()")
         try:
-            # Busca a tarefa atual para verificar o status
-            tarefa_atual = self.__tarefa_service.findById(id, usuario_id)
-            if not tarefa_atual:
-                return jsonify({
-                    "success": False,
-                    "error": {
-                        "message": "Tarefa não encontrada",
-                        "code": 404
-                    }
-                }), 404
+            # ✅ OTIMIZAÇÃO: Alterna no próprio UPDATE (sem buscar a tarefa antes)
+            self.__tarefa_service.alternarConcluida(id, usuario_id)
 
-            # Alterna o status de concluída
-            nova_concluida = not tarefa_atual.get('concluida', False)
-            novo_status = "concluida" if nova_concluida else "pendente"
-            
-            request_body = {
-                "tarefa": {
-                    "concluida": nova_concluida,
-                    "status": novo_status
-                }
-            }
-            
-            tarefa_atualizada = self.__tarefa_service.updateTarefaConcluida(id, request_body, usuario_id)
-            
             # Busca a tarefa atualizada
             tarefa_final = self.__tarefa_service.findById(id, usuario_id)
             
             return jsonify({
                 "success": True,
-                "message": f"Tarefa marcada como {novo_status} com sucesso!",
+                "message": f"Tarefa marcada como {tarefa_final.get('status')} com sucesso!",
                 "data": {
                     "tarefa": tarefa_final
                 }
@@ -450,11 +574,50 @@ class TarefaControl:
                 }
             }), e.status_code
         except Exception as e:
-            print(f"❌ Erro inesperado em toggle_concluida: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em toggle_concluida", exc_info=True)
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            }), 500
+
+    def search_tarefas(self, usuario_id: int = None):
+        """Busca tarefas por termo (título ou descrição)"""
+        logger.debug("🔵 TarefaControl.search_tarefas()")
+        try:
+            termo = request.args.get('q', '').strip()
+
+            # ✅ OTIMIZAÇÃO: Busca no índice FULLTEXT, já ordenada e limitada
+            tarefas_encontradas = self.__tarefa_service.searchTarefas(
+                usuario_id, termo, request.args.get('limite')
+            )
+
+            return jsonify({
+                "success": True,
+                "message": "Busca realizada com sucesso",
+                "data": {
+                    "tarefas": tarefas_encontradas,
+                    "total_encontrado": len(tarefas_encontradas),
+                    "termo_busca": termo
+                }
+            }), 200
+        except ErrorResponse as e:
+            return jsonify({
+                "success": False,
+                "error": {
+                    "message": e.message,
+                    "details": e.details,
+                    "code": e.status_code
+                }
+            }), e.status_code
+        except Exception as e:
+            logger.error("❌ Erro inesperado em search_tarefas", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
                     "message": "Erro interno no servidor",
                     "code": 500
                 }
-            }), 500
\ No newline at end of file
+            }), 500
@@ -1,8 +1,10 @@
 # control/usuario_control.py
 from flask import request, jsonify
-import traceback
 from api.service.usuario_service import UsuarioService
 from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class UsuarioControl:
     def __init__(self, usuario_service: UsuarioService):
@@ -10,12 +12,12 @@ class UsuarioControl:
         Construtor da classe UsuarioControl
         :param usuario_service: Instância do UsuarioService (injeção de dependência)
         """
-        print("⬆️  UsuarioControl.constructor()")
+        logger.debug("⬆️  UsuarioControl.constructor()")
         self.__usuario_service = usuario_service
 
     def login(self):
         """Autentica um usuário pelo email e senha"""
-        print("🔵 UsuarioControl.login()")
+        logger.debug("🔵 UsuarioControl.login()")
         try:
             json_usuario = request.json.get("usuario")
             if not json_usuario:
@@ -31,7 +33,7 @@ class UsuarioControl:
             
             # ✅ CORREÇÃO: Verifica se o token foi gerado e retorna a estrutura correta
             if 'token' not in resultado:
-                print("❌ Token não foi gerado no serviço de login")
+                logger.error("❌ Token não foi gerado no serviço de login")
                 return jsonify({
                     "success": False,
                     "error": {
@@ -51,7 +53,7 @@ class UsuarioControl:
             }), 200
             
         except ErrorResponse as e:
-            print(f"❌ ErrorResponse em login: {e.message}")
+            logger.error("❌ ErrorResponse em login: %s", e.message)
             return jsonify({
                 "success": False,
                 "error": {
@@ -59,9 +61,9 @@ class UsuarioControl:
                     "details": e.details,
                     "code": e.status_code
                 }
-            }), e.status_code
+            }), e.status_code, e.headers
         except Exception as e:
-            print(f"❌ Erro inesperado em login: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em login", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -72,7 +74,7 @@ class UsuarioControl:
 
     def store(self):
         """Cria um novo usuário"""
-        print("🔵 UsuarioControl.store()")
+        logger.debug("🔵 UsuarioControl.store()")
         try:
             json_usuario = request.json.get("usuario")
             if not json_usuario:
@@ -104,9 +106,9 @@ class UsuarioControl:
                     "details": e.details,
                     "code": e.status_code
                 }
-            }), e.status_code
+            }), e.status_code, e.headers
         except Exception as e:
-            print(f"❌ Erro inesperado em store: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em store", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -117,9 +119,9 @@ class UsuarioControl:
 
     def index(self):
         """Lista todos os usuários cadastrados"""
-        print("🔵 UsuarioControl.index()")
+        logger.debug("🔵 UsuarioControl.index()")
         try:
-            lista_usuarios = self.__usuario_service.findAll()
+            lista_usuarios = self.__usuario_service.findAll(request.args.get("fields"))
             return jsonify({
                 "success": True,
                 "message": "Executado com sucesso",
@@ -133,9 +135,9 @@ class UsuarioControl:
                     "details": e.details,
                     "code": e.status_code
                 }
-            }), e.status_code
+            }), e.status_code, e.headers
         except Exception as e:
-            print(f"❌ Erro inesperado em index: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em index", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -146,7 +148,7 @@ class UsuarioControl:
 
     def show(self, id):
         """Busca um usuário pelo ID"""
-        print("🔵 UsuarioControl.show()")
+        logger.debug("🔵 UsuarioControl.show()")
         try:
             usuario = self.__usuario_service.findById(id)
             return jsonify({
@@ -162,9 +164,9 @@ class UsuarioControl:
                     "details": e.details,
                     "code": e.status_code
                 }
-            }), e.status_code
+            }), e.status_code, e.headers
         except Exception as e:
-            print(f"❌ Erro inesperado em show: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em show", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -175,7 +177,7 @@ class UsuarioControl:
 
     def update(self, id):
         """Atualiza os dados de um usuário existente"""
-        print("🔵 UsuarioControl.update()")
+        logger.debug("🔵 UsuarioControl.update()")
         try:
             usuario_atualizado = self.__usuario_service.updateUsuario(id, request.json)
 
@@ -198,9 +200,9 @@ class UsuarioControl:
                     "details": e.details,
                     "code": e.status_code
                 }
-            }), e.status_code
+            }), e.status_code, e.headers
         except Exception as e:
-            print(f"❌ Erro inesperado em update: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em update", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
@@ -211,7 +213,7 @@ class UsuarioControl:
 
     def destroy(self, id):
         """Remove um usuário pelo ID"""
-        print("🔵 UsuarioControl.destroy()")
+        logger.debug("🔵 UsuarioControl.destroy()")
         try:
             excluiu = self.__usuario_service.deleteUsuario(id)
             return jsonify({
@@ -226,9 +228,9 @@ class UsuarioControl:
                     "details": e.details,
                     "code": e.status_code
                 }
-            }), e.status_code
+            }), e.status_code, e.headers
         except Exception as e:
-            print(f"❌ Erro inesperado em destroy: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em destroy", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": {
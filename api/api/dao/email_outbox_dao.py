@@ -0,0 +1,147 @@
+# dao/email_outbox_dao.py
+import uuid
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+"""
+Classe responsável pela fila persistente de emails (outbox).
+
+A requisição apenas grava a mensagem; o EmailWorker reserva lotes de
+mensagens pendentes, envia e marca o resultado. A reserva é feita com um
+UPDATE condicional, então vários processos podem drenar a mesma fila sem
+enviar a mesma mensagem duas vezes.
+"""
+
+class EmailOutboxDAO:
+    # Reservas mais antigas que isso são consideradas abandonadas (worker morreu)
+    RESERVA_EXPIRA_SEGUNDOS = 600
+
+    def __init__(self, database_dependency):
+        logger.debug("⬆️  EmailOutboxDAO.__init__()")
+        self.__database = database_dependency
+        self._create_tables()
+
+    def _create_tables(self):
+        """Cria a tabela da outbox se não existir"""
+        logger.debug("🟢 EmailOutboxDAO._create_tables()")
+        try:
+            SQL = '''
+                CREATE TABLE IF NOT EXISTS email_outbox (
+                    id INT PRIMARY KEY AUTO_INCREMENT,
+                    destinatario VARCHAR(255) NOT NULL,
+                    assunto VARCHAR(255) NOT NULL,
+                    corpo_html MEDIUMTEXT NOT NULL,
+                    status VARCHAR(20) NOT NULL DEFAULT 'pendente',
+                    tentativas INT NOT NULL DEFAULT 0,
+                    proxima_tentativa DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    reservado_por CHAR(32) NULL,
+                    reservado_em DATETIME NULL,
+                    ultimo_erro TEXT NULL,
+                    data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    data_envio DATETIME NULL,
+                    INDEX idx_email_outbox_fila (status, proxima_tentativa),
+                    INDEX idx_email_outbox_reserva (reservado_por)
+                )
+            '''
+            self.__database.execute_query(SQL)
+            logger.debug("✅ Tabela 'email_outbox' criada/verificada com sucesso!")
+        except Exception as e:
+            logger.error("❌ Erro em EmailOutboxDAO._create_tables(): %s", e)
+
+    def enqueue(self, destinatario: str, assunto: str, corpo_html: str) -> int:
+        """
+        Coloca uma mensagem na fila.
+
+        :return: ID da mensagem
+        """
+        logger.debug("🟢 EmailOutboxDAO.enqueue() - Para: %s", destinatario)
+        try:
+            SQL = '''
+                INSERT INTO email_outbox (destinatario, assunto, corpo_html)
+                VALUES (%s, %s, %s)
+            '''
+            return self.__database.execute_query(SQL, (destinatario, assunto, corpo_html))
+        except Exception as e:
+            logger.error("❌ Erro em EmailOutboxDAO.enqueue(): %s", e)
+            raise
+
+    def apos_commit(self, callback):
+        """
+        Executa `callback` quando as mensagens enfileiradas nesta requisição
+        já estiverem confirmadas no banco (na hora, se o banco não tem
+        unidade de trabalho).
+        """
+        apos_commit = getattr(self.__database, "apos_commit", None)
+        if apos_commit is None:
+            callback()
+        else:
+            apos_commit(callback)
+
+    def reservar_lote(self, limite: int = 20) -> list:
+        """
+        Reserva até `limite` mensagens prontas para envio.
+
+        :return: list[dict] com id, destinatario, assunto, corpo_html, tentativas
+        """
+        reserva = uuid.uuid4().hex
+        SQL = '''
+            UPDATE email_outbox
+            SET status = 'enviando', reservado_por = %s, reservado_em = NOW()
+            WHERE (status = 'pendente' AND proxima_tentativa <= NOW())
+               OR (status = 'enviando' AND reservado_em < DATE_SUB(NOW(), INTERVAL %s SECOND))
+            ORDER BY id
+            LIMIT %s
+        '''
+        reservadas = self.__database.execute_query(SQL, (reserva, self.RESERVA_EXPIRA_SEGUNDOS, limite))
+        if not reservadas:
+            return []
+
+        SQL = '''
+            SELECT id, destinatario, assunto, corpo_html, tentativas
+            FROM email_outbox
+            WHERE reservado_por = %s AND status = 'enviando'
+            ORDER BY id
+        '''
+        return self.__database.execute_query(SQL, (reserva,), fetch=True) or []
+
+    def marcar_enviados(self, ids: list) -> int:
+        """Marca mensagens como enviadas"""
+        if not ids:
+            return 0
+        marcadores = ", ".join(["%s"] * len(ids))
+        SQL = f'''
+            UPDATE email_outbox
+            SET status = 'enviado', data_envio = NOW(), reservado_por = NULL, ultimo_erro = NULL
+            WHERE id IN ({marcadores})
+        '''
+        return self.__database.execute_query(SQL, tuple(ids))
+
+    def marcar_falha(self, id: int, erro: str, atraso_segundos: int, max_tentativas: int) -> int:
+        """
+        Registra uma falha de envio e agenda a próxima tentativa.
+        Ao atingir `max_tentativas` a mensagem fica com status 'falhou'.
+        """
+        SQL = '''
+            UPDATE email_outbox
+            SET tentativas = tentativas + 1,
+                status = CASE WHEN tentativas >= %s THEN 'falhou' ELSE 'pendente' END,
+                proxima_tentativa = DATE_ADD(NOW(), INTERVAL %s SECOND),
+                reservado_por = NULL,
+                ultimo_erro = %s
+            WHERE id = %s
+        '''
+        # Em MySQL as atribuições do SET são avaliadas em ordem: o CASE já vê tentativas + 1
+        return self.__database.execute_query(SQL, (max_tentativas, int(atraso_segundos), str(erro)[:1000], id))
+
+    def liberar(self, ids: list) -> int:
+        """Devolve mensagens reservadas para a fila sem contar tentativa"""
+        if not ids:
+            return 0
+        marcadores = ", ".join(["%s"] * len(ids))
+        SQL = f'''
+            UPDATE email_outbox
+            SET status = 'pendente', reservado_por = NULL
+            WHERE id IN ({marcadores}) AND status = 'enviando'
+        '''
+        return self.__database.execute_query(SQL, tuple(ids))
@@ -1,13 +1,48 @@
 # -*- coding: utf-8 -*-
+import time
 from api.model.projeto import Projeto
+from api.utils.logger import Logger
+from api.utils.cache_lru import CacheLRU
+from api.utils.indice_invertido import IndiceInvertido
+from api.utils.projecao import Projecao
+
+logger = Logger.get_logger(__name__)
 
 class ProjetoDAO:
-    def __init__(self, database_dependency):
-        print("⬆️  ProjetoDAO.__init__()")
+    # ✅ NOVO: Máximo de IDs por consulta em findManyByIds()
+    TAMANHO_LOTE_IDS = 500
+
+    # ✅ NOVO: Campos projetáveis nas listagens (?fields=)
+    PROJECAO = Projecao(
+        campos={
+            "id": ("p.id", None),
+            "nome": ("p.nome", None),
+            "descricao": ("p.descricao", None),
+            "data_inicio": ("p.data_inicio", None),
+            "data_fim": ("p.data_fim", None),
+            "status": ("p.status", None),
+            "usuario_id": ("p.usuario_id", None),
+            "data_criacao": ("p.data_criacao", None),
+            "data_atualizacao": ("p.data_atualizacao", None),
+            "usuario_nome": ("u.nome", "usuario"),
+        },
+        joins={"usuario": "LEFT JOIN usuarios u ON p.usuario_id = u.id"}
+    )
+
+    # Índices em memória (bancos sem FULLTEXT) são reconstruídos após este tempo
+    INDICE_LOCAL_TTL = 30
+
+    def __init__(self, database_dependency, versao_dao_dependency=None):
+        """
+        :param versao_dao_dependency: VersaoDAO para invalidar as ETags a cada escrita (opcional)
+        """
+        logger.debug("⬆️  ProjetoDAO.__init__()")
         self.__database = database_dependency
+        self.__versao_dao = versao_dao_dependency
+        self.__indices_locais = CacheLRU(capacidade=256)
 
     def create(self, objProjeto: Projeto) -> int:
-        print("🟢 ProjetoDAO.create()")
+        logger.debug("🟢 ProjetoDAO.create()")
         try:
             SQL = """
                 INSERT INTO projetos 
@@ -27,15 +62,21 @@ class ProjetoDAO:
             
             if not insert_id:
                 raise Exception("Falha ao inserir projeto")
+            if self.__versao_dao:
+                self.__versao_dao.incrementar([objProjeto.usuario_id])
+            self.__indices_locais.delete(objProjeto.usuario_id)
             return insert_id
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.create(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.create(): %s", e)
             raise
 
     def delete(self, id: int, usuario_id: int = None) -> bool:
-        print("🟢 ProjetoDAO.delete()")
+        logger.debug("🟢 ProjetoDAO.delete()")
         try:
+            # ✅ NOVO: Invalida as ETags antes do DELETE, enquanto as tarefas ainda existem
+            if self.__versao_dao:
+                self.__versao_dao.incrementar_por_projeto(id)
             if usuario_id:
                 # ✅ CORREÇÃO: Só deleta se o projeto pertencer ao usuário
                 SQL = "DELETE FROM projetos WHERE id = %s AND usuario_id = %s"
@@ -43,13 +84,15 @@ class ProjetoDAO:
             else:
                 SQL = "DELETE FROM projetos WHERE id = %s"
                 affected = self.__database.execute_query(SQL, (id,))
+            if affected > 0:
+                self.__indices_locais.clear()
             return affected > 0
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.delete(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.delete(): %s", e)
             raise
 
     def update(self, objProjeto: Projeto) -> bool:
-        print("🟢 ProjetoDAO.update()")
+        logger.debug("🟢 ProjetoDAO.update()")
         try:
             # ✅ CORREÇÃO: Só atualiza se o projeto pertencer ao usuário
             SQL = """
@@ -68,15 +111,37 @@ class ProjetoDAO:
             )
 
             affected = self.__database.execute_query(SQL, params)
+            if affected > 0 and self.__versao_dao:
+                self.__versao_dao.incrementar_por_projeto(objProjeto.id)
+            self.__indices_locais.delete(objProjeto.usuario_id)
             return affected > 0
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.update(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.update(): %s", e)
             raise
 
-    def findAll(self, usuario_id: int = None) -> list[dict]:
-        print("🟢 ProjetoDAO.findAll()")
+    def findAll(self, usuario_id: int = None, campos: tuple = None) -> list[dict]:
+        """
+        :param campos: tuple - Campos de PROJECAO a retornar (None = todos)
+        """
+        logger.debug("🟢 ProjetoDAO.findAll()")
         try:
+            if campos:
+                # ✅ NOVO: Só as colunas pedidas; JOIN com usuarios só se usuario_nome for pedido
+                SQL = f"""
+                    SELECT
+                        {self.PROJECAO.select(campos)}
+                    FROM projetos p
+                    {self.PROJECAO.joins(campos)}
+                """
+                params = ()
+                if usuario_id:
+                    SQL += " WHERE p.usuario_id = %s"
+                    params = (usuario_id,)
+                SQL += " ORDER BY p.data_criacao DESC"
+                rows = self.__database.execute_query(SQL, params, fetch=True)
+                return [self.PROJECAO.converter(row, campos) for row in rows]
+
             if usuario_id:
                 # ✅ CORREÇÃO: Só retorna projetos do usuário específico
                 SQL = """
@@ -125,11 +190,58 @@ class ProjetoDAO:
             return projetos
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.findAll(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.findAll(): %s", e)
+            raise
+
+    def streamAll(self, usuario_id: int = None, status: str = None, tamanho_lote: int = 500,
+                  limite: int = None):
+        """
+        ✅ NOVO: Mesmas colunas de findAll(), entregues uma a uma (gerador) a
+        partir de um cursor sem buffer, para exportações em memória constante.
+
+        :param limite: int - Máximo de linhas (None = todas)
+        """
+        logger.debug("🟢 ProjetoDAO.streamAll()")
+        SQL = """
+            SELECT 
+                p.id, 
+                p.nome, 
+                p.descricao, 
+                p.data_inicio, 
+                p.data_fim,
+                p.status, 
+                p.usuario_id,
+                p.data_criacao,
+                p.data_atualizacao,
+                u.nome as usuario_nome
+            FROM projetos p
+            LEFT JOIN usuarios u ON p.usuario_id = u.id
+        """
+        conditions = []
+        params = []
+        if usuario_id:
+            conditions.append("p.usuario_id = %s")
+            params.append(usuario_id)
+        if status:
+            conditions.append("p.status = %s")
+            params.append(status)
+        if conditions:
+            SQL += " WHERE " + " AND ".join(conditions)
+        # Com usuario_id, idx_projetos_usuario_data entrega a ordem sem filesort
+        SQL += " ORDER BY p.data_criacao DESC"
+        if limite:
+            SQL += " LIMIT %s"
+            params.append(limite)
+
+        try:
+            for row in self.__database.stream_query(SQL, tuple(params), tamanho_lote=tamanho_lote):
+                yield self._row_to_dict(row)
+        except Exception as e:
+            logger.error("❌ Erro em ProjetoDAO.streamAll(): %s", e)
             raise
 
     def findById(self, id: int, usuario_id: int = None) -> dict | None:
-        print("✅ ProjetoDAO.findById()")
+        logger.debug("✅ ProjetoDAO.findById()")
         try:
             if usuario_id:
                 # ✅ CORREÇÃO: Só retorna projeto se pertencer ao usuário
@@ -176,11 +288,11 @@ class ProjetoDAO:
             return self._row_to_dict(row)
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.findById(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.findById(): %s", e)
             raise
 
     def findByUsuarioId(self, usuario_id: int) -> list[dict]:
-        print("🟢 ProjetoDAO.findByUsuarioId()")
+        logger.debug("🟢 ProjetoDAO.findByUsuarioId()")
         try:
             SQL = """
                 SELECT 
@@ -209,7 +321,44 @@ class ProjetoDAO:
             return projetos
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.findByUsuarioId(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.findByUsuarioId(): %s", e)
+            raise
+
+    # ✅ NOVO: Vários registros em uma única consulta
+    def findManyByIds(self, ids: list, usuario_id: int = None) -> list[dict]:
+        """
+        Busca vários projetos por ID com WHERE id IN (...), em lotes de
+        TAMANHO_LOTE_IDS para listas muito grandes.
+
+        :param ids: list - IDs (repetidos são ignorados)
+        :param usuario_id: int - Se fornecido, só retorna projetos desse usuário
+        :return: list[dict] na ordem dos IDs; IDs inexistentes (ou de outro usuário) são omitidos
+        """
+        ids = list(dict.fromkeys(ids))
+        logger.debug("✅ ProjetoDAO.findManyByIds() - %s IDs", len(ids))
+        try:
+            encontrados = {}
+            for inicio in range(0, len(ids), self.TAMANHO_LOTE_IDS):
+                lote = ids[inicio:inicio + self.TAMANHO_LOTE_IDS]
+                SQL = f"""
+                    SELECT
+                        {self.PROJECAO.select()}
+                    FROM projetos p
+                    {self.PROJECAO.joins()}
+                    WHERE p.id IN ({', '.join(['%s'] * len(lote))})
+                """
+                params = list(lote)
+                if usuario_id:
+                    SQL += " AND p.usuario_id = %s"
+                    params.append(usuario_id)
+
+                for row in self.__database.execute_query(SQL, tuple(params), fetch=True):
+                    encontrados[row["id"]] = self._row_to_dict(row)
+
+            return [encontrados[id] for id in ids if id in encontrados]
+
+        except Exception as e:
+            logger.error("❌ Erro em ProjetoDAO.findManyByIds(): %s", e)
             raise
 
     def _row_to_dict(self, row: dict) -> dict:
@@ -225,25 +374,143 @@ class ProjetoDAO:
             "usuario_nome": row.get("usuario_nome")
         }
         
-        # Tratamento seguro para datas
-        date_fields = ["data_inicio", "data_fim", "data_criacao", "data_atualizacao"]
-        for field in date_fields:
-            if row.get(field):
-                if hasattr(row[field], 'isoformat'):
-                    projeto_data[field] = row[field].isoformat()
-                else:
-                    projeto_data[field] = str(row[field])
-            else:
-                projeto_data[field] = None
+        # ✅ OTIMIZAÇÃO: Datas seguem como date/datetime; o JsonProviderRapido
+        # as serializa em ISO 8601 (sem isoformat() por campo)
+        for field in ("data_inicio", "data_fim", "data_criacao", "data_atualizacao"):
+            projeto_data[field] = row.get(field) or None
                 
         return projeto_data
 
+    # ✅ NOVO: Projetos mais recentes (top-N direto no banco)
+    def findRecentes(self, usuario_id: int, limite: int = 5) -> list[dict]:
+        """
+        Retorna os `limite` projetos mais recentes do usuário.
+        Lê apenas as linhas retornadas (ORDER BY ... LIMIT).
+        """
+        logger.debug("🟢 ProjetoDAO.findRecentes()")
+        try:
+            SQL = """
+                SELECT 
+                    p.id, 
+                    p.nome, 
+                    p.descricao, 
+                    p.data_inicio, 
+                    p.data_fim,
+                    p.status, 
+                    p.usuario_id,
+                    p.data_criacao,
+                    p.data_atualizacao,
+                    u.nome as usuario_nome
+                FROM projetos p
+                LEFT JOIN usuarios u ON p.usuario_id = u.id
+                WHERE p.usuario_id = %s
+                ORDER BY p.data_criacao DESC, p.id DESC
+                LIMIT %s
+            """
+            rows = self.__database.execute_query(SQL, (usuario_id, int(limite)), fetch=True)
+            return [self._row_to_dict(row) for row in rows]
+
+        except Exception as e:
+            logger.error("❌ Erro em ProjetoDAO.findRecentes(): %s", e)
+            raise
+
+    # ✅ NOVO: Busca textual com ranking por relevância
+    def search(self, usuario_id: int, termo: str, limite: int = 20) -> list[dict]:
+        """
+        Busca projetos do usuário por nome/descrição.
+
+        - MySQL: índice FULLTEXT (nome, descricao) em modo booleano, ordenado
+          por relevância e limitado no banco.
+        - Bancos sem FULLTEXT (MockDatabase/SQLite): índice invertido em memória.
+
+        :return: list[dict] - Projetos com o campo "relevancia"
+        """
+        logger.debug("🟢 ProjetoDAO.search() - Termo: %s", termo)
+        if not getattr(self.__database, 'suporta_fulltext', False):
+            return self._search_local(usuario_id, termo, limite)
+
+        consulta = IndiceInvertido.consulta_fulltext(termo)
+        try:
+            if consulta:
+                SQL = """
+                    SELECT 
+                        p.id, 
+                        p.nome, 
+                        p.descricao, 
+                        p.data_inicio, 
+                        p.data_fim,
+                        p.status, 
+                        p.usuario_id,
+                        p.data_criacao,
+                        p.data_atualizacao,
+                        u.nome as usuario_nome,
+                        MATCH(p.nome, p.descricao) AGAINST (%s IN BOOLEAN MODE) AS relevancia
+                    FROM projetos p
+                    LEFT JOIN usuarios u ON p.usuario_id = u.id
+                    WHERE p.usuario_id = %s
+                      AND MATCH(p.nome, p.descricao) AGAINST (%s IN BOOLEAN MODE)
+                    ORDER BY relevancia DESC, p.id DESC
+                    LIMIT %s
+                """
+                rows = self.__database.execute_query(SQL, (consulta, usuario_id, consulta, int(limite)), fetch=True)
+            else:
+                rows = self._search_like(usuario_id, termo, limite)
+        except Exception as e:
+            # 1191: índice FULLTEXT ainda não criado (ver docs/Banco.sql)
+            if getattr(e, 'errno', None) != 1191:
+                logger.error("❌ Erro em ProjetoDAO.search(): %s", e)
+                raise
+            logger.warning("⚠️  Índice FULLTEXT de projetos não encontrado, usando LIKE")
+            rows = self._search_like(usuario_id, termo, limite)
+
+        projetos = []
+        for row in rows:
+            projeto_data = self._row_to_dict(row)
+            projeto_data["relevancia"] = float(row.get("relevancia") or 0)
+            projetos.append(projeto_data)
+        return projetos
+
+    def _search_like(self, usuario_id: int, termo: str, limite: int) -> list[dict]:
+        """Busca por substring, para termos curtos demais para o FULLTEXT"""
+        SQL = """
+            SELECT 
+                p.id, 
+                p.nome, 
+                p.descricao, 
+                p.data_inicio, 
+                p.data_fim,
+                p.status, 
+                p.usuario_id,
+                p.data_criacao,
+                p.data_atualizacao,
+                u.nome as usuario_nome,
+                0 AS relevancia
+            FROM projetos p
+            LEFT JOIN usuarios u ON p.usuario_id = u.id
+            WHERE p.usuario_id = %s AND (p.nome LIKE %s ESCAPE '\\\\' OR p.descricao LIKE %s ESCAPE '\\\\')
+            ORDER BY p.data_criacao DESC
+            LIMIT %s
+        """
+        padrao = IndiceInvertido.padrao_like(termo)
+        return self.__database.execute_query(SQL, (usuario_id, padrao, padrao, int(limite)), fetch=True)
+
+    def _search_local(self, usuario_id: int, termo: str, limite: int) -> list[dict]:
+        """Busca no índice invertido em memória do usuário"""
+        indice = self.__indices_locais.get(usuario_id)
+        if indice is None:
+            indice = IndiceInvertido(pesos={"nome": 2, "descricao": 1})
+            for projeto in self.findAll(usuario_id):
+                indice.adicionar(projeto["id"], {"nome": projeto["nome"], "descricao": projeto["descricao"]}, projeto)
+            self.__indices_locais.set(usuario_id, indice, expira_em=time.time() + self.INDICE_LOCAL_TTL)
+
+        return [dict(projeto, relevancia=relevancia) for projeto, relevancia in indice.buscar(termo, limite)]
+
     # ✅ NOVO: Método para contar projetos por status
     def count_by_status(self, usuario_id: int) -> dict:
         """
         Retorna contagem de projetos por status para um usuário
         """
-        print("🟢 ProjetoDAO.count_by_status()")
+        logger.debug("🟢 ProjetoDAO.count_by_status()")
         try:
             SQL = """
                 SELECT 
@@ -262,7 +529,7 @@ class ProjetoDAO:
             return result
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.count_by_status(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.count_by_status(): %s", e)
             return {}
 
     # ✅ NOVO: Método para buscar projetos com filtros
@@ -270,7 +537,7 @@ class ProjetoDAO:
         """
         Busca projetos com filtros opcionais
         """
-        print("🟢 ProjetoDAO.find_with_filters()")
+        logger.debug("🟢 ProjetoDAO.find_with_filters()")
         try:
             base_sql = """
                 SELECT 
@@ -299,9 +566,9 @@ class ProjetoDAO:
                     params.append(filters['status'])
                 
                 if filters.get('search_term'):
-                    conditions.append("(p.nome LIKE %s OR p.descricao LIKE %s)")
-                    params.append(f"%{filters['search_term']}%")
-                    params.append(f"%{filters['search_term']}%")
+                    conditions.append("(p.nome LIKE %s ESCAPE '\\\\' OR p.descricao LIKE %s ESCAPE '\\\\')")
+                    params.append(IndiceInvertido.padrao_like(filters['search_term']))
+                    params.append(IndiceInvertido.padrao_like(filters['search_term']))
             
             # Construir query final
             if conditions:
@@ -319,5 +586,5 @@ class ProjetoDAO:
             return projetos
             
         except Exception as e:
-            print(f"❌ Erro em ProjetoDAO.find_with_filters(): {e}")
+            logger.error("❌ Erro em ProjetoDAO.find_with_filters(): %s", e)
             raise
\ No newline at end of file
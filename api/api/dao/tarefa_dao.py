@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
+import time
 from api.model.tarefa import Tarefa
+from api.utils.logger import Logger
+from api.utils.cache_lru import CacheLRU
+from api.utils.indice_invertido import IndiceInvertido
+from api.utils.projecao import Projecao
+
+logger = Logger.get_logger(__name__)
 
 """
 Classe responsável por gerenciar operações CRUD
@@ -7,12 +14,97 @@ para a entidade Tarefa no banco de dados.
 """
 
 class TarefaDAO:
-    def __init__(self, database_dependency):
-        print("⬆️  TarefaDAO.__init__()")
+    # Colunas que podem ser alteradas por updateParcial()
+    CAMPOS_ATUALIZAVEIS = [
+        "titulo", "descricao", "status", "prioridade", "concluida",
+        "data_limite", "data_inicio", "data_fim", "projeto_id",
+        "usuario_responsavel_id", "usuario_atribuidor_id"
+    ]
+
+    # ✅ NOVO: Filtros aceitos por findFiltered()/findPage(): nome -> (coluna, operador).
+    # Só estes nomes viram SQL; os valores vão sempre como parâmetros.
+    FILTROS = {
+        "status": ("t.status", "IN"),
+        "prioridade": ("t.prioridade", "IN"),
+        "concluida": ("t.concluida", "="),
+        "projeto_id": ("t.projeto_id", "="),
+        "responsavel_id": ("t.usuario_responsavel_id", "="),
+        "atribuidor_id": ("t.usuario_atribuidor_id", "="),
+        "data_limite_de": ("t.data_limite", ">="),
+        "data_limite_ate": ("t.data_limite", "<="),
+    }
+
+    # ✅ NOVO: Ordenações aceitas por findFiltered() ("-" = decrescente)
+    ORDENACOES = {
+        "padrao": """
+            CASE
+                WHEN t.concluida = TRUE THEN 3
+                WHEN t.status = 'andamento' THEN 1
+                WHEN t.status = 'pendente' THEN 2
+                ELSE 4
+            END,
+            t.prioridade DESC,
+            t.data_limite ASC,
+            t.id ASC
+        """,
+        "data_limite": "t.data_limite IS NULL, t.data_limite ASC, t.id ASC",
+        "-data_limite": "t.data_limite DESC, t.id DESC",
+        "prioridade": "FIELD(t.prioridade, 'baixa', 'media', 'alta') ASC, t.id ASC",
+        "-prioridade": "FIELD(t.prioridade, 'baixa', 'media', 'alta') DESC, t.id ASC",
+        "titulo": "t.titulo ASC, t.id ASC",
+        "-titulo": "t.titulo DESC, t.id DESC",
+        "id": "t.id ASC",
+        "-id": "t.id DESC",
+    }
+
+    # ✅ NOVO: Campos projetáveis nas listagens (?fields=); os nomes só fazem
+    # JOIN com projetos/usuarios quando pedidos
+    PROJECAO = Projecao(
+        campos={
+            "id": ("t.id", None),
+            "titulo": ("t.titulo", None),
+            "descricao": ("t.descricao", None),
+            "status": ("t.status", None),
+            "prioridade": ("t.prioridade", None),
+            "concluida": ("t.concluida", None),
+            "data_limite": ("t.data_limite", None),
+            "data_inicio": ("t.data_inicio", None),
+            "data_fim": ("t.data_fim", None),
+            "projeto_id": ("t.projeto_id", None),
+            "usuario_responsavel_id": ("t.usuario_responsavel_id", None),
+            "usuario_atribuidor_id": ("t.usuario_atribuidor_id", None),
+            "projeto_nome": ("p.nome", "projeto"),
+            "responsavel_nome": ("ur.nome", "responsavel"),
+            "atribuidor_nome": ("ua.nome", "atribuidor"),
+        },
+        joins={
+            "projeto": "LEFT JOIN projetos p ON t.projeto_id = p.id",
+            "responsavel": "LEFT JOIN usuarios ur ON t.usuario_responsavel_id = ur.id",
+            "atribuidor": "LEFT JOIN usuarios ua ON t.usuario_atribuidor_id = ua.id",
+        },
+        conversores={"concluida": bool}
+    )
+
+    # ✅ NOVO: Máximo de IDs por consulta em findManyByIds()/deleteMany() e
+    # de linhas por INSERT em createMany()
+    TAMANHO_LOTE_IDS = 500
+
+    # Índices em memória (bancos sem FULLTEXT) são reconstruídos após este tempo
+    INDICE_LOCAL_TTL = 30
+
+    def __init__(self, database_dependency, versao_dao_dependency=None):
+        """
+        :param versao_dao_dependency: VersaoDAO para invalidar as ETags a cada escrita (opcional)
+        """
+        logger.debug("⬆️  TarefaDAO.__init__()")
         self.__database = database_dependency
+        self.__versao_dao = versao_dao_dependency
+        self.__indices_locais = CacheLRU(capacidade=256)
+        self.__incremento_auto = None
+        self.__ordem_persistida = True
 
     def create(self, objTarefa: Tarefa) -> int:
-        print("🟢 TarefaDAO.create()")
+        logger.debug("🟢 TarefaDAO.create()")
         try:
             SQL = """
                 INSERT INTO tarefas 
@@ -21,79 +113,88 @@ class TarefaDAO:
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
             
-            # ✅ CORREÇÃO: Tratamento seguro para datas
-            data_limite_value = None
-            if objTarefa.data_limite:
-                if hasattr(objTarefa.data_limite, 'isoformat'):
-                    data_limite_value = objTarefa.data_limite.isoformat()
-                else:
-                    data_limite_value = str(objTarefa.data_limite)
-            
-            data_inicio_value = None
-            if hasattr(objTarefa, 'data_inicio') and objTarefa.data_inicio:
-                if hasattr(objTarefa.data_inicio, 'isoformat'):
-                    data_inicio_value = objTarefa.data_inicio.isoformat()
-                else:
-                    data_inicio_value = str(objTarefa.data_inicio)
-            
-            data_fim_value = None
-            if hasattr(objTarefa, 'data_fim') and objTarefa.data_fim:
-                if hasattr(objTarefa.data_fim, 'isoformat'):
-                    data_fim_value = objTarefa.data_fim.isoformat()
-                else:
-                    data_fim_value = str(objTarefa.data_fim)
-
-            # ✅ CORREÇÃO: projeto_id pode ser None
-            projeto_id_value = objTarefa.projeto_id if hasattr(objTarefa, 'projeto_id') else None
-
-            # ✅✅✅ CORREÇÃO CRÍTICA: Tratamento para usuario_responsavel_id
-            # Se usuario_responsavel_id for None (que é o caso do seu erro), 
-            # vamos usar o usuario_atribuidor_id como fallback
-            usuario_responsavel_id_value = objTarefa.usuario_responsavel_id
-            usuario_atribuidor_id_value = objTarefa.usuario_atribuidor_id
-            
-            # Se responsável for None, tentamos usar o atribuidor
-            if usuario_responsavel_id_value is None and usuario_atribuidor_id_value is not None:
-                print(f"⚠️  usuario_responsavel_id está None, usando usuario_atribuidor_id: {usuario_atribuidor_id_value}")
-                usuario_responsavel_id_value = usuario_atribuidor_id_value
-            # Se ambos forem None, lançamos um erro mais específico
-            elif usuario_responsavel_id_value is None and usuario_atribuidor_id_value is None:
-                raise ValueError("❌ Tanto usuario_responsavel_id quanto usuario_atribuidor_id são None. Pelo menos um deve ter valor.")
-            
-            # ✅ CORREÇÃO: Verifica se temos um valor válido para usuario_responsavel_id
-            if usuario_responsavel_id_value is None:
-                raise ValueError("❌ usuario_responsavel_id não pode ser None após tratamento")
-
-            params = (
-                objTarefa.titulo,
-                objTarefa.descricao if hasattr(objTarefa, 'descricao') else "",
-                objTarefa.status if hasattr(objTarefa, 'status') else "pendente",
-                objTarefa.prioridade if hasattr(objTarefa, 'prioridade') else "media",
-                objTarefa.concluida,
-                data_limite_value,
-                data_inicio_value,
-                data_fim_value,
-                projeto_id_value,   # ✅ AGORA PODE SER None
-                usuario_responsavel_id_value,  # ✅ AGORA COM VALOR GARANTIDO
-                usuario_atribuidor_id_value  # ✅ PODE SER None (mas não será no seu caso)
-            )
+            params = self._params_insert(objTarefa)
 
-            print(f"📝 Parâmetros da inserção: {params}")
+            logger.debug("📝 Parâmetros da inserção: %s", params)
             insert_id = self.__database.execute_query(SQL, params)
             
             if not insert_id:
                 raise Exception("Falha ao inserir tarefa")
+            self._nova_versao(usuario_ids=params[9:11])
+            self.__indices_locais.clear()
             return insert_id
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.create(): {e}")
+            logger.error("❌ Erro em TarefaDAO.create(): %s", e)
             raise
 
+    def _params_insert(self, objTarefa: Tarefa) -> tuple:
+        """
+        ✅ NOVO: Parâmetros do INSERT de uma tarefa (usado por create e createMany)
+        """
+        # ✅ CORREÇÃO: Tratamento seguro para datas
+        data_limite_value = None
+        if objTarefa.data_limite:
+            if hasattr(objTarefa.data_limite, 'isoformat'):
+                data_limite_value = objTarefa.data_limite.isoformat()
+            else:
+                data_limite_value = str(objTarefa.data_limite)
+        
+        data_inicio_value = None
+        if hasattr(objTarefa, 'data_inicio') and objTarefa.data_inicio:
+            if hasattr(objTarefa.data_inicio, 'isoformat'):
+                data_inicio_value = objTarefa.data_inicio.isoformat()
+            else:
+                data_inicio_value = str(objTarefa.data_inicio)
+        
+        data_fim_value = None
+        if hasattr(objTarefa, 'data_fim') and objTarefa.data_fim:
+            if hasattr(objTarefa.data_fim, 'isoformat'):
+                data_fim_value = objTarefa.data_fim.isoformat()
+            else:
+                data_fim_value = str(objTarefa.data_fim)
+
+        # ✅ CORREÇÃO: projeto_id pode ser None
+        projeto_id_value = objTarefa.projeto_id if hasattr(objTarefa, 'projeto_id') else None
+
+        # ✅✅✅ CORREÇÃO CRÍTICA: Tratamento para usuario_responsavel_id
+        # Se usuario_responsavel_id for None (que é o caso do seu erro), 
+        # vamos usar o usuario_atribuidor_id como fallback
+        usuario_responsavel_id_value = objTarefa.usuario_responsavel_id
+        usuario_atribuidor_id_value = objTarefa.usuario_atribuidor_id
+        
+        # Se responsável for None, tentamos usar o atribuidor
+        if usuario_responsavel_id_value is None and usuario_atribuidor_id_value is not None:
+            logger.warning("⚠️  usuario_responsavel_id está None, usando usuario_atribuidor_id: %s", usuario_atribuidor_id_value)
+            usuario_responsavel_id_value = usuario_atribuidor_id_value
+        # Se ambos forem None, lançamos um erro mais específico
+        elif usuario_responsavel_id_value is None and usuario_atribuidor_id_value is None:
+            raise ValueError("❌ Tanto usuario_responsavel_id quanto usuario_atribuidor_id são None. Pelo menos um deve ter valor.")
+        
+        # ✅ CORREÇÃO: Verifica se temos um valor válido para usuario_responsavel_id
+        if usuario_responsavel_id_value is None:
+            raise ValueError("❌ usuario_responsavel_id não pode ser None após tratamento")
+
+        params = (
+            objTarefa.titulo,
+            objTarefa.descricao if hasattr(objTarefa, 'descricao') else "",
+            objTarefa.status if hasattr(objTarefa, 'status') else "pendente",
+            objTarefa.prioridade if hasattr(objTarefa, 'prioridade') else "media",
+            objTarefa.concluida,
+            data_limite_value,
+            data_inicio_value,
+            data_fim_value,
+            projeto_id_value,   # ✅ AGORA PODE SER None
+            usuario_responsavel_id_value,  # ✅ AGORA COM VALOR GARANTIDO
+            usuario_atribuidor_id_value  # ✅ PODE SER None (mas não será no seu caso)
+        )
+        return params
+
     def delete(self, id: int, usuario_id: int = None) -> bool:
         """
         ✅ CORREÇÃO: Agora verifica por usuario_responsavel_id
         """
-        print("🟢 TarefaDAO.delete()")
+        logger.debug("🟢 TarefaDAO.delete()")
         try:
             if usuario_id:
                 # ✅ CORREÇÃO: Só deleta se a tarefa pertencer ao usuário responsável
@@ -103,14 +204,16 @@ class TarefaDAO:
                 SQL = "DELETE FROM tarefas WHERE id = %s"
                 params = (id,)
                 
+            self._nova_versao(tarefa_ids=[id])
             affected = self.__database.execute_query(SQL, params)
+            self.__indices_locais.clear()
             return affected > 0
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.delete(): {e}")
+            logger.error("❌ Erro em TarefaDAO.delete(): %s", e)
             raise
 
     def update(self, objTarefa: Tarefa, usuario_id: int = None) -> bool:
-        print("🟢 TarefaDAO.update()")
+        logger.debug("🟢 TarefaDAO.update()")
         try:
             # ✅ CORREÇÃO: SQL completo com novos campos
             SQL = """
@@ -175,18 +278,222 @@ class TarefaDAO:
             if usuario_id:
                 params.append(usuario_id)
 
+            self._nova_versao(tarefa_ids=[objTarefa.id], usuario_ids=[objTarefa.usuario_responsavel_id, objTarefa.usuario_atribuidor_id])
             affected = self.__database.execute_query(SQL, tuple(params))
+            self.__indices_locais.clear()
             return affected > 0
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.update(): {e}")
+            logger.error("❌ Erro em TarefaDAO.update(): %s", e)
+            raise
+
+    def updateParcial(self, id: int, campos: dict, usuario_id: int = None) -> bool:
+        """
+        ✅ NOVO: Atualiza apenas as colunas informadas, em um único UPDATE.
+
+        Não faz SELECT antes: a existência (e a posse, quando usuario_id é
+        informado) é decidida pelo número de linhas encontradas pelo WHERE.
+
+        :param campos: dict coluna -> valor (apenas colunas de CAMPOS_ATUALIZAVEIS)
+        :return: True se a tarefa existe (para o usuário), False caso contrário
+        """
+        logger.debug("🟢 TarefaDAO.updateParcial() - ID: %s, Campos: %s", id, list(campos.keys()))
+        try:
+            invalidos = [campo for campo in campos if campo not in self.CAMPOS_ATUALIZAVEIS]
+            if invalidos:
+                raise ValueError(f"Campo(s) inválido(s) para atualização: {', '.join(invalidos)}")
+            if not campos:
+                raise ValueError("Nenhum campo informado para atualização")
+
+            sets = []
+            params = []
+            for campo, valor in campos.items():
+                if valor is not None and campo in ("data_limite", "data_inicio", "data_fim"):
+                    valor = valor.isoformat() if hasattr(valor, 'isoformat') else str(valor)
+                sets.append(f"{campo} = %s")
+                params.append(valor)
+
+            SQL = f"UPDATE tarefas SET {', '.join(sets)} WHERE id = %s"
+            params.append(id)
+            if usuario_id:
+                SQL += " AND usuario_responsavel_id = %s"
+                params.append(usuario_id)
+
+            self._nova_versao(tarefa_ids=[id], usuario_ids=[campos.get("usuario_responsavel_id"), campos.get("usuario_atribuidor_id")])
+            affected = self.__database.execute_query(SQL, tuple(params))
+            self.__indices_locais.clear()
+            return affected > 0
+
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.updateParcial(): %s", e)
+            raise
+
+    # ✅ NOVO: Operações em lote (POST /api/tarefa/bulk)
+    def createMany(self, tarefas: list[Tarefa]) -> list[int]:
+        """
+        Insere várias tarefas com INSERT de múltiplas linhas (um por lote de
+        TAMANHO_LOTE_IDS linhas).
+
+        O InnoDB reserva IDs consecutivos para um INSERT de múltiplas linhas
+        com quantidade conhecida, então os IDs são o lastrowid do lote mais
+        a posição x @@auto_increment_increment.
+
+        :return: list[int] - IDs na mesma ordem de `tarefas`
+        """
+        logger.debug("🟢 TarefaDAO.createMany() - %s tarefas", len(tarefas))
+        try:
+            linhas = [self._params_insert(objTarefa) for objTarefa in tarefas]
+            ids = []
+            for inicio in range(0, len(linhas), self.TAMANHO_LOTE_IDS):
+                lote = linhas[inicio:inicio + self.TAMANHO_LOTE_IDS]
+                SQL = f"""
+                    INSERT INTO tarefas 
+                    (titulo, descricao, status, prioridade, concluida, data_limite, 
+                     data_inicio, data_fim, projeto_id, usuario_responsavel_id, usuario_atribuidor_id) 
+                    VALUES {', '.join(['(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'] * len(lote))}
+                """
+                primeiro_id = self.__database.execute_query(SQL, tuple(v for linha in lote for v in linha))
+                if not primeiro_id:
+                    raise Exception("Falha ao inserir tarefas")
+                incremento = self._incremento_auto()
+                ids.extend(primeiro_id + posicao * incremento for posicao in range(len(lote)))
+
+            self._nova_versao(usuario_ids=[v for linha in linhas for v in linha[9:11]])
+            self.__indices_locais.clear()
+            return ids
+
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.createMany(): %s", e)
+            raise
+
+    def updateMany(self, alteracoes: list, usuario_id: int = None) -> int:
+        """
+        Aplica várias atualizações parciais. Alterações com o mesmo conjunto
+        de colunas são enviadas juntas com executemany.
+
+        :param alteracoes: list[tuple[int, dict]] - (id, campos) como em updateParcial()
+        :return: int - Total de linhas encontradas
+        """
+        logger.debug("🟢 TarefaDAO.updateMany() - %s alterações", len(alteracoes))
+        try:
+            grupos = {}
+            for id, campos in alteracoes:
+                invalidos = [campo for campo in campos if campo not in self.CAMPOS_ATUALIZAVEIS]
+                if invalidos:
+                    raise ValueError(f"Campo(s) inválido(s) para atualização: {', '.join(invalidos)}")
+                if not campos:
+                    raise ValueError("Nenhum campo informado para atualização")
+
+                colunas = tuple(sorted(campos))
+                params = []
+                for campo in colunas:
+                    valor = campos[campo]
+                    if valor is not None and campo in ("data_limite", "data_inicio", "data_fim"):
+                        valor = valor.isoformat() if hasattr(valor, 'isoformat') else str(valor)
+                    params.append(valor)
+                params.append(id)
+                if usuario_id:
+                    params.append(usuario_id)
+                grupos.setdefault(colunas, []).append(tuple(params))
+
+            self._nova_versao(
+                tarefa_ids=[id for id, _ in alteracoes],
+                usuario_ids=[campos.get(c) for _, campos in alteracoes for c in ("usuario_responsavel_id", "usuario_atribuidor_id")]
+            )
+            total = 0
+            for colunas, lista_params in grupos.items():
+                SQL = f"UPDATE tarefas SET {', '.join(f'{campo} = %s' for campo in colunas)} WHERE id = %s"
+                if usuario_id:
+                    SQL += " AND usuario_responsavel_id = %s"
+                total += self.__database.execute_many(SQL, lista_params)
+
+            self.__indices_locais.clear()
+            return total
+
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.updateMany(): %s", e)
+            raise
+
+    def deleteMany(self, ids: list, usuario_id: int = None) -> int:
+        """
+        Remove várias tarefas com DELETE ... WHERE id IN (...), em lotes.
+
+        :return: int - Total de linhas removidas
+        """
+        logger.debug("🟢 TarefaDAO.deleteMany() - %s IDs", len(ids))
+        try:
+            ids = list(dict.fromkeys(ids))
+            self._nova_versao(tarefa_ids=ids)
+            total = 0
+            for inicio in range(0, len(ids), self.TAMANHO_LOTE_IDS):
+                lote = ids[inicio:inicio + self.TAMANHO_LOTE_IDS]
+                SQL = f"DELETE FROM tarefas WHERE id IN ({', '.join(['%s'] * len(lote))})"
+                params = list(lote)
+                if usuario_id:
+                    SQL += " AND usuario_responsavel_id = %s"
+                    params.append(usuario_id)
+                total += self.__database.execute_query(SQL, tuple(params))
+
+            self.__indices_locais.clear()
+            return total
+
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.deleteMany(): %s", e)
+            raise
+
+    def _nova_versao(self, tarefa_ids: list = None, usuario_ids: list = None):
+        """
+        ✅ NOVO: Incrementa a versão (ETag) dos usuários afetados por uma escrita,
+        na mesma transação. Chamado antes de UPDATE/DELETE para alcançar o
+        responsável/atribuidor atuais; usuario_ids cobre os novos.
+        """
+        if self.__versao_dao is None:
+            return
+        if tarefa_ids:
+            self.__versao_dao.incrementar_por_tarefas(tarefa_ids)
+        if usuario_ids:
+            self.__versao_dao.incrementar(usuario_ids)
+
+    def _incremento_auto(self) -> int:
+        """Valor de @@auto_increment_increment (lido uma vez)"""
+        if self.__incremento_auto is None:
+            rows = self.__database.execute_query("SELECT @@auto_increment_increment AS incremento", fetch=True)
+            self.__incremento_auto = int(rows[0].get("incremento") or 1) if rows else 1
+        return self.__incremento_auto
+
+    def alternarConcluida(self, id: int, usuario_id: int = None) -> bool:
+        """
+        ✅ NOVO: Inverte 'concluida' e ajusta 'status' no próprio UPDATE.
+        O MySQL avalia o SET da esquerda para a direita, então o CASE já
+        enxerga o novo valor de 'concluida'.
+        """
+        logger.debug("🟢 TarefaDAO.alternarConcluida() - ID: %s", id)
+        try:
+            SQL = """
+                UPDATE tarefas
+                SET concluida = NOT concluida,
+                    status = CASE WHEN concluida THEN 'concluida' ELSE 'pendente' END
+                WHERE id = %s
+            """
+            params = [id]
+            if usuario_id:
+                SQL += " AND usuario_responsavel_id = %s"
+                params.append(usuario_id)
+
+            self._nova_versao(tarefa_ids=[id])
+            affected = self.__database.execute_query(SQL, tuple(params))
+            self.__indices_locais.clear()
+            return affected > 0
+
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.alternarConcluida(): %s", e)
             raise
 
     def updateCampo(self, id: int, campo: str, valor: any, usuario_id: int = None) -> bool:
         """
         ✅ CORREÇÃO: Agora verifica por usuario_responsavel_id
         """
-        print(f"🟢 TarefaDAO.updateCampo() - ID: {id}, Campo: {campo}, Valor: {valor}")
+        logger.debug("🟢 TarefaDAO.updateCampo() - ID: %s, Campo: %s, Valor: %s", id, campo, valor)
         
         # ✅ CORREÇÃO: Query com verificação de usuario_responsavel_id
         if usuario_id:
@@ -197,17 +504,19 @@ class TarefaDAO:
             params = (valor, id)
         
         try:
+            self._nova_versao(tarefa_ids=[id], usuario_ids=[valor] if campo in ("usuario_responsavel_id", "usuario_atribuidor_id") else None)
             result = self.__database.execute_query(query, params)
+            self.__indices_locais.clear()
             return result > 0
         except Exception as e:
-            print(f"❌ Erro no TarefaDAO.updateCampo(): {e}")
+            logger.error("❌ Erro no TarefaDAO.updateCampo(): %s", e)
             raise e
 
     def marcarConcluida(self, id: int, concluida: bool, usuario_id: int = None) -> bool:
         """
         ✅ CORREÇÃO: Agora verifica por usuario_responsavel_id
         """
-        print(f"🟢 TarefaDAO.marcarConcluida() - ID: {id}, Concluída: {concluida}")
+        logger.debug("🟢 TarefaDAO.marcarConcluida() - ID: %s, Concluída: %s", id, concluida)
         
         # ✅ CORREÇÃO: Query com verificação de usuario_responsavel_id
         if usuario_id:
@@ -218,17 +527,19 @@ class TarefaDAO:
             params = (concluida, id)
         
         try:
+            self._nova_versao(tarefa_ids=[id])
             result = self.__database.execute_query(query, params)
+            self.__indices_locais.clear()
             return result > 0
         except Exception as e:
-            print(f"❌ Erro no TarefaDAO.marcarConcluida(): {e}")
+            logger.error("❌ Erro no TarefaDAO.marcarConcluida(): %s", e)
             raise e
 
     def findAll(self, usuario_id: int = None) -> list[dict]:
         """
         ✅ CORREÇÃO: Query atualizada com novos campos
         """
-        print("🟢 TarefaDAO.findAll()")
+        logger.debug("🟢 TarefaDAO.findAll()")
         try:
             if usuario_id:
                 SQL = """
@@ -309,14 +620,69 @@ class TarefaDAO:
             return tarefas
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findAll(): {e}")
+            logger.error("❌ Erro em TarefaDAO.findAll(): %s", e)
+            raise
+
+    def streamAll(self, usuario_id: int = None, tamanho_lote: int = 500, filtros: dict = None,
+                  limite: int = None):
+        """
+        ✅ NOVO: Mesmas colunas de findAll(), entregues uma a uma (gerador) a
+        partir de um cursor sem buffer, para exportações em memória constante.
+
+        :param filtros: dict - Mesmos filtros de findFiltered() (FILTROS)
+        :param limite: int - Máximo de linhas (None = todas)
+
+        Ordena por id (chave primária) em vez da ordem de exibição: o MySQL
+        começa a enviar linhas na hora, sem ordenar a tabela inteira antes.
+        """
+        logger.debug("🟢 TarefaDAO.streamAll()")
+        SQL = """
+            SELECT 
+                t.id, 
+                t.titulo,
+                t.descricao,
+                t.status,
+                t.prioridade,
+                t.concluida, 
+                t.data_limite, 
+                t.data_inicio,
+                t.data_fim,
+                t.projeto_id,
+                t.usuario_responsavel_id,
+                t.usuario_atribuidor_id,
+                p.nome as projeto_nome,
+                ur.nome as responsavel_nome,
+                ua.nome as atribuidor_nome
+            FROM tarefas t
+            LEFT JOIN projetos p ON t.projeto_id = p.id
+            LEFT JOIN usuarios ur ON t.usuario_responsavel_id = ur.id
+            LEFT JOIN usuarios ua ON t.usuario_atribuidor_id = ua.id
+        """
+        conditions = []
+        params = []
+        if usuario_id:
+            conditions.append("t.usuario_responsavel_id = %s")
+            params.append(usuario_id)
+        self._aplicar_filtros(filtros, conditions, params)
+        if conditions:
+            SQL += " WHERE " + " AND ".join(conditions)
+        SQL += " ORDER BY t.id"
+        if limite:
+            SQL += " LIMIT %s"
+            params.append(limite)
+
+        try:
+            for row in self.__database.stream_query(SQL, tuple(params), tamanho_lote=tamanho_lote):
+                yield self._row_to_dict(row)
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.streamAll(): %s", e)
             raise
 
     def findById(self, id: int, usuario_id: int = None) -> dict | None:
         """
         ✅ CORREÇÃO: Query atualizada com novos campos
         """
-        print("✅ TarefaDAO.findById()")
+        logger.debug("✅ TarefaDAO.findById()")
         try:
             if usuario_id:
                 SQL = """
@@ -378,14 +744,52 @@ class TarefaDAO:
             return self._row_to_dict(row)
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findById(): {e}")
+            logger.error("❌ Erro em TarefaDAO.findById(): %s", e)
+            raise
+
+    # ✅ NOVO: Vários registros em uma única consulta
+    def findManyByIds(self, ids: list, usuario_id: int = None, campos: tuple = None) -> list[dict]:
+        """
+        Busca várias tarefas por ID com WHERE id IN (...), em lotes de
+        TAMANHO_LOTE_IDS para listas muito grandes.
+
+        :param ids: list - IDs (repetidos são ignorados)
+        :param usuario_id: int - Se fornecido, só retorna tarefas em que o usuário é responsável
+        :param campos: tuple - Campos de PROJECAO a retornar (None = todos)
+        :return: list[dict] na ordem dos IDs; IDs inexistentes (ou de outro usuário) são omitidos
+        """
+        ids = list(dict.fromkeys(ids))
+        logger.debug("✅ TarefaDAO.findManyByIds() - %s IDs", len(ids))
+        try:
+            encontrados = {}
+            for inicio in range(0, len(ids), self.TAMANHO_LOTE_IDS):
+                lote = ids[inicio:inicio + self.TAMANHO_LOTE_IDS]
+                SQL = f"""
+                    SELECT
+                        {self.PROJECAO.select(campos)}
+                    FROM tarefas t
+                    {self.PROJECAO.joins(campos)}
+                    WHERE t.id IN ({', '.join(['%s'] * len(lote))})
+                """
+                params = list(lote)
+                if usuario_id:
+                    SQL += " AND t.usuario_responsavel_id = %s"
+                    params.append(usuario_id)
+
+                for row in self.__database.execute_query(SQL, tuple(params), fetch=True):
+                    encontrados[row["id"]] = self.PROJECAO.converter(row, campos) if campos else self._row_to_dict(row)
+
+            return [encontrados[id] for id in ids if id in encontrados]
+
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.findManyByIds(): %s", e)
             raise
 
     def findByField(self, campo: str, valor, usuario_id: int = None) -> list[dict]:
         """
         ✅ CORREÇÃO: Query atualizada com novos campos
         """
-        print(f"🟢 TarefaDAO.findByField() - Campo: {campo}, Valor: {valor}")
+        logger.debug("🟢 TarefaDAO.findByField() - Campo: %s, Valor: %s", campo, valor)
         try:
             # ✅ CORREÇÃO: Campos permitidos atualizados
             allowedFields = ["id", "titulo", "concluida", "projeto_id", "status", 
@@ -432,14 +836,14 @@ class TarefaDAO:
             return tarefas
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findByField(): {e}")
+            logger.error("❌ Erro em TarefaDAO.findByField(): %s", e)
             raise
 
     def findByProjetoId(self, projeto_id: int, usuario_id: int = None) -> list[dict]:
         """
         ✅ CORREÇÃO: Query atualizada com novos campos
         """
-        print("🟢 TarefaDAO.findByProjetoId()")
+        logger.debug("🟢 TarefaDAO.findByProjetoId()")
         try:
             if usuario_id:
                 SQL = """
@@ -516,14 +920,214 @@ class TarefaDAO:
             return tarefas
             
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.findByProjetoId(): {e}")
+            logger.error("❌ Erro em TarefaDAO.findByProjetoId(): %s", e)
+            raise
+
+    # ✅ CORREÇÃO: Chaves de ordenação de findPage() gravadas como colunas
+    # geradas (STORED) e cobertas por idx_tarefas_pagina (docs/Banco.sql):
+    # o keyset e o ORDER BY percorrem o índice em vez de ordenar todas as
+    # tarefas do usuário a cada página.
+    ORDEM_COLUNAS = {
+        "status": "t.ordem_status",
+        "prioridade": "t.prioridade_ord",
+        "data_limite": "t.data_limite_ord"
+    }
+    # Mesmas chaves calculadas na query, para bancos ainda sem as colunas.
+    # NULLs já ordenam primeiro (ASC) e por último (DESC) no MySQL;
+    # COALESCE mantém essa ordem e permite comparar o cursor com "=".
+    ORDEM_EXPRESSOES = {
+        "status": """
+            CASE
+                WHEN t.concluida = TRUE THEN 3
+                WHEN t.status = 'andamento' THEN 1
+                WHEN t.status = 'pendente' THEN 2
+                ELSE 4
+            END
+        """,
+        "prioridade": "COALESCE(t.prioridade, '')",
+        "data_limite": "COALESCE(t.data_limite, '1000-01-01 00:00:00')"
+    }
+
+    def findPage(self, usuario_id: int = None, limite: int = 50, cursor: list = None,
+                 projeto_id: int = None, atribuidor_id: int = None, filtros: dict = None,
+                 campos: tuple = None) -> dict:
+        """
+        ✅ NOVO: Paginação por cursor (keyset) sobre a mesma ordenação de findAll().
+
+        A ordenação é a tupla (ordem_status, prioridade DESC, data_limite, id),
+        lida das colunas geradas de ORDEM_COLUNAS. Em vez de OFFSET, cada
+        página continua do ponto do índice idx_tarefas_pagina em que a
+        anterior parou, então o custo não cresce com a profundidade da página.
+        Sem as colunas (erro 1054) usa ORDEM_EXPRESSOES, que ordena todas as
+        tarefas do usuário a cada página.
+
+        :param cursor: list - [ordem_status, prioridade, data_limite, id] da última linha
+        :param filtros: dict - Filtros adicionais (ver FILTROS)
+        :param campos: tuple - Campos de PROJECAO a retornar (None = todos)
+        :return: dict com "tarefas" e "next_cursor" (None na última página)
+        """
+        logger.debug("🟢 TarefaDAO.findPage() - Limite: %s, Cursor: %s", limite, cursor)
+        if self.__ordem_persistida:
+            try:
+                return self._findPage(self.ORDEM_COLUNAS, usuario_id, limite, cursor,
+                                      projeto_id, atribuidor_id, filtros, campos)
+            except Exception as e:
+                # 1054: colunas de ordenação ainda não criadas (ver docs/Banco.sql)
+                if getattr(e, 'errno', None) != 1054:
+                    logger.error("❌ Erro em TarefaDAO.findPage(): %s", e)
+                    raise
+                logger.warning("⚠️  Colunas de ordenação de tarefas não encontradas, ordenando na query")
+                self.__ordem_persistida = False
+        try:
+            return self._findPage(self.ORDEM_EXPRESSOES, usuario_id, limite, cursor,
+                                  projeto_id, atribuidor_id, filtros, campos)
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.findPage(): %s", e)
+            raise
+
+    def _findPage(self, ordem: dict, usuario_id, limite, cursor, projeto_id,
+                  atribuidor_id, filtros, campos) -> dict:
+        ordem_status, prioridade, data_limite = ordem["status"], ordem["prioridade"], ordem["data_limite"]
+
+        conditions = []
+        params = []
+
+        if usuario_id:
+            conditions.append("t.usuario_responsavel_id = %s")
+            params.append(usuario_id)
+        if projeto_id:
+            conditions.append("t.projeto_id = %s")
+            params.append(projeto_id)
+        if atribuidor_id:
+            conditions.append("t.usuario_atribuidor_id = %s AND t.usuario_responsavel_id <> %s")
+            params.extend([atribuidor_id, atribuidor_id])
+        self._aplicar_filtros(filtros, conditions, params)
+
+        if cursor:
+            c_status, c_prioridade, c_data_limite, c_id = cursor
+            # O primeiro termo é redundante, mas dá ao otimizador um intervalo
+            # (usuario_responsavel_id, ordem_status >= ...) para posicionar no índice
+            conditions.append(f"""
+                {ordem_status} >= %s AND
+                ({ordem_status} > %s OR ({ordem_status} = %s AND (
+                    {prioridade} < %s OR ({prioridade} = %s AND (
+                        {data_limite} > %s OR ({data_limite} = %s AND t.id > %s)
+                    ))
+                )))
+            """)
+            params.extend([c_status, c_status, c_status, c_prioridade, c_prioridade,
+                           c_data_limite, c_data_limite, c_id])
+
+        # prioridade e id são lidos sempre: compõem o próximo cursor
+        campos_select = campos
+        if campos and "prioridade" not in campos:
+            campos_select = campos + ("prioridade",)
+
+        SQL = f"""
+            SELECT
+                {self.PROJECAO.select(campos_select)},
+                {ordem_status} as ordem_status,
+                {data_limite} as ordem_data_limite
+            FROM tarefas t
+            {self.PROJECAO.joins(campos_select)}
+        """
+        if conditions:
+            SQL += " WHERE " + " AND ".join(conditions)
+
+        # Busca uma linha a mais para saber se existe próxima página
+        SQL += f"""
+            ORDER BY {ordem_status} ASC, {prioridade} DESC, {data_limite} ASC, t.id ASC
+            LIMIT %s
+        """
+        params.append(limite + 1)
+
+        rows = self.__database.execute_query(SQL, tuple(params), fetch=True)
+
+        tarefas = []
+        for row in rows[:limite]:
+            tarefas.append(self.PROJECAO.converter(row, campos) if campos else self._row_to_dict(row))
+
+        next_cursor = None
+        if len(rows) > limite:
+            ultima = rows[limite - 1]
+            next_cursor = [
+                ultima["ordem_status"],
+                ultima["prioridade"] or "",
+                str(ultima["ordem_data_limite"]),
+                ultima["id"]
+            ]
+
+        return {"tarefas": tarefas, "next_cursor": next_cursor}
+
+    # ✅ NOVO: Listagem com vários filtros combinados em uma única query
+    def findFiltered(self, usuario_id: int = None, filtros: dict = None, ordenar: str = "padrao",
+                     atribuidor_id: int = None, campos: tuple = None) -> list[dict]:
+        """
+        Lista tarefas aplicando os filtros de FILTROS e a ordenação de ORDENACOES.
+
+        :param usuario_id: int - Restringe às tarefas em que o usuário é responsável
+        :param filtros: dict - nome do filtro -> valor (lista para filtros "IN")
+        :param ordenar: str - Chave de ORDENACOES
+        :param atribuidor_id: int - Restringe às tarefas que o usuário atribuiu para outros
+        :param campos: tuple - Campos de PROJECAO a retornar (None = todos)
+        :raises ValueError: Se o filtro ou a ordenação não forem permitidos
+        """
+        logger.debug("🟢 TarefaDAO.findFiltered() - Filtros: %s, Ordenar: %s", filtros, ordenar)
+        if ordenar not in self.ORDENACOES:
+            raise ValueError(f"Ordenação inválida: {ordenar}")
+
+        try:
+            conditions = []
+            params = []
+
+            if usuario_id:
+                conditions.append("t.usuario_responsavel_id = %s")
+                params.append(usuario_id)
+            if atribuidor_id:
+                conditions.append("t.usuario_atribuidor_id = %s AND t.usuario_responsavel_id <> %s")
+                params.extend([atribuidor_id, atribuidor_id])
+            self._aplicar_filtros(filtros, conditions, params)
+
+            SQL = f"""
+                SELECT
+                    {self.PROJECAO.select(campos)}
+                FROM tarefas t
+                {self.PROJECAO.joins(campos)}
+            """
+            if conditions:
+                SQL += " WHERE " + " AND ".join(conditions)
+            SQL += " ORDER BY " + self.ORDENACOES[ordenar]
+
+            rows = self.__database.execute_query(SQL, tuple(params), fetch=True)
+            if campos:
+                return [self.PROJECAO.converter(row, campos) for row in rows]
+            return [self._row_to_dict(row) for row in rows]
+
+        except Exception as e:
+            logger.error("❌ Erro em TarefaDAO.findFiltered(): %s", e)
             raise
 
+    def _aplicar_filtros(self, filtros: dict, conditions: list, params: list):
+        """Acrescenta as condições de FILTROS em conditions/params"""
+        for nome, valor in (filtros or {}).items():
+            if nome not in self.FILTROS:
+                raise ValueError(f"Filtro inválido: {nome}")
+            coluna, operador = self.FILTROS[nome]
+            if operador == "IN":
+                valores = list(valor) if isinstance(valor, (list, tuple, set)) else [valor]
+                if not valores:
+                    continue
+                conditions.append(f"{coluna} IN ({', '.join(['%s'] * len(valores))})")
+                params.extend(valores)
+            else:
+                conditions.append(f"{coluna} {operador} %s")
+                params.append(valor)
+
     def marcarComoConcluida(self, id: int, usuario_id: int = None) -> bool:
         """
         ✅ CORREÇÃO: Agora verifica por usuario_responsavel_id
         """
-        print("🟢 TarefaDAO.marcarComoConcluida()")
+        logger.debug("🟢 TarefaDAO.marcarComoConcluida()")
         try:
             if usuario_id:
                 SQL = "UPDATE tarefas SET concluida = TRUE WHERE id = %s AND usuario_responsavel_id = %s"
@@ -532,12 +1136,126 @@ class TarefaDAO:
                 SQL = "UPDATE tarefas SET concluida = TRUE WHERE id = %s"
                 params = (id,)
                 
+            self._nova_versao(tarefa_ids=[id])
             affected = self.__database.execute_query(SQL, params)
+            self.__indices_locais.clear()
             return affected > 0
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.marcarComoConcluida(): {e}")
+            logger.error("❌ Erro em TarefaDAO.marcarComoConcluida(): %s", e)
             raise
 
+    # ✅ NOVO: Busca textual com ranking por relevância
+    def search(self, usuario_id: int, termo: str, limite: int = 20) -> list[dict]:
+        """
+        Busca, por título/descrição, tarefas em que o usuário é responsável
+        ou atribuidor.
+
+        - MySQL: índice FULLTEXT (titulo, descricao) em modo booleano,
+          ordenado por relevância e limitado no banco.
+        - Bancos sem FULLTEXT (MockDatabase/SQLite): índice invertido em memória.
+
+        :return: list[dict] - Tarefas com o campo "relevancia"
+        """
+        logger.debug("🟢 TarefaDAO.search() - Termo: %s", termo)
+        if not getattr(self.__database, 'suporta_fulltext', False):
+            return self._search_local(usuario_id, termo, limite)
+
+        consulta = IndiceInvertido.consulta_fulltext(termo)
+        try:
+            if consulta:
+                SQL = """
+                    SELECT 
+                        t.id, 
+                        t.titulo,
+                        t.descricao,
+                        t.status,
+                        t.prioridade,
+                        t.concluida, 
+                        t.data_limite, 
+                        t.data_inicio,
+                        t.data_fim,
+                        t.projeto_id,
+                        t.usuario_responsavel_id,
+                        t.usuario_atribuidor_id,
+                        p.nome as projeto_nome,
+                        ur.nome as responsavel_nome,
+                        ua.nome as atribuidor_nome,
+                        MATCH(t.titulo, t.descricao) AGAINST (%s IN BOOLEAN MODE) AS relevancia
+                    FROM tarefas t
+                    LEFT JOIN projetos p ON t.projeto_id = p.id
+                    LEFT JOIN usuarios ur ON t.usuario_responsavel_id = ur.id
+                    LEFT JOIN usuarios ua ON t.usuario_atribuidor_id = ua.id
+                    WHERE (t.usuario_responsavel_id = %s OR t.usuario_atribuidor_id = %s)
+                      AND MATCH(t.titulo, t.descricao) AGAINST (%s IN BOOLEAN MODE)
+                    ORDER BY relevancia DESC, t.id DESC
+                    LIMIT %s
+                """
+                rows = self.__database.execute_query(
+                    SQL, (consulta, usuario_id, usuario_id, consulta, int(limite)), fetch=True
+                )
+            else:
+                rows = self._search_like(usuario_id, termo, limite)
+        except Exception as e:
+            # 1191: índice FULLTEXT ainda não criado (ver docs/Banco.sql)
+            if getattr(e, 'errno', None) != 1191:
+                logger.error("❌ Erro em TarefaDAO.search(): %s", e)
+                raise
+            logger.warning("⚠️  Índice FULLTEXT de tarefas não encontrado, usando LIKE")
+            rows = self._search_like(usuario_id, termo, limite)
+
+        tarefas = []
+        for row in rows:
+            tarefa_data = self._row_to_dict(row)
+            tarefa_data["relevancia"] = float(row.get("relevancia") or 0)
+            tarefas.append(tarefa_data)
+        return tarefas
+
+    def _search_like(self, usuario_id: int, termo: str, limite: int) -> list[dict]:
+        """Busca por substring, para termos curtos demais para o FULLTEXT"""
+        SQL = """
+            SELECT 
+                t.id, 
+                t.titulo,
+                t.descricao,
+                t.status,
+                t.prioridade,
+                t.concluida, 
+                t.data_limite, 
+                t.data_inicio,
+                t.data_fim,
+                t.projeto_id,
+                t.usuario_responsavel_id,
+                t.usuario_atribuidor_id,
+                p.nome as projeto_nome,
+                ur.nome as responsavel_nome,
+                ua.nome as atribuidor_nome,
+                0 AS relevancia
+            FROM tarefas t
+            LEFT JOIN projetos p ON t.projeto_id = p.id
+            LEFT JOIN usuarios ur ON t.usuario_responsavel_id = ur.id
+            LEFT JOIN usuarios ua ON t.usuario_atribuidor_id = ua.id
+            WHERE (t.usuario_responsavel_id = %s OR t.usuario_atribuidor_id = %s)
+              AND (t.titulo LIKE %s ESCAPE '\\\\' OR t.descricao LIKE %s ESCAPE '\\\\')
+            ORDER BY t.id DESC
+            LIMIT %s
+        """
+        padrao = IndiceInvertido.padrao_like(termo)
+        return self.__database.execute_query(
+            SQL, (usuario_id, usuario_id, padrao, padrao, int(limite)), fetch=True
+        )
+
+    def _search_local(self, usuario_id: int, termo: str, limite: int) -> list[dict]:
+        """Busca no índice invertido em memória do usuário"""
+        indice = self.__indices_locais.get(usuario_id)
+        if indice is None:
+            indice = IndiceInvertido(pesos={"titulo": 2, "descricao": 1})
+            tarefas = self.findAll(usuario_id) + self.findByField("usuario_atribuidor_id", usuario_id)
+            for tarefa in tarefas:
+                indice.adicionar(tarefa["id"], {"titulo": tarefa["titulo"], "descricao": tarefa["descricao"]}, tarefa)
+            self.__indices_locais.set(usuario_id, indice, expira_em=time.time() + self.INDICE_LOCAL_TTL)
+
+        return [dict(tarefa, relevancia=relevancia) for tarefa, relevancia in indice.buscar(termo, limite)]
+
     def _row_to_dict(self, row: dict) -> dict:
         """
         ✅ CORREÇÃO: Método auxiliar atualizado para novos campos
@@ -557,16 +1275,10 @@ class TarefaDAO:
             "atribuidor_nome": row.get("atribuidor_nome")
         }
         
-        # ✅ CORREÇÃO: Tratamento seguro para datas
-        date_fields = ["data_limite", "data_inicio", "data_fim"]
-        for field in date_fields:
-            if row.get(field):
-                if hasattr(row[field], 'isoformat'):
-                    tarefa_data[field] = row[field].isoformat()
-                else:
-                    tarefa_data[field] = str(row[field])
-            else:
-                tarefa_data[field] = None
+        # ✅ OTIMIZAÇÃO: Datas seguem como date/datetime; o JsonProviderRapido
+        # as serializa em ISO 8601 (sem isoformat() por campo)
+        for field in ("data_limite", "data_inicio", "data_fim"):
+            tarefa_data[field] = row.get(field) or None
                 
         return tarefa_data
 
@@ -574,62 +1286,80 @@ class TarefaDAO:
         """
         ✅ NOVO: Método específico para buscar tarefas de um usuário
         """
-        print(f"🟢 TarefaDAO.getTarefasByUsuario() - Usuario ID: {usuario_id}")
+        logger.debug("🟢 TarefaDAO.getTarefasByUsuario() - Usuario ID: %s", usuario_id)
         return self.findAll(usuario_id=usuario_id)
 
-    def getEstatisticasUsuario(self, usuario_id: int) -> dict:
+    def agregarEstatisticas(self, usuario_id: int = None, projeto_id: int = None,
+                            data_inicio: str = None, data_fim: str = None, filtros: dict = None) -> dict:
         """
-        ✅ CORREÇÃO: Query atualizada para usuario_responsavel_id
+        ✅ NOVO: Estatísticas do dashboard calculadas no banco em uma única query.
+
+        Agrupa por (status, prioridade, concluida), de modo que o resultado tem
+        no máximo algumas dezenas de linhas independentemente do total de tarefas.
+        Os filtros de projeto e de intervalo de data_limite são opcionais.
+
+        :param filtros: dict - Mesmos filtros de findFiltered() (FILTROS)
         """
-        print(f"🟢 TarefaDAO.getEstatisticasUsuario() - Usuario ID: {usuario_id}")
+        logger.debug("🟢 TarefaDAO.agregarEstatisticas() - Usuario ID: %s", usuario_id)
         try:
             SQL = """
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN concluida = TRUE THEN 1 ELSE 0 END) as concluidas,
-                    SUM(CASE WHEN concluida = FALSE THEN 1 ELSE 0 END) as pendentes,
-                    SUM(CASE WHEN status = 'andamento' THEN 1 ELSE 0 END) as em_andamento,
-                    SUM(CASE WHEN prioridade = 'alta' THEN 1 ELSE 0 END) as prioridade_alta,
-                    SUM(CASE WHEN prioridade = 'media' THEN 1 ELSE 0 END) as prioridade_media,
-                    SUM(CASE WHEN prioridade = 'baixa' THEN 1 ELSE 0 END) as prioridade_baixa
-                FROM tarefas 
-                WHERE usuario_responsavel_id = %s
+                SELECT
+                    t.status,
+                    t.prioridade,
+                    t.concluida,
+                    COUNT(*) as total
+                FROM tarefas t
             """
-            rows = self.__database.execute_query(SQL, (usuario_id,), fetch=True)
-            
-            if not rows:
-                return {
-                    "total": 0,
-                    "concluidas": 0,
-                    "pendentes": 0,
-                    "em_andamento": 0,
-                    "prioridade_alta": 0,
-                    "prioridade_media": 0,
-                    "prioridade_baixa": 0
-                }
-                
-            row = rows[0]
+            conditions = []
+            params = []
+
+            if usuario_id:
+                conditions.append("t.usuario_responsavel_id = %s")
+                params.append(usuario_id)
+            if projeto_id:
+                conditions.append("t.projeto_id = %s")
+                params.append(projeto_id)
+            if data_inicio:
+                conditions.append("t.data_limite >= %s")
+                params.append(data_inicio)
+            if data_fim:
+                conditions.append("t.data_limite <= %s")
+                params.append(data_fim)
+            self._aplicar_filtros(filtros, conditions, params)
+
+            if conditions:
+                SQL += " WHERE " + " AND ".join(conditions)
+            SQL += " GROUP BY t.status, t.prioridade, t.concluida"
+
+            rows = self.__database.execute_query(SQL, tuple(params) if params else None, fetch=True)
+
+            total = 0
+            concluidas = 0
+            por_prioridade = {"alta": 0, "media": 0, "baixa": 0}
+            por_status = {}
+
+            for row in rows:
+                quantidade = row["total"] or 0
+                total += quantidade
+                if row["concluida"]:
+                    concluidas += quantidade
+                if row["prioridade"] in por_prioridade:
+                    por_prioridade[row["prioridade"]] += quantidade
+                status = row["status"] or "pendente"
+                por_status[status] = por_status.get(status, 0) + quantidade
+
             return {
-                "total": row["total"] or 0,
-                "concluidas": row["concluidas"] or 0,
-                "pendentes": row["pendentes"] or 0,
-                "em_andamento": row["em_andamento"] or 0,
-                "prioridade_alta": row["prioridade_alta"] or 0,
-                "prioridade_media": row["prioridade_media"] or 0,
-                "prioridade_baixa": row["prioridade_baixa"] or 0
+                "total": total,
+                "concluidas": concluidas,
+                "pendentes": total - concluidas,
+                "por_prioridade": por_prioridade,
+                "por_status": por_status,
+                "taxa_conclusao": round((concluidas / total * 100), 2) if total > 0 else 0
             }
-            
+
         except Exception as e:
-            print(f"❌ Erro em TarefaDAO.getEstatisticasUsuario(): {e}")
-            return {
-                "total": 0,
-                "concluidas": 0,
-                "pendentes": 0,
-                "em_andamento": 0,
-                "prioridade_alta": 0,
-                "prioridade_media": 0,
-                "prioridade_baixa": 0
-            }
+            logger.error("❌ Erro em TarefaDAO.agregarEstatisticas(): %s", e)
+            raise
 
     def count_by_projeto_id(self, projeto_id: int) -> int:
         """
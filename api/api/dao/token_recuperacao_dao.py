@@ -0,0 +1,131 @@
+# dao/token_recuperacao_dao.py
+import hashlib
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+"""
+Classe responsável por persistir os tokens de recuperação de senha.
+
+Apenas o SHA-256 do token é gravado; o token em si só existe no email
+enviado ao usuário. A expiração é calculada pelo próprio MySQL (NOW()),
+para que todos os processos da aplicação concordem sobre a validade.
+"""
+
+class TokenRecuperacaoDAO:
+    def __init__(self, database_dependency):
+        logger.debug("⬆️  TokenRecuperacaoDAO.__init__()")
+        self.__database = database_dependency
+        self._create_tables()
+
+    def _create_tables(self):
+        """Cria a tabela de tokens se não existir"""
+        logger.debug("🟢 TokenRecuperacaoDAO._create_tables()")
+        try:
+            SQL = '''
+                CREATE TABLE IF NOT EXISTS tokens_recuperacao (
+                    id INT PRIMARY KEY AUTO_INCREMENT,
+                    token_hash CHAR(64) NOT NULL,
+                    usuario_id INT NOT NULL,
+                    email VARCHAR(255) NOT NULL,
+                    expira_em DATETIME NOT NULL,
+                    data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    INDEX idx_tokens_recuperacao_hash_expira (token_hash, expira_em),
+                    INDEX idx_tokens_recuperacao_expira (expira_em)
+                )
+            '''
+            self.__database.execute_query(SQL)
+            logger.debug("✅ Tabela 'tokens_recuperacao' criada/verificada com sucesso!")
+        except Exception as e:
+            logger.error("❌ Erro em TokenRecuperacaoDAO._create_tables(): %s", e)
+
+    @staticmethod
+    def _hash(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def create(self, token: str, usuario_id: int, email: str, validade_segundos: int = 3600) -> int:
+        """
+        Grava um novo token de recuperação.
+
+        :param token: Token enviado ao usuário (somente o hash é gravado)
+        :param validade_segundos: Tempo de vida do token
+        :return: ID do registro
+        """
+        logger.debug("🟢 TokenRecuperacaoDAO.create() - Usuário: %s", usuario_id)
+        try:
+            SQL = '''
+                INSERT INTO tokens_recuperacao (token_hash, usuario_id, email, expira_em)
+                VALUES (%s, %s, %s, DATE_ADD(NOW(), INTERVAL %s SECOND))
+            '''
+            return self.__database.execute_query(
+                SQL, (self._hash(token), usuario_id, email, int(validade_segundos))
+            )
+        except Exception as e:
+            logger.error("❌ Erro em TokenRecuperacaoDAO.create(): %s", e)
+            raise
+
+    def find_valido(self, token: str):
+        """
+        Busca um token ainda não expirado.
+
+        :return: dict {id, usuario_id, email, expira_em} ou None
+        """
+        try:
+            SQL = '''
+                SELECT id, usuario_id, email, expira_em
+                FROM tokens_recuperacao
+                WHERE token_hash = %s AND expira_em > NOW()
+                LIMIT 1
+            '''
+            result = self.__database.execute_query(SQL, (self._hash(token),), fetch=True)
+            if result and len(result) > 0:
+                return result[0]
+            return None
+        except Exception as e:
+            logger.error("❌ Erro em TokenRecuperacaoDAO.find_valido(): %s", e)
+            raise
+
+    def consumir(self, token: str):
+        """
+        Invalida o token (uso único) e retorna seus dados.
+
+        O DELETE condicional garante que, entre requisições concorrentes
+        com o mesmo token, apenas uma consiga usá-lo.
+
+        :return: dict {id, usuario_id, email, expira_em} ou None se inválido/expirado/já usado
+        """
+        logger.debug("🟢 TokenRecuperacaoDAO.consumir()")
+        try:
+            registro = self.find_valido(token)
+            if not registro:
+                return None
+
+            SQL = "DELETE FROM tokens_recuperacao WHERE id = %s"
+            affected = self.__database.execute_query(SQL, (registro['id'],))
+            return registro if affected > 0 else None
+        except Exception as e:
+            logger.error("❌ Erro em TokenRecuperacaoDAO.consumir(): %s", e)
+            raise
+
+    def delete_expirados(self, lote: int = 500) -> int:
+        """
+        Remove tokens expirados em lotes (DELETE ... LIMIT), sem segurar
+        locks da tabela inteira por muito tempo.
+
+        :param lote: Quantidade máxima de linhas por DELETE
+        :return: Total de linhas removidas
+        """
+        total = 0
+        try:
+            SQL = "DELETE FROM tokens_recuperacao WHERE expira_em <= NOW() LIMIT %s"
+            while True:
+                affected = self.__database.execute_query(SQL, (lote,))
+                total += affected
+                if affected < lote:
+                    break
+            if total:
+                logger.info("🧹 %s tokens de recuperação expirados removidos", total)
+            return total
+        except Exception as e:
+            logger.error("❌ Erro em TokenRecuperacaoDAO.delete_expirados(): %s", e)
+            return total
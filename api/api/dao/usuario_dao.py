@@ -1,16 +1,36 @@
 # dao/usuario_dao.py
 from datetime import datetime
 from api.model.usuario import Usuario
+from api.utils.logger import Logger
+from api.utils.projecao import Projecao
+
+logger = Logger.get_logger(__name__)
 
 class UsuarioDAO:
+    # ✅ NOVO: Máximo de IDs por consulta em find_many_by_ids()
+    TAMANHO_LOTE_IDS = 500
+
+    # ✅ NOVO: Campos projetáveis na listagem (?fields=); senha_hash nunca é exposto
+    PROJECAO = Projecao(
+        campos={
+            "id": ("id", None),
+            "nome": ("nome", None),
+            "email": ("email", None),
+            "data_criacao": ("data_criacao", None),
+        },
+        conversores={
+            "data_criacao": lambda d: d.strftime('%Y-%m-%d %H:%M:%S') if hasattr(d, 'strftime') else str(d)
+        }
+    )
+
     def __init__(self, database_dependency):
-        print("⬆️  UsuarioDAO.__init__()")
+        logger.debug("⬆️  UsuarioDAO.__init__()")
         self.__database = database_dependency
         self._create_tables()
 
     def _create_tables(self):
         """Cria as tabelas necessárias se não existirem"""
-        print("🟢 UsuarioDAO._create_tables()")
+        logger.debug("🟢 UsuarioDAO._create_tables()")
         try:
             SQL = '''
                 CREATE TABLE IF NOT EXISTS usuarios (
@@ -24,9 +44,9 @@ class UsuarioDAO:
                 )
             '''
             self.__database.execute_query(SQL)
-            print("✅ Tabela 'usuarios' criada/verificada com sucesso!")
+            logger.debug("✅ Tabela 'usuarios' criada/verificada com sucesso!")
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO._create_tables(): {e}")
+            logger.error("❌ Erro em UsuarioDAO._create_tables(): %s", e)
 
     def email_exists(self, email: str) -> bool:
         """
@@ -34,13 +54,13 @@ class UsuarioDAO:
         :param email: Email a verificar
         :return: Boolean indicando se existe
         """
-        print(f"🟢 UsuarioDAO.email_exists() - Email: {email}")
+        logger.debug("🟢 UsuarioDAO.email_exists() - Email: %s", email)
         try:
             SQL = "SELECT id FROM usuarios WHERE email = %s"
             result = self.__database.execute_query(SQL, (email,), fetch=True)
             return len(result) > 0
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.email_exists(): {e}")
+            logger.error("❌ Erro em UsuarioDAO.email_exists(): %s", e)
             raise
 
     def create(self, usuario: Usuario) -> int:
@@ -49,7 +69,7 @@ class UsuarioDAO:
         :param usuario: Objeto Usuario
         :return: ID do usuário criado
         """
-        print("🟢 UsuarioDAO.create()")
+        logger.debug("🟢 UsuarioDAO.create()")
         try:
             SQL = '''
                 INSERT INTO usuarios (nome, email, senha_hash, empresa, data_criacao)
@@ -72,9 +92,45 @@ class UsuarioDAO:
         except Exception as e:
             if "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
                 raise ValueError("Email já cadastrado")
-            print(f"❌ Erro em UsuarioDAO.create(): {e}")
+            logger.error("❌ Erro em UsuarioDAO.create(): %s", e)
             raise
     
+    def count(self) -> int:
+        """
+        ✅ NOVO: Total de usuários cadastrados (COUNT no banco)
+        """
+        logger.debug("🟢 UsuarioDAO.count()")
+        try:
+            SQL = "SELECT COUNT(*) AS total FROM usuarios"
+            result = self.__database.execute_query(SQL, fetch=True)
+            return int(result[0]["total"]) if result else 0
+        except Exception as e:
+            logger.error("❌ Erro em UsuarioDAO.count(): %s", e)
+            raise
+
+    def resumo(self) -> dict:
+        """
+        ✅ NOVO: Total, maior id e última atualização dos usuários em uma
+        consulta agregada. Muda sempre que um usuário é criado, alterado ou
+        removido, então serve como versão da lista de usuários.
+        """
+        logger.debug("🟢 UsuarioDAO.resumo()")
+        try:
+            SQL = """
+                SELECT COUNT(*) AS total, MAX(id) AS ultimo_id, MAX(data_atualizacao) AS ultima_atualizacao
+                FROM usuarios
+            """
+            result = self.__database.execute_query(SQL, fetch=True)
+            row = result[0] if result else {}
+            return {
+                "total": int(row.get("total") or 0),
+                "ultimo_id": row.get("ultimo_id"),
+                "ultima_atualizacao": row.get("ultima_atualizacao")
+            }
+        except Exception as e:
+            logger.error("❌ Erro em UsuarioDAO.resumo(): %s", e)
+            raise
+
     def buscar_por_email(self, email):
         """
         Busca um usuário pelo email
@@ -88,7 +144,7 @@ class UsuarioDAO:
             return None
             
         except Exception as e:
-            print(f"❌ Erro ao buscar usuário por email: {e}")
+            logger.error("❌ Erro ao buscar usuário por email: %s", e)
             return None
 
     def buscar_por_id(self, usuario_id):
@@ -104,7 +160,7 @@ class UsuarioDAO:
             return None
             
         except Exception as e:
-            print(f"❌ Erro ao buscar usuário por ID: {e}")
+            logger.error("❌ Erro ao buscar usuário por ID: %s", e)
             return None
 
     def atualizar_senha(self, usuario_id, senha_hash):
@@ -117,7 +173,7 @@ class UsuarioDAO:
             return result > 0
             
         except Exception as e:
-            print(f"❌ Erro ao atualizar senha: {e}")
+            logger.error("❌ Erro ao atualizar senha: %s", e)
             return False
     
     def find_by_id(self, usuario_id: int) -> Usuario | None:
@@ -126,7 +182,7 @@ class UsuarioDAO:
         :param usuario_id: ID do usuário
         :return: Objeto Usuario ou None
         """
-        print(f"✅ UsuarioDAO.find_by_id() - ID: {usuario_id}")
+        logger.debug("✅ UsuarioDAO.find_by_id() - ID: %s", usuario_id)
         try:
             SQL = '''
                 SELECT id, nome, email, senha_hash, empresa, data_criacao, data_atualizacao
@@ -137,48 +193,80 @@ class UsuarioDAO:
             if not rows:
                 return None
 
-            row = rows[0]
-            usuario = Usuario()
-            usuario.id = row["id"]
-            usuario.nome = row["nome"]
-            usuario.email = row["email"]
-            usuario.senha_hash = row["senha_hash"]
-            
-            # ✅ CORREÇÃO: Verifica se a coluna empresa existe antes de acessar
-            usuario.empresa = row.get("empresa")  # Usa get() para evitar KeyError
-            
-            # Tratamento para datas
-            if row["data_criacao"]:
-                if hasattr(row["data_criacao"], 'isoformat'):
-                    usuario.data_criacao = row["data_criacao"]
-                else:
-                    try:
-                        usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S')
-                    except ValueError:
-                        usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S.%f')
-            
-            if row["data_atualizacao"]:
-                if hasattr(row["data_atualizacao"], 'isoformat'):
-                    usuario.data_atualizacao = row["data_atualizacao"]
-                else:
-                    try:
-                        usuario.data_atualizacao = datetime.strptime(str(row["data_atualizacao"]), '%Y-%m-%d %H:%M:%S')
-                    except ValueError:
-                        usuario.data_atualizacao = datetime.strptime(str(row["data_atualizacao"]), '%Y-%m-%d %H:%M:%S.%f')
-            
-            return usuario
+            return self._row_to_usuario(rows[0])
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.find_by_id(): {e}")
+            logger.error("❌ Erro em UsuarioDAO.find_by_id(): %s", e)
             raise
 
+    # ✅ NOVO: Vários usuários em uma única consulta
+    def find_many_by_ids(self, ids: list) -> list[Usuario]:
+        """
+        Busca vários usuários por ID com WHERE id IN (...), em lotes de
+        TAMANHO_LOTE_IDS para listas muito grandes.
+        :param ids: IDs dos usuários (repetidos são ignorados)
+        :return: Lista de objetos Usuario na ordem dos IDs; IDs inexistentes são omitidos
+        """
+        ids = list(dict.fromkeys(ids))
+        logger.debug("✅ UsuarioDAO.find_many_by_ids() - %s IDs", len(ids))
+        try:
+            encontrados = {}
+            for inicio in range(0, len(ids), self.TAMANHO_LOTE_IDS):
+                lote = ids[inicio:inicio + self.TAMANHO_LOTE_IDS]
+                SQL = f'''
+                    SELECT id, nome, email, senha_hash, empresa, data_criacao, data_atualizacao
+                    FROM usuarios WHERE id IN ({', '.join(['%s'] * len(lote))})
+                '''
+                for row in self.__database.execute_query(SQL, tuple(lote), fetch=True):
+                    encontrados[row["id"]] = self._row_to_usuario(row)
+
+            return [encontrados[id] for id in ids if id in encontrados]
+
+        except Exception as e:
+            logger.error("❌ Erro em UsuarioDAO.find_many_by_ids(): %s", e)
+            raise
+
+    def _row_to_usuario(self, row: dict) -> Usuario:
+        """
+        ✅ NOVO: Converte uma linha do banco em objeto Usuario
+        """
+        usuario = Usuario()
+        usuario.id = row["id"]
+        usuario.nome = row["nome"]
+        usuario.email = row["email"]
+        usuario.senha_hash = row["senha_hash"]
+        
+        # ✅ CORREÇÃO: Verifica se a coluna empresa existe antes de acessar
+        usuario.empresa = row.get("empresa")  # Usa get() para evitar KeyError
+        
+        # Tratamento para datas
+        if row["data_criacao"]:
+            if hasattr(row["data_criacao"], 'isoformat'):
+                usuario.data_criacao = row["data_criacao"]
+            else:
+                try:
+                    usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S')
+                except ValueError:
+                    usuario.data_criacao = datetime.strptime(str(row["data_criacao"]), '%Y-%m-%d %H:%M:%S.%f')
+        
+        if row["data_atualizacao"]:
+            if hasattr(row["data_atualizacao"], 'isoformat'):
+                usuario.data_atualizacao = row["data_atualizacao"]
+            else:
+                try:
+                    usuario.data_atualizacao = datetime.strptime(str(row["data_atualizacao"]), '%Y-%m-%d %H:%M:%S')
+                except ValueError:
+                    usuario.data_atualizacao = datetime.strptime(str(row["data_atualizacao"]), '%Y-%m-%d %H:%M:%S.%f')
+
+        return usuario
+
     def find_by_email(self, email: str) -> Usuario | None:
         """
         Busca usuário por email
         :param email: Email do usuário
         :return: Objeto Usuario ou None
         """
-        print(f"🟢 UsuarioDAO.find_by_email() - Email: {email}")
+        logger.debug("🟢 UsuarioDAO.find_by_email() - Email: %s", email)
         try:
             SQL = '''
                 SELECT id, nome, email, senha_hash, empresa, data_criacao, data_atualizacao
@@ -221,7 +309,7 @@ class UsuarioDAO:
             return usuario
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.find_by_email(): {e}")
+            logger.error("❌ Erro em UsuarioDAO.find_by_email(): %s", e)
             raise
 
     def find_all(self) -> list[Usuario]:
@@ -229,7 +317,7 @@ class UsuarioDAO:
         Retorna todos os usuários
         :return: Lista de objetos Usuario
         """
-        print("🟢 UsuarioDAO.find_all()")
+        logger.debug("🟢 UsuarioDAO.find_all()")
         try:
             SQL = '''
                 SELECT id, nome, email, senha_hash, empresa, data_criacao, data_atualizacao
@@ -269,11 +357,45 @@ class UsuarioDAO:
                 
                 usuarios.append(usuario)
 
-            print(f"✅ UsuarioDAO.find_all() encontrou {len(usuarios)} usuários")
+            logger.debug("✅ UsuarioDAO.find_all() encontrou %s usuários", len(usuarios))
             return usuarios
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.find_all(): {e}")
+            logger.error("❌ Erro em UsuarioDAO.find_all(): %s", e)
+            raise
+
+    def stream_all(self, tamanho_lote: int = 500, limite: int = None):
+        """
+        ✅ NOVO: Dados públicos dos usuários (sem senha), entregues um a um
+        (gerador) a partir de um cursor sem buffer, para exportações.
+
+        :param limite: int - Máximo de linhas (None = todas)
+        """
+        logger.debug("🟢 UsuarioDAO.stream_all()")
+        SQL = "SELECT id, nome, email, data_criacao FROM usuarios ORDER BY nome"
+        params = None
+        if limite:
+            SQL += " LIMIT %s"
+            params = (limite,)
+        try:
+            yield from self.__database.stream_query(SQL, params, tamanho_lote=tamanho_lote)
+        except Exception as e:
+            logger.error("❌ Erro em UsuarioDAO.stream_all(): %s", e)
+            raise
+
+    def find_all_campos(self, campos: tuple) -> list[dict]:
+        """
+        ✅ NOVO: Lista todos os usuários lendo só as colunas pedidas
+        :param campos: tuple - Campos de PROJECAO
+        :return: Lista de dicionários
+        """
+        logger.debug("🟢 UsuarioDAO.find_all_campos() - Campos: %s", campos)
+        try:
+            SQL = f"SELECT {self.PROJECAO.select(campos)} FROM usuarios ORDER BY nome"
+            rows = self.__database.execute_query(SQL, fetch=True)
+            return [self.PROJECAO.converter(row, campos) for row in rows]
+        except Exception as e:
+            logger.error("❌ Erro em UsuarioDAO.find_all_campos(): %s", e)
             raise
 
     def update(self, usuario: Usuario) -> bool:
@@ -282,7 +404,7 @@ class UsuarioDAO:
         :param usuario: Objeto Usuario
         :return: Boolean indicando sucesso
         """
-        print(f"🟢 UsuarioDAO.update() - ID: {usuario.id}")
+        logger.debug("🟢 UsuarioDAO.update() - ID: %s", usuario.id)
         try:
             SQL = '''
                 UPDATE usuarios 
@@ -303,7 +425,7 @@ class UsuarioDAO:
         except Exception as e:
             if "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
                 raise ValueError("Email já cadastrado")
-            print(f"❌ Erro em UsuarioDAO.update(): {e}")
+            logger.error("❌ Erro em UsuarioDAO.update(): %s", e)
             raise
 
     def delete(self, usuario_id: int) -> bool:
@@ -312,12 +434,12 @@ class UsuarioDAO:
         :param usuario_id: ID do usuário
         :return: Boolean indicando sucesso
         """
-        print(f"🟢 UsuarioDAO.delete() - ID: {usuario_id}")
+        logger.debug("🟢 UsuarioDAO.delete() - ID: %s", usuario_id)
         try:
             SQL = 'DELETE FROM usuarios WHERE id = %s'
             affected = self.__database.execute_query(SQL, (usuario_id,))
             return affected > 0
 
         except Exception as e:
-            print(f"❌ Erro em UsuarioDAO.delete(): {e}")
+            logger.error("❌ Erro em UsuarioDAO.delete(): %s", e)
             raise
\ No newline at end of file
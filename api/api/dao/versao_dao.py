@@ -0,0 +1,135 @@
+# dao/versao_dao.py
+from flask import g, has_request_context
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+"""
+Classe responsável pelo contador de versão dos dados de cada usuário.
+
+Toda escrita em tarefas/projetos incrementa a versão dos usuários afetados
+(na mesma transação da escrita). A versão é usada como ETag das listagens:
+uma listagem sem mudanças custa uma leitura por chave primária.
+
+Uma versão nova começa em UNIX_TIMESTAMP() e não em 1, para que um banco
+recriado não repita ETags já vistas pelos navegadores.
+"""
+
+class VersaoDAO:
+    def __init__(self, database_dependency):
+        logger.debug("⬆️  VersaoDAO.__init__()")
+        self.__database = database_dependency
+        self._create_tables()
+
+    def _create_tables(self):
+        """Cria a tabela de versões se não existir"""
+        logger.debug("🟢 VersaoDAO._create_tables()")
+        try:
+            SQL = '''
+                CREATE TABLE IF NOT EXISTS versoes_usuario (
+                    usuario_id INT PRIMARY KEY,
+                    versao BIGINT NOT NULL,
+                    data_atualizacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                )
+            '''
+            self.__database.execute_query(SQL)
+            logger.debug("✅ Tabela 'versoes_usuario' criada/verificada com sucesso!")
+        except Exception as e:
+            logger.error("❌ Erro em VersaoDAO._create_tables(): %s", e)
+
+    def get(self, usuario_id: int) -> int:
+        """
+        Versão atual dos dados do usuário (0 se ele nunca teve escritas).
+
+        Dentro de uma requisição o valor é lido uma vez só (ETag e cache de
+        leitura usam a mesma leitura) até a próxima escrita da requisição.
+        """
+        versoes = g.setdefault("versoes_usuario", {}) if has_request_context() else {}
+        if usuario_id in versoes:
+            return versoes[usuario_id]
+        logger.debug("🟢 VersaoDAO.get() - Usuário: %s", usuario_id)
+        try:
+            SQL = "SELECT versao FROM versoes_usuario WHERE usuario_id = %s"
+            rows = self.__database.execute_query(SQL, (usuario_id,), fetch=True)
+            versoes[usuario_id] = int(rows[0].get("versao") or 0) if rows else 0
+            return versoes[usuario_id]
+        except Exception as e:
+            logger.error("❌ Erro em VersaoDAO.get(): %s", e)
+            raise
+
+    def incrementar(self, usuario_ids: list):
+        """
+        Incrementa a versão dos usuários informados (None é ignorado).
+        """
+        usuario_ids = list(dict.fromkeys(id for id in usuario_ids if id))
+        if not usuario_ids:
+            return
+        logger.debug("🟢 VersaoDAO.incrementar() - Usuários: %s", usuario_ids)
+        try:
+            SQL = f'''
+                INSERT INTO versoes_usuario (usuario_id, versao)
+                VALUES {', '.join(['(%s, UNIX_TIMESTAMP())'] * len(usuario_ids))}
+                ON DUPLICATE KEY UPDATE versao = versoes_usuario.versao + 1
+            '''
+            self.__database.execute_query(SQL, tuple(usuario_ids))
+            self._descartar_lidas()
+        except Exception as e:
+            logger.error("❌ Erro em VersaoDAO.incrementar(): %s", e)
+            raise
+
+    def incrementar_por_tarefas(self, tarefa_ids: list):
+        """
+        Incrementa a versão do responsável e do atribuidor de cada tarefa,
+        em um único comando (chame antes de excluir as tarefas).
+        """
+        tarefa_ids = list(dict.fromkeys(tarefa_ids))
+        if not tarefa_ids:
+            return
+        logger.debug("🟢 VersaoDAO.incrementar_por_tarefas() - %s tarefas", len(tarefa_ids))
+        try:
+            marcadores = ', '.join(['%s'] * len(tarefa_ids))
+            SQL = f'''
+                INSERT INTO versoes_usuario (usuario_id, versao)
+                SELECT afetados.usuario_id, UNIX_TIMESTAMP() FROM (
+                    SELECT usuario_responsavel_id AS usuario_id FROM tarefas WHERE id IN ({marcadores})
+                    UNION
+                    SELECT usuario_atribuidor_id FROM tarefas
+                    WHERE id IN ({marcadores}) AND usuario_atribuidor_id IS NOT NULL
+                ) AS afetados
+                ON DUPLICATE KEY UPDATE versao = versoes_usuario.versao + 1
+            '''
+            self.__database.execute_query(SQL, tuple(tarefa_ids) * 2)
+            self._descartar_lidas()
+        except Exception as e:
+            logger.error("❌ Erro em VersaoDAO.incrementar_por_tarefas(): %s", e)
+            raise
+
+    def incrementar_por_projeto(self, projeto_id: int):
+        """
+        Incrementa a versão do dono do projeto e dos usuários das tarefas do
+        projeto (o nome do projeto aparece nas listagens de tarefas).
+        """
+        logger.debug("🟢 VersaoDAO.incrementar_por_projeto() - Projeto: %s", projeto_id)
+        try:
+            SQL = '''
+                INSERT INTO versoes_usuario (usuario_id, versao)
+                SELECT afetados.usuario_id, UNIX_TIMESTAMP() FROM (
+                    SELECT usuario_id FROM projetos WHERE id = %s
+                    UNION
+                    SELECT usuario_responsavel_id FROM tarefas WHERE projeto_id = %s
+                    UNION
+                    SELECT usuario_atribuidor_id FROM tarefas
+                    WHERE projeto_id = %s AND usuario_atribuidor_id IS NOT NULL
+                ) AS afetados
+                ON DUPLICATE KEY UPDATE versao = versoes_usuario.versao + 1
+            '''
+            self.__database.execute_query(SQL, (projeto_id, projeto_id, projeto_id))
+            self._descartar_lidas()
+        except Exception as e:
+            logger.error("❌ Erro em VersaoDAO.incrementar_por_projeto(): %s", e)
+            raise
+
+    def _descartar_lidas(self):
+        """Esquece as versões lidas nesta requisição (houve escrita)"""
+        if has_request_context():
+            g.pop("versoes_usuario", None)
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+
+import aiomysql
+from pymysql.constants import CLIENT
+
+from api.database.unit_of_work import UnitOfWork
+from api.utils.ponte_async import await_only
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Conexão perdida com o servidor: descarta em vez de reaproveitar
+_ERROS_CONEXAO = (2006, 2013, 2055)
+
+
+def _errno(err) -> int:
+    """Código MySQL do erro (o PyMySQL não tem o atributo errno do mysql-connector)"""
+    if getattr(err, "errno", None) is None:
+        err.errno = err.args[0] if err.args and isinstance(err.args[0], int) else None
+    return err.errno
+
+
+class _ConexaoPonte:
+    """
+    Conexão do pool aiomysql com a interface síncrona que a UnitOfWork usa
+    (autocommit, commit, rollback, close). Cada operação é aguardada no
+    event loop via await_only().
+    """
+
+    def __init__(self, pool, conn):
+        self.__pool = pool
+        self.bruta = conn
+
+    @property
+    def autocommit(self) -> bool:
+        return self.bruta.get_autocommit()
+
+    @autocommit.setter
+    def autocommit(self, valor: bool):
+        await_only(self.bruta.autocommit(valor))
+
+    def commit(self):
+        await_only(self.bruta.commit())
+
+    def rollback(self):
+        await_only(self.bruta.rollback())
+
+    def is_connected(self) -> bool:
+        return not self.bruta.closed
+
+    def close(self):
+        """Devolve a conexão ao pool"""
+        if self.bruta is not None:
+            conn, self.bruta = self.bruta, None
+            self.__pool.release(conn)
+
+
+class AsyncMysqlDatabase:
+    """
+    Banco MySQL sobre um pool assíncrono (aiomysql), para o servidor ASGI.
+
+    Expõe a mesma interface de MysqlDatabase (execute_query, execute_many,
+    stream_query, get_connection, init_app), então DAOs, services e
+    controls são reaproveitados sem mudança. As chamadas devem acontecer
+    dentro de executar_sincrono(): cada ida ao banco vira um await e,
+    enquanto o MySQL responde, o event loop atende outras requisições.
+    O número de requisições simultâneas deixa de depender de threads;
+    o pool limita só quantas estão no banco ao mesmo tempo.
+    """
+
+    # Os DAOs usam MATCH ... AGAINST quando o banco suporta FULLTEXT
+    suporta_fulltext = True
+
+    def __init__(self, host="127.0.0.1", user="root", password="", database="projeto", port=3306,
+                 pool_min=1, pool_max=20, timeout=10.0):
+        """
+        :param pool_max: Conexões abertas no máximo (requisições além disso aguardam uma vaga)
+        :param timeout: Segundos de espera por uma conexão livre do pool
+        """
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+        self.port = port
+        self.pool_min = pool_min
+        self.pool_max = pool_max
+        self.timeout = timeout
+        self.__pool = None
+        self.unit_of_work = UnitOfWork(self)
+
+    async def iniciar(self):
+        """
+        Cria o banco, se preciso, e o pool de conexões.
+        Deve ser aguardado no startup do servidor ASGI, antes da primeira requisição.
+        """
+        if self.__pool is not None:
+            return self.__pool
+
+        logger.info("🔄 Iniciando pool assíncrono de conexões MySQL...")
+        try:
+            conn = await aiomysql.connect(host=self.host, port=self.port, user=self.user,
+                                          password=self.password)
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SHOW DATABASES LIKE %s", (self.database,))
+                    if not await cursor.fetchone():
+                        logger.warning("⚠️  Banco '%s' não existe. Criando...", self.database)
+                        await cursor.execute(f"CREATE DATABASE {self.database}")
+                        logger.info("✅ Banco '%s' criado com sucesso!", self.database)
+            finally:
+                conn.close()
+
+            self.__pool = await aiomysql.create_pool(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                db=self.database,
+                minsize=self.pool_min,
+                maxsize=self.pool_max,
+                autocommit=False,
+                # Mesmo comportamento do pool síncrono: rowcount conta linhas encontradas
+                client_flag=CLIENT.FOUND_ROWS,
+                pool_recycle=3600
+            )
+
+            async with self.__pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT VERSION()")
+                    version = (await cursor.fetchone())[0]
+
+            logger.info("✅ Conectado ao MySQL %s (banco: %s, pool assíncrono de até %s conexões)",
+                        version, self.database, self.pool_max)
+            return self.__pool
+
+        except Exception as err:
+            logger.error("❌ Falha ao conectar ao MySQL: %s", err)
+            logger.debug("🔧 Configuração: %s:%s, user: %s", self.host, self.port, self.user)
+            raise
+
+    async def encerrar(self):
+        """Fecha o pool (shutdown do servidor ASGI)"""
+        if self.__pool is not None:
+            logger.info("🔒 Fechando pool assíncrono de conexões MySQL...")
+            pool, self.__pool = self.__pool, None
+            pool.close()
+            await pool.wait_closed()
+            logger.info("✅ Pool de conexões fechado.")
+
+    def get_connection(self) -> _ConexaoPonte:
+        """
+        Obtém uma conexão do pool, aguardando no event loop se todas estiverem em uso.
+        """
+        if self.__pool is None:
+            raise RuntimeError("Pool assíncrono não iniciado (aguarde AsyncMysqlDatabase.iniciar())")
+        conn = await_only(asyncio.wait_for(self.__pool.acquire(), self.timeout))
+        return _ConexaoPonte(self.__pool, conn)
+
+    def init_app(self, app):
+        """Ativa a unidade de trabalho por requisição na aplicação Flask"""
+        self.unit_of_work.init_app(app)
+
+    def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
+        """
+        Executa uma query e retorna os resultados (mesma semântica de MysqlDatabase).
+        """
+        em_unidade = self.unit_of_work.ativa()
+        conn = self.unit_of_work.connection() if em_unidade else self.get_connection()
+        try:
+            if em_unidade:
+                self.unit_of_work.marcar_pendente()
+            resultado = await_only(self._executar(conn.bruta, query, params, fetch))
+            if not em_unidade:
+                # Também nas leituras: o pool fecha conexões devolvidas com transação aberta
+                conn.commit()
+            return resultado
+
+        except Exception as err:
+            logger.error("❌ Erro ao executar query: %s", err)
+            self._tratar_falha(conn, em_unidade, err)
+            raise
+        finally:
+            if not em_unidade:
+                conn.close()
+
+    def execute_many(self, query: str, params_list: list) -> int:
+        """
+        Executa a mesma query para vários conjuntos de parâmetros (executemany).
+
+        :return: Total de linhas afetadas
+        """
+        if not params_list:
+            return 0
+
+        em_unidade = self.unit_of_work.ativa()
+        conn = self.unit_of_work.connection() if em_unidade else self.get_connection()
+        try:
+            if em_unidade:
+                self.unit_of_work.marcar_pendente()
+            total = await_only(self._executar_lote(conn.bruta, query, params_list))
+            if not em_unidade:
+                conn.commit()
+            return total
+
+        except Exception as err:
+            logger.error("❌ Erro ao executar query em lote: %s", err)
+            self._tratar_falha(conn, em_unidade, err)
+            raise
+        finally:
+            if not em_unidade:
+                conn.close()
+
+    def stream_query(self, query: str, params: tuple = None, tamanho_lote: int = 500):
+        """
+        Gerador que entrega as linhas aos poucos (SSDictCursor + fetchmany),
+        em uma conexão própria do pool, fora da UnitOfWork.
+        """
+        conn = self.get_connection()
+        cursor = None
+        try:
+            cursor = await_only(conn.bruta.cursor(aiomysql.SSDictCursor))
+            await_only(cursor.execute(query, params or ()))
+            while True:
+                rows = await_only(cursor.fetchmany(tamanho_lote))
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            if cursor:
+                try:
+                    # Cliente desconectou no meio: o close descarta o resto do resultado
+                    await_only(cursor.close())
+                except Exception:
+                    pass
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            conn.close()
+
+    def test_connection(self) -> bool:
+        """Teste de conexão (dentro de executar_sincrono)"""
+        try:
+            self.execute_query("SELECT 1 AS test", fetch=True)
+            logger.info("✅ Conexão com MySQL testada com sucesso!")
+            return True
+        except Exception as err:
+            logger.error("❌ Erro ao testar conexão: %s", err)
+            return False
+
+    def get_pool_status(self):
+        if self.__pool is None:
+            return {"status": "Pool não inicializado"}
+        return {
+            "status": "Ativo",
+            "driver": "aiomysql",
+            "pool_size": self.__pool.size,
+            "pool_livres": self.__pool.freesize,
+            "pool_max": self.pool_max,
+            "database": self.database
+        }
+
+    @staticmethod
+    async def _executar(conn, query: str, params, fetch: bool):
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, params or ())
+            if fetch:
+                return await cursor.fetchall()
+            return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+    @staticmethod
+    async def _executar_lote(conn, query: str, params_list: list) -> int:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.executemany(query, params_list)
+            return cursor.rowcount
+
+    def _tratar_falha(self, conn: _ConexaoPonte, em_unidade: bool, err):
+        perdida = _errno(err) in _ERROS_CONEXAO
+        if em_unidade:
+            self.unit_of_work.marcar_falha()
+            if perdida:
+                # A próxima query da requisição pega outra conexão do pool
+                self.unit_of_work.descartar()
+        elif not perdida:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+
+
+def create_async_database_instance():
+    """
+    Factory com as mesmas variáveis de ambiente de create_database_instance().
+    ASGI_DB_POOL define o máximo de conexões do pool assíncrono.
+    """
+    return AsyncMysqlDatabase(
+        host=os.getenv('MYSQL_HOST', '127.0.0.1'),
+        user=os.getenv('MYSQL_USER', 'root'),
+        password=os.getenv('MYSQL_PASSWORD', ''),
+        database=os.getenv('MYSQL_DATABASE', 'projeto'),
+        port=int(os.getenv('MYSQL_PORT', '3306')),
+        pool_max=int(os.getenv('ASGI_DB_POOL', '20')),
+        timeout=float(os.getenv('ASGI_DB_TIMEOUT', '10'))
+    )
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 import mysql.connector
 from mysql.connector import pooling, Error
+from mysql.connector.constants import ClientFlag
 import sys
 import os
 import time
+from api.database.unit_of_work import UnitOfWork
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 
 class MysqlDatabase:
@@ -13,6 +18,9 @@ class MysqlDatabase:
     __pool = None
     __instance = None
 
+    # ✅ NOVO: Os DAOs usam MATCH ... AGAINST quando o banco suporta FULLTEXT
+    suporta_fulltext = True
+
     def __init__(self, pool_name="projeto_pool", pool_size=5, pool_reset_session=True,
                  host="127.0.0.1", user="root", password="", database="projeto", port=3306):
         """
@@ -31,6 +39,9 @@ class MysqlDatabase:
         self.password = password
         self.database = database
         self.port = port
+        # ✅ NOVO: Unidade de trabalho por requisição (ativada com init_app)
+        if not hasattr(self, "unit_of_work"):
+            self.unit_of_work = UnitOfWork(self)
 
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
@@ -43,7 +54,7 @@ class MysqlDatabase:
         """
         if MysqlDatabase.__pool is None:
             try:
-                print("🔄 Iniciando pool de conexões MySQL...")
+                logger.info("🔄 Iniciando pool de conexões MySQL...")
                 
                 # Primeiro tenta conectar sem database para verificar se MySQL está rodando
                 test_config = {
@@ -62,9 +73,9 @@ class MysqlDatabase:
                 db_exists = test_cursor.fetchone()
                 
                 if not db_exists:
-                    print(f"⚠️  Banco '{self.database}' não existe. Criando...")
+                    logger.warning("⚠️  Banco '%s' não existe. Criando...", self.database)
                     test_cursor.execute(f"CREATE DATABASE {self.database}")
-                    print(f"✅ Banco '{self.database}' criado com sucesso!")
+                    logger.info("✅ Banco '%s' criado com sucesso!", self.database)
                 
                 test_cursor.close()
                 test_conn.close()
@@ -79,7 +90,10 @@ class MysqlDatabase:
                     password=self.password,
                     database=self.database,
                     port=self.port,
-                    autocommit=False
+                    autocommit=False,
+                    # rowcount passa a contar linhas encontradas (não só alteradas),
+                    # permitindo decidir 404 pelo UPDATE sem SELECT prévio
+                    client_flags=[ClientFlag.FOUND_ROWS]
                 )
 
                 # Testa a conexão com o database
@@ -91,15 +105,15 @@ class MysqlDatabase:
                 cursor.close()
                 conn.close()
                 
-                print(f"✅ Conectado ao MySQL {version} (banco: {self.database})")
+                logger.info("✅ Conectado ao MySQL %s (banco: %s)", version, self.database)
                 
             except mysql.connector.Error as err:
-                print(f"❌ Falha ao conectar ao MySQL: {err}")
-                print(f"🔧 Configuração: {self.host}:{self.port}, user: {self.user}")
-                print("💡 Verifique se:")
-                print("   - MySQL está rodando (XAMPP)")
-                print("   - Serviço MySQL foi iniciado")
-                print("   - Porta 3306 está livre")
+                logger.error("❌ Falha ao conectar ao MySQL: %s", err)
+                logger.debug("🔧 Configuração: %s:%s, user: %s", self.host, self.port, self.user)
+                logger.debug("💡 Verifique se:")
+                logger.debug("   - MySQL está rodando (XAMPP)")
+                logger.debug("   - Serviço MySQL foi iniciado")
+                logger.debug("   - Porta 3306 está livre")
                 raise
 
         return MysqlDatabase.__pool
@@ -116,15 +130,32 @@ class MysqlDatabase:
                 conn.autocommit = False
                 return conn
             except mysql.connector.Error as err:
-                print(f"❌ Tentativa {attempt + 1}/{max_retries} - Erro ao obter conexão: {err}")
+                logger.error("❌ Tentativa %s/%s - Erro ao obter conexão: %s", attempt + 1, max_retries, err)
                 if attempt == max_retries - 1:
                     raise
                 time.sleep(1)  # Espera 1 segundo antes de tentar novamente
 
+    def init_app(self, app):
+        """
+        ✅ NOVO: Ativa a unidade de trabalho por requisição na aplicação Flask.
+        Cada requisição passa a usar uma única conexão e um único commit.
+        """
+        self.unit_of_work.init_app(app)
+
+    def apos_commit(self, callback):
+        """
+        ✅ NOVO: Executa `callback` depois do commit das escritas feitas até
+        aqui (ver UnitOfWork.apos_commit).
+        """
+        self.unit_of_work.apos_commit(callback)
+
     def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
         """
         Executa uma query e retorna os resultados.
         """
+        if self.unit_of_work.ativa():
+            return self._execute_in_unit_of_work(query, params, fetch)
+
         conn = None
         cursor = None
         try:
@@ -143,7 +174,7 @@ class MysqlDatabase:
         except mysql.connector.Error as err:
             if conn:
                 conn.rollback()
-            print(f"❌ Erro ao executar query: {err}")
+            logger.error("❌ Erro ao executar query: %s", err)
             raise
         finally:
             if cursor:
@@ -151,6 +182,107 @@ class MysqlDatabase:
             if conn:
                 conn.close()
 
+    def _execute_in_unit_of_work(self, query: str, params: tuple = None, fetch: bool = False):
+        """
+        Executa a query na conexão da requisição, sem commit.
+        O commit (ou rollback) é feito uma vez pela UnitOfWork no fim da requisição.
+        """
+        cursor = None
+        try:
+            conn = self.unit_of_work.connection()
+            cursor = conn.cursor(dictionary=True)
+            self.unit_of_work.marcar_pendente()
+
+            cursor.execute(query, params or ())
+
+            if fetch:
+                return cursor.fetchall()
+            return cursor.lastrowid if query.strip().upper().startswith('INSERT') else cursor.rowcount
+
+        except mysql.connector.Error as err:
+            logger.error("❌ Erro ao executar query: %s", err)
+            self.unit_of_work.marcar_falha()
+            if err.errno in (2006, 2013, 2055):
+                # Conexão perdida: descarta para a próxima query pegar outra do pool
+                self.unit_of_work.descartar()
+            raise
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    pass
+
+    def execute_many(self, query: str, params_list: list) -> int:
+        """
+        ✅ NOVO: Executa a mesma query para vários conjuntos de parâmetros
+        (cursor.executemany) em uma única ida ao banco.
+        Dentro de uma requisição usa a conexão/transação da UnitOfWork.
+
+        :return: Total de linhas afetadas
+        """
+        if not params_list:
+            return 0
+
+        em_unidade = self.unit_of_work.ativa()
+        conn = self.unit_of_work.connection() if em_unidade else self.get_connection()
+        cursor = None
+        try:
+            if em_unidade:
+                self.unit_of_work.marcar_pendente()
+            cursor = conn.cursor(dictionary=True)
+            cursor.executemany(query, params_list)
+            if not em_unidade:
+                conn.commit()
+            return cursor.rowcount
+
+        except mysql.connector.Error as err:
+            logger.error("❌ Erro ao executar query em lote: %s", err)
+            if em_unidade:
+                self.unit_of_work.marcar_falha()
+            else:
+                conn.rollback()
+            raise
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    pass
+            if not em_unidade:
+                conn.close()
+
+    def stream_query(self, query: str, params: tuple = None, tamanho_lote: int = 500):
+        """
+        ✅ NOVO: Gerador que entrega as linhas aos poucos (cursor sem buffer +
+        fetchmany), para exportações grandes em memória constante.
+
+        Usa uma conexão própria do pool, fora da UnitOfWork: a resposta em
+        streaming continua sendo lida depois que a requisição terminou.
+        """
+        conn = self.get_connection()
+        cursor = None
+        concluido = False
+        try:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(tamanho_lote)
+                if not rows:
+                    break
+                yield from rows
+            concluido = True
+        finally:
+            if not concluido:
+                # ✅ CORREÇÃO: Cliente desconectou no meio: não lê o resto do resultado
+                descartar_conexao(conn)
+            else:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    pass
+                conn.close()
+
     def test_connection(self):
         """
         Teste de conexão mais simples e robusto.
@@ -166,11 +298,11 @@ class MysqlDatabase:
             cursor.close()
             conn.close()
             
-            print("✅ Conexão com MySQL testada com sucesso!")
+            logger.info("✅ Conexão com MySQL testada com sucesso!")
             return True
             
         except mysql.connector.Error as err:
-            print(f"❌ Erro ao testar conexão: {err}")
+            logger.error("❌ Erro ao testar conexão: %s", err)
             return False
 
     def get_pool_status(self):
@@ -184,12 +316,75 @@ class MysqlDatabase:
             "database": self.database
         }
 
+    def fechar_pool(self):
+        """
+        ✅ NOVO: Fecha as conexões ociosas do pool (processo mestre, antes do fork).
+        A próxima get_connection() cria um pool novo.
+        """
+        if MysqlDatabase.__pool is not None:
+            try:
+                MysqlDatabase.__pool._remove_connections()
+            except mysql.connector.Error as err:
+                logger.warning("⚠️  Erro ao fechar conexões do pool: %s", err)
+            MysqlDatabase.__pool = None
+
+    def reiniciar_pool(self):
+        """
+        ✅ NOVO: Abandona o pool herdado do processo pai (hook pós-fork).
+        Os sockets do pai não podem ser usados pelo filho; o pool do
+        processo é criado de novo na próxima get_connection().
+        """
+        MysqlDatabase.__pool = None
+
     def close_pool(self):
         if MysqlDatabase.__pool is not None:
-            print("🔒 Fechando pool de conexões MySQL...")
+            logger.info("🔒 Fechando pool de conexões MySQL...")
             MysqlDatabase.__pool = None
             MysqlDatabase.__instance = None
-            print("✅ Pool de conexões fechado.")
+            logger.info("✅ Pool de conexões fechado.")
+
+
+def descartar_conexao(conn):
+    """
+    ✅ CORREÇÃO: Devolve ao pool uma conexão com resultado pela metade sem
+    ler o resto das linhas.
+
+    shutdown() fecha o socket sem QUIT (o servidor aborta a query ao não
+    conseguir enviar); a conexão volta ao pool fechada e o pool reconecta
+    no próximo get_connection(), então a vaga não se perde.
+    """
+    try:
+        conn.shutdown()
+    except Exception:
+        pass
+    try:
+        # reset_session falha no socket fechado, mas a conexão já voltou ao pool
+        conn.close()
+    except Exception:
+        pass
+
+
+# Máximo aceito pelo pool do mysql-connector
+_POOL_MAXIMO = 32
+
+
+def tamanho_pool_padrao() -> int:
+    """
+    ✅ CORREÇÃO: Tamanho do pool de um processo (MYSQL_POOL_SIZE, se definido).
+
+    Cada thread de requisição (WEB_THREADS) usa até 2 conexões ao mesmo
+    tempo (a da requisição e a de uma exportação em streaming), e o processo
+    tem ainda as threads do dashboard (DASHBOARD_WORKERS), dos relatórios
+    (RELATORIO_WORKERS), o EmailWorker e o job de limpeza de tokens.
+    """
+    configurado = int(os.getenv('MYSQL_POOL_SIZE', 0))
+    if configurado:
+        return min(configurado, _POOL_MAXIMO)
+    tamanho = (2 * int(os.getenv('WEB_THREADS', 4))
+               + int(os.getenv('DASHBOARD_WORKERS', 3))
+               + int(os.getenv('RELATORIO_WORKERS', 2))
+               + 2)
+    return min(tamanho, _POOL_MAXIMO)
 
 
 def create_database_instance():
@@ -202,7 +397,7 @@ def create_database_instance():
         'password': os.getenv('MYSQL_PASSWORD', ''),
         'database': os.getenv('MYSQL_DATABASE', 'projeto'),
         'port': int(os.getenv('MYSQL_PORT', '3306')),
-        'pool_size': int(os.getenv('MYSQL_POOL_SIZE', '5'))
+        'pool_size': tamanho_pool_padrao()
     }
     
     return MysqlDatabase(**config)
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+from flask import g, has_app_context, jsonify
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class UnitOfWork:
+    """
+    Unidade de trabalho por requisição (request-scoped).
+
+    Mantém UMA conexão do pool presa ao contexto da aplicação Flask durante
+    toda a requisição, com autocommit desligado:
+    - todas as queries da requisição usam a mesma conexão;
+    - o commit acontece uma única vez no after_request (ou rollback se alguma
+      query falhou);
+    - a conexão volta ao pool no teardown_appcontext;
+    - ações registradas com apos_commit() rodam só depois do commit.
+
+    Fora de um contexto Flask (scripts, testes de conexão, inicialização)
+    o banco continua no modo antigo: uma conexão e um commit por query.
+    """
+
+    # Unidades com conexão aberta na requisição (para liberar_conexoes)
+    CHAVE_UNIDADES = "_unidades_de_trabalho"
+
+    def __init__(self, database):
+        """
+        :param database: Objeto com get_connection() que devolve conexões do pool
+        """
+        self.__database = database
+        self.__chave = f"_unit_of_work_{id(database)}"
+        self.__habilitada = False
+
+    def init_app(self, app):
+        """
+        Registra os hooks de commit e liberação da conexão na aplicação Flask.
+        """
+        app.after_request(self._after_request)
+        app.teardown_appcontext(self._teardown)
+        self.__habilitada = True
+
+    def ativa(self) -> bool:
+        """Indica se a query atual deve usar a conexão da requisição"""
+        return self.__habilitada and has_app_context()
+
+    def connection(self):
+        """
+        Retorna a conexão da requisição, obtendo-a do pool no primeiro uso.
+        """
+        estado = g.get(self.__chave)
+        if estado is None:
+            conn = self.__database.get_connection()
+            estado = {
+                "conn": conn,
+                "autocommit": conn.autocommit,
+                # Uma conexão descartada nesta requisição invalida a unidade toda
+                "falhou": g.get(self.__chave + "_descartada", False),
+                "pendente": False
+            }
+            conn.autocommit = False
+            setattr(g, self.__chave, estado)
+            unidades = g.setdefault(UnitOfWork.CHAVE_UNIDADES, [])
+            if self not in unidades:
+                unidades.append(self)
+        return estado["conn"]
+
+    def marcar_pendente(self):
+        """Registra que a requisição abriu uma transação que precisa ser encerrada"""
+        estado = g.get(self.__chave)
+        if estado is not None:
+            estado["pendente"] = True
+
+    def marcar_falha(self):
+        """Uma query falhou: a unidade de trabalho será desfeita no final"""
+        estado = g.get(self.__chave)
+        if estado is not None:
+            estado["falhou"] = True
+
+    def descartar(self):
+        """
+        Descarta a conexão da requisição (ex.: conexão perdida com o servidor).
+        A próxima query obtém uma conexão nova do pool.
+        """
+        estado = g.pop(self.__chave, None)
+        if estado is not None:
+            setattr(g, self.__chave + "_descartada", True)
+            self._liberar(estado)
+
+    def liberar(self):
+        """
+        Devolve ao pool a conexão da requisição antes de uma espera que não
+        usa o banco (ex.: bcrypt no HashExecutor), confirmando o que estiver
+        pendente. A próxima query da requisição obtém outra conexão.
+
+        Se alguma query já falhou a conexão é mantida, para o rollback do
+        final da requisição.
+        """
+        estado = g.get(self.__chave)
+        if estado is None or estado["falhou"]:
+            return
+        if estado["pendente"]:
+            try:
+                estado["conn"].commit()
+            except Exception as e:
+                logger.error("❌ Erro ao confirmar transação antes de liberar a conexão: %s", e)
+                estado["falhou"] = True
+                return
+            estado["pendente"] = False
+            self._executar_apos_commit(estado)
+        g.pop(self.__chave, None)
+        self._liberar(estado)
+
+    @staticmethod
+    def liberar_conexoes():
+        """
+        Libera as conexões de todas as unidades de trabalho da requisição
+        atual (no-op fora de um contexto Flask).
+        """
+        if not has_app_context():
+            return
+        for unidade in g.get(UnitOfWork.CHAVE_UNIDADES, ()):
+            unidade.liberar()
+
+    def commit(self):
+        """
+        Confirma antecipadamente o que foi feito até aqui na requisição.
+        """
+        estado = g.get(self.__chave)
+        if estado is not None and estado["pendente"] and not estado["falhou"]:
+            estado["conn"].commit()
+            estado["pendente"] = False
+            self._executar_apos_commit(estado)
+
+    def apos_commit(self, callback):
+        """
+        ✅ NOVO: Executa `callback` depois que a transação da requisição for
+        confirmada (ex.: acordar o EmailWorker só quando a mensagem já está
+        visível para ele). Se a transação for desfeita, não é executado.
+
+        Sem transação aberta (fora de uma requisição ou nada pendente) as
+        escritas já foram confirmadas: executa na hora.
+        """
+        estado = g.get(self.__chave) if self.ativa() else None
+        if estado is None or not estado["pendente"]:
+            callback()
+            return
+        estado.setdefault("apos_commit", []).append(callback)
+
+    def _executar_apos_commit(self, estado: dict):
+        for callback in estado.pop("apos_commit", ()):
+            try:
+                callback()
+            except Exception as e:
+                logger.error("❌ Erro em ação pós-commit: %s", e)
+
+    def _after_request(self, response):
+        estado = g.get(self.__chave)
+        if estado is None:
+            return response
+
+        try:
+            if estado["falhou"] or response.status_code >= 500:
+                estado["conn"].rollback()
+                estado.pop("apos_commit", None)
+            elif estado["pendente"]:
+                estado["conn"].commit()
+                self._executar_apos_commit(estado)
+            estado["pendente"] = False
+        except Exception as e:
+            logger.error("❌ Erro ao finalizar transação da requisição: %s", e)
+            estado["falhou"] = True
+            response = jsonify({
+                "success": False,
+                "error": {
+                    "message": "Erro interno no servidor",
+                    "code": 500
+                }
+            })
+            response.status_code = 500
+        return response
+
+    def _teardown(self, exception=None):
+        estado = g.pop(self.__chave, None)
+        if estado is not None:
+            # Sem after_request (exceção não tratada) nada foi confirmado
+            self._liberar(estado)
+
+    def _liberar(self, estado: dict):
+        conn = estado["conn"]
+        try:
+            # O que não foi confirmado no after_request é desfeito
+            if estado["pendente"]:
+                conn.rollback()
+        except Exception as e:
+            logger.error("❌ Erro ao encerrar transação: %s", e)
+        try:
+            conn.autocommit = estado["autocommit"]
+        except Exception:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
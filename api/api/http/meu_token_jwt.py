@@ -2,6 +2,9 @@
 import jwt
 import secrets
 import time
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 
 """
@@ -63,31 +66,47 @@ class MeuTokenJWT:
         """
         Valida um token JWT.
 
+        ⚠️ Guarda os claims em self.payload, que é compartilhado por todas as
+        requisições que usam esta instância. Em código concorrente use
+        decodificarToken(), que apenas devolve os claims.
+
         :param stringToken: Token JWT a ser validado (pode incluir prefixo "Bearer ")
         :return: True se válido, False caso contrário
         """
-        if not stringToken or stringToken.strip() == "":
-            print("❌ Token não fornecido ou em branco")
+        decoded = self.decodificarToken(stringToken)
+        if decoded is None:
             return False
+        self.__payload = decoded
+        return True
+
+    def decodificarToken(self, stringToken: str):
+        """
+        ✅ NOVO: Verifica assinatura, expiração, audience e issuer do token
+        sem alterar o estado da instância.
+
+        :param stringToken: Token JWT (pode incluir prefixo "Bearer ")
+        :return: dict com os claims, ou None se o token for inválido
+        """
+        if not stringToken or stringToken.strip() == "":
+            logger.error("❌ Token não fornecido ou em branco")
+            return None
 
         token = stringToken.replace("Bearer ", "").strip()
 
         try:
-            decoded = jwt.decode(
+            return jwt.decode(
                 token,
                 self.__key,
                 algorithms=[self.__alg],
                 audience=self.__aud,
                 issuer=self.__iss
             )
-            self.__payload = decoded
-            return True
         except jwt.ExpiredSignatureError:
-            print("❌ Token expirado")
-            return False
+            logger.error("❌ Token expirado")
+            return None
         except jwt.InvalidTokenError as err:
-            print("❌ Token inválido:", err)
-            return False
+            logger.error("❌ Token inválido: %s", err)
+            return None
 
     # Getters e Setters
     @property
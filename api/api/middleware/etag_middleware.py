@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+from flask import request, make_response
+from api.middleware.jwt_middleware import JwtMiddleware
+from api.dao.versao_dao import VersaoDAO
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class EtagMiddleware:
+    """
+    Middleware de requisições condicionais (ETag / If-None-Match) para as
+    leituras de tarefas e projetos.
+
+    A ETag é a versão dos dados do usuário (VersaoDAO), incrementada pelos
+    DAOs a cada escrita. Se o cliente já tem a versão atual, a resposta é
+    304 sem executar a consulta nem serializar o JSON: o custo é uma leitura
+    por chave primária.
+
+    Deve ser aplicado depois de JwtMiddleware.validate_token.
+    """
+
+    # Trocar o prefixo invalida todas as ETags (ex.: mudança no formato das respostas)
+    PREFIXO = "v1"
+
+    def __init__(self, jwt_middleware: JwtMiddleware, versao_dao: VersaoDAO):
+        """
+        :param jwt_middleware: Middleware de onde vem o usuário autenticado
+        :param versao_dao: DAO com a versão dos dados de cada usuário
+        """
+        logger.debug("⬆️  EtagMiddleware.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__versao_dao = versao_dao
+
+    # ✅ CORREÇÃO: Representações negociadas pelo Accept na mesma URL
+    # (ex.: GET /api/tarefa/ em JSON ou NDJSON); a primeira é a padrão
+    TIPOS = ["application/json", "application/x-ndjson"]
+
+    def _etag(self, usuario_id) -> str:
+        """
+        ETag (fraca) da versão atual dos dados do usuário, com o tipo da
+        representação quando não é a padrão: JSON e NDJSON nunca
+        compartilham a mesma ETag.
+        """
+        etag = f"{self.PREFIXO}-u{usuario_id}-{self.__versao_dao.get(usuario_id)}"
+        tipo = request.accept_mimetypes.best_match(self.TIPOS) or self.TIPOS[0]
+        if tipo != self.TIPOS[0]:
+            etag += "-" + tipo.rsplit("/", 1)[-1].replace("x-", "")
+        return etag
+
+    def condicional(self, f):
+        """
+        Decorator que responde 304 quando If-None-Match traz a versão atual
+        e adiciona ETag às respostas 200.
+
+        A versão é lida ANTES da view: se uma escrita acontecer no meio, a
+        resposta sai com a versão antiga e o próximo pedido a busca de novo.
+        """
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            usuario_id = self.__jwt_middleware.get_user_id()
+            if not usuario_id:
+                return f(*args, **kwargs)
+
+            etag = self._etag(usuario_id)
+            if request.if_none_match.contains_weak(etag):
+                logger.debug("🔷 EtagMiddleware.condicional() - 304 (%s)", etag)
+                return self._validadores(make_response("", 304), etag)
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200:
+                self._validadores(response, etag)
+            return response
+
+        return decorated_function
+
+    @staticmethod
+    def _validadores(response, etag: str):
+        """
+        ETag e cabeçalhos de cache, iguais no 200 e no 304 (RFC 9110 §15.4.5)
+        """
+        response.set_etag(etag, weak=True)
+        # O navegador guarda, mas sempre revalida (dados por usuário)
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.vary.add("Authorization")
+        response.vary.add("Accept")
+        return response
@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
-from flask import request, jsonify
+import hashlib
+from flask import request, jsonify, g, has_request_context
 from functools import wraps
 from api.http.meu_token_jwt import MeuTokenJWT
+from api.utils.cache_lru import CacheLRU
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 
 class JwtMiddleware:
@@ -10,16 +15,49 @@ class JwtMiddleware:
     
     Implementa validação de token JWT para proteger endpoints da API.
     Utiliza injeção de dependência para receber a instância de MeuTokenJWT.
+
+    ✅ NOVO: Os claims do token ficam em flask.g (um por requisição), e não
+    na instância compartilhada de MeuTokenJWT. Tokens já verificados ficam
+    em um cache LRU (chave = SHA-256 do token) até o seu "exp", evitando
+    refazer a verificação HS256 a cada requisição do SPA.
     """
 
-    def __init__(self, jwt_instance: MeuTokenJWT = None):
+    def __init__(self, jwt_instance: MeuTokenJWT = None, token_cache: CacheLRU = None):
         """
         Construtor do JwtMiddleware.
         
         :param jwt_instance: Instância de MeuTokenJWT (opcional)
+        :param token_cache: Cache de tokens verificados (opcional)
         """
-        print("⬆️  JwtMiddleware.__init__()")
+        logger.debug("⬆️  JwtMiddleware.__init__()")
         self.__jwt_instance = jwt_instance or MeuTokenJWT()
+        self.__token_cache = token_cache or CacheLRU(capacidade=4096)
+
+    def _autenticar(self, authorization_header: str):
+        """
+        Verifica o token (ou o encontra no cache) e guarda os claims em flask.g.
+
+        :return: dict com os claims, ou None se o token for inválido
+        """
+        token = authorization_header.replace("Bearer ", "").strip()
+        chave = hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+        payload = self.__token_cache.get(chave)
+        if payload is None:
+            payload = self.__jwt_instance.decodificarToken(token)
+            if payload is None:
+                return None
+            # Claims verificados valem até a expiração do próprio token
+            self.__token_cache.set(chave, payload, expira_em=payload.get("exp"))
+
+        g.jwt_payload = payload
+        return payload
+
+    def _payload(self):
+        """Claims do token da requisição atual (ou None)"""
+        if not has_request_context():
+            return None
+        return g.get("jwt_payload")
 
     def validate_token(self, f):
         """
@@ -35,13 +73,13 @@ class JwtMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 JwtMiddleware.validate_token()")
+            logger.debug("🔷 JwtMiddleware.validate_token()")
             
             # Obtém o header Authorization
             authorization_header = request.headers.get("Authorization")
             
             if not authorization_header:
-                print("❌ Header Authorization não encontrado")
+                logger.error("❌ Header Authorization não encontrado")
                 return jsonify({
                     "success": False,
                     "error": {
@@ -51,11 +89,12 @@ class JwtMiddleware:
                 }), 401
 
             # Valida o token
-            if self.__jwt_instance.validarToken(authorization_header):
-                print(f"✅ Token válido para: {self.__jwt_instance.payload.get('email', 'Unknown')}")
+            payload = self._autenticar(authorization_header)
+            if payload is not None:
+                logger.debug("✅ Token válido para: %s", payload.get('email', 'Unknown'))
                 return f(*args, **kwargs)
             else:
-                print("❌ Token inválido ou expirado")
+                logger.error("❌ Token inválido ou expirado")
                 return jsonify({
                     "success": False,
                     "error": {
@@ -72,14 +111,15 @@ class JwtMiddleware:
         
         :return: dict com dados do usuário ou None se não houver token válido
         """
-        if not self.__jwt_instance.payload:
+        payload = self._payload()
+        if not payload:
             return None
         
         return {
-            "id": self.__jwt_instance.payload.get("idFuncionario"),
-            "email": self.__jwt_instance.payload.get("email"),
-            "name": self.__jwt_instance.payload.get("name"),
-            "role": self.__jwt_instance.payload.get("role")
+            "id": payload.get("idFuncionario"),
+            "email": payload.get("email"),
+            "name": payload.get("name"),
+            "role": payload.get("role")
         }
 
     def validate_token_and_role(self, allowed_roles: list):
@@ -92,7 +132,7 @@ class JwtMiddleware:
         def decorator(f):
             @wraps(f)
             def decorated_function(*args, **kwargs):
-                print(f"🔷 JwtMiddleware.validate_token_and_role() - Roles: {allowed_roles}")
+                logger.debug("🔷 JwtMiddleware.validate_token_and_role() - Roles: %s", allowed_roles)
                 
                 # Primeiro valida o token
                 authorization_header = request.headers.get("Authorization")
@@ -106,7 +146,8 @@ class JwtMiddleware:
                         }
                     }), 401
 
-                if not self.__jwt_instance.validarToken(authorization_header):
+                payload = self._autenticar(authorization_header)
+                if payload is None:
                     return jsonify({
                         "success": False,
                         "error": {
@@ -116,9 +157,9 @@ class JwtMiddleware:
                     }), 401
 
                 # Verifica se o role do usuário está permitido
-                user_role = self.__jwt_instance.payload.get("role")
+                user_role = payload.get("role")
                 if user_role not in allowed_roles:
-                    print(f"❌ Acesso negado. Role: {user_role}, Permitidos: {allowed_roles}")
+                    logger.error("❌ Acesso negado. Role: %s, Permitidos: %s", user_role, allowed_roles)
                     return jsonify({
                         "success": False,
                         "error": {
@@ -127,7 +168,7 @@ class JwtMiddleware:
                         }
                     }), 403
 
-                print(f"✅ Acesso permitido para role: {user_role}")
+                logger.debug("✅ Acesso permitido para role: %s", user_role)
                 return f(*args, **kwargs)
 
             return decorated_function
@@ -137,16 +178,17 @@ class JwtMiddleware:
         """
         ✅ CORREÇÃO: Método atualizado para extrair user_id corretamente
         """
-        if not self.__jwt_instance.payload:
+        payload = self._payload()
+        if not payload:
             return None
         
         # Tenta diferentes possíveis chaves para o user_id
-        user_id = (self.__jwt_instance.payload.get("id") or 
-                  self.__jwt_instance.payload.get("idFuncionario") or 
-                  self.__jwt_instance.payload.get("user_id") or
-                  self.__jwt_instance.payload.get("usuario_id"))
+        user_id = (payload.get("id") or 
+                  payload.get("idFuncionario") or 
+                  payload.get("user_id") or
+                  payload.get("usuario_id"))
         
-        print(f"🔍 JwtMiddleware.get_user_id() - Extraído: {user_id}")
+        logger.debug("🔍 JwtMiddleware.get_user_id() - Extraído: %s", user_id)
         return user_id
 
     def get_user_email(self):
@@ -155,9 +197,10 @@ class JwtMiddleware:
         
         :return: str Email do usuário ou None
         """
-        if not self.__jwt_instance.payload:
+        payload = self._payload()
+        if not payload:
             return None
-        return self.__jwt_instance.payload.get("email")
+        return payload.get("email")
 
 
 # Exemplo de uso
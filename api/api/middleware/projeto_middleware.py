@@ -2,6 +2,9 @@
 from functools import wraps
 from flask import request
 from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class ProjetoMiddleware:
     """
@@ -22,7 +25,7 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_body()")
+            logger.debug("🔷 ProjetoMiddleware.validate_body()")
             body = request.get_json()
             
             if not body or 'projeto' not in body:
@@ -49,7 +52,7 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_body_update()")
+            logger.debug("🔷 ProjetoMiddleware.validate_body_update()")
             body = request.get_json()
             
             if not body or 'projeto' not in body:
@@ -74,7 +77,7 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_id_param()")
+            logger.debug("🔷 ProjetoMiddleware.validate_id_param()")
             if 'id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'id' é obrigatório!"})
             return f(*args, **kwargs)
@@ -88,7 +91,7 @@ class ProjetoMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 ProjetoMiddleware.validate_usuario_id_param()")
+            logger.debug("🔷 ProjetoMiddleware.validate_usuario_id_param()")
             if 'usuario_id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'usuario_id' é obrigatório!"})
             return f(*args, **kwargs)
@@ -2,6 +2,9 @@
 from functools import wraps
 from flask import request
 from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class TarefaMiddleware:
     """
@@ -22,7 +25,7 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_body()")
+            logger.debug("🔷 TarefaMiddleware.validate_body()")
             body = request.get_json()
             
             if not body or 'tarefa' not in body:
@@ -46,7 +49,7 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_body_update()")
+            logger.debug("🔷 TarefaMiddleware.validate_body_update()")
             body = request.get_json()
             
             if not body or 'tarefa' not in body:
@@ -73,7 +76,7 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_body_concluida()")
+            logger.debug("🔷 TarefaMiddleware.validate_body_concluida()")
             body = request.get_json()
             
             if not body or 'tarefa' not in body:
@@ -98,7 +101,7 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_id_param()")
+            logger.debug("🔷 TarefaMiddleware.validate_id_param()")
             if 'id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'id' é obrigatório!"})
             return f(*args, **kwargs)
@@ -112,7 +115,7 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_projeto_id_param()")
+            logger.debug("🔷 TarefaMiddleware.validate_projeto_id_param()")
             if 'projeto_id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'projeto_id' é obrigatório!"})
             return f(*args, **kwargs)
@@ -125,7 +128,7 @@ class TarefaMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 TarefaMiddleware.validate_usuario_permission()")
+            logger.debug("🔷 TarefaMiddleware.validate_usuario_permission()")
             # A validação de permissão será feita no Service/DAO
             # Este middleware apenas garante que o user_id está disponível
             return f(*args, **kwargs)
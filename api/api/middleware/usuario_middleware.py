@@ -2,6 +2,9 @@
 from functools import wraps
 from flask import request
 from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class UsuarioMiddleware:
     """
@@ -18,7 +21,7 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_body()")
+            logger.debug("🔷 UsuarioMiddleware.validate_body()")
             body = request.get_json()
             
             if not body or 'usuario' not in body:
@@ -45,7 +48,7 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_body_update()")
+            logger.debug("🔷 UsuarioMiddleware.validate_body_update()")
             body = request.get_json()
             
             if not body or 'usuario' not in body:
@@ -72,7 +75,7 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_login_body()")
+            logger.debug("🔷 UsuarioMiddleware.validate_login_body()")
             body = request.get_json()
 
             if not body or 'usuario' not in body:
@@ -97,7 +100,7 @@ class UsuarioMiddleware:
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            print("🔷 UsuarioMiddleware.validate_id_param()")
+            logger.debug("🔷 UsuarioMiddleware.validate_id_param()")
             if 'id' not in kwargs:
                 raise ErrorResponse(400, "Erro na validação de dados", {"message": "O parâmetro 'id' é obrigatório!"})
             return f(*args, **kwargs)
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 from datetime import datetime, date
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class Tarefa:
     def __init__(self):
@@ -291,7 +294,7 @@ class Tarefa:
                     continue
             
             # ✅ CORREÇÃO: Se nenhum formato funcionar, define como None sem erro
-            print(f"⚠️  Formato de data não reconhecido: '{value}'. Definindo data_limite como None.")
+            logger.warning("⚠️  Formato de data não reconhecido: '%s'. Definindo data_limite como None.", value)
             self.__data_limite = None
         else:
             # ✅ CORREÇÃO: Para outros tipos, tenta converter ou define como None
@@ -299,7 +302,7 @@ class Tarefa:
                 if hasattr(value, 'isoformat'):
                     self.__data_limite = value
                 else:
-                    print(f"⚠️  Tipo não suportado para data_limite: {type(value)}. Definindo como None.")
+                    logger.warning("⚠️  Tipo não suportado para data_limite: %s. Definindo como None.", type(value))
                     self.__data_limite = None
             except:
                 self.__data_limite = None
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from flask import Blueprint
+from api.middleware.jwt_middleware import JwtMiddleware
+from api.control.dashboard_control import DashboardControl
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+class DashboardRoteador:
+    """
+    Classe responsável por configurar as rotas do dashboard no Flask.
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware, dashboard_control: DashboardControl):
+        """
+        Construtor do roteador.
+
+        :param jwt_middleware: Middleware responsável por validar token JWT.
+        :param dashboard_control: Controlador do dashboard.
+        """
+        logger.debug("⬆️  DashboardRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__dashboard_control = dashboard_control
+
+        self.__blueprint = Blueprint('dashboard', __name__)
+
+    def create_routes(self):
+        """
+        Configura e retorna as rotas do dashboard.
+
+        Rotas implementadas:
+        - GET /api/dashboard -> Resumo do usuário autenticado
+          Query params opcionais:
+            ?recentes=N  Quantidade de projetos recentes (padrão 3, máx. 20)
+        """
+
+        @self.__blueprint.route('', methods=['GET'])
+        @self.__blueprint.route('/', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def index():
+            """
+            Rota que retorna contagens, totais de conclusão e projetos recentes.
+            Requer autenticação JWT.
+            """
+            user_id = self.__jwt_middleware.get_user_id()
+            return self.__dashboard_control.index(user_id)
+
+        return self.__blueprint
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from flask import Blueprint
+from api.middleware.jwt_middleware import JwtMiddleware
+from api.control.exportacao_control import ExportacaoControl
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+class ExportacaoRoteador:
+    """
+    Classe responsável por configurar as rotas de exportação CSV no Flask.
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware, exportacao_control: ExportacaoControl):
+        """
+        Construtor do roteador.
+
+        :param jwt_middleware: Middleware responsável por validar token JWT.
+        :param exportacao_control: Controlador das exportações.
+        """
+        logger.debug("⬆️  ExportacaoRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__exportacao_control = exportacao_control
+
+        self.__blueprint = Blueprint('exportacao', __name__)
+
+    def create_routes(self):
+        """
+        Configura e retorna as rotas de exportação.
+
+        Rotas implementadas (CSV em streaming, UTF-8 com BOM):
+        - GET /api/export/tarefas.csv  -> Tarefas do usuário (aceita ?status=, ?prioridade=, ...)
+        - GET /api/export/projetos.csv -> Projetos do usuário (?status= opcional)
+        - GET /api/export/usuarios.csv -> Usuários
+        """
+
+        @self.__blueprint.route('/tarefas.csv', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def tarefas():
+            """Exporta as tarefas onde o usuário é RESPONSÁVEL. Requer autenticação JWT."""
+            user_id = self.__jwt_middleware.get_user_id()
+            return self.__exportacao_control.tarefas(user_id)
+
+        @self.__blueprint.route('/projetos.csv', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def projetos():
+            """Exporta os projetos do usuário. Requer autenticação JWT."""
+            user_id = self.__jwt_middleware.get_user_id()
+            return self.__exportacao_control.projetos(user_id)
+
+        @self.__blueprint.route('/usuarios.csv', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def usuarios():
+            """Exporta os usuários. Requer autenticação JWT."""
+            return self.__exportacao_control.usuarios()
+
+        return self.__blueprint
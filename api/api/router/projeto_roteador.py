@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 from flask import Blueprint, request, jsonify
 from api.middleware.jwt_middleware import JwtMiddleware
+from api.middleware.etag_middleware import EtagMiddleware
 from api.middleware.projeto_middleware import ProjetoMiddleware
 from api.control.projeto_control import ProjetoControl
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class ProjetoRoteador:
     """
@@ -14,18 +18,22 @@ class ProjetoRoteador:
     - Aplicar autenticação JWT e validações antes de chamar o controlador.
     """
 
-    def __init__(self, jwt_middleware: JwtMiddleware, projeto_middleware: ProjetoMiddleware, projeto_control: ProjetoControl):
+    def __init__(self, jwt_middleware: JwtMiddleware, projeto_middleware: ProjetoMiddleware, projeto_control: ProjetoControl,
+                 etag_middleware: EtagMiddleware = None):
         """
         Construtor do roteador.
 
         :param jwt_middleware: Middleware responsável por validar token JWT.
         :param projeto_middleware: Middleware com validações específicas para Projeto.
         :param projeto_control: Controlador que implementa a lógica de negócio.
+        :param etag_middleware: Middleware de ETag/If-None-Match para as leituras (opcional).
         """
-        print("⬆️  ProjetoRoteador.__init__()")
+        logger.debug("⬆️  ProjetoRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__projeto_middleware = projeto_middleware
         self.__projeto_control = projeto_control
+        # ✅ NOVO: Sem EtagMiddleware as leituras respondem sempre 200
+        self.__condicional = etag_middleware.condicional if etag_middleware else (lambda f: f)
 
         self.__blueprint = Blueprint('projeto', __name__)
 
@@ -35,12 +43,17 @@ class ProjetoRoteador:
 
         Rotas implementadas:
         - POST /        -> Cria um novo projeto PARA O USUÁRIO
-        - GET /         -> Lista todos os projetos DO USUÁRIO
+        - GET /         -> Lista todos os projetos DO USUÁRIO (?fields=id,nome,status para projeção)
         - GET /<id>     -> Retorna um projeto por ID (só se for do usuário)
         - PUT /<id>     -> Atualiza um projeto por ID (só se for do usuário)
         - DELETE /<id>  -> Remove um projeto por ID (só se for do usuário)
         - GET /usuario/<usuario_id> -> Lista projetos por usuário (só admin)
         - GET /meus-projetos -> Lista projetos do usuário autenticado
+        - GET /buscar?q=<termo> -> Busca projetos do usuário por relevância
+        - GET /recentes?limite=<n> -> Projetos mais recentes do usuário
+        - GET /estatisticas -> Contagem por status e projetos recentes
+
+        ✅ Leituras do usuário respondem com ETag; If-None-Match com a versão atual -> 304
         """
 
         # POST / -> cria um projeto PARA O USUÁRIO
@@ -60,6 +73,7 @@ class ProjetoRoteador:
         # GET / -> lista todos os projetos DO USUÁRIO
         @self.__blueprint.route('/', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         def index():
             """
             Rota responsável por listar todos os projetos do usuário autenticado.
@@ -72,6 +86,7 @@ class ProjetoRoteador:
         # GET /<id> -> retorna um projeto específico (só se for do usuário)
         @self.__blueprint.route('/<int:id>', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         @self.__projeto_middleware.validate_id_param
         def show(id):
             """
@@ -133,6 +148,7 @@ class ProjetoRoteador:
         # GET /meus-projetos -> lista projetos do usuário autenticado
         @self.__blueprint.route('/meus-projetos', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         def show_meus_projetos():
             """
             Rota que retorna todos os projetos do usuário autenticado.
@@ -152,5 +168,67 @@ class ProjetoRoteador:
             # ✅ CORREÇÃO: Usa o método index que agora filtra por usuário
             return self.__projeto_control.index(user_id)
 
+        # ✅ NOVO: GET /buscar?q=<termo>&limite=<n> -> busca textual ranqueada
+        @self.__blueprint.route('/buscar', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def buscar_projetos():
+            """
+            Rota que busca projetos do usuário por nome ou descrição, ordenados por relevância.
+            Requer autenticação JWT.
+            """
+            user_id = self.__jwt_middleware.get_user_id()
+            if not user_id:
+                return jsonify({
+                    "success": False,
+                    "error": {
+                        "message": "Não foi possível identificar o usuário",
+                        "code": 401
+                    }
+                }), 401
+
+            return self.__projeto_control.search_projetos(user_id)
+
+        # ✅ NOVO: GET /recentes?limite=<n>
+        @self.__blueprint.route('/recentes', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        @self.__condicional
+        def show_projetos_recentes():
+            """
+            Rota que retorna os projetos mais recentes do usuário autenticado.
+            Requer autenticação JWT.
+            """
+            user_id = self.__jwt_middleware.get_user_id()
+            if not user_id:
+                return jsonify({
+                    "success": False,
+                    "error": {
+                        "message": "Não foi possível identificar o usuário",
+                        "code": 401
+                    }
+                }), 401
+
+            return self.__projeto_control.get_projetos_recentes(user_id)
+
+        # ✅ NOVO: GET /estatisticas
+        @self.__blueprint.route('/estatisticas', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        @self.__condicional
+        def show_estatisticas():
+            """
+            Rota que retorna a contagem de projetos por status e os 3 mais recentes.
+            Requer autenticação JWT.
+            """
+            user_id = self.__jwt_middleware.get_user_id()
+            if not user_id:
+                return jsonify({
+                    "success": False,
+                    "error": {
+                        "message": "Não foi possível identificar o usuário",
+                        "code": 401
+                    }
+                }), 401
+
+            return self.__projeto_control.get_estatisticas(user_id)
+
         # Retorna o Blueprint configurado para registro na aplicação Flask
         return self.__blueprint
\ No newline at end of file
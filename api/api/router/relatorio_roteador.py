@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from flask import Blueprint
+from api.middleware.jwt_middleware import JwtMiddleware
+from api.control.relatorio_control import RelatorioControl
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+class RelatorioRoteador:
+    """
+    Classe responsável por configurar as rotas de relatórios PDF no Flask.
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware, relatorio_control: RelatorioControl):
+        """
+        Construtor do roteador.
+
+        :param jwt_middleware: Middleware responsável por validar token JWT.
+        :param relatorio_control: Controlador dos relatórios.
+        """
+        logger.debug("⬆️  RelatorioRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__relatorio_control = relatorio_control
+
+        self.__blueprint = Blueprint('relatorio', __name__)
+
+    def create_routes(self):
+        """
+        Configura e retorna as rotas de relatórios.
+
+        Rotas implementadas:
+        - POST /api/relatorios                  -> Cria o job ({"tipo": "tarefas"|"projetos"|"usuarios",
+                                                   "parametros": {...}}); 202, ou 200 se já em cache
+        - GET  /api/relatorios/<job_id>         -> Status (pendente, processando, concluido, erro)
+        - GET  /api/relatorios/<job_id>/arquivo -> PDF (409 enquanto não estiver pronto)
+        """
+
+        @self.__blueprint.route('', methods=['POST'])
+        @self.__blueprint.route('/', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        def store():
+            """Enfileira um relatório do usuário autenticado. Requer autenticação JWT."""
+            user_id = self.__jwt_middleware.get_user_id()
+            return self.__relatorio_control.store(user_id)
+
+        @self.__blueprint.route('/<job_id>', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def show(job_id):
+            """Status de um relatório do usuário. Requer autenticação JWT."""
+            user_id = self.__jwt_middleware.get_user_id()
+            return self.__relatorio_control.show(user_id, job_id)
+
+        @self.__blueprint.route('/<job_id>/arquivo', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def arquivo(job_id):
+            """Baixa o PDF de um relatório concluído. Requer autenticação JWT."""
+            user_id = self.__jwt_middleware.get_user_id()
+            return self.__relatorio_control.arquivo(user_id, job_id)
+
+        return self.__blueprint
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 from flask import Blueprint, request, jsonify
 from api.middleware.jwt_middleware import JwtMiddleware
+from api.middleware.etag_middleware import EtagMiddleware
 from api.middleware.tarefa_middleware import TarefaMiddleware
 from api.control.tarefa_control import TarefaControl
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class TarefaRoteador:
     """
@@ -14,18 +18,22 @@ class TarefaRoteador:
     - Aplicar autenticação JWT e validações antes de chamar o controlador.
     """
 
-    def __init__(self, jwt_middleware: JwtMiddleware, tarefa_middleware: TarefaMiddleware, tarefa_control: TarefaControl):
+    def __init__(self, jwt_middleware: JwtMiddleware, tarefa_middleware: TarefaMiddleware, tarefa_control: TarefaControl,
+                 etag_middleware: EtagMiddleware = None):
         """
         Construtor do roteador.
 
         :param jwt_middleware: Middleware responsável por validar token JWT.
         :param tarefa_middleware: Middleware com validações específicas para Tarefa.
         :param tarefa_control: Controlador que implementa a lógica de negócio.
+        :param etag_middleware: Middleware de ETag/If-None-Match para as leituras (opcional).
         """
-        print("⬆️  TarefaRoteador.__init__()")
+        logger.debug("⬆️  TarefaRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__tarefa_middleware = tarefa_middleware
         self.__tarefa_control = tarefa_control
+        # ✅ NOVO: Sem EtagMiddleware as leituras respondem sempre 200
+        self.__condicional = etag_middleware.condicional if etag_middleware else (lambda f: f)
 
         self.__blueprint = Blueprint('tarefa', __name__)
 
@@ -44,7 +52,25 @@ class TarefaRoteador:
         - PUT /<id>/toggle-concluir -> Alterna status de conclusão
         - GET /minhas-tarefas -> Lista tarefas onde usuário é RESPONSÁVEL
         - GET /atribuidas-por-mim -> Lista tarefas que usuário ATRIBUIU para outros
+        - GET /buscar?q=<termo> -> Busca tarefas por relevância (responsável ou atribuidor)
         - GET /dashboard -> Estatísticas das tarefas
+
+        ✅ Paginação por cursor (opcional) nas rotas de listagem:
+        - ?limite=<n>         -> Tamanho da página (padrão 50, máximo 500)
+        - ?cursor=<token>     -> Valor de "next_cursor" retornado pela página anterior
+
+        ✅ Filtros e ordenação (opcionais) nas rotas de listagem, combináveis entre si:
+        - ?status=pendente,andamento  ?prioridade=alta  ?concluida=false
+        - ?projeto_id=<id>  ?responsavel_id=<id>  ?atribuidor_id=<id>
+        - ?data_limite_de=<data>  ?data_limite_ate=<data>  (ISO 8601)
+        - ?ordenar=padrao|data_limite|-data_limite|prioridade|-prioridade|titulo|-titulo|id|-id
+        - ?fields=id,titulo,concluida -> Só esses campos (sem JOIN se nenhum *_nome for pedido)
+
+        ✅ GET /?ids=1,2,3 -> Várias tarefas em uma única consulta (aceita ?fields=)
+        ✅ POST /bulk -> Lote de criações/atualizações/exclusões em uma transação
+        ✅ Leituras do usuário respondem com ETag; If-None-Match com a versão atual -> 304
+        ✅ GET / e GET /todas-tarefas com Accept: application/x-ndjson (ou ?stream=1)
+           -> uma tarefa por linha, em streaming (exportações grandes)
         """
 
         # POST / -> cria uma tarefa (com responsável e atribuidor)
@@ -62,9 +88,22 @@ class TarefaRoteador:
             user_id = self.__jwt_middleware.get_user_id()
             return self.__tarefa_control.store(user_id)
 
+        # ✅ NOVO: POST /bulk -> cria/atualiza/exclui várias tarefas em uma transação
+        @self.__blueprint.route('/bulk', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        def bulk():
+            """
+            Rota que aplica um lote de operações:
+            {"criar": [...], "atualizar": [{"id": 1, "tarefa": {...}}], "excluir": [2, 3]}
+            Requer autenticação JWT. Ou tudo é aplicado, ou nada.
+            """
+            user_id = self.__jwt_middleware.get_user_id()
+            return self.__tarefa_control.bulk(user_id)
+
         # GET / -> lista tarefas onde usuário é RESPONSÁVEL
         @self.__blueprint.route('/', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         def index():
             """
             Rota responsável por listar tarefas onde o usuário é RESPONSÁVEL.
@@ -77,6 +116,7 @@ class TarefaRoteador:
         # GET /<id> -> retorna uma tarefa específica (só se usuário for RESPONSÁVEL)
         @self.__blueprint.route('/<int:id>', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         @self.__tarefa_middleware.validate_id_param
         def show(id):
             """
@@ -126,6 +166,7 @@ class TarefaRoteador:
         # GET /projeto/<projeto_id> -> lista tarefas por projeto (só se usuário for RESPONSÁVEL)
         @self.__blueprint.route('/projeto/<int:projeto_id>', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         @self.__tarefa_middleware.validate_projeto_id_param
         def show_by_projeto(projeto_id):
             """
@@ -173,6 +214,7 @@ class TarefaRoteador:
         # GET /minhas-tarefas -> lista tarefas onde usuário é RESPONSÁVEL
         @self.__blueprint.route('/minhas-tarefas', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         def show_minhas_tarefas():
             """
             Rota que retorna todas as tarefas onde o usuário é RESPONSÁVEL.
@@ -194,6 +236,7 @@ class TarefaRoteador:
         # ✅ NOVA ROTA: GET /atribuidas-por-mim -> tarefas que usuário ATRIBUIU para outros
         @self.__blueprint.route('/atribuidas-por-mim', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         def show_tarefas_atribuidas():
             """
             Rota que retorna todas as tarefas que o usuário ATRIBUIU para outros.
@@ -215,10 +258,13 @@ class TarefaRoteador:
         # GET /dashboard -> estatísticas das tarefas onde usuário é RESPONSÁVEL
         @self.__blueprint.route('/dashboard', methods=['GET'])
         @self.__jwt_middleware.validate_token
+        @self.__condicional
         def dashboard():
             """
             Rota que retorna estatísticas das tarefas onde o usuário é RESPONSÁVEL.
             Requer autenticação JWT.
+
+            Filtros opcionais: ?projeto_id=, ?data_inicio= e ?data_fim= (sobre data_limite).
             """
             user_id = self.__jwt_middleware.get_user_id()
             if not user_id:
@@ -241,6 +287,8 @@ class TarefaRoteador:
             Rota que retorna TODAS as tarefas (sem filtro por usuário).
             ⚠️ APENAS PARA DESENVOLVIMENTO/ADMIN
             Requer autenticação JWT.
+            Com Accept: application/x-ndjson (ou ?stream=1) a exportação é enviada
+            em streaming, em memória constante.
             """
             user_id = self.__jwt_middleware.get_user_id()
             if not user_id:
@@ -321,6 +369,27 @@ class TarefaRoteador:
                 }
             }), 200
 
+        # ✅ NOVO: GET /buscar?q=<termo>&limite=<n> -> busca textual ranqueada
+        @self.__blueprint.route('/buscar', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        def buscar_tarefas():
+            """
+            Rota que busca tarefas (onde o usuário é responsável ou atribuidor)
+            por título ou descrição, ordenadas por relevância.
+            Requer autenticação JWT.
+            """
+            user_id = self.__jwt_middleware.get_user_id()
+            if not user_id:
+                return jsonify({
+                    "success": False,
+                    "error": {
+                        "message": "Não foi possível identificar o usuário",
+                        "code": 401
+                    }
+                }), 401
+
+            return self.__tarefa_control.search_tarefas(user_id)
+
         # ✅ NOVA ROTA: Health check para tarefas
         @self.__blueprint.route('/health', methods=['GET'])
         def health_check():
@@ -337,6 +406,7 @@ class TarefaRoteador:
                     "version": "1.0.0",
                     "endpoints": {
                         "criar_tarefa": "POST /api/tarefa/",
+                        "lote_tarefas": "POST /api/tarefa/bulk",
                         "listar_tarefas": "GET /api/tarefa/", 
                         "buscar_tarefa": "GET /api/tarefa/<id>",
                         "atualizar_tarefa": "PUT /api/tarefa/<id>",
@@ -344,6 +414,7 @@ class TarefaRoteador:
                         "tarefas_por_projeto": "GET /api/tarefa/projeto/<projeto_id>",
                         "minhas_tarefas": "GET /api/tarefa/minhas-tarefas",
                         "tarefas_atribuidas": "GET /api/tarefa/atribuidas-por-mim",
+                        "buscar_tarefas": "GET /api/tarefa/buscar?q=<termo>",
                         "dashboard": "GET /api/tarefa/dashboard"
                     }
                 }
@@ -3,6 +3,9 @@ from flask import Blueprint, request, jsonify
 from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.usuario_middleware import UsuarioMiddleware
 from api.control.usuario_control import UsuarioControl
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class UsuarioRoteador:
     """
@@ -22,7 +25,7 @@ class UsuarioRoteador:
         :param usuario_middleware: Middleware com validações específicas para Usuario.
         :param usuario_control: Controlador que implementa a lógica de negócio.
         """
-        print("⬆️  UsuarioRoteador.__init__()")
+        logger.debug("⬆️  UsuarioRoteador.__init__()")
         self.__jwt_middleware = jwt_middleware
         self.__usuario_middleware = usuario_middleware
         self.__usuario_control = usuario_control
@@ -37,7 +40,7 @@ class UsuarioRoteador:
         Rotas implementadas:
         - POST /login    -> Autentica usuário e retorna token JWT
         - POST /         -> Cria um novo usuário (cadastro)
-        - GET /          -> Lista todos os usuários (público para login)
+        - GET /          -> Lista todos os usuários (público para login; ?fields=id,nome para projeção)
         - GET /<id>      -> Retorna um usuário por ID
         - PUT /<id>      -> Atualiza um usuário por ID
         - DELETE /<id>   -> Remove um usuário por ID
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ThreadPoolExecutor
+from api.dao.usuario_dao import UsuarioDAO
+from api.dao.projeto_dao import ProjetoDAO
+from api.dao.tarefa_dao import TarefaDAO
+from api.utils.error_response import ErrorResponse
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+class DashboardService:
+    """
+    Monta o resumo do dashboard a partir de consultas agregadas.
+
+    As consultas são independentes e rodam em paralelo em um pool de threads
+    compartilhado. Fora do contexto da requisição cada thread usa sua própria
+    conexão do pool do MySQL, por isso o pool de threads é pequeno
+    (DASHBOARD_WORKERS, padrão 3) para não esgotar as conexões.
+    """
+
+    LIMITE_RECENTES_PADRAO = 3
+    LIMITE_RECENTES_MAXIMO = 20
+
+    def __init__(self, usuario_dao_dependency: UsuarioDAO, projeto_dao_dependency: ProjetoDAO,
+                 tarefa_dao_dependency: TarefaDAO, executor: ThreadPoolExecutor = None):
+        logger.debug("⬆️  DashboardService.__init__()")
+        self.__usuarioDAO = usuario_dao_dependency
+        self.__projetoDAO = projeto_dao_dependency
+        self.__tarefaDAO = tarefa_dao_dependency
+        self.__executor = executor or ThreadPoolExecutor(
+            max_workers=int(os.getenv("DASHBOARD_WORKERS", 3)),
+            thread_name_prefix="dashboard"
+        )
+
+    def getResumo(self, usuario_id: int, limite_recentes=None) -> dict:
+        """
+        Retorna contagens de usuários, projetos e tarefas, totais de
+        conclusão e os projetos mais recentes do usuário.
+        """
+        logger.debug("🟢 DashboardService.getResumo()")
+
+        if limite_recentes is None:
+            limite_recentes = self.LIMITE_RECENTES_PADRAO
+        try:
+            limite_recentes = int(limite_recentes)
+        except (TypeError, ValueError):
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'recentes' deve ser um número inteiro"})
+        if limite_recentes < 0 or limite_recentes > self.LIMITE_RECENTES_MAXIMO:
+            raise ErrorResponse(400, "Parâmetro inválido", {
+                "message": f"O parâmetro 'recentes' deve estar entre 0 e {self.LIMITE_RECENTES_MAXIMO}"
+            })
+
+        usuarios = self.__executor.submit(self.__usuarioDAO.count)
+        projetos = self.__executor.submit(self.__projetoDAO.count_by_status, usuario_id)
+        tarefas = self.__executor.submit(self.__tarefaDAO.agregarEstatisticas, usuario_id)
+        recentes = self.__executor.submit(self.__projetoDAO.findRecentes, usuario_id, limite_recentes) \
+            if limite_recentes else None
+
+        projetos_por_status = projetos.result()
+        estatisticas = tarefas.result()
+
+        return {
+            "usuarios": {"total": usuarios.result()},
+            "projetos": {
+                "total": sum(projetos_por_status.values()),
+                "por_status": projetos_por_status
+            },
+            "tarefas": {
+                "total": estatisticas["total"],
+                "concluidas": estatisticas["concluidas"],
+                "pendentes": estatisticas["pendentes"],
+                "taxa_conclusao": estatisticas["taxa_conclusao"]
+            },
+            "projetos_recentes": [
+                {
+                    "id": p["id"],
+                    "nome": p["nome"],
+                    "descricao": p["descricao"],
+                    "status": p["status"],
+                    "data_criacao": p["data_criacao"]
+                }
+                for p in (recentes.result() if recentes else [])
+            ]
+        }
@@ -0,0 +1,78 @@
+# api/service/email_service.py
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+class EmailService:
+    def __init__(self, email_outbox_dao_dependency, email_worker_dependency=None):
+        """
+        Service para envio de emails da aplicação.
+
+        Nenhum email é enviado na thread da requisição: as mensagens são
+        gravadas na outbox e entregues pelo EmailWorker.
+
+        :param email_worker_dependency: Worker a ser acordado após enfileirar (opcional)
+        """
+        logger.debug("⬆️  EmailService.__init__()")
+        self.__email_outbox_dao = email_outbox_dao_dependency
+        self.__email_worker = email_worker_dependency
+
+    def enfileirar(self, destinatario: str, assunto: str, corpo_html: str) -> int:
+        """
+        Coloca um email na outbox.
+
+        :return: ID da mensagem na outbox
+        """
+        logger.debug("🟢 EmailService.enfileirar() - Para: %s", destinatario)
+        id = self.__email_outbox_dao.enqueue(destinatario, assunto, corpo_html)
+        if self.__email_worker is not None:
+            # ✅ CORREÇÃO: Acordado antes do commit, o worker não via a mensagem
+            # e ela esperava o próximo ciclo (intervalo_segundos)
+            self.__email_outbox_dao.apos_commit(self.__email_worker.notificar)
+        return id
+
+    def enviarRecuperacaoSenha(self, email_destino: str, token: str, url_base: str = "http://localhost:5500") -> int:
+        """
+        Enfileira o email de recuperação de senha.
+
+        :return: ID da mensagem na outbox
+        """
+        assunto = "Recuperação de Senha - Organização de Tarefas"
+
+        # URL para redefinir senha (ajuste conforme sua estrutura)
+        url_redefinicao = f"{url_base}/redefinir-senha.html?token={token}"
+
+        mensagem_html = f"""
+        <html>
+        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+            <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #ddd; border-radius: 10px;">
+                <h2 style="color: #667eea; text-align: center;">Recuperação de Senha</h2>
+
+                <p>Olá,</p>
+
+                <p>Você solicitou a redefinição de sua senha no sistema <strong>Organização de Tarefas</strong>.</p>
+
+                <p>Clique no botão abaixo para redefinir sua senha:</p>
+
+                <div style="text-align: center; margin: 30px 0;">
+                    <a href="{url_redefinicao}" style="background-color: #667eea; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">
+                        Redefinir Senha
+                    </a>
+                </div>
+
+                <p><strong>Este link expira em 1 hora.</strong></p>
+
+                <p>Se você não solicitou esta redefinição, por favor ignore este email.</p>
+
+                <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
+
+                <p style="font-size: 12px; color: #666;">
+                    Equipe Organização de Tarefas<br>
+                    Este é um email automático, por favor não responda.
+                </p>
+            </div>
+        </body>
+        </html>
+        """
+
+        return self.enfileirar(email_destino, assunto, mensagem_html)
@@ -0,0 +1,190 @@
+# api/service/email_worker.py
+import smtplib
+import socket
+import threading
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# ✅ CORREÇÃO: Só estas exceções indicam servidor indisponível. Os demais
+# SMTPException (destinatário recusado, erro no DATA...) são do envio de
+# uma mensagem: em Python 3 eles também herdam de OSError.
+ERROS_CONEXAO = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, socket.timeout)
+
+
+class SessaoSMTP:
+    """
+    Conexão SMTP de longa duração.
+
+    Conecta (STARTTLS + login, se configurados) no primeiro envio e reaproveita
+    a sessão nos envios seguintes. Se o servidor derrubar a conexão ociosa,
+    reconecta uma vez e repete o envio.
+
+    Configuração (mesmas chaves de EMAIL_CONFIG):
+    - smtp_server, smtp_port
+    - email: remetente (e usuário do login)
+    - password: senha do login (None/vazio = sem login)
+    - starttls: bool (padrão True)
+    - timeout: segundos (padrão 30)
+    """
+
+    def __init__(self, config: dict):
+        self.__config = config
+        self.__smtp = None
+
+    def enviar(self, destinatario: str, assunto: str, corpo_html: str):
+        msg = MIMEMultipart()
+        msg['From'] = self.__config['email']
+        msg['To'] = destinatario
+        msg['Subject'] = assunto
+        msg.attach(MIMEText(corpo_html, 'html'))
+
+        try:
+            self._conexao().send_message(msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # Conexão ociosa derrubada (ex.: servidor reiniciado)
+            logger.info("🔄 Conexão SMTP perdida, reconectando...")
+            self.fechar()
+            self._conexao().send_message(msg)
+
+    def fechar(self):
+        smtp, self.__smtp = self.__smtp, None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except Exception:
+                try:
+                    smtp.close()
+                except Exception:
+                    pass
+
+    def _conexao(self) -> smtplib.SMTP:
+        if self.__smtp is None:
+            smtp = smtplib.SMTP(
+                self.__config['smtp_server'],
+                self.__config['smtp_port'],
+                timeout=self.__config.get('timeout', 30)
+            )
+            try:
+                if self.__config.get('starttls', True):
+                    smtp.starttls()
+                if self.__config.get('password'):
+                    smtp.login(self.__config['email'], self.__config['password'])
+            except Exception:
+                smtp.close()
+                raise
+            logger.info("✅ Sessão SMTP aberta em %s:%s", self.__config['smtp_server'], self.__config['smtp_port'])
+            self.__smtp = smtp
+        return self.__smtp
+
+
+class EmailWorker:
+    """
+    Worker em segundo plano que drena a outbox de emails.
+
+    - Reserva lotes de mensagens (EmailOutboxDAO.reservar_lote) e envia
+      todas pela mesma SessaoSMTP.
+    - Falhas são reagendadas com backoff exponencial
+      (backoff_base * 2^tentativas, até backoff_maximo) e, após
+      max_tentativas, a mensagem fica com status 'falhou'.
+    - Se a conexão SMTP cair no meio do lote, o restante volta para a fila
+      e o worker espera antes de reconectar.
+
+    processar_lote() pode ser chamado diretamente (ex.: em testes contra um
+    servidor SMTP local como o aiosmtpd, com starttls=False e sem senha).
+    """
+
+    def __init__(self, email_outbox_dao_dependency, smtp_config: dict, lote: int = 20,
+                 intervalo_segundos: float = 5, max_tentativas: int = 5,
+                 backoff_base: int = 30, backoff_maximo: int = 3600, sessao_smtp: SessaoSMTP = None):
+        logger.debug("⬆️  EmailWorker.__init__()")
+        self.__email_outbox_dao = email_outbox_dao_dependency
+        self.__sessao = sessao_smtp or SessaoSMTP(smtp_config)
+        self.__lote = lote
+        self.__intervalo = intervalo_segundos
+        self.__max_tentativas = max_tentativas
+        self.__backoff_base = backoff_base
+        self.__backoff_maximo = backoff_maximo
+        self.__acordar = threading.Event()
+        self.__parar = threading.Event()
+        self.__thread = None
+        self.__falhas_conexao = 0
+
+    def start(self):
+        """Inicia a thread do worker (chamadas repetidas são ignoradas)"""
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__parar.clear()
+        self.__thread = threading.Thread(target=self._loop, name="email-worker", daemon=True)
+        self.__thread.start()
+        logger.info("📧 EmailWorker iniciado")
+
+    def stop(self, timeout: float = 10):
+        """Para o worker e fecha a sessão SMTP"""
+        self.__parar.set()
+        self.__acordar.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+        self.__sessao.fechar()
+
+    def notificar(self):
+        """Acorda o worker (há mensagem nova na fila)"""
+        self.__acordar.set()
+
+    def processar_lote(self) -> int:
+        """
+        Reserva e envia um lote de mensagens.
+
+        :return: Quantidade de mensagens enviadas com sucesso
+        """
+        mensagens = self.__email_outbox_dao.reservar_lote(self.__lote)
+        enviados = []
+
+        for posicao, mensagem in enumerate(mensagens):
+            try:
+                self.__sessao.enviar(mensagem['destinatario'], mensagem['assunto'], mensagem['corpo_html'])
+                enviados.append(mensagem['id'])
+            except ERROS_CONEXAO as e:
+                # Servidor indisponível: não adianta tentar o resto do lote agora
+                logger.error("❌ Falha de conexão SMTP: %s", e)
+                self.__sessao.fechar()
+                self.__falhas_conexao += 1
+                self._registrar_falha(mensagem, e)
+                self.__email_outbox_dao.liberar([m['id'] for m in mensagens[posicao + 1:]])
+                break
+            except Exception as e:
+                logger.error("❌ Erro ao enviar email %s para %s: %s", mensagem['id'], mensagem['destinatario'], e)
+                self._registrar_falha(mensagem, e)
+        else:
+            self.__falhas_conexao = 0
+
+        self.__email_outbox_dao.marcar_enviados(enviados)
+        if enviados:
+            logger.info("✅ %s email(s) enviados", len(enviados))
+        return len(enviados)
+
+    def _registrar_falha(self, mensagem: dict, erro: Exception):
+        atraso = min(self.__backoff_base * (2 ** mensagem.get('tentativas', 0)), self.__backoff_maximo)
+        self.__email_outbox_dao.marcar_falha(mensagem['id'], erro, atraso, self.__max_tentativas)
+
+    def _loop(self):
+        while not self.__parar.is_set():
+            try:
+                enviados = self.processar_lote()
+            except Exception:
+                logger.error("❌ Erro no EmailWorker", exc_info=True)
+                enviados = 0
+
+            if enviados >= self.__lote:
+                continue  # Fila cheia: próximo lote imediatamente
+
+            # Conexão caindo seguidamente: espera mais antes de reconectar
+            espera = self.__intervalo
+            if self.__falhas_conexao:
+                espera = min(self.__intervalo * (2 ** self.__falhas_conexao), self.__backoff_maximo)
+
+            self.__acordar.wait(espera)
+            self.__acordar.clear()
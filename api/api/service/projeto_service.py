@@ -3,22 +3,41 @@ from api.dao.projeto_dao import ProjetoDAO
 from api.dao.usuario_dao import UsuarioDAO
 from api.model.projeto import Projeto
 from api.utils.error_response import ErrorResponse
-import traceback
+from api.utils.cache_leitura import CacheLeitura
+from api.utils.csv_stream import CsvStream
 from datetime import datetime
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class ProjetoService:
-    def __init__(self, projeto_dao_dependency: ProjetoDAO, usuario_dao_dependency: UsuarioDAO):
-        print("⬆️  ProjetoService.__init__()")
+    LIMITE_BUSCA_PADRAO = 20
+    LIMITE_BUSCA_MAXIMO = 100
+    LIMITE_RECENTES_PADRAO = 5
+    LIMITE_RECENTES_MAXIMO = 50
+    TOTAL_RECENTES_ESTATISTICAS = 3
+
+    # ✅ NOVO: Rótulos usados na exportação CSV
+    ROTULOS_STATUS = {"pendente": "Pendente", "andamento": "Em Andamento", "concluido": "Concluído"}
+    CABECALHO_CSV = ["ID", "Nome", "Descrição", "Status", "Responsável", "Data Início", "Data Término"]
+    # ✅ NOVO: Colunas do relatório PDF (larguras em mm)
+    CABECALHO_PDF = ["ID", "Nome", "Status", "Responsável", "Data Início", "Data Término"]
+    LARGURAS_PDF = [15, 47, 28, 40, 26, 26]
+
+    def __init__(self, projeto_dao_dependency: ProjetoDAO, usuario_dao_dependency: UsuarioDAO,
+                 cache_leitura_dependency: CacheLeitura = None):
+        logger.debug("⬆️  ProjetoService.__init__()")
         self.__projetoDAO = projeto_dao_dependency
         self.__usuarioDAO = usuario_dao_dependency
+        self.__cache = cache_leitura_dependency
 
     def createProjeto(self, jsonProjeto: dict, usuario_id: int = None) -> int:
         """
         Cria um novo projeto.
         Se usuario_id for fornecido, garante que o projeto seja criado para esse usuário.
         """
-        print("🟣 ProjetoService.createProjeto()")
-        print(f"📝 Dados recebidos para criar projeto: {jsonProjeto}")
+        logger.debug("🟣 ProjetoService.createProjeto()")
+        logger.debug("📝 Dados recebidos para criar projeto: %s", jsonProjeto)
 
         try:
             # Validações iniciais
@@ -57,28 +76,152 @@ class ProjetoService:
             return self.__projetoDAO.create(objProjeto)
 
         except ValueError as e:
-            print(f"❌ Erro de validação em createProjeto: {e}")
+            logger.error("❌ Erro de validação em createProjeto: %s", e)
             raise ErrorResponse(str(e), 400)
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em createProjeto: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em createProjeto: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(f"Erro interno ao criar projeto: {str(e)}", 500)
 
-    def findAll(self, usuario_id: int = None) -> list[dict]:
+    def findAll(self, usuario_id: int = None, fields: str = None) -> list[dict]:
         """
         Retorna todos os projetos.
         Se usuario_id for fornecido, retorna apenas projetos desse usuário.
+        ✅ NOVO: fields ("id,nome,status") limita as colunas lidas e retornadas.
         """
-        print("🟣 ProjetoService.findAll()")
+        logger.debug("🟣 ProjetoService.findAll()")
+        try:
+            campos = ProjetoDAO.PROJECAO.parse(fields)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": str(e)})
+
         try:
-            return self.__projetoDAO.findAll(usuario_id)
+            carregar = lambda: self.__projetoDAO.findAll(usuario_id, campos=campos)
+            # ✅ NOVO: Cache de leitura por usuário (invalidado pela versão a cada escrita)
+            if self.__cache is None:
+                return carregar()
+            return self.__cache.obter(usuario_id, "projetos", (campos,), carregar)
         except Exception as e:
-            print(f"❌ Erro inesperado em findAll: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em findAll: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao buscar projetos", 500)
 
+    def exportarCsv(self, usuario_id: int, parametros: dict = None):
+        """
+        ✅ NOVO: CSV dos projetos do usuário (opcionalmente ?status=), gerado em
+        blocos a partir do banco, com o nome do responsável vindo do JOIN
+        """
+        logger.debug("🟣 ProjetoService.exportarCsv()")
+        status = ((parametros or {}).get("status") or "").strip() or None
+        linhas = (
+            [
+                p["id"],
+                p["nome"] or "Sem nome",
+                p["descricao"] or "",
+                self.ROTULOS_STATUS.get(p["status"], p["status"]),
+                p["usuario_nome"] or "Não atribuído",
+                CsvStream.data(p["data_inicio"]),
+                CsvStream.data(p["data_fim"])
+            ]
+            for p in self.__projetoDAO.streamAll(usuario_id, status=status)
+        )
+        return CsvStream.gerar(self.CABECALHO_CSV, linhas)
+
+    def filtrosRelatorio(self, parametros: dict = None) -> dict:
+        """
+        ✅ NOVO: Filtros do relatório PDF de projetos (?status= opcional)
+        """
+        status = str((parametros or {}).get("status") or "").strip()
+        return {"status": status} if status else {}
+
+    def dadosRelatorio(self, usuario_id: int, filtros: dict, limite: int) -> dict:
+        """
+        ✅ NOVO: Conteúdo do relatório PDF de projetos: contagem por status
+        (consulta agregada) e as primeiras `limite` linhas, lidas em streaming
+        com o nome do responsável vindo do JOIN.
+        """
+        logger.debug("🟣 ProjetoService.dadosRelatorio()")
+        status = filtros.get("status")
+        por_status = self.__projetoDAO.count_by_status(usuario_id)
+        linhas = (
+            [
+                p["id"],
+                p["nome"] or "Sem nome",
+                self.ROTULOS_STATUS.get(p["status"], p["status"]),
+                p["usuario_nome"] or "Não atribuído",
+                CsvStream.data(p["data_inicio"]),
+                CsvStream.data(p["data_fim"])
+            ]
+            for p in self.__projetoDAO.streamAll(usuario_id, status=status, limite=limite)
+        )
+
+        resumo = []
+        if not status and por_status:
+            resumo.append("Por status: " + ", ".join(
+                f"{self.ROTULOS_STATUS.get(chave, chave)}: {total}" for chave, total in por_status.items()
+            ))
+
+        return {
+            "total": por_status.get(status, 0) if status else sum(por_status.values()),
+            "resumo": resumo,
+            "filtros": f"Status: {self.ROTULOS_STATUS.get(status, status)}" if status else "",
+            "cabecalho": self.CABECALHO_PDF,
+            "larguras": self.LARGURAS_PDF,
+            "tamanho_fonte": 9,
+            "linhas": linhas
+        }
+
+    def searchProjetos(self, usuario_id: int, termo: str, limite=None) -> list[dict]:
+        """
+        ✅ NOVO: Busca textual em nome/descrição, ordenada por relevância.
+        A filtragem e o limite acontecem no índice (FULLTEXT ou em memória).
+        """
+        logger.debug("🟣 ProjetoService.searchProjetos()")
+        termo = (termo or "").strip()
+        if not termo:
+            raise ErrorResponse(400, "Termo de busca não fornecido", {"message": "Informe o parâmetro 'q'"})
+        try:
+            limite = int(limite) if limite is not None else self.LIMITE_BUSCA_PADRAO
+        except (ValueError, TypeError):
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'limite' deve ser um número inteiro"})
+        if limite <= 0:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'limite' deve ser maior que zero"})
+        limite = min(limite, self.LIMITE_BUSCA_MAXIMO)
+
+        return self.__projetoDAO.search(usuario_id, termo, limite)
+
+    def findRecentes(self, usuario_id: int, limite=None) -> list[dict]:
+        """
+        ✅ NOVO: Projetos mais recentes do usuário.
+        Ordenação e limite acontecem no banco (índice usuario_id, data_criacao).
+        """
+        logger.debug("🟣 ProjetoService.findRecentes()")
+        try:
+            limite = int(limite) if limite is not None else self.LIMITE_RECENTES_PADRAO
+        except (ValueError, TypeError):
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'limite' deve ser um número inteiro"})
+        if limite <= 0 or limite > self.LIMITE_RECENTES_MAXIMO:
+            raise ErrorResponse(400, "Parâmetro inválido", {
+                "message": f"O parâmetro 'limite' deve estar entre 1 e {self.LIMITE_RECENTES_MAXIMO}"
+            })
+
+        return self.__projetoDAO.findRecentes(usuario_id, limite)
+
+    def getEstatisticas(self, usuario_id: int) -> dict:
+        """
+        ✅ NOVO: Total e contagem por status (GROUP BY) mais os últimos projetos.
+        Nenhuma consulta lê todos os projetos do usuário.
+        """
+        logger.debug("🟣 ProjetoService.getEstatisticas()")
+        projetos_por_status = self.__projetoDAO.count_by_status(usuario_id)
+        return {
+            "total_projetos": sum(projetos_por_status.values()),
+            "projetos_por_status": projetos_por_status,
+            "projetos_recentes": self.__projetoDAO.findRecentes(usuario_id, self.TOTAL_RECENTES_ESTATISTICAS)
+        }
+
     def findById(self, id: int, usuario_id: int = None) -> dict:
         """
         Busca projeto por ID.
@@ -103,8 +246,8 @@ class ProjetoService:
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em findById: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em findById: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao buscar projeto", 500)
 
     def updateProjeto(self, id: int, requestBody: dict, usuario_id: int = None) -> bool:
@@ -112,8 +255,8 @@ class ProjetoService:
         Atualiza dados de um projeto.
         Se usuario_id for fornecido, só atualiza se o projeto pertencer ao usuário.
         """
-        print("🟣 ProjetoService.updateProjeto()")
-        print(f"📝 Dados recebidos para atualizar projeto {id}: {requestBody}")
+        logger.debug("🟣 ProjetoService.updateProjeto()")
+        logger.debug("📝 Dados recebidos para atualizar projeto %s: %s", id, requestBody)
 
         try:
             if not requestBody or 'projeto' not in requestBody:
@@ -148,13 +291,13 @@ class ProjetoService:
             return self.__projetoDAO.update(objProjeto)
 
         except ValueError as e:
-            print(f"❌ Erro de validação em updateProjeto: {e}")
+            logger.error("❌ Erro de validação em updateProjeto: %s", e)
             raise ErrorResponse(str(e), 400)
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em updateProjeto: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em updateProjeto: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(f"Erro interno ao atualizar projeto: {str(e)}", 500)
 
     def deleteProjeto(self, id: int, usuario_id: int = None) -> bool:
@@ -162,19 +305,19 @@ class ProjetoService:
         Remove projeto por ID.
         Se usuario_id for fornecido, só deleta se o projeto pertencer ao usuário.
         """
-        print("🟣 ProjetoService.deleteProjeto()")
+        logger.debug("🟣 ProjetoService.deleteProjeto()")
         try:
             return self.__projetoDAO.delete(id, usuario_id)
         except Exception as e:
-            print(f"❌ Erro inesperado em deleteProjeto: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em deleteProjeto: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(f"Erro interno ao excluir projeto: {str(e)}", 500)
 
     def findByUsuarioId(self, usuario_id: int) -> list[dict]:
         """
         Busca projetos por ID do usuário.
         """
-        print("🟣 ProjetoService.findByUsuarioId()")
+        logger.debug("🟣 ProjetoService.findByUsuarioId()")
         
         try:
             # Verifica se o usuário existe
@@ -190,6 +333,6 @@ class ProjetoService:
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em findByUsuarioId: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em findByUsuarioId: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao buscar projetos do usuário", 500)
\ No newline at end of file
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from api.dao.versao_dao import VersaoDAO
+from api.service.tarefa_service import TarefaService
+from api.service.projeto_service import ProjetoService
+from api.service.usuario_service import UsuarioService
+from api.utils.error_response import ErrorResponse
+from api.utils.pdf_relatorio import PdfRelatorio
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class RelatorioService:
+    """
+    Relatórios PDF gerados em segundo plano (substitui o static/js/pdfGenerator.js).
+
+    - enfileirar() valida o pedido na requisição e devolve um job; a
+      renderização roda em um pool de threads próprio (RELATORIO_WORKERS,
+      padrão 2), nunca na thread da requisição. Fora do contexto da
+      requisição cada thread usa sua própria conexão do pool do MySQL, por
+      isso o pool é pequeno.
+    - Os dados vêm de consultas agregadas (totais por status/prioridade) e
+      de uma leitura em streaming limitada a RELATORIO_LIMITE_LINHAS linhas.
+    - O PDF fica em cache pela chave (usuário, tipo, filtros, versão dos
+      dados). A versão é a do VersaoDAO (tarefas/projetos) ou o resumo da
+      tabela de usuários, então pedidos repetidos sem escrita no meio saem
+      do cache e qualquer escrita gera um relatório novo.
+    - Pedidos iguais enquanto um relatório está sendo gerado entram no mesmo
+      grupo e são concluídos juntos, sem renderizar de novo.
+    - Com a fila cheia (RELATORIO_MAX_PENDENTES) o pedido é recusado com 503.
+
+    Jobs e arquivos ficam no backend de cache (CacheLRU ou CacheRedis) por
+    RELATORIO_TTL segundos; com Redis o status pode ser consultado em
+    qualquer processo. O agrupamento e o limite da fila continuam por
+    processo. Com vários workers e CacheLRU um job criado em um worker não
+    existe nos outros (ver `compartilhado`).
+    """
+
+    # tipo -> (título, assunto, rótulo usado em "Total de ...")
+    TIPOS = {
+        "tarefas": ("Relatório de Tarefas", "Lista de tarefas do sistema", "tarefas"),
+        "projetos": ("Relatório de Projetos", "Lista de projetos do sistema", "projetos"),
+        "usuarios": ("Relatório de Usuários", "Lista de usuários do sistema", "usuários"),
+    }
+
+    def __init__(self, tarefa_service_dependency: TarefaService, projeto_service_dependency: ProjetoService,
+                 usuario_service_dependency: UsuarioService, versao_dao_dependency: VersaoDAO, backend,
+                 executor: ThreadPoolExecutor = None, max_pendentes: int = None, ttl: int = None,
+                 limite_linhas: int = None):
+        """
+        :param backend: CacheLRU, CacheRedis ou objeto com get/set(expira_em=)/delete
+        :param executor: Pool onde os relatórios são renderizados
+        :param max_pendentes: int - Relatórios aceitos ao mesmo tempo (fila + em geração)
+        :param ttl: int - Segundos que jobs e arquivos ficam disponíveis
+        :param limite_linhas: int - Máximo de linhas na tabela de cada relatório
+        """
+        logger.debug("⬆️  RelatorioService.__init__()")
+        self.__fontes = {
+            "tarefas": tarefa_service_dependency,
+            "projetos": projeto_service_dependency,
+            "usuarios": usuario_service_dependency,
+        }
+        self.__usuario_service = usuario_service_dependency
+        self.__versao_dao = versao_dao_dependency
+        self.__backend = backend
+        self.__executor = executor or ThreadPoolExecutor(
+            max_workers=int(os.getenv("RELATORIO_WORKERS", 2)),
+            thread_name_prefix="relatorio"
+        )
+        self.__max_pendentes = max_pendentes or int(os.getenv("RELATORIO_MAX_PENDENTES", 20))
+        self.__ttl = ttl or int(os.getenv("RELATORIO_TTL", 3600))
+        self.__limite_linhas = limite_linhas or int(os.getenv("RELATORIO_LIMITE_LINHAS", 5000))
+        self.__vagas = threading.BoundedSemaphore(self.__max_pendentes)
+        self.__lock = threading.Lock()
+        self.__em_andamento = {}   # chave -> {"status": ..., "jobs": [ids]}
+        self.__contadores = {"gerados": 0, "do_cache": 0, "agrupados": 0, "erros": 0}
+
+    def enfileirar(self, usuario_id: int, tipo: str, parametros: dict = None) -> dict:
+        """
+        Cria um job de relatório.
+
+        :return: dict - Job (status "concluido" na hora quando o PDF já está em cache)
+        :raises ErrorResponse: 400 (tipo/filtros inválidos) ou 503 (fila cheia)
+        """
+        logger.debug("🟣 RelatorioService.enfileirar() - Tipo: %s", tipo)
+        if tipo not in self.TIPOS:
+            raise ErrorResponse(400, "Parâmetro inválido", {
+                "message": f"O campo 'tipo' deve ser um de: {', '.join(self.TIPOS)}"
+            })
+        if parametros is not None and not isinstance(parametros, dict):
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O campo 'parametros' deve ser um objeto"})
+
+        filtros = self.__fontes[tipo].filtrosRelatorio(parametros)
+        chave = self._chave(usuario_id, tipo, filtros)
+        job = {
+            "id": uuid.uuid4().hex,
+            "usuario_id": usuario_id,
+            "tipo": tipo,
+            "chave": chave,
+            "status": "pendente",
+            "em_cache": False,
+            "tamanho": None,
+            "erro": None,
+            "criado_em": datetime.now(),
+            "concluido_em": None,
+        }
+
+        conteudo = self.__backend.get(f"pdf:{chave}")
+        if conteudo is not None:
+            job.update(status="concluido", em_cache=True, tamanho=len(conteudo), concluido_em=datetime.now())
+            self._salvar(job)
+            self._contar("do_cache")
+            logger.debug("🎯 Relatório em cache - %s", chave)
+            return self._publico(job)
+
+        with self.__lock:
+            grupo = self.__em_andamento.get(chave)
+            if grupo is not None:
+                # Mesmo relatório já na fila: concluído junto com o primeiro
+                job["status"] = grupo["status"]
+                grupo["jobs"].append(job["id"])
+                self._salvar(job)
+                self.__contadores["agrupados"] += 1
+                return self._publico(job)
+
+            if not self.__vagas.acquire(blocking=False):
+                logger.warning("⚠️  Fila de relatórios cheia (%s pendentes)", self.__max_pendentes)
+                raise ErrorResponse(503, "Servidor ocupado, tente novamente em instantes", {"retry_after": 5})
+            self.__em_andamento[chave] = {"status": "pendente", "jobs": [job["id"]]}
+            self._salvar(job)
+
+        try:
+            self.__executor.submit(self._gerar, chave, tipo, usuario_id, filtros)
+        except RuntimeError as e:
+            logger.error("❌ Pool de relatórios indisponível: %s", e)
+            self.__vagas.release()
+            self._atualizar_grupo(chave, finalizar=True, status="erro", erro="Serviço de relatórios indisponível")
+            raise ErrorResponse(503, "Servidor ocupado, tente novamente em instantes", {"retry_after": 5})
+        return self._publico(job)
+
+    def consultar(self, usuario_id: int, job_id: str) -> dict:
+        """
+        Status do job (somente o dono enxerga o job).
+
+        :raises ErrorResponse: 404 se o job não existe, venceu ou é de outro usuário
+        """
+        return self._publico(self._job(usuario_id, job_id))
+
+    def arquivo(self, usuario_id: int, job_id: str) -> tuple:
+        """
+        PDF de um job concluído.
+
+        :return: tuple (conteúdo em bytes, nome do arquivo)
+        :raises ErrorResponse: 404 (job inexistente), 409 (ainda não pronto ou com erro), 410 (arquivo vencido)
+        """
+        job = self._job(usuario_id, job_id)
+        if job["status"] != "concluido":
+            raise ErrorResponse(409, "Relatório ainda não está pronto", {
+                "status": job["status"],
+                "message": job["erro"] or "Consulte o status do relatório e tente novamente"
+            })
+        conteudo = self.__backend.get(f"pdf:{job['chave']}")
+        if conteudo is None:
+            raise ErrorResponse(410, "Relatório expirado", {"message": "Solicite o relatório novamente"})
+        return conteudo, f"{job['tipo']}_{job['criado_em']:%Y-%m-%d}.pdf"
+
+    @property
+    def compartilhado(self) -> bool:
+        """Indica se jobs e PDFs ficam em um backend visível por todos os processos"""
+        return getattr(self.__backend, "compartilhado", False)
+
+    def estatisticas(self) -> dict:
+        """Contadores de relatórios gerados, servidos do cache, agrupados e com erro"""
+        with self.__lock:
+            return dict(self.__contadores, em_andamento=len(self.__em_andamento))
+
+    def shutdown(self):
+        """Cancela os relatórios na fila (os que estão sendo gerados terminam)"""
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    # ======================== GERAÇÃO ========================
+    def _gerar(self, chave: str, tipo: str, usuario_id: int, filtros: dict):
+        """Roda no pool: renderiza, guarda o PDF e conclui todos os jobs do grupo"""
+        inicio = time.perf_counter()
+        try:
+            self._atualizar_grupo(chave, status="processando")
+            conteudo = self._renderizar(tipo, usuario_id, filtros)
+            self.__backend.set(f"pdf:{chave}", conteudo, expira_em=time.time() + self.__ttl)
+            self._atualizar_grupo(chave, finalizar=True, status="concluido", tamanho=len(conteudo),
+                                  concluido_em=datetime.now())
+            self._contar("gerados")
+            logger.info("📄 Relatório de %s gerado em %.0f ms (%s bytes)",
+                        tipo, (time.perf_counter() - inicio) * 1000, len(conteudo))
+        except ErrorResponse as e:
+            self._atualizar_grupo(chave, finalizar=True, status="erro", erro=e.message, concluido_em=datetime.now())
+            self._contar("erros")
+        except Exception:
+            logger.error("❌ Erro ao gerar relatório de %s", tipo, exc_info=True)
+            self._atualizar_grupo(chave, finalizar=True, status="erro", erro="Erro interno ao gerar o relatório",
+                                  concluido_em=datetime.now())
+            self._contar("erros")
+        finally:
+            self.__vagas.release()
+
+    def _renderizar(self, tipo: str, usuario_id: int, filtros: dict) -> bytes:
+        titulo, assunto, rotulo = self.TIPOS[tipo]
+        dados = self.__fontes[tipo].dadosRelatorio(usuario_id, filtros, self.__limite_linhas)
+
+        agora = datetime.now()
+        informacoes = [
+            f"Data de emissão: {agora:%d/%m/%Y} às {agora:%H:%M:%S}",
+            f"Total de {rotulo}: {dados['total']}",
+        ]
+        if dados["filtros"]:
+            informacoes.append(f"Filtros aplicados: {dados['filtros']}")
+        informacoes.extend(dados["resumo"])
+        if dados["total"] > self.__limite_linhas:
+            informacoes.append(f"Tabela limitada às primeiras {self.__limite_linhas} linhas")
+
+        pdf = PdfRelatorio(titulo, assunto)
+        pdf.informacoes(informacoes)
+        pdf.tabela(dados["cabecalho"], dados["larguras"], dados["linhas"], tamanho_fonte=dados["tamanho_fonte"])
+        return pdf.gerar()
+
+    # ======================== AUXILIARES ========================
+    def _chave(self, usuario_id: int, tipo: str, filtros: dict) -> str:
+        """(usuário, tipo, filtros, versão dos dados); o de usuários é o mesmo para todos"""
+        if tipo == "usuarios":
+            dono, versao = 0, self.__usuario_service.versaoRelatorio()
+        else:
+            dono, versao = usuario_id, self.__versao_dao.get(usuario_id)
+        bruta = f"{dono}:{tipo}:{sorted(filtros.items())!r}:{versao}"
+        return hashlib.sha256(bruta.encode("utf-8")).hexdigest()
+
+    def _job(self, usuario_id: int, job_id: str) -> dict:
+        job = self.__backend.get(f"job:{job_id}")
+        if job is None or job["usuario_id"] != usuario_id:
+            raise ErrorResponse(404, "Relatório não encontrado", {"message": f"Relatório {job_id} não encontrado"})
+        return job
+
+    def _salvar(self, job: dict):
+        self.__backend.set(f"job:{job['id']}", job, expira_em=time.time() + self.__ttl)
+
+    def _atualizar_grupo(self, chave: str, finalizar: bool = False, **campos):
+        with self.__lock:
+            grupo = self.__em_andamento.pop(chave, None) if finalizar else self.__em_andamento.get(chave)
+            if grupo is None:
+                return
+            grupo["status"] = campos.get("status", grupo["status"])
+            for job_id in grupo["jobs"]:
+                job = self.__backend.get(f"job:{job_id}")
+                if job is not None:
+                    job.update(campos)
+                    self._salvar(job)
+
+    def _contar(self, contador: str):
+        with self.__lock:
+            self.__contadores[contador] += 1
+
+    @staticmethod
+    def _publico(job: dict) -> dict:
+        return {
+            "id": job["id"],
+            "tipo": job["tipo"],
+            "status": job["status"],
+            "em_cache": job["em_cache"],
+            "tamanho": job["tamanho"],
+            "erro": job["erro"],
+            "criado_em": job["criado_em"],
+            "concluido_em": job["concluido_em"],
+        }
@@ -1,23 +1,55 @@
 # -*- coding: utf-8 -*-
+from datetime import datetime, time
 from api.dao.tarefa_dao import TarefaDAO
 from api.dao.projeto_dao import ProjetoDAO
 from api.dao.usuario_dao import UsuarioDAO
 from api.model.tarefa import Tarefa
 from api.utils.error_response import ErrorResponse
-import traceback
+from api.utils.cursor import Cursor
+from api.utils.cache_leitura import CacheLeitura
+from api.utils.csv_stream import CsvStream
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 """
 Classe responsável pela camada de serviço para a entidade Tarefa.
 """
 class TarefaService:
-    def __init__(self, tarefa_dao_dependency: TarefaDAO, projeto_dao_dependency: ProjetoDAO, usuario_dao_dependency: UsuarioDAO = None):
-        print("⬆️  TarefaService.__init__()")
+    LIMITE_PADRAO = 50
+    LIMITE_MAXIMO = 500
+    # Tupla do cursor de findPage: [ordem_status, prioridade, data_limite, id]
+    TIPOS_CURSOR = (int, str, str, int)
+    LIMITE_BUSCA_PADRAO = 20
+    LIMITE_BUSCA_MAXIMO = 100
+    MAX_VALORES_FILTRO = 20
+    MAX_IDS = 1000
+    MAX_OPERACOES_BULK = 500
+
+    # ✅ NOVO: Rótulos e colunas da exportação CSV
+    ROTULOS_STATUS = {"pendente": "Pendente", "andamento": "Em Andamento", "concluida": "Concluída"}
+    ROTULOS_PRIORIDADE = {"alta": "Alta", "media": "Média", "baixa": "Baixa"}
+    CABECALHO_CSV = [
+        "ID", "Título", "Descrição", "Projeto", "Responsável", "Atribuído por",
+        "Status", "Prioridade", "Data Limite", "Data Início", "Data Fim", "Concluída"
+    ]
+    # ✅ NOVO: Colunas do relatório PDF (larguras em mm)
+    CABECALHO_PDF = ["ID", "Título", "Projeto", "Responsável", "Status", "Prioridade", "Data Limite"]
+    LARGURAS_PDF = [12, 42, 32, 32, 22, 20, 22]
+
+    # ✅ NOVO: Parâmetros de query string aceitos nas listagens
+    PARAMETROS_FILTRO = tuple(TarefaDAO.FILTROS) + ("ordenar", "fields")
+
+    def __init__(self, tarefa_dao_dependency: TarefaDAO, projeto_dao_dependency: ProjetoDAO, usuario_dao_dependency: UsuarioDAO = None,
+                 cache_leitura_dependency: CacheLeitura = None):
+        logger.debug("⬆️  TarefaService.__init__()")
         self.__tarefaDAO = tarefa_dao_dependency
         self.__projetoDAO = projeto_dao_dependency
         self.__usuarioDAO = usuario_dao_dependency
+        self.__cache = cache_leitura_dependency
 
     def createTarefa(self, jsonTarefa: dict, usuario_atribuidor_id: int = None) -> int:
-        print("🟣 TarefaService.createTarefa()")
+        logger.debug("🟣 TarefaService.createTarefa()")
 
         objTarefa = Tarefa()
         objTarefa.titulo = jsonTarefa["titulo"]
@@ -47,30 +79,30 @@ class TarefaService:
                 atribuidor_existe = None
                 
                 if hasattr(self.__usuarioDAO, 'find_by_id'):
-                    print(f"🔍 Validando responsável ID: {objTarefa.usuario_responsavel_id}")
+                    logger.debug("🔍 Validando responsável ID: %s", objTarefa.usuario_responsavel_id)
                     responsavel_existe = self.__usuarioDAO.find_by_id(objTarefa.usuario_responsavel_id)
-                    print(f"🔍 Validando atribuidor ID: {objTarefa.usuario_atribuidor_id}")
+                    logger.debug("🔍 Validando atribuidor ID: %s", objTarefa.usuario_atribuidor_id)
                     atribuidor_existe = self.__usuarioDAO.find_by_id(objTarefa.usuario_atribuidor_id)
                 
                 elif hasattr(self.__usuarioDAO, 'findById'):
-                    print(f"🔍 Validando responsável ID: {objTarefa.usuario_responsavel_id}")
+                    logger.debug("🔍 Validando responsável ID: %s", objTarefa.usuario_responsavel_id)
                     responsavel_existe = self.__usuarioDAO.findById(objTarefa.usuario_responsavel_id)
-                    print(f"🔍 Validando atribuidor ID: {objTarefa.usuario_atribuidor_id}")
+                    logger.debug("🔍 Validando atribuidor ID: %s", objTarefa.usuario_atribuidor_id)
                     atribuidor_existe = self.__usuarioDAO.findById(objTarefa.usuario_atribuidor_id)
                 
                 elif hasattr(self.__usuarioDAO, 'findByField'):
-                    print(f"🔍 Validando responsável ID: {objTarefa.usuario_responsavel_id}")
+                    logger.debug("🔍 Validando responsável ID: %s", objTarefa.usuario_responsavel_id)
                     responsavel_existe = self.__usuarioDAO.findByField("id", objTarefa.usuario_responsavel_id)
-                    print(f"🔍 Validando atribuidor ID: {objTarefa.usuario_atribuidor_id}")
+                    logger.debug("🔍 Validando atribuidor ID: %s", objTarefa.usuario_atribuidor_id)
                     atribuidor_existe = self.__usuarioDAO.findByField("id", objTarefa.usuario_atribuidor_id)
                 
                 else:
-                    print("⚠️  UsuarioDAO não possui métodos de busca conhecidos, pulando validação de usuários")
+                    logger.warning("⚠️  UsuarioDAO não possui métodos de busca conhecidos, pulando validação de usuários")
                     responsavel_existe = True
                     atribuidor_existe = True
                 
-                print(f"📊 Resultado validação responsável: {responsavel_existe}")
-                print(f"📊 Resultado validação atribuidor: {atribuidor_existe}")
+                logger.debug("📊 Resultado validação responsável: %s", responsavel_existe)
+                logger.debug("📊 Resultado validação atribuidor: %s", atribuidor_existe)
                 
                 #if not responsavel_existe:
                     #raise ErrorResponse(400, "Responsável não encontrado",
@@ -83,21 +115,235 @@ class TarefaService:
             except ErrorResponse:
                 raise
             except Exception as e:
-                print(f"⚠️  Erro na validação de usuários: {e}")
-                print(f"🔍 Stack trace: {traceback.format_exc()}")
-                print("⚠️  Continuando sem validação de usuários devido a erro...")
+                logger.warning("⚠️  Erro na validação de usuários: %s", e)
+                logger.error("🔍 Stack trace", exc_info=True)
+                logger.warning("⚠️  Continuando sem validação de usuários devido a erro...")
 
         projeto_existe = self.__projetoDAO.findById(objTarefa.projeto_id)
         if not projeto_existe:
             raise ErrorResponse(400, "Projeto não encontrado",
                               {"message": f"Projeto com ID {objTarefa.projeto_id} não existe"})
 
-        print(f"✅ Dados validados. Criando tarefa: {objTarefa.titulo}")
+        logger.debug("✅ Dados validados. Criando tarefa: %s", objTarefa.titulo)
         return self.__tarefaDAO.create(objTarefa)
 
     def findAll(self, usuario_id: int = None) -> list[dict]:
-        print("🟣 TarefaService.findAll()")
-        return self.__tarefaDAO.findAll(usuario_id=usuario_id)
+        logger.debug("🟣 TarefaService.findAll()")
+        return self._em_cache(usuario_id, "tarefas", (),
+                              lambda: self.__tarefaDAO.findAll(usuario_id=usuario_id))
+
+    def streamAll(self, usuario_id: int = None):
+        """
+        ✅ NOVO: Gerador com todas as tarefas (do responsável, se informado),
+        lidas aos poucos do banco. Sem cache: é para exportações grandes.
+        """
+        logger.debug("🟣 TarefaService.streamAll()")
+        return self.__tarefaDAO.streamAll(usuario_id)
+
+    def exportarCsv(self, usuario_id: int, parametros: dict = None):
+        """
+        ✅ NOVO: CSV das tarefas do responsável (aceita os mesmos filtros das
+        listagens), gerado em blocos a partir do banco. Os nomes de projeto,
+        responsável e atribuidor vêm dos JOINs da consulta.
+        """
+        logger.debug("🟣 TarefaService.exportarCsv()")
+        filtros, _ = self._ler_filtros(parametros)
+        linhas = (
+            [
+                t["id"],
+                t["titulo"] or "Sem título",
+                t["descricao"] or "",
+                t["projeto_nome"] or "N/A",
+                t["responsavel_nome"] or "N/A",
+                t["atribuidor_nome"] or "N/A",
+                self.ROTULOS_STATUS.get(t["status"], t["status"]),
+                self.ROTULOS_PRIORIDADE.get(t["prioridade"], t["prioridade"]),
+                CsvStream.data(t["data_limite"]),
+                CsvStream.data(t["data_inicio"]),
+                CsvStream.data(t["data_fim"]),
+                "Sim" if t["concluida"] else "Não"
+            ]
+            for t in self.__tarefaDAO.streamAll(usuario_id, filtros=filtros)
+        )
+        return CsvStream.gerar(self.CABECALHO_CSV, linhas)
+
+    def filtrosRelatorio(self, parametros: dict = None) -> dict:
+        """
+        ✅ NOVO: Valida os filtros do relatório PDF (os mesmos das listagens)
+        """
+        filtros, _ = self._ler_filtros(parametros)
+        return filtros
+
+    def dadosRelatorio(self, usuario_id: int, filtros: dict, limite: int) -> dict:
+        """
+        ✅ NOVO: Conteúdo do relatório PDF de tarefas: totais por status e
+        prioridade em uma consulta agregada e as primeiras `limite` linhas,
+        lidas em streaming com os nomes vindos dos JOINs.
+        """
+        logger.debug("🟣 TarefaService.dadosRelatorio()")
+        estatisticas = self.__tarefaDAO.agregarEstatisticas(usuario_id, filtros=filtros)
+        linhas = (
+            [
+                t["id"],
+                t["titulo"] or "Sem título",
+                t["projeto_nome"] or "N/A",
+                t["responsavel_nome"] or "Não atribuído",
+                self.ROTULOS_STATUS.get(t["status"], t["status"]),
+                self.ROTULOS_PRIORIDADE.get(t["prioridade"], t["prioridade"]),
+                CsvStream.data(t["data_limite"])
+            ]
+            for t in self.__tarefaDAO.streamAll(usuario_id, filtros=filtros, limite=limite)
+        )
+
+        resumo = []
+        if estatisticas["total"]:
+            resumo.append("Por status: " + ", ".join(
+                f"{self.ROTULOS_STATUS.get(status, status)}: {total}"
+                for status, total in estatisticas["por_status"].items()
+            ))
+            resumo.append("Por prioridade: " + ", ".join(
+                f"{self.ROTULOS_PRIORIDADE[prioridade]}: {total}"
+                for prioridade, total in estatisticas["por_prioridade"].items()
+            ))
+            resumo.append(f"Concluídas: {estatisticas['concluidas']} ({estatisticas['taxa_conclusao']}%)")
+
+        descricao = []
+        for nome, valor in filtros.items():
+            rotulos = {"status": self.ROTULOS_STATUS, "prioridade": self.ROTULOS_PRIORIDADE}.get(nome, {})
+            if isinstance(valor, list):
+                valor = ", ".join(rotulos.get(v, v) for v in valor)
+            elif isinstance(valor, bool):
+                valor = "sim" if valor else "não"
+            descricao.append(f"{nome}: {valor}")
+
+        return {
+            "total": estatisticas["total"],
+            "resumo": resumo,
+            "filtros": "; ".join(descricao),
+            "cabecalho": self.CABECALHO_PDF,
+            "larguras": self.LARGURAS_PDF,
+            "tamanho_fonte": 8,
+            "linhas": linhas
+        }
+
+    def searchTarefas(self, usuario_id: int, termo: str, limite=None) -> list[dict]:
+        """
+        ✅ NOVO: Busca textual em título/descrição, ordenada por relevância.
+        A filtragem e o limite acontecem no índice (FULLTEXT ou em memória).
+        """
+        logger.debug("🟣 TarefaService.searchTarefas()")
+        termo = (termo or "").strip()
+        if not termo:
+            raise ErrorResponse(400, "Termo de busca não fornecido", {"message": "Informe o parâmetro 'q'"})
+        try:
+            limite = int(limite) if limite is not None else self.LIMITE_BUSCA_PADRAO
+        except (ValueError, TypeError):
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'limite' deve ser um número inteiro"})
+        if limite <= 0:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'limite' deve ser maior que zero"})
+        limite = min(limite, self.LIMITE_BUSCA_MAXIMO)
+
+        return self.__tarefaDAO.search(usuario_id, termo, limite)
+
+    def findManyByIds(self, usuario_id: int, ids: str, parametros: dict = None) -> list[dict]:
+        """
+        ✅ NOVO: Resolve várias tarefas em uma consulta (WHERE id IN).
+
+        :param ids: str - IDs separados por vírgula ("1,2,3")
+        :param parametros: dict - Query string (aceita fields=)
+        :return: Tarefas encontradas, na ordem dos IDs
+        """
+        logger.debug("🟣 TarefaService.findManyByIds()")
+        try:
+            lista_ids = [int(id) for id in (ids or "").split(",") if id.strip()]
+        except ValueError:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'ids' deve conter números inteiros separados por vírgula"})
+        if not lista_ids:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "Informe ao menos um ID em 'ids'"})
+        if len(lista_ids) > self.MAX_IDS:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": f"O parâmetro 'ids' aceita no máximo {self.MAX_IDS} IDs"})
+
+        return self.__tarefaDAO.findManyByIds(lista_ids, usuario_id=usuario_id, campos=self._ler_campos(parametros))
+
+    def findFiltered(self, usuario_id: int = None, parametros: dict = None, atribuidor_id: int = None) -> list[dict]:
+        """
+        ✅ NOVO: Lista tarefas filtradas e ordenadas no banco.
+
+        :param parametros: dict - Query string (ver PARAMETROS_FILTRO), ex.:
+            status=pendente,andamento&prioridade=alta&data_limite_ate=2025-11-16&ordenar=data_limite
+            ✅ NOVO: fields=id,titulo,concluida limita as colunas lidas (e os JOINs) e retornadas
+        """
+        logger.debug("🟣 TarefaService.findFiltered()")
+        filtros, ordenar = self._ler_filtros(parametros)
+        return self.__tarefaDAO.findFiltered(
+            usuario_id=usuario_id,
+            filtros=filtros,
+            ordenar=ordenar,
+            atribuidor_id=atribuidor_id,
+            campos=self._ler_campos(parametros)
+        )
+
+    def findPage(self, usuario_id: int = None, limite=None, cursor: str = None,
+                 projeto_id: int = None, atribuidor_id: int = None, parametros: dict = None) -> dict:
+        """
+        ✅ NOVO: Lista tarefas paginadas por cursor.
+        Retorna a página e o next_cursor opaco para buscar a próxima.
+        Aceita os mesmos filtros de findFiltered(); a ordenação é sempre a padrão.
+        """
+        logger.debug("🟣 TarefaService.findPage()")
+        filtros, ordenar = self._ler_filtros(parametros)
+        if ordenar != "padrao":
+            raise ErrorResponse(400, "Parâmetro inválido", {
+                "message": "O parâmetro 'ordenar' não pode ser usado com paginação por cursor"
+            })
+
+        try:
+            limite = int(limite) if limite is not None else self.LIMITE_PADRAO
+        except (ValueError, TypeError):
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'limite' deve ser um número inteiro"})
+        if limite <= 0:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'limite' deve ser maior que zero"})
+        limite = min(limite, self.LIMITE_MAXIMO)
+
+        valores_cursor = None
+        if cursor:
+            try:
+                valores_cursor = Cursor.decode(cursor, self.TIPOS_CURSOR)
+                datetime.fromisoformat(valores_cursor[2])
+            except ValueError:
+                raise ErrorResponse(400, "Parâmetro inválido", {"message": "Cursor inválido"})
+
+        if projeto_id:
+            projetoExiste = self.__projetoDAO.findById(projeto_id)
+            if not projetoExiste:
+                raise ErrorResponse(
+                    404,
+                    "Projeto não encontrado",
+                    {"message": f"Não existe projeto com id {projeto_id}"}
+                )
+
+        pagina = self.__tarefaDAO.findPage(
+            usuario_id=usuario_id,
+            limite=limite,
+            cursor=valores_cursor,
+            projeto_id=projeto_id,
+            atribuidor_id=atribuidor_id,
+            filtros=filtros,
+            campos=self._ler_campos(parametros)
+        )
+
+        return {
+            "tarefas": pagina["tarefas"],
+            "next_cursor": Cursor.encode(pagina["next_cursor"]) if pagina["next_cursor"] else None,
+            "limite": limite
+        }
+
+    def findByField(self, campo: str, valor, usuario_id: int = None) -> list[dict]:
+        logger.debug("🟣 TarefaService.findByField() - Campo: %s", campo)
+        try:
+            return self.__tarefaDAO.findByField(campo, valor, usuario_id=usuario_id)
+        except ValueError as e:
+            raise ErrorResponse(400, str(e), {"message": f"Erro de validação: {str(e)}"})
 
     def findById(self, id: int, usuario_id: int = None) -> dict:
         tarefa = self.__tarefaDAO.findById(id, usuario_id=usuario_id)
@@ -110,78 +356,49 @@ class TarefaService:
 
     def updateTarefa(self, id: int, requestBody: dict, usuario_id: int = None) -> bool:
         """
-        ✅ CORREÇÃO CRÍTICA: Método completamente corrigido para evitar erro de atributo
+        ✅ OTIMIZAÇÃO: Atualiza apenas os campos enviados, sem buscar a tarefa antes.
+        A existência é decidida pelo número de linhas afetadas pelo UPDATE.
         """
-        print("🟣 TarefaService.updateTarefa()")
-        print(f"📝 Dados recebidos para atualizar tarefa {id}: {requestBody}")
+        logger.debug("🟣 TarefaService.updateTarefa()")
+        logger.debug("📝 Dados recebidos para atualizar tarefa %s: %s", id, requestBody)
 
         try:
             jsonTarefa = requestBody["tarefa"]
 
-            # ✅ CORREÇÃO: Busca a tarefa existente (retorna dict)
-            tarefa_existente_dict = self.__tarefaDAO.findById(id, usuario_id=usuario_id)
-            if not tarefa_existente_dict:
-                error_msg = f"Tarefa com ID {id} não existe"
-                if usuario_id:
-                    error_msg += f" para o usuário {usuario_id}"
-                raise ErrorResponse(404, "Tarefa não encontrada", {"message": error_msg})
-
-            # ✅ CORREÇÃO CRÍTICA: Converter dict para objeto Tarefa ANTES de usar
-            tarefa_existente_obj = self._dict_to_tarefa(tarefa_existente_dict)
-
-            objTarefa = Tarefa()
-            objTarefa.id = id
-            
-            # ✅ CORREÇÃO: Usa o objeto convertido (não o dict)
-            objTarefa.titulo = jsonTarefa.get("titulo", tarefa_existente_obj.titulo)
-            objTarefa.descricao = jsonTarefa.get("descricao", tarefa_existente_obj.descricao)
-            objTarefa.status = jsonTarefa.get("status", tarefa_existente_obj.status)
-            objTarefa.prioridade = jsonTarefa.get("prioridade", tarefa_existente_obj.prioridade)
-            objTarefa.concluida = jsonTarefa.get("concluida", tarefa_existente_obj.concluida)
-            objTarefa.projeto_id = jsonTarefa.get("projeto_id", tarefa_existente_obj.projeto_id)
-            objTarefa.usuario_responsavel_id = jsonTarefa.get("usuario_responsavel_id", tarefa_existente_obj.usuario_responsavel_id)
-            objTarefa.usuario_atribuidor_id = jsonTarefa.get("usuario_atribuidor_id", tarefa_existente_obj.usuario_atribuidor_id)
-            
-            # ✅ CORREÇÃO CRÍTICA: Verifica se usuario_id existe no objeto antes de usar
-            if hasattr(tarefa_existente_obj, 'usuario_id') and tarefa_existente_obj.usuario_id:
-                objTarefa.usuario_id = tarefa_existente_obj.usuario_id
-            else:
-                print("⚠️  Tarefa existente não possui usuario_id, mantendo como None")
+            campos = self._validar_campos(jsonTarefa)
 
-            # ✅ CORREÇÃO: Tratamento de datas
-            data_limite = jsonTarefa.get("data_limite")
-            if data_limite is not None:
-                objTarefa.data_limite = data_limite
-            else:
-                objTarefa.data_limite = tarefa_existente_obj.data_limite
+            # ✅ CORREÇÃO: data_limite nula mantém o valor atual
+            if "data_limite" in campos and campos["data_limite"] is None:
+                del campos["data_limite"]
 
-            # ✅ CORREÇÃO: Campos de data adicionais
-            objTarefa.data_inicio = jsonTarefa.get("data_inicio", getattr(tarefa_existente_obj, 'data_inicio', None))
-            objTarefa.data_fim = jsonTarefa.get("data_fim", getattr(tarefa_existente_obj, 'data_fim', None))
+            logger.debug("🔍 Campos a serem atualizados: %s", list(campos.keys()))
 
-            print(f"🔍 Campos a serem atualizados: {[k for k, v in jsonTarefa.items()]}")
+            if not campos:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": "Nenhum campo válido informado para atualização"})
 
             # ✅ CORREÇÃO: Valida projeto apenas se foi fornecido
-            if "projeto_id" in jsonTarefa and objTarefa.projeto_id:
-                projeto_existe = self.__projetoDAO.findById(objTarefa.projeto_id)
+            if campos.get("projeto_id"):
+                projeto_existe = self.__projetoDAO.findById(campos["projeto_id"])
                 if not projeto_existe:
-                    raise ErrorResponse(404, "Projeto não encontrado", {"message": f"Projeto com ID {objTarefa.projeto_id} não existe"})
+                    raise ErrorResponse(404, "Projeto não encontrado", {"message": f"Projeto com ID {campos['projeto_id']} não existe"})
 
-            return self.__tarefaDAO.update(objTarefa, usuario_id=usuario_id)
+            if not self.__tarefaDAO.updateParcial(id, campos, usuario_id=usuario_id):
+                raise self._tarefa_nao_encontrada(id, usuario_id)
+            return True
 
         except ValueError as e:
-            print(f"❌ Erro de validação em updateTarefa: {e}")
+            logger.error("❌ Erro de validação em updateTarefa: %s", e)
             raise ErrorResponse(400, str(e), {"message": f"Erro de validação: {str(e)}"})
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em updateTarefa: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em updateTarefa: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(500, "Erro interno do servidor", {"message": f"Erro interno ao atualizar tarefa: {str(e)}"})
 
     def updateTarefaConcluida(self, id: int, requestBody: dict, usuario_id: int = None) -> bool:
-        print("🟣 TarefaService.updateTarefaConcluida()")
-        print(f"📝 Atualizando apenas campo 'concluida' da tarefa {id}: {requestBody}")
+        logger.debug("🟣 TarefaService.updateTarefaConcluida()")
+        logger.debug("📝 Atualizando apenas campo 'concluida' da tarefa %s: %s", id, requestBody)
 
         try:
             jsonTarefa = requestBody["tarefa"]
@@ -195,33 +412,45 @@ class TarefaService:
                 else:
                     raise ErrorResponse(400, "Valor inválido", {"message": "O campo 'concluida' deve ser true ou false"})
 
-            tarefa_existente = self.__tarefaDAO.findById(id, usuario_id=usuario_id)
-            if not tarefa_existente:
-                error_msg = f"Tarefa com ID {id} não existe"
-                if usuario_id:
-                    error_msg += f" para o usuário {usuario_id}"
-                raise ErrorResponse(404, "Tarefa não encontrada", {"message": error_msg})
-
-            if hasattr(self.__tarefaDAO, 'marcarConcluida'):
-                return self.__tarefaDAO.marcarConcluida(id, concluida, usuario_id=usuario_id)
-            elif hasattr(self.__tarefaDAO, 'updateCampo'):
-                return self.__tarefaDAO.updateCampo(id, 'concluida', concluida, usuario_id=usuario_id)
-            else:
-                return self.marcarConcluida(id, concluida, usuario_id=usuario_id)
+            campos = {"concluida": concluida}
+            if "status" in jsonTarefa:
+                campos["status"] = jsonTarefa["status"]
+
+            # ✅ OTIMIZAÇÃO: Um único UPDATE, sem findById antes
+            if not self.__tarefaDAO.updateParcial(id, campos, usuario_id=usuario_id):
+                raise self._tarefa_nao_encontrada(id, usuario_id)
+            return True
 
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em updateTarefaConcluida: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em updateTarefaConcluida: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(500, "Erro interno do servidor", {"message": f"Erro interno ao atualizar status da tarefa: {str(e)}"})
 
+    def alternarConcluida(self, id: int, usuario_id: int = None) -> bool:
+        """
+        ✅ NOVO: Alterna 'concluida'/'status' em um único UPDATE no banco
+        """
+        logger.debug("🟣 TarefaService.alternarConcluida() - ID: %s", id)
+        try:
+            if not self.__tarefaDAO.alternarConcluida(id, usuario_id=usuario_id):
+                raise self._tarefa_nao_encontrada(id, usuario_id)
+            return True
+
+        except ErrorResponse:
+            raise
+        except Exception as e:
+            logger.error("❌ Erro inesperado em alternarConcluida: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
+            raise ErrorResponse(500, "Erro interno do servidor", {"message": f"Erro interno ao alternar status da tarefa: {str(e)}"})
+
     def deleteTarefa(self, id: int, usuario_id: int = None) -> bool:
-        print("🟣 TarefaService.deleteTarefa()")
+        logger.debug("🟣 TarefaService.deleteTarefa()")
         return self.__tarefaDAO.delete(id, usuario_id=usuario_id)
 
     def findByProjetoId(self, projeto_id: int, usuario_id: int = None) -> list[dict]:
-        print("🟣 TarefaService.findByProjetoId()")
+        logger.debug("🟣 TarefaService.findByProjetoId()")
         
         projetoExiste = self.__projetoDAO.findById(projeto_id)
         if not projetoExiste:
@@ -231,47 +460,229 @@ class TarefaService:
                 {"message": f"Não existe projeto com id {projeto_id}"}
             )
 
-        return self.__tarefaDAO.findByProjetoId(projeto_id, usuario_id=usuario_id)
+        return self._em_cache(usuario_id, "tarefas_projeto", (projeto_id,),
+                              lambda: self.__tarefaDAO.findByProjetoId(projeto_id, usuario_id=usuario_id))
 
     def marcarConcluida(self, id: int, concluida: bool, usuario_id: int = None) -> bool:
-        print(f"🟣 TarefaService.marcarConcluida() - ID: {id}, Concluída: {concluida}")
+        logger.debug("🟣 TarefaService.marcarConcluida() - ID: %s, Concluída: %s", id, concluida)
         
         try:
-            tarefa_existente_dict = self.__tarefaDAO.findById(id, usuario_id=usuario_id)
-            if not tarefa_existente_dict:
-                error_msg = f"Tarefa com ID {id} não existe"
-                if usuario_id:
-                    error_msg += f" para o usuário {usuario_id}"
-                raise ErrorResponse(404, "Tarefa não encontrada", {"message": error_msg})
-
-            # ✅ CORREÇÃO: Converter dict para objeto Tarefa
-            tarefa_existente_obj = self._dict_to_tarefa(tarefa_existente_dict)
-
-            objTarefa = Tarefa()
-            objTarefa.id = id
-            objTarefa.concluida = concluida
-            
-            # ✅ CORREÇÃO: Usa o objeto convertido
-            objTarefa.titulo = tarefa_existente_obj.titulo
-            objTarefa.descricao = tarefa_existente_obj.descricao
-            objTarefa.status = "concluida" if concluida else "pendente"
-            objTarefa.prioridade = tarefa_existente_obj.prioridade
-            objTarefa.data_limite = tarefa_existente_obj.data_limite
-            objTarefa.data_inicio = getattr(tarefa_existente_obj, 'data_inicio', None)
-            objTarefa.data_fim = getattr(tarefa_existente_obj, 'data_fim', None)
-            objTarefa.projeto_id = tarefa_existente_obj.projeto_id
-            objTarefa.usuario_responsavel_id = getattr(tarefa_existente_obj, 'usuario_responsavel_id', None)
-            objTarefa.usuario_atribuidor_id = getattr(tarefa_existente_obj, 'usuario_atribuidor_id', None)
-
-            return self.__tarefaDAO.update(objTarefa, usuario_id=usuario_id)
+            # ✅ OTIMIZAÇÃO: Atualiza só 'concluida' e 'status', sem buscar a tarefa antes
+            campos = {
+                "concluida": concluida,
+                "status": "concluida" if concluida else "pendente"
+            }
+            if not self.__tarefaDAO.updateParcial(id, campos, usuario_id=usuario_id):
+                raise self._tarefa_nao_encontrada(id, usuario_id)
+            return True
 
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em marcarConcluida: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em marcarConcluida: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(500, "Erro interno do servidor", {"message": f"Erro interno ao marcar tarefa como concluida: {str(e)}"})
 
+    def bulk(self, usuario_id: int, requestBody: dict) -> list[dict]:
+        """
+        ✅ NOVO: Cria, atualiza e exclui várias tarefas em uma única transação.
+
+        Corpo: {"criar": [{...tarefa}], "atualizar": [{"id": 1, "tarefa": {...}}], "excluir": [2, 3]}
+
+        Todas as operações são validadas antes de qualquer escrita (projetos
+        em uma consulta, posse das tarefas em outra). Se alguma falhar, nada é
+        aplicado e o erro traz o resultado de cada item. Caso contrário as
+        escritas usam INSERT de múltiplas linhas, executemany e DELETE ... IN,
+        na transação da requisição.
+
+        :return: list[dict] - Resultado de cada operação, na ordem recebida
+        """
+        logger.debug("🟣 TarefaService.bulk()")
+        if not isinstance(requestBody, dict):
+            raise ErrorResponse(400, "Dados não fornecidos", {"message": "Envie um objeto com 'criar', 'atualizar' e/ou 'excluir'"})
+
+        criar = requestBody.get("criar") or []
+        atualizar = requestBody.get("atualizar") or []
+        excluir = requestBody.get("excluir") or []
+        if not all(isinstance(lista, list) for lista in (criar, atualizar, excluir)):
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "'criar', 'atualizar' e 'excluir' devem ser listas"})
+        total = len(criar) + len(atualizar) + len(excluir)
+        if total == 0:
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "Nenhuma operação informada"})
+        if total > self.MAX_OPERACOES_BULK:
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": f"Máximo de {self.MAX_OPERACOES_BULK} operações por lote"})
+
+        erros = []
+
+        def erro(operacao, indice, status, mensagem, id=None):
+            erros.append({"operacao": operacao, "indice": indice, "id": id, "status": status, "erro": mensagem})
+
+        # 1ª passada: validação sem acesso ao banco
+        novas = []
+        for indice, jsonTarefa in enumerate(criar):
+            try:
+                if not isinstance(jsonTarefa, dict) or not jsonTarefa.get("titulo"):
+                    raise ValueError("O campo 'titulo' é obrigatório")
+                if jsonTarefa.get("projeto_id") is None:
+                    raise ValueError("O campo 'projeto_id' é obrigatório")
+                objTarefa = Tarefa()
+                objTarefa.titulo = jsonTarefa["titulo"]
+                objTarefa.descricao = jsonTarefa.get("descricao", "")
+                objTarefa.status = jsonTarefa.get("status", "pendente")
+                objTarefa.prioridade = jsonTarefa.get("prioridade", "media")
+                objTarefa.concluida = jsonTarefa.get("concluida", False)
+                objTarefa.data_limite = jsonTarefa.get("data_limite")
+                objTarefa.projeto_id = jsonTarefa["projeto_id"]
+                # Mesmo resultado de createTarefa: responsável = quem cria
+                objTarefa.usuario_atribuidor_id = usuario_id
+                objTarefa.usuario_responsavel_id = usuario_id
+                novas.append((indice, objTarefa))
+            except ValueError as e:
+                erro("criar", indice, 400, str(e))
+
+        alteracoes = []
+        for indice, item in enumerate(atualizar):
+            id = item.get("id") if isinstance(item, dict) else None
+            try:
+                if not isinstance(id, int) or isinstance(id, bool):
+                    raise ValueError("O campo 'id' deve ser um número inteiro")
+                campos = self._validar_campos(item.get("tarefa") or {})
+                # data_limite nula mantém o valor atual (como em updateTarefa)
+                if "data_limite" in campos and campos["data_limite"] is None:
+                    del campos["data_limite"]
+                if not campos:
+                    raise ValueError("Nenhum campo válido informado para atualização")
+                alteracoes.append((indice, id, campos))
+            except ValueError as e:
+                erro("atualizar", indice, 400, str(e), id)
+
+        exclusoes = []
+        for indice, id in enumerate(excluir):
+            if not isinstance(id, int) or isinstance(id, bool):
+                erro("excluir", indice, 400, "O ID deve ser um número inteiro", id)
+            else:
+                exclusoes.append((indice, id))
+
+        # 2ª passada: uma consulta para os projetos e uma para as tarefas
+        projeto_ids = {objTarefa.projeto_id for _, objTarefa in novas}
+        projeto_ids.update(campos["projeto_id"] for _, _, campos in alteracoes if campos.get("projeto_id"))
+        projetos_existentes = {p["id"] for p in self.__projetoDAO.findManyByIds(list(projeto_ids))} if projeto_ids else set()
+
+        tarefa_ids = [id for _, id, _ in alteracoes] + [id for _, id in exclusoes]
+        tarefas_existentes = {
+            t["id"] for t in self.__tarefaDAO.findManyByIds(tarefa_ids, usuario_id=usuario_id, campos=("id",))
+        } if tarefa_ids else set()
+
+        for indice, objTarefa in novas:
+            if objTarefa.projeto_id not in projetos_existentes:
+                erro("criar", indice, 400, f"Projeto com ID {objTarefa.projeto_id} não existe")
+        for indice, id, campos in alteracoes:
+            if id not in tarefas_existentes:
+                erro("atualizar", indice, 404, self._tarefa_nao_encontrada(id, usuario_id).details["message"], id)
+            elif campos.get("projeto_id") and campos["projeto_id"] not in projetos_existentes:
+                erro("atualizar", indice, 404, f"Projeto com ID {campos['projeto_id']} não existe", id)
+        for indice, id in exclusoes:
+            if id not in tarefas_existentes:
+                erro("excluir", indice, 404, self._tarefa_nao_encontrada(id, usuario_id).details["message"], id)
+
+        if erros:
+            ordem = {"criar": 0, "atualizar": 1, "excluir": 2}
+            erros.sort(key=lambda item: (ordem[item["operacao"]], item["indice"]))
+            raise ErrorResponse(400, "Erro na validação do lote", {
+                "message": f"{len(erros)} operação(ões) inválida(s); nenhuma alteração foi aplicada",
+                "resultados": erros
+            })
+
+        # Escritas: tudo na mesma transação da requisição
+        ids_criados = self.__tarefaDAO.createMany([objTarefa for _, objTarefa in novas]) if novas else []
+        if alteracoes:
+            self.__tarefaDAO.updateMany([(id, campos) for _, id, campos in alteracoes], usuario_id=usuario_id)
+        if exclusoes:
+            self.__tarefaDAO.deleteMany([id for _, id in exclusoes], usuario_id=usuario_id)
+
+        resultados = [
+            {"operacao": "criar", "indice": indice, "id": id, "status": 201}
+            for (indice, _), id in zip(novas, ids_criados)
+        ]
+        resultados += [{"operacao": "atualizar", "indice": indice, "id": id, "status": 200} for indice, id, _ in alteracoes]
+        resultados += [{"operacao": "excluir", "indice": indice, "id": id, "status": 200} for indice, id in exclusoes]
+        return resultados
+
+    def _em_cache(self, usuario_id: int, consulta: str, args: tuple, carregar):
+        """✅ NOVO: Lê pelo cache de leitura, se configurado"""
+        if self.__cache is None:
+            return carregar()
+        return self.__cache.obter(usuario_id, consulta, args, carregar)
+
+    def _validar_campos(self, jsonTarefa: dict) -> dict:
+        """
+        ✅ NOVO: Valida e normaliza apenas os campos enviados usando os setters do modelo.
+        :raises ValueError: Se algum valor for inválido
+        """
+        objTarefa = Tarefa()
+        campos = {}
+        for campo in TarefaDAO.CAMPOS_ATUALIZAVEIS:
+            if campo in jsonTarefa:
+                setattr(objTarefa, campo, jsonTarefa[campo])
+                campos[campo] = getattr(objTarefa, campo)
+        return campos
+
+    def _ler_filtros(self, parametros: dict) -> tuple:
+        """
+        ✅ NOVO: Converte e valida os filtros da query string.
+        Listas usam vírgula (status=pendente,andamento); datas usam ISO 8601
+        e data_limite_ate só com a data inclui o dia inteiro.
+
+        :return: tuple (filtros, ordenar)
+        """
+        parametros = parametros or {}
+        filtros = {}
+        try:
+            for nome in TarefaDAO.FILTROS:
+                valor = (parametros.get(nome) or "").strip()
+                if not valor:
+                    continue
+                if nome in ("status", "prioridade"):
+                    valores = list(dict.fromkeys(v.strip() for v in valor.split(",") if v.strip()))
+                    if len(valores) > self.MAX_VALORES_FILTRO:
+                        raise ValueError(f"O parâmetro '{nome}' aceita no máximo {self.MAX_VALORES_FILTRO} valores")
+                    filtros[nome] = valores
+                elif nome == "concluida":
+                    if valor.lower() not in ("true", "false", "1", "0"):
+                        raise ValueError("O parâmetro 'concluida' deve ser true ou false")
+                    filtros[nome] = valor.lower() in ("true", "1")
+                elif nome.startswith("data_limite"):
+                    data = datetime.fromisoformat(valor)
+                    if nome == "data_limite_ate" and len(valor) == 10:
+                        data = datetime.combine(data.date(), time.max.replace(microsecond=0))
+                    filtros[nome] = data.strftime("%Y-%m-%d %H:%M:%S")
+                else:
+                    filtros[nome] = int(valor)
+        except ValueError as e:
+            mensagem = str(e) if str(e).startswith("O parâmetro") else f"Valor inválido para o filtro '{nome}'"
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": mensagem})
+
+        ordenar = (parametros.get("ordenar") or "padrao").strip()
+        if ordenar not in TarefaDAO.ORDENACOES:
+            raise ErrorResponse(400, "Parâmetro inválido", {
+                "message": f"O parâmetro 'ordenar' deve ser um de: {', '.join(TarefaDAO.ORDENACOES)}"
+            })
+        return filtros, ordenar
+
+    def _ler_campos(self, parametros: dict) -> tuple | None:
+        """✅ NOVO: Lê a projeção ?fields= (None = todos os campos)"""
+        try:
+            return TarefaDAO.PROJECAO.parse((parametros or {}).get("fields"))
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": str(e)})
+
+    def _tarefa_nao_encontrada(self, id: int, usuario_id: int = None) -> ErrorResponse:
+        error_msg = f"Tarefa com ID {id} não existe"
+        if usuario_id:
+            error_msg += f" para o usuário {usuario_id}"
+        return ErrorResponse(404, "Tarefa não encontrada", {"message": error_msg})
+
+
     def _dict_to_tarefa(self, tarefa_dict: dict) -> Tarefa:
         """
         ✅ CORREÇÃO MELHORADA: Converte dicionário para objeto Tarefa de forma mais robusta
@@ -313,36 +724,73 @@ class TarefaService:
                 objTarefa.usuario_id = tarefa_dict['usuario_id']
                 
         except Exception as e:
-            print(f"⚠️  Erro ao converter dict para Tarefa: {e}")
-            print(f"🔍 Dados problemáticos: {tarefa_dict}")
+            logger.warning("⚠️  Erro ao converter dict para Tarefa: %s", e)
+            logger.debug("🔍 Dados problemáticos: %s", tarefa_dict)
             # Continua com o objeto parcialmente preenchido
             
         return objTarefa
 
     def atualizarCampoSimples(self, id: int, campo: str, valor: any, usuario_id: int = None) -> bool:
-        print(f"🟣 TarefaService.atualizarCampoSimples() - ID: {id}, Campo: {campo}, Valor: {valor}")
+        logger.debug("🟣 TarefaService.atualizarCampoSimples() - ID: %s, Campo: %s, Valor: %s", id, campo, valor)
         
         try:
-            tarefa_existente = self.__tarefaDAO.findById(id, usuario_id=usuario_id)
-            if not tarefa_existente:
-                error_msg = f"Tarefa com ID {id} não existe"
-                if usuario_id:
-                    error_msg += f" para o usuário {usuario_id}"
-                raise ErrorResponse(404, "Tarefa não encontrada", {"message": error_msg})
-
-            if hasattr(self.__tarefaDAO, 'updateCampo'):
-                return self.__tarefaDAO.updateCampo(id, campo, valor, usuario_id=usuario_id)
-            else:
-                update_data = {"tarefa": {campo: valor}}
-                return self.updateTarefa(id, update_data, usuario_id=usuario_id)
+            # ✅ OTIMIZAÇÃO: UPDATE de uma coluna só; 404 decidido pelas linhas afetadas
+            campos = self._validar_campos({campo: valor})
+            if not campos:
+                raise ErrorResponse(400, "Campo inválido", {"message": f"O campo '{campo}' não pode ser atualizado"})
+
+            if not self.__tarefaDAO.updateParcial(id, campos, usuario_id=usuario_id):
+                raise self._tarefa_nao_encontrada(id, usuario_id)
+            return True
 
+        except ValueError as e:
+            raise ErrorResponse(400, str(e), {"message": f"Erro de validação: {str(e)}"})
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em atualizarCampoSimples: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em atualizarCampoSimples: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(500, "Erro interno do servidor", {"message": f"Erro interno ao atualizar campo: {str(e)}"})
 
+    def getEstatisticas(self, usuario_id: int = None, projeto_id=None,
+                        data_inicio: str = None, data_fim: str = None) -> dict:
+        """
+        ✅ NOVO: Estatísticas agregadas no banco, com recorte opcional por projeto e período.
+        Datas em ISO 8601; data_fim só com a data inclui o dia inteiro.
+        """
+        logger.debug("🟣 TarefaService.getEstatisticas() - Usuario ID: %s", usuario_id)
+
+        if projeto_id is not None:
+            try:
+                projeto_id = int(projeto_id)
+            except (ValueError, TypeError):
+                raise ErrorResponse(400, "Parâmetro inválido", {"message": "O parâmetro 'projeto_id' deve ser um número inteiro"})
+
+        # ✅ CORREÇÃO: Valida o período antes de comparar com data_limite no banco
+        periodo = {}
+        for nome, valor in (("data_inicio", data_inicio), ("data_fim", data_fim)):
+            valor = (valor or "").strip()
+            if not valor:
+                periodo[nome] = None
+                continue
+            try:
+                data = datetime.fromisoformat(valor)
+            except ValueError:
+                raise ErrorResponse(400, "Parâmetro inválido", {
+                    "message": f"O parâmetro '{nome}' deve ser uma data ISO 8601 (ex.: 2025-11-16)"
+                })
+            if nome == "data_fim" and len(valor) == 10:
+                data = datetime.combine(data.date(), time.max.replace(microsecond=0))
+            periodo[nome] = data.strftime("%Y-%m-%d %H:%M:%S")
+        data_inicio, data_fim = periodo["data_inicio"], periodo["data_fim"]
+
+        return self.__tarefaDAO.agregarEstatisticas(
+            usuario_id=usuario_id,
+            projeto_id=projeto_id,
+            data_inicio=data_inicio,
+            data_fim=data_fim
+        )
+
     def getTarefasByUsuario(self, usuario_id: int) -> list[dict]:
-        print(f"🟣 TarefaService.getTarefasByUsuario() - Usuario ID: {usuario_id}")
+        logger.debug("🟣 TarefaService.getTarefasByUsuario() - Usuario ID: %s", usuario_id)
         return self.__tarefaDAO.findByField("usuario_responsavel_id", usuario_id)
\ No newline at end of file
@@ -1,24 +1,30 @@
 # api/service/usuario_service.py
 from api.model.usuario import Usuario  # ✅ CORREÇÃO: models NO PLURAL
 from api.utils.error_response import ErrorResponse
-import bcrypt
+from api.utils.hash_executor import HashExecutor
+from api.utils.csv_stream import CsvStream
 from datetime import datetime
-import traceback
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 class UsuarioService:
-    def __init__(self, usuario_dao_dependency):
+    def __init__(self, usuario_dao_dependency, hash_executor_dependency: HashExecutor = None):
         """
         Service para regras de negócio do Usuario
+
+        :param hash_executor_dependency: Executor de bcrypt fora da thread da requisição
         """
-        print("⬆️  UsuarioService.__init__()")
+        logger.debug("⬆️  UsuarioService.__init__()")
         self.__usuario_dao = usuario_dao_dependency
+        self.__hash_executor = hash_executor_dependency or HashExecutor()
 
     def createUsuario(self, usuario_data):
         """
         Cria um novo usuário com validações
         """
-        print("🟢 UsuarioService.createUsuario()")
-        print(f"📝 Dados recebidos: {usuario_data}")
+        logger.debug("🟢 UsuarioService.createUsuario()")
+        logger.debug("📝 Dados recebidos: %s", usuario_data)
         
         try:
             # Validações iniciais
@@ -38,44 +44,44 @@ class UsuarioService:
                 raise ErrorResponse("Senha é obrigatória", 400)
 
             # Verifica se email já existe
-            print(f"🔍 Verificando se email existe: {email}")
+            logger.debug("🔍 Verificando se email existe: %s", email)
             if self.__usuario_dao.email_exists(email):
                 raise ErrorResponse("Email já cadastrado", 400)
 
             # Cria objeto Usuario
-            print("👤 Criando objeto Usuario...")
+            logger.debug("👤 Criando objeto Usuario...")
             usuario = Usuario()
             usuario.nome = nome
             usuario.email = email
             
             # Hash da senha
-            print("🔐 Gerando hash da senha...")
-            senha_hash = bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+            logger.debug("🔐 Gerando hash da senha...")
+            senha_hash = self.__hash_executor.hash_senha(senha)
             usuario.senha_hash = senha_hash
             usuario.data_criacao = datetime.now()
 
-            print(f"💾 Salvando usuário no banco: {usuario.nome}, {usuario.email}")
+            logger.debug("💾 Salvando usuário no banco: %s, %s", usuario.nome, usuario.email)
             # Salva no banco
             new_id = self.__usuario_dao.create(usuario)
-            print(f"✅ Usuário criado com ID: {new_id}")
+            logger.debug("✅ Usuário criado com ID: %s", new_id)
             
             return new_id
 
         except ValueError as e:
-            print(f"❌ Erro de validação em createUsuario: {e}")
+            logger.error("❌ Erro de validação em createUsuario: %s", e)
             raise ErrorResponse(str(e), 400)
         except ErrorResponse:
             raise  # Re-lança erros que já são ErrorResponse
         except Exception as e:
-            print(f"❌ Erro inesperado em createUsuario: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em createUsuario: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse(f"Erro interno ao criar usuário: {str(e)}", 500)
 
     def loginUsuario(self, login_data):
         """
         Autentica usuário e retorna token JWT
         """
-        print("🟢 UsuarioService.loginUsuario()")
+        logger.debug("🟢 UsuarioService.loginUsuario()")
         try:
             email = login_data.get('email')
             senha = login_data.get('senha')
@@ -83,18 +89,18 @@ class UsuarioService:
             if not email or not senha:
                 raise ErrorResponse("Email e senha são obrigatórios", 400)
 
-            print(f"🔍 Buscando usuário por email: {email}")
+            logger.debug("🔍 Buscando usuário por email: %s", email)
             # Busca usuário
             usuario_db = self.__usuario_dao.find_by_email(email)
             if not usuario_db:
                 raise ErrorResponse("Email ou senha incorretos", 401)
 
-            print("🔐 Verificando senha...")
+            logger.debug("🔐 Verificando senha...")
             # Verifica senha
-            if not bcrypt.checkpw(senha.encode('utf-8'), usuario_db.senha_hash.encode('utf-8')):
+            if not self.__hash_executor.verificar_senha(senha, usuario_db.senha_hash):
                 raise ErrorResponse("Email ou senha incorretos", 401)
 
-            print(f"✅ Login bem-sucedido para: {usuario_db.nome}")
+            logger.debug("✅ Login bem-sucedido para: %s", usuario_db.nome)
             
             # ✅ CORREÇÃO: GERAR TOKEN JWT
             from api.http.meu_token_jwt import MeuTokenJWT  # Import aqui para evitar circular imports
@@ -124,14 +130,14 @@ class UsuarioService:
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em loginUsuario: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em loginUsuario: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao fazer login", 500)
     def findById(self, id):
         """
         Busca usuário por ID
         """
-        print(f"🟢 UsuarioService.findById() - ID: {id}")
+        logger.debug("🟢 UsuarioService.findById() - ID: %s", id)
         try:
             usuario_db = self.__usuario_dao.find_by_id(id)
             if not usuario_db:
@@ -149,16 +155,25 @@ class UsuarioService:
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em findById: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em findById: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao buscar usuário", 500)
 
-    def findAll(self):
+    def findAll(self, fields: str = None):
         """
         Busca todos os usuários
+        :param fields: str - ✅ NOVO: Projeção opcional ("id,nome"); só essas colunas são lidas
         """
-        print("🟢 UsuarioService.findAll()")
+        logger.debug("🟢 UsuarioService.findAll()")
+        try:
+            campos = self.__usuario_dao.PROJECAO.parse(fields)
+        except ValueError as e:
+            raise ErrorResponse(400, "Parâmetro inválido", {"message": str(e)})
+
         try:
+            if campos:
+                return self.__usuario_dao.find_all_campos(campos)
+
             usuarios_db = self.__usuario_dao.find_all()
             
             usuarios = []
@@ -170,19 +185,66 @@ class UsuarioService:
                     'data_criacao': usuario_db.data_criacao.strftime('%Y-%m-%d %H:%M:%S') if usuario_db.data_criacao else None
                 })
 
-            print(f"✅ Encontrados {len(usuarios)} usuários")
+            logger.debug("✅ Encontrados %s usuários", len(usuarios))
             return usuarios
 
         except Exception as e:
-            print(f"❌ Erro inesperado em findAll: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em findAll: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao buscar usuários", 500)
 
+    def exportarCsv(self):
+        """
+        ✅ NOVO: CSV de usuários (id, nome, email, data de criação), gerado em
+        blocos a partir do banco
+        """
+        logger.debug("🟢 UsuarioService.exportarCsv()")
+        linhas = (
+            [u["id"], u["nome"] or "Sem nome", u["email"] or "Sem email", CsvStream.data(u["data_criacao"])]
+            for u in self.__usuario_dao.stream_all()
+        )
+        return CsvStream.gerar(["ID", "Nome", "Email", "Data de Criação"], linhas)
+
+    def filtrosRelatorio(self, parametros: dict = None) -> dict:
+        """
+        ✅ NOVO: O relatório PDF de usuários não tem filtros
+        """
+        return {}
+
+    def dadosRelatorio(self, usuario_id: int, filtros: dict, limite: int) -> dict:
+        """
+        ✅ NOVO: Conteúdo do relatório PDF de usuários: total (consulta
+        agregada) e as primeiras `limite` linhas, lidas em streaming
+        """
+        logger.debug("🟢 UsuarioService.dadosRelatorio()")
+        resumo = self.__usuario_dao.resumo()
+        linhas = (
+            [u["id"], u["nome"] or "Sem nome", u["email"] or "Sem email", CsvStream.data(u["data_criacao"])]
+            for u in self.__usuario_dao.stream_all(limite=limite)
+        )
+        return {
+            "total": resumo["total"],
+            "resumo": [],
+            "filtros": "",
+            "cabecalho": ["ID", "Nome", "Email", "Data de Criação"],
+            "larguras": [15, 60, 70, 35],
+            "tamanho_fonte": 9,
+            "linhas": linhas
+        }
+
+    def versaoRelatorio(self) -> str:
+        """
+        ✅ NOVO: Versão da lista de usuários (muda a cada cadastro, alteração
+        ou remoção), usada na chave do cache de relatórios
+        """
+        resumo = self.__usuario_dao.resumo()
+        return f"{resumo['total']}-{resumo['ultimo_id']}-{resumo['ultima_atualizacao']}"
+
     def updateUsuario(self, id, usuario_data):
         """
         Atualiza usuário
         """
-        print(f"🟢 UsuarioService.updateUsuario() - ID: {id}")
+        logger.debug("🟢 UsuarioService.updateUsuario() - ID: %s", id)
         try:
             usuario_db = self.__usuario_dao.find_by_id(id)
             if not usuario_db:
@@ -190,7 +252,7 @@ class UsuarioService:
 
             update_data = usuario_data.get('usuario', {})
             
-            print(f"📝 Dados para atualização: {update_data}")
+            logger.debug("📝 Dados para atualização: %s", update_data)
             # Atualiza dados
             if 'nome' in update_data:
                 usuario_db.nome = update_data['nome']
@@ -201,54 +263,54 @@ class UsuarioService:
                         raise ErrorResponse("Email já está em uso por outro usuário", 400)
                 usuario_db.email = update_data['email']
             if 'senha' in update_data and update_data['senha']:
-                senha_hash = bcrypt.hashpw(update_data['senha'].encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+                senha_hash = self.__hash_executor.hash_senha(update_data['senha'])
                 usuario_db.senha_hash = senha_hash
 
             self.__usuario_dao.update(usuario_db)
-            print(f"✅ Usuário {id} atualizado com sucesso")
+            logger.debug("✅ Usuário %s atualizado com sucesso", id)
             return True
 
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em updateUsuario: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em updateUsuario: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao atualizar usuário", 500)
 
     def deleteUsuario(self, id):
         """
         Remove usuário
         """
-        print(f"🟢 UsuarioService.deleteUsuario() - ID: {id}")
+        logger.debug("🟢 UsuarioService.deleteUsuario() - ID: %s", id)
         try:
             usuario_db = self.__usuario_dao.find_by_id(id)
             if not usuario_db:
                 raise ErrorResponse("Usuário não encontrado", 404)
 
             self.__usuario_dao.delete(id)
-            print(f"✅ Usuário {id} excluído com sucesso")
+            logger.debug("✅ Usuário %s excluído com sucesso", id)
             return True
 
         except ErrorResponse:
             raise
         except Exception as e:
-            print(f"❌ Erro inesperado em deleteUsuario: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em deleteUsuario: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao excluir usuário", 500)
 
     def verificarEmail(self, email):
         """
         Verifica se email existe
         """
-        print(f"🟢 UsuarioService.verificarEmail() - Email: {email}")
+        logger.debug("🟢 UsuarioService.verificarEmail() - Email: %s", email)
         try:
             existe = self.__usuario_dao.email_exists(email)
-            print(f"📧 Email {email} existe: {existe}")
+            logger.debug("📧 Email %s existe: %s", email, existe)
             return {
                 'email_existe': existe
             }
 
         except Exception as e:
-            print(f"❌ Erro inesperado em verificarEmail: {e}")
-            print(f"🔍 Stack trace: {traceback.format_exc()}")
+            logger.error("❌ Erro inesperado em verificarEmail: %s", e)
+            logger.error("🔍 Stack trace", exc_info=True)
             raise ErrorResponse("Erro interno ao verificar email", 500)
\ No newline at end of file
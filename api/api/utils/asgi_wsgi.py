@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import io
+import sys
+
+from api.utils.ponte_async import executar_sincrono, await_only
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class AsgiWsgi:
+    """
+    Aplicação ASGI que atende as requisições com uma aplicação WSGI (Flask)
+    executada dentro de executar_sincrono().
+
+    Cada requisição roda em um greenlet no próprio event loop: as esperas
+    por banco (AsyncMysqlDatabase) e por envio ao cliente viram awaits, e
+    nenhuma thread fica presa por conexão. Respostas em streaming são
+    enviadas bloco a bloco, na ordem em que o gerador as produz.
+
+    O ciclo de vida (lifespan) chama `iniciar`, uma corrotina que devolve a
+    aplicação WSGI pronta, e `encerrar` no desligamento.
+    """
+
+    def __init__(self, iniciar, encerrar=None):
+        """
+        :param iniciar: async () -> aplicação WSGI
+        :param encerrar: async () -> None (opcional)
+        """
+        self.__iniciar = iniciar
+        self.__encerrar = encerrar
+        self.__wsgi_app = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+        else:
+            # websocket não é suportado pela API
+            raise RuntimeError(f"Tipo de conexão ASGI não suportado: {scope['type']}")
+
+    async def _lifespan(self, receive, send):
+        while True:
+            mensagem = await receive()
+            if mensagem["type"] == "lifespan.startup":
+                try:
+                    self.__wsgi_app = await self.__iniciar()
+                except Exception as e:
+                    logger.error("❌ Erro ao iniciar aplicação ASGI: %s", e, exc_info=True)
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif mensagem["type"] == "lifespan.shutdown":
+                try:
+                    if self.__encerrar is not None:
+                        await self.__encerrar()
+                except Exception as e:
+                    logger.error("❌ Erro ao encerrar aplicação ASGI: %s", e, exc_info=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        if self.__wsgi_app is None:
+            # Servidor sem lifespan (ou startup ainda não concluído)
+            await send({"type": "http.response.start", "status": 503,
+                        "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"retry-after", b"1")]})
+            await send({"type": "http.response.body", "body": "Servidor iniciando".encode("utf-8")})
+            return
+
+        corpo = bytearray()
+        while True:
+            mensagem = await receive()
+            if mensagem["type"] == "http.disconnect":
+                return
+            corpo += mensagem.get("body", b"")
+            if not mensagem.get("more_body"):
+                break
+
+        estado = {"desconectado": False}
+        vigia = asyncio.ensure_future(self._vigiar_desconexao(receive, estado))
+        try:
+            await executar_sincrono(self._responder, scope, bytes(corpo), send, estado)
+        finally:
+            vigia.cancel()
+
+    @staticmethod
+    async def _vigiar_desconexao(receive, estado: dict):
+        while True:
+            mensagem = await receive()
+            if mensagem["type"] == "http.disconnect":
+                estado["desconectado"] = True
+                return
+
+    def _responder(self, scope, corpo: bytes, send, estado: dict):
+        """Executa a aplicação WSGI (dentro do greenlet da requisição)"""
+        inicio = {}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and inicio.get("enviado"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            inicio["status"] = int(status.split(" ", 1)[0])
+            inicio["headers"] = [
+                (nome.lower().encode("latin-1"), valor.encode("latin-1")) for nome, valor in headers
+            ]
+            return lambda dados: None
+
+        def enviar_inicio():
+            if not inicio.get("enviado"):
+                inicio["enviado"] = True
+                await_only(send({"type": "http.response.start", "status": inicio["status"],
+                                 "headers": inicio["headers"]}))
+
+        resultado = self.__wsgi_app(self._environ(scope, corpo), start_response)
+        try:
+            for bloco in resultado:
+                if estado["desconectado"]:
+                    logger.debug("🔌 Cliente desconectou durante a resposta")
+                    return
+                if not bloco:
+                    continue
+                enviar_inicio()
+                await_only(send({"type": "http.response.body", "body": bloco, "more_body": True}))
+            enviar_inicio()
+            await_only(send({"type": "http.response.body", "body": b""}))
+        finally:
+            # Fecha o iterador aqui: teardown do Flask e devolução das conexões rodam no greenlet
+            if hasattr(resultado, "close"):
+                resultado.close()
+
+    @staticmethod
+    def _environ(scope, corpo: bytes) -> dict:
+        servidor = scope.get("server") or ("localhost", 80)
+        cliente = scope.get("client") or ("", 0)
+        root_path = scope.get("root_path", "")
+        caminho = scope["path"]
+        if root_path and caminho.startswith(root_path):
+            caminho = caminho[len(root_path):]
+
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            # PEP 3333: caminho em bytes decodificados como latin-1
+            "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+            "PATH_INFO": caminho.encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": str(servidor[0]),
+            "SERVER_PORT": str(servidor[1] or 80),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": cliente[0],
+            "REMOTE_PORT": str(cliente[1]),
+            "CONTENT_LENGTH": str(len(corpo)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(corpo),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": False,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+            "asgi.scope": scope
+        }
+
+        for nome, valor in scope.get("headers", []):
+            nome = nome.decode("latin-1").upper().replace("-", "_")
+            valor = valor.decode("latin-1")
+            if nome == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = valor
+                continue
+            if nome == "CONTENT_LENGTH":
+                continue
+            chave = f"HTTP_{nome}"
+            environ[chave] = f"{environ[chave]},{valor}" if chave in environ else valor
+        return environ
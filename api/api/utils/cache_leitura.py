@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from api.utils.single_flight import SingleFlight
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+_AUSENTE = object()
+
+
+class CacheLeitura:
+    """
+    Cache read-through das listagens por usuário, entre os services e os DAOs.
+
+    A chave de cada consulta é "u<usuario_id>:v<versao>:<consulta>:<args>",
+    onde a versão vem do VersaoDAO. Toda escrita nos DAOs de tarefas e
+    projetos incrementa a versão dos usuários afetados, então as entradas
+    antigas deixam de ser lidas na hora, só para esses usuários, inclusive
+    em outros processos. As entradas órfãs saem pelo despejo do backend
+    (LRU) ou pelo TTL, que também limita o atraso de escritas feitas fora
+    da API.
+
+    O backend é plugável: CacheLRU (em processo) ou CacheRedis (compartilhado).
+    Com um SingleFlight, leituras simultâneas da mesma chave que não estão
+    no cache fazem uma única consulta ao banco e compartilham o resultado.
+    Os valores devolvidos são compartilhados entre requisições e devem ser
+    tratados como somente leitura.
+    """
+
+    def __init__(self, backend, versao_dao, ttl: int = 300, single_flight: SingleFlight = None):
+        """
+        :param backend: CacheLRU, CacheRedis ou objeto com get/set(expira_em=)
+        :param versao_dao: VersaoDAO com a versão dos dados de cada usuário
+        :param ttl: int - Segundos que cada entrada vale
+        :param single_flight: SingleFlight para agrupar consultas simultâneas (opcional)
+        """
+        logger.debug("⬆️  CacheLeitura.__init__()")
+        self.__backend = backend
+        self.__versao_dao = versao_dao
+        self.__ttl = ttl
+        self.__single_flight = single_flight
+        self.__lock = threading.Lock()
+        self.__contadores = {}   # consulta -> [hits, misses]
+
+    def obter(self, usuario_id, consulta: str, args: tuple, carregar):
+        """
+        Retorna o resultado em cache ou chama carregar() e guarda o resultado.
+        Sem usuario_id (listagens globais) não há cache, só o agrupamento.
+
+        A versão é lida antes de carregar(): o resultado é no mínimo tão novo
+        quanto a versão da chave em que é guardado.
+        """
+        if not usuario_id:
+            return self._agrupar(f"global:{consulta}:{args!r}", carregar)
+
+        chave = f"u{usuario_id}:v{self.__versao_dao.get(usuario_id)}:{consulta}:{args!r}"
+        valor = self.__backend.get(chave, _AUSENTE)
+        self._contar(consulta, valor is not _AUSENTE)
+        if valor is not _AUSENTE:
+            logger.debug("🎯 CacheLeitura HIT - %s", chave)
+            return valor
+
+        # A chave inclui a versão: só leituras da mesma versão são agrupadas
+        return self._agrupar(chave, lambda: self._carregar_e_guardar(chave, carregar))
+
+    def _carregar_e_guardar(self, chave: str, carregar):
+        valor = carregar()
+        self.__backend.set(chave, valor, expira_em=time.time() + self.__ttl)
+        return valor
+
+    def _agrupar(self, chave: str, carregar):
+        if self.__single_flight is None:
+            return carregar()
+        return self.__single_flight.executar(chave, carregar)
+
+    def _contar(self, consulta: str, hit: bool):
+        with self.__lock:
+            contador = self.__contadores.setdefault(consulta, [0, 0])
+            contador[0 if hit else 1] += 1
+
+    def estatisticas(self) -> dict:
+        """Hits/misses totais e por consulta"""
+        with self.__lock:
+            por_consulta = {
+                consulta: {"hits": hits, "misses": misses}
+                for consulta, (hits, misses) in self.__contadores.items()
+            }
+        hits = sum(c["hits"] for c in por_consulta.values())
+        misses = sum(c["misses"] for c in por_consulta.values())
+        return {
+            "backend": type(self.__backend).__name__,
+            "hits": hits,
+            "misses": misses,
+            "taxa_acerto": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "por_consulta": por_consulta,
+            "agrupamento": self.__single_flight.estatisticas() if self.__single_flight else None
+        }
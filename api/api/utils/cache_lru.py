@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """
+    Cache em memória limitado, com despejo LRU e expiração por item.
+
+    Seguro para uso entre threads: todas as operações são feitas sob um lock.
+    Cada item guarda o instante (epoch, em segundos) em que deixa de valer;
+    itens vencidos são descartados na leitura.
+    """
+
+    # Os itens ficam na memória do processo (não são vistos por outros workers)
+    compartilhado = False
+
+    def __init__(self, capacidade: int = 1024):
+        """
+        :param capacidade: int - Número máximo de itens mantidos
+        """
+        if capacidade <= 0:
+            raise ValueError("Capacidade do cache deve ser maior que zero")
+        self.__capacidade = capacidade
+        self.__itens = OrderedDict()
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, chave, padrao=None):
+        """
+        Retorna o valor da chave, ou `padrao` se ausente ou vencido.
+        """
+        agora = time.time()
+        with self.__lock:
+            item = self.__itens.get(chave)
+            if item is None:
+                self.misses += 1
+                return padrao
+
+            valor, expira_em = item
+            if expira_em is not None and expira_em <= agora:
+                del self.__itens[chave]
+                self.misses += 1
+                return padrao
+
+            self.__itens.move_to_end(chave)
+            self.hits += 1
+            return valor
+
+    def set(self, chave, valor, expira_em: float = None):
+        """
+        Armazena um valor.
+
+        :param expira_em: float - Epoch em que o item vence (None = sem expiração)
+        """
+        if expira_em is not None and expira_em <= time.time():
+            return
+
+        with self.__lock:
+            self.__itens[chave] = (valor, expira_em)
+            self.__itens.move_to_end(chave)
+            while len(self.__itens) > self.__capacidade:
+                self.__itens.popitem(last=False)
+
+    def delete(self, chave):
+        """Remove a chave, se existir"""
+        with self.__lock:
+            self.__itens.pop(chave, None)
+
+    def clear(self):
+        """Remove todos os itens"""
+        with self.__lock:
+            self.__itens.clear()
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__itens)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import pickle
+import threading
+import time
+
+
+class CacheRedis:
+    """
+    Cache em um servidor compatível com Redis, com a mesma interface do
+    CacheLRU (get/set/delete/clear), para ser compartilhado entre processos.
+
+    Recebe o cliente pronto (redis.Redis ou qualquer objeto com get,
+    set(..., ex=), delete e scan_iter), o que permite trocar o servidor
+    por um substituto local em desenvolvimento. Os valores são serializados
+    com pickle: use apenas com um servidor confiável e privado.
+    """
+
+    # Todos os processos que usam o mesmo servidor enxergam os mesmos itens
+    compartilhado = True
+
+    def __init__(self, cliente, prefixo: str = "organizacao:"):
+        """
+        :param cliente: Cliente compatível com Redis
+        :param prefixo: str - Prefixo de todas as chaves gravadas
+        """
+        self.__cliente = cliente
+        self.__prefixo = prefixo
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, chave, padrao=None):
+        """
+        Retorna o valor da chave, ou `padrao` se ausente ou vencido.
+        """
+        bruto = self.__cliente.get(self.__prefixo + str(chave))
+        with self.__lock:
+            if bruto is None:
+                self.misses += 1
+                return padrao
+            self.hits += 1
+        return pickle.loads(bruto)
+
+    def set(self, chave, valor, expira_em: float = None):
+        """
+        Armazena um valor.
+
+        :param expira_em: float - Epoch em que o item vence (None = sem expiração)
+        """
+        ttl = None
+        if expira_em is not None:
+            ttl = int(expira_em - time.time())
+            if ttl <= 0:
+                return
+        self.__cliente.set(self.__prefixo + str(chave), pickle.dumps(valor), ex=ttl)
+
+    def delete(self, chave):
+        """Remove a chave, se existir"""
+        self.__cliente.delete(self.__prefixo + str(chave))
+
+    def clear(self):
+        """Remove todas as chaves com o prefixo deste cache"""
+        chaves = list(self.__cliente.scan_iter(match=self.__prefixo + "*"))
+        if chaves:
+            self.__cliente.delete(*chaves)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import os
+
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Extensões com threads próprias (start/stop): não sobrevivem ao fork
+SERVICOS_EM_SEGUNDO_PLANO = ("limpeza_tokens", "email_worker")
+
+# ✅ CORREÇÃO: Jobs de relatório em CacheLRU só existem no worker que os criou
+MENSAGEM_RELATORIO_LOCAL = (
+    "%s workers, mas os jobs de relatório ficam na memória de cada processo: "
+    "defina CACHE_REDIS_URL (backend compartilhado) ou use WEB_WORKERS=1"
+)
+
+
+def verificar_workers(app, workers: int):
+    """
+    ✅ CORREÇÃO: Recusa subir vários workers com estado que não é compartilhado
+    entre processos: um relatório criado em um worker e consultado em
+    outro responderia 404.
+
+    :raises RuntimeError: workers > 1 com jobs de relatório em memória
+    """
+    relatorio_service = app.extensions.get("relatorio_service")
+    if workers > 1 and relatorio_service is not None and not relatorio_service.compartilhado:
+        logger.error("❌ " + MENSAGEM_RELATORIO_LOCAL, workers)
+        raise RuntimeError(MENSAGEM_RELATORIO_LOCAL % workers)
+
+
+def preparar_fork(app):
+    """
+    Chamada no processo mestre depois de carregar a aplicação (preload) e
+    antes de criar os workers.
+
+    O mestre não atende requisições: para as threads de segundo plano,
+    encerra o pool de processos de hash e fecha as conexões do pool MySQL,
+    para que nenhum worker herde sockets abertos.
+    """
+    for nome in SERVICOS_EM_SEGUNDO_PLANO:
+        servico = app.extensions.get(nome)
+        if servico is not None:
+            servico.stop()
+
+    hash_executor = app.extensions.get("hash_executor")
+    if hash_executor is not None:
+        hash_executor.shutdown()
+
+    database = app.extensions.get("database")
+    if hasattr(database, "fechar_pool"):
+        database.fechar_pool()
+
+    logger.info("🍴 Aplicação pronta para o fork dos workers (mestre pid %s)", os.getpid())
+
+
+def apos_fork(app):
+    """
+    Chamada em cada worker logo após o fork.
+
+    Recria o que é do processo: a thread de logging, o pool MySQL (um por
+    worker, nunca compartilhado) e as threads de segundo plano.
+    """
+    Logger.apos_fork()
+
+    database = app.extensions.get("database")
+    if hasattr(database, "reiniciar_pool"):
+        database.reiniciar_pool()
+
+    for nome in SERVICOS_EM_SEGUNDO_PLANO:
+        servico = app.extensions.get(nome)
+        if servico is not None:
+            servico.start()
+
+    logger.info("👷 Worker %s pronto (pool MySQL próprio)", os.getpid())
+
+
+def encerrar_worker(app):
+    """
+    Chamada quando um worker sai (parada graciosa, HUP ou max_requests):
+    para as threads e pools do processo e esvazia a fila de logging.
+    """
+    for nome in SERVICOS_EM_SEGUNDO_PLANO:
+        servico = app.extensions.get(nome)
+        if servico is not None:
+            servico.stop()
+
+    for nome in ("hash_executor", "relatorio_service"):
+        servico = app.extensions.get(nome)
+        if servico is not None:
+            servico.shutdown()
+
+    logger.info("👋 Worker %s encerrado", os.getpid())
+    Logger.shutdown()
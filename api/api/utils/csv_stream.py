@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import csv
+import io
+from datetime import date
+
+
+class CsvStream:
+    """
+    Classe utilitária para gerar CSV em blocos, a partir de um iterável de
+    linhas, sem montar o arquivo inteiro em memória.
+
+    Mesmo formato do antigo static/js/csvGenerator.js: separador vírgula,
+    BOM UTF-8 (para o Excel abrir com acentos) e datas em dd/mm/aaaa.
+    """
+
+    BOM = "﻿"
+
+    @staticmethod
+    def gerar(cabecalho: list, linhas, linhas_por_bloco: int = 500):
+        """
+        Gera o CSV em blocos de texto.
+
+        :param cabecalho: list - Nomes das colunas
+        :param linhas: Iterável de listas (uma por linha do CSV)
+        :param linhas_por_bloco: int - Linhas acumuladas antes de cada envio
+        """
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer, lineterminator="\n")
+        buffer.write(CsvStream.BOM)
+        escritor.writerow(cabecalho)
+
+        pendentes = 0
+        for linha in linhas:
+            escritor.writerow(linha)
+            pendentes += 1
+            if pendentes >= linhas_por_bloco:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                pendentes = 0
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def data(valor, padrao: str = "N/A") -> str:
+        """Formata date/datetime (ou texto ISO) como dd/mm/aaaa"""
+        if not valor:
+            return padrao
+        if isinstance(valor, str):
+            try:
+                valor = date.fromisoformat(valor[:10])
+            except ValueError:
+                return valor
+        return valor.strftime("%d/%m/%Y")
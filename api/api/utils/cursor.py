@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import base64
+import json
+
+
+class Cursor:
+    """
+    Classe utilitária para paginação por cursor (keyset).
+
+    O cursor é a tupla de ordenação da última linha entregue ao cliente,
+    serializada em JSON e codificada em base64 (url-safe), de forma que
+    o cliente o trate como um valor opaco.
+    """
+
+    @staticmethod
+    def encode(valores: list) -> str:
+        """
+        Codifica a tupla de ordenação em um token opaco.
+
+        :param valores: list - Valores das colunas de ordenação da última linha
+        :return: str - Token do cursor
+        """
+        bruto = json.dumps(valores, separators=(",", ":"), default=str)
+        return base64.urlsafe_b64encode(bruto.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode(token: str, tipos: tuple) -> list:
+        """
+        Decodifica um token gerado por Cursor.encode().
+
+        :param token: str - Token recebido do cliente
+        :param tipos: tuple - Tipo esperado de cada valor da tupla (ex.: (int, str, str, int))
+        :return: list - Valores das colunas de ordenação
+        :raises ValueError: Se o token estiver malformado
+        """
+        try:
+            preenchimento = "=" * (-len(token) % 4)
+            bruto = base64.urlsafe_b64decode((token + preenchimento).encode("ascii"))
+            valores = json.loads(bruto.decode("utf-8"))
+        except (ValueError, TypeError, UnicodeError):
+            raise ValueError("Cursor inválido")
+
+        if not isinstance(valores, list) or len(valores) != len(tipos):
+            raise ValueError("Cursor inválido")
+        # ✅ CORREÇÃO: O token vem do cliente: cada valor vai como parâmetro SQL
+        # (bool é subclasse de int no Python e não é aceito como inteiro)
+        for valor, tipo in zip(valores, tipos):
+            if not isinstance(valor, tipo) or (tipo is int and isinstance(valor, bool)):
+                raise ValueError("Cursor inválido")
+        return valores
@@ -38,6 +38,16 @@ class ErrorResponse(Exception):
         """Retorna informações adicionais sobre o erro"""
         return self.__error
 
+    @property
+    def headers(self) -> dict:
+        """
+        ✅ NOVO: Cabeçalhos HTTP da resposta de erro: Retry-After quando os
+        detalhes trazem "retry_after" (ex.: 503 do HashExecutor ocupado)
+        """
+        if isinstance(self.__error, dict) and self.__error.get("retry_after"):
+            return {"Retry-After": str(self.__error["retry_after"])}
+        return {}
+
     def __str__(self) -> str:
         """Representação textual do erro"""
         return f"[{self.__httpCode}] {self.__message} | Detalhes: {self.__error}"
\ No newline at end of file
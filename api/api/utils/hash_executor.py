@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import bcrypt
+
+from api.database.unit_of_work import UnitOfWork
+from api.utils.error_response import ErrorResponse
+from api.utils.ponte_async import await_only, em_ponte
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+def _hashpw(senha: str) -> str:
+    return bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+
+def _checkpw(senha: str, senha_hash: str) -> bool:
+    try:
+        return bcrypt.checkpw(senha.encode('utf-8'), senha_hash.encode('utf-8'))
+    except ValueError:
+        # Hash em formato não-bcrypt (ex.: gerado por outra biblioteca)
+        return False
+
+
+class HashExecutor:
+    """
+    Executor dedicado para hash/verificação de senhas com bcrypt.
+
+    O bcrypt é propositalmente lento (centenas de ms por operação). Rodá-lo
+    na thread da requisição prende o worker e atrasa todas as outras
+    requisições durante picos de login. Aqui ele roda em um pool de
+    processos do tamanho do número de núcleos, com uma fila limitada:
+    quando a fila está cheia a operação é recusada com ErrorResponse 503
+    em vez de acumular requisições esperando.
+
+    Configuração por ambiente:
+    - HASH_WORKERS: processos do pool (padrão: os.cpu_count())
+    - HASH_MAX_PENDENTES: operações aceitas ao mesmo tempo (padrão: 4 x workers)
+    - HASH_TIMEOUT: segundos de espera pelo resultado (padrão: 10)
+    """
+
+    def __init__(self, workers: int = None, max_pendentes: int = None, timeout: float = None):
+        self.__workers = workers or int(os.getenv("HASH_WORKERS", 0)) or os.cpu_count() or 1
+        self.__max_pendentes = max_pendentes or int(os.getenv("HASH_MAX_PENDENTES", 0)) or self.__workers * 4
+        self.__timeout = timeout or float(os.getenv("HASH_TIMEOUT", 10))
+        self.__vagas = threading.BoundedSemaphore(self.__max_pendentes)
+        self.__lock = threading.Lock()
+        self.__pool = None
+
+    def hash_senha(self, senha: str) -> str:
+        """
+        Gera o hash bcrypt da senha.
+
+        :raises ErrorResponse: 503 se o executor estiver sobrecarregado
+        """
+        return self._executar(_hashpw, senha)
+
+    def verificar_senha(self, senha: str, senha_hash: str) -> bool:
+        """
+        Verifica a senha contra um hash bcrypt.
+
+        :raises ErrorResponse: 503 se o executor estiver sobrecarregado
+        """
+        return self._executar(_checkpw, senha, senha_hash)
+
+    def shutdown(self):
+        """Encerra os processos do pool (o próximo uso cria um pool novo)"""
+        with self.__lock:
+            pool, self.__pool = self.__pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self.__lock:
+            if self.__pool is None:
+                self.__pool = ProcessPoolExecutor(max_workers=self.__workers)
+            return self.__pool
+
+    def _executar(self, funcao, *args):
+        # Backpressure: não enfileira além do limite
+        if not self.__vagas.acquire(blocking=False):
+            logger.warning("⚠️  HashExecutor sobrecarregado (%s operações pendentes)", self.__max_pendentes)
+            raise self._ocupado()
+
+        try:
+            future = self._get_pool().submit(funcao, *args)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self.__vagas.release()
+            logger.error("❌ Pool de hash indisponível: %s", e)
+            self.shutdown()
+            raise self._ocupado()
+
+        # A vaga é devolvida quando o processo termina, mesmo após timeout
+        future.add_done_callback(lambda _: self.__vagas.release())
+
+        # ✅ CORREÇÃO: Não segura uma conexão do pool durante o bcrypt (até HASH_TIMEOUT)
+        UnitOfWork.liberar_conexoes()
+
+        try:
+            if em_ponte():
+                # ✅ NOVO: No servidor ASGI aguarda no event loop, sem travar as outras requisições
+                return await_only(asyncio.wait_for(asyncio.wrap_future(future), self.__timeout))
+            return future.result(timeout=self.__timeout)
+        except (FutureTimeoutError, asyncio.TimeoutError):
+            logger.error("❌ Timeout aguardando operação de hash")
+            raise self._ocupado()
+        except BrokenProcessPool as e:
+            logger.error("❌ Pool de hash quebrou: %s", e)
+            self.shutdown()
+            raise self._ocupado()
+
+    @staticmethod
+    def _ocupado() -> ErrorResponse:
+        return ErrorResponse(503, "Servidor ocupado, tente novamente em instantes", {"retry_after": 1})
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import bisect
+import math
+import re
+import threading
+import unicodedata
+
+
+class IndiceInvertido:
+    """
+    Índice invertido em memória para busca textual com ranking.
+
+    Usado quando o banco não oferece FULLTEXT (MockDatabase/SQLite). Cada
+    termo aponta para os documentos que o contêm; a busca só visita as
+    listas dos termos consultados, então o custo depende do tamanho do
+    resultado e não do total de documentos.
+
+    Semântica igual à busca FULLTEXT em modo booleano usada no MySQL:
+    todos os termos da consulta devem aparecer (como prefixo) no documento.
+    Relevância: soma de frequência x IDF, com peso por campo.
+    """
+
+    __PALAVRA = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self, pesos: dict = None):
+        """
+        :param pesos: dict campo -> peso (ex.: {"nome": 2, "descricao": 1})
+        """
+        self.__pesos = pesos or {}
+        self.__postings = {}     # termo -> {doc_id: frequência ponderada}
+        self.__documentos = {}   # doc_id -> (termos, documento)
+        self.__termos_ordenados = []
+        self.__sujo = False
+        self.__lock = threading.RLock()
+
+    @staticmethod
+    def tokenizar(texto) -> list:
+        """Divide o texto em termos minúsculos e sem acentos"""
+        if not texto:
+            return []
+        texto = unicodedata.normalize("NFKD", str(texto).lower())
+        texto = "".join(c for c in texto if not unicodedata.combining(c))
+        return IndiceInvertido.__PALAVRA.findall(texto)
+
+    @staticmethod
+    def consulta_fulltext(texto, tamanho_minimo: int = 3) -> str:
+        """
+        Converte o texto digitado em uma consulta MATCH ... AGAINST em modo
+        booleano com a mesma semântica de buscar(): "+termo1* +termo2*".
+        Termos menores que o tamanho mínimo indexado pelo InnoDB são ignorados.
+
+        :return: str - Consulta, ou "" se nenhum termo puder ser usado
+        """
+        termos = [t for t in IndiceInvertido.tokenizar(texto) if len(t) >= tamanho_minimo]
+        return " ".join(f"+{termo}*" for termo in termos)
+
+    @staticmethod
+    def padrao_like(texto) -> str:
+        """
+        ✅ NOVO: Padrão "%texto%" para LIKE ... ESCAPE '\\' com os curingas
+        do próprio texto (%, _ e a barra) escapados: buscar "50%" não casa
+        com tudo.
+        """
+        escapado = str(texto).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"%{escapado}%"
+
+    def adicionar(self, doc_id, campos: dict, documento=None):
+        """
+        Indexa (ou reindexa) um documento.
+
+        :param campos: dict campo -> texto a ser indexado
+        :param documento: Objeto devolvido nas buscas (padrão: campos)
+        """
+        with self.__lock:
+            self.remover(doc_id)
+            frequencias = {}
+            for campo, texto in campos.items():
+                peso = self.__pesos.get(campo, 1)
+                for termo in self.tokenizar(texto):
+                    frequencias[termo] = frequencias.get(termo, 0) + peso
+
+            for termo, frequencia in frequencias.items():
+                if termo not in self.__postings:
+                    self.__postings[termo] = {}
+                    self.__sujo = True
+                self.__postings[termo][doc_id] = frequencia
+            self.__documentos[doc_id] = (frequencias.keys(), documento if documento is not None else campos)
+
+    def remover(self, doc_id):
+        """Remove um documento do índice"""
+        with self.__lock:
+            registro = self.__documentos.pop(doc_id, None)
+            if registro is None:
+                return
+            for termo in registro[0]:
+                documentos = self.__postings.get(termo)
+                if documentos is not None:
+                    documentos.pop(doc_id, None)
+                    if not documentos:
+                        del self.__postings[termo]
+                        self.__sujo = True
+
+    def buscar(self, consulta: str, limite: int = 20) -> list:
+        """
+        Retorna até `limite` tuplas (documento, relevancia), da mais relevante
+        para a menos relevante.
+        """
+        termos = self.tokenizar(consulta)
+        if not termos:
+            return []
+
+        with self.__lock:
+            total = len(self.__documentos) or 1
+            pontuacao = None
+            for termo in termos:
+                parcial = {}
+                for termo_indexado in self._expandir(termo):
+                    documentos = self.__postings[termo_indexado]
+                    idf = math.log(1 + total / len(documentos))
+                    for doc_id, frequencia in documentos.items():
+                        parcial[doc_id] = parcial.get(doc_id, 0) + frequencia * idf
+
+                # Todos os termos são obrigatórios
+                if pontuacao is None:
+                    pontuacao = parcial
+                else:
+                    pontuacao = {d: pontuacao[d] + p for d, p in parcial.items() if d in pontuacao}
+                if not pontuacao:
+                    return []
+
+            melhores = sorted(pontuacao.items(), key=lambda item: (-item[1], str(item[0])))[:limite]
+            return [(self.__documentos[doc_id][1], round(relevancia, 4)) for doc_id, relevancia in melhores]
+
+    def _expandir(self, prefixo: str) -> list:
+        """Termos indexados que começam com o prefixo"""
+        if self.__sujo:
+            self.__termos_ordenados = sorted(self.__postings)
+            self.__sujo = False
+        ordenados = self.__termos_ordenados
+        posicao = bisect.bisect_left(ordenados, prefixo)
+        termos = []
+        while posicao < len(ordenados) and ordenados[posicao].startswith(prefixo):
+            termos.append(ordenados[posicao])
+            posicao += 1
+        return termos
+
+    def __len__(self):
+        return len(self.__documentos)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import threading
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class JobPeriodico:
+    """
+    Executa uma função em intervalos fixos, em uma thread daemon.
+
+    Erros da função são registrados no log e não interrompem o job.
+    """
+
+    def __init__(self, nome: str, intervalo_segundos: float, funcao):
+        """
+        :param nome: Nome do job (usado na thread e no log)
+        :param intervalo_segundos: Intervalo entre execuções
+        :param funcao: Função sem argumentos a ser executada
+        """
+        self.__nome = nome
+        self.__intervalo = intervalo_segundos
+        self.__funcao = funcao
+        self.__parar = threading.Event()
+        self.__thread = None
+
+    def start(self):
+        """Inicia o job (chamadas repetidas são ignoradas)"""
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__parar.clear()
+        self.__thread = threading.Thread(target=self._loop, name=self.__nome, daemon=True)
+        self.__thread.start()
+        logger.info("⏱️  Job '%s' iniciado (a cada %ss)", self.__nome, self.__intervalo)
+
+    def stop(self, timeout: float = 5):
+        """Sinaliza a parada e aguarda a execução atual terminar"""
+        self.__parar.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def _loop(self):
+        while not self.__parar.wait(self.__intervalo):
+            try:
+                self.__funcao()
+            except Exception:
+                logger.error("❌ Erro no job '%s'", self.__nome, exc_info=True)
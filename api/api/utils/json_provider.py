@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import json
+from datetime import date, time, timedelta
+from decimal import Decimal
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson é opcional
+    orjson = None
+
+
+def _padrao(valor):
+    """
+    Serializa os tipos que os DAOs devolvem e o JSON não conhece.
+    date/datetime/time saem em ISO 8601 (o provider padrão do Flask usaria
+    o formato de data HTTP).
+    """
+    if isinstance(valor, (date, time)):
+        return valor.isoformat()
+    if isinstance(valor, timedelta):
+        return str(valor)
+    if isinstance(valor, Decimal):
+        # Igual ao provider padrão do Flask: SUM(...) do MySQL chega como Decimal
+        return str(valor)
+    if isinstance(valor, (set, frozenset)):
+        return list(valor)
+    return DefaultJSONProvider.default(valor)
+
+
+class JsonProviderRapido(DefaultJSONProvider):
+    """
+    Provider JSON do Flask (jsonify, request.get_json) com caminho rápido via
+    orjson, quando instalado, e o json da biblioteca padrão como alternativa.
+
+    Nos dois caminhos date/datetime viram ISO 8601, então os DAOs podem
+    entregar as datas como objetos, sem isoformat() por campo.
+
+    As chaves saem na ordem em que foram montadas (sort_keys = False); com
+    compact = False (ou debug) a saída é indentada.
+
+    Uso:
+        app.json = JsonProviderRapido(app)
+    """
+
+    default = staticmethod(_padrao)
+    sort_keys = False
+    ensure_ascii = False
+
+    def _opcoes_orjson(self, indentar: bool = False) -> int:
+        opcoes = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            opcoes |= orjson.OPT_SORT_KEYS
+        if indentar:
+            opcoes |= orjson.OPT_INDENT_2
+        return opcoes
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_padrao, option=self._opcoes_orjson()).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Como o DefaultJSONProvider.response, mas gera os bytes direto do orjson"""
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indentar = self.compact is False or (self.compact is None and self._app.debug)
+        corpo = orjson.dumps(obj, default=_padrao, option=self._opcoes_orjson(indentar))
+        return self._app.response_class(corpo + b"\n", mimetype=self.mimetype)
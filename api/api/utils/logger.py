@@ -1,4 +1,9 @@
 import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
 import traceback
 from datetime import datetime
 
@@ -6,9 +11,97 @@ class Logger:
     """
     Classe Logger
     Responsável por registrar mensagens de erro e exceções com stack trace completo.
+
+    Também configura o pipeline de logging da aplicação:
+    - os módulos obtêm seus loggers com Logger.get_logger(__name__);
+    - os registros vão para uma fila (QueueHandler) e são gravados por uma
+      thread em segundo plano (QueueListener), sem bloquear a requisição;
+    - mensagens usam formatação preguiçosa (logger.debug("x=%s", x)), então
+      níveis desligados custam apenas a checagem do nível.
     """
 
     LOG_FILE = "api/system/log.log"
+    FORMATO = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+    __listener = None
+
+    @staticmethod
+    def get_logger(nome: str) -> logging.Logger:
+        """
+        Retorna o logger de um módulo (use __name__).
+        """
+        return logging.getLogger(nome)
+
+    @staticmethod
+    def configure(level: str = None, module_levels: dict = None):
+        """
+        Configura o pipeline assíncrono de logging (chamar uma vez na inicialização).
+
+        :param level: Nível padrão (ex.: "INFO"). Padrão: variável LOG_LEVEL ou INFO.
+        :param module_levels: dict módulo -> nível (ex.: {"api.dao": "DEBUG"}).
+            Padrão: variável LOG_LEVELS no formato "api.dao=DEBUG,api.service=WARNING".
+        """
+        level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+        if module_levels is None:
+            module_levels = Logger._parse_module_levels(os.getenv("LOG_LEVELS", ""))
+
+        root = logging.getLogger()
+
+        if Logger.__listener is None:
+            fila = queue.SimpleQueue()
+
+            console = logging.StreamHandler(sys.stdout)
+            console.setFormatter(logging.Formatter(Logger.FORMATO))
+
+            os.makedirs(os.path.dirname(Logger.LOG_FILE), exist_ok=True)
+            arquivo = logging.FileHandler(Logger.LOG_FILE, encoding="utf-8")
+            arquivo.setLevel(logging.ERROR)
+            arquivo.setFormatter(logging.Formatter(Logger.FORMATO))
+
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+            root.addHandler(logging.handlers.QueueHandler(fila))
+
+            Logger.__listener = logging.handlers.QueueListener(
+                fila, console, arquivo, respect_handler_level=True
+            )
+            Logger.__listener.start()
+            atexit.register(Logger.shutdown)
+
+        root.setLevel(level)
+        for modulo, nivel in module_levels.items():
+            logging.getLogger(modulo).setLevel(str(nivel).upper())
+
+    @staticmethod
+    def apos_fork():
+        """
+        ✅ NOVO: Recria a thread de gravação em um processo filho (fork).
+        A thread do processo pai não existe no filho e a fila ficaria sem leitor.
+        """
+        antigo = Logger.__listener
+        if antigo is not None:
+            Logger.__listener = logging.handlers.QueueListener(
+                antigo.queue, *antigo.handlers, respect_handler_level=True
+            )
+            Logger.__listener.start()
+
+    @staticmethod
+    def shutdown():
+        """
+        Esvazia a fila e encerra a thread de gravação.
+        """
+        if Logger.__listener is not None:
+            Logger.__listener.stop()
+            Logger.__listener = None
+
+    @staticmethod
+    def _parse_module_levels(valor: str) -> dict:
+        niveis = {}
+        for item in valor.split(","):
+            if "=" in item:
+                modulo, nivel = item.split("=", 1)
+                niveis[modulo.strip()] = nivel.strip()
+        return niveis
 
     @staticmethod
     def log_error(message: str):
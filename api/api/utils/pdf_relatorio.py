@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+import unicodedata
+import zlib
+from datetime import datetime
+
+
+# Larguras (em 1/1000 do tamanho da fonte) da Helvetica para os caracteres
+# ASCII 32..126, das métricas AFM padrão. Letras acentuadas usam a largura
+# da letra base; o negrito é aproximado com um fator.
+_LARGURAS_HELVETICA = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+_FATOR_NEGRITO = 1.08
+
+_MM = 72 / 25.4   # pontos por milímetro
+
+
+def _cor(rgb: tuple) -> str:
+    return " ".join(f"{c / 255:.3f}" for c in rgb)
+
+
+def _texto_pdf(texto: str) -> str:
+    """String literal PDF em WinAnsiEncoding (cp1252), com escapes"""
+    bruto = texto.encode("cp1252", errors="replace").decode("latin-1")
+    return "(" + bruto.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def _texto_info(texto: str) -> str:
+    """String do dicionário /Info em UTF-16BE (acentos fora do ASCII)"""
+    return "<FEFF" + texto.encode("utf-16-be").hex().upper() + ">"
+
+
+class PdfRelatorio:
+    """
+    Gerador de relatórios PDF em tabela, sem dependências externas.
+
+    Reproduz o layout do antigo static/js/pdfGenerator.js (jsPDF +
+    autoTable): página A4 em milímetros, faixa de cabeçalho, bloco de
+    informações, tabela em grade com cabeçalho repetido a cada página e
+    linhas alternadas, "Página X de Y" e rodapé. Usa as fontes padrão
+    Helvetica/Helvetica-Bold (WinAnsiEncoding), então não embute fontes e
+    o arquivo fica pequeno; o conteúdo das páginas é comprimido (Flate).
+
+    Uso:
+        pdf = PdfRelatorio("Relatório de Tarefas")
+        pdf.informacoes(["Total de tarefas: 10"])
+        pdf.tabela(["ID", "Título"], [15, 60], linhas)
+        conteudo = pdf.gerar()
+    """
+
+    LARGURA = 210
+    ALTURA = 297
+    MARGEM = 14
+    LIMITE_INFERIOR = 277
+
+    COR_DESTAQUE = (102, 126, 234)
+    COR_GRADE = (200, 200, 200)
+    COR_ALTERNADA = (245, 247, 250)
+    COR_RODAPE = (100, 100, 100)
+
+    def __init__(self, titulo: str, assunto: str = ""):
+        """
+        :param titulo: str - Subtítulo da faixa de cabeçalho (ex.: "Relatório de Tarefas")
+        :param assunto: str - Assunto gravado nos metadados do arquivo
+        """
+        self.__titulo = titulo
+        self.__assunto = assunto
+        self.__paginas = []
+        self.__y = 0
+        self._nova_pagina()
+        self._cabecalho()
+
+    # ======================== CONTEÚDO ========================
+    def informacoes(self, linhas: list):
+        """Bloco "Informações do Relatório:" seguido de uma linha separadora"""
+        self.__y = 40
+        self._texto(self.MARGEM, self.__y, "Informações do Relatório:", 10, negrito=True)
+        self.__y += 2
+        for linha in linhas:
+            self.__y += 5
+            self._texto(self.MARGEM, self.__y, linha, 10)
+        self.__y += 8
+        self._linha(self.MARGEM, self.__y, self.LARGURA - self.MARGEM, self.__y, self.COR_GRADE)
+        self.__y += 6
+
+    def tabela(self, cabecalho: list, larguras: list, linhas, tamanho_fonte: int = 9,
+               espacamento: float = 2.5) -> int:
+        """
+        Desenha a tabela, quebrando páginas quando necessário.
+
+        :param cabecalho: list - Títulos das colunas
+        :param larguras: list - Largura de cada coluna, em mm
+        :param linhas: Iterável de listas de textos (pode ser um gerador)
+        :param tamanho_fonte: int - Tamanho da fonte, em pontos
+        :param espacamento: float - Espaço interno das células, em mm
+        :return: int - Quantidade de linhas desenhadas
+        """
+        # Como o autoTable: colunas que não cabem entre as margens são reduzidas na mesma proporção
+        disponivel = self.LARGURA - 2 * self.MARGEM
+        if sum(larguras) > disponivel:
+            larguras = [largura * disponivel / sum(larguras) for largura in larguras]
+
+        altura_linha = tamanho_fonte * 0.3528 + 2 * espacamento
+        self._linha_tabela(cabecalho, larguras, altura_linha, tamanho_fonte, espacamento, cabecalho=True)
+
+        total = 0
+        for linha in linhas:
+            if self.__y + altura_linha > self.LIMITE_INFERIOR:
+                self._nova_pagina()
+                self.__y = self.MARGEM
+                self._linha_tabela(cabecalho, larguras, altura_linha, tamanho_fonte, espacamento, cabecalho=True)
+            self._linha_tabela(linha, larguras, altura_linha, tamanho_fonte, espacamento,
+                               alternada=total % 2 == 1)
+            total += 1
+        return total
+
+    def gerar(self) -> bytes:
+        """Monta o arquivo PDF (numeração de páginas e rodapé incluídos)"""
+        total_paginas = len(self.__paginas)
+        for numero, pagina in enumerate(self.__paginas, start=1):
+            self.__atual = pagina
+            self._texto(self.LARGURA / 2, self.ALTURA - 10, f"Página {numero} de {total_paginas}", 8,
+                        cor=self.COR_RODAPE, alinhamento="centro")
+            self._texto(self.LARGURA / 2, self.ALTURA - 5,
+                        "Relatório gerado automaticamente pelo Sistema Organização de Tarefas", 8,
+                        cor=self.COR_RODAPE, alinhamento="centro")
+
+        # Objetos: 1 catálogo, 2 árvore de páginas, 3-4 fontes, 5 info, depois página + conteúdo
+        objetos = []
+        kids = " ".join(f"{6 + i * 2} 0 R" for i in range(total_paginas))
+        objetos.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+        objetos.append(f"<< /Type /Pages /Kids [{kids}] /Count {total_paginas} >>".encode())
+        for fonte in ("Helvetica", "Helvetica-Bold"):
+            objetos.append(
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{fonte} /Encoding /WinAnsiEncoding >>".encode()
+            )
+        objetos.append((
+            f"<< /Title {_texto_info(self.__titulo + ' - Organização de Tarefas')}"
+            f" /Subject {_texto_info(self.__assunto)}"
+            f" /Author {_texto_info('Sistema Organização de Tarefas')}"
+            f" /Creator {_texto_info('Organização de Tarefas')}"
+            f" /CreationDate (D:{datetime.now():%Y%m%d%H%M%S}) >>"
+        ).encode())
+
+        largura_pt, altura_pt = self.LARGURA * _MM, self.ALTURA * _MM
+        for i, pagina in enumerate(self.__paginas):
+            conteudo = zlib.compress("\n".join(pagina).encode("latin-1"))
+            objetos.append((
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {largura_pt:.2f} {altura_pt:.2f}]"
+                f" /Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {7 + i * 2} 0 R >>"
+            ).encode())
+            objetos.append(
+                f"<< /Length {len(conteudo)} /Filter /FlateDecode >>\nstream\n".encode()
+                + conteudo + b"\nendstream"
+            )
+
+        saida = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        posicoes = []
+        for numero, objeto in enumerate(objetos, start=1):
+            posicoes.append(len(saida))
+            saida += f"{numero} 0 obj\n".encode() + objeto + b"\nendobj\n"
+
+        inicio_xref = len(saida)
+        saida += f"xref\n0 {len(objetos) + 1}\n0000000000 65535 f \n".encode()
+        for posicao in posicoes:
+            saida += f"{posicao:010d} 00000 n \n".encode()
+        saida += (
+            f"trailer\n<< /Size {len(objetos) + 1} /Root 1 0 R /Info 5 0 R >>\n"
+            f"startxref\n{inicio_xref}\n%%EOF\n"
+        ).encode()
+        return bytes(saida)
+
+    @staticmethod
+    def largura_texto(texto: str, tamanho_fonte: float, negrito: bool = False) -> float:
+        """Largura aproximada do texto, em mm"""
+        total = 0
+        for caractere in texto:
+            codigo = ord(caractere)
+            if not 32 <= codigo <= 126:
+                base = unicodedata.normalize("NFD", caractere)[0]
+                codigo = ord(base) if 32 <= ord(base) <= 126 else 110   # 'n'
+            total += _LARGURAS_HELVETICA[codigo - 32]
+        largura = total / 1000 * tamanho_fonte / _MM
+        return largura * _FATOR_NEGRITO if negrito else largura
+
+    # ======================== AUXILIARES ========================
+    def _nova_pagina(self):
+        self.__atual = []
+        self.__paginas.append(self.__atual)
+
+    def _cabecalho(self):
+        self._retangulo(0, 0, self.LARGURA, 30, self.COR_DESTAQUE)
+        self._texto(self.LARGURA / 2, 15, "Organização de Tarefas", 20, negrito=True,
+                    cor=(255, 255, 255), alinhamento="centro")
+        self._texto(self.LARGURA / 2, 22, self.__titulo, 12, cor=(255, 255, 255), alinhamento="centro")
+
+    def _linha_tabela(self, valores, larguras, altura, tamanho_fonte, espacamento,
+                      cabecalho=False, alternada=False):
+        x = self.MARGEM
+        base = self.__y + espacamento + tamanho_fonte * 0.3528 * 0.8
+        for valor, largura in zip(valores, larguras):
+            fundo = self.COR_DESTAQUE if cabecalho else (self.COR_ALTERNADA if alternada else None)
+            if fundo:
+                self._retangulo(x, self.__y, largura, altura, fundo)
+            self._contorno(x, self.__y, largura, altura)
+            texto = self._ajustar("" if valor is None else str(valor), largura - 2 * espacamento,
+                                  tamanho_fonte, cabecalho)
+            self._texto(x + espacamento, base, texto, tamanho_fonte, negrito=cabecalho,
+                        cor=(255, 255, 255) if cabecalho else (0, 0, 0))
+            x += largura
+        self.__y += altura
+
+    def _ajustar(self, texto: str, largura: float, tamanho_fonte: float, negrito: bool) -> str:
+        """Corta o texto com reticências para caber na largura da célula"""
+        texto = " ".join(texto.split())
+        if self.largura_texto(texto, tamanho_fonte, negrito) <= largura:
+            return texto
+        # Uma passada só: acumula a largura de cada caractere até o limite
+        disponivel = largura - self.largura_texto("…", tamanho_fonte, negrito)
+        usada = 0
+        for posicao, caractere in enumerate(texto):
+            usada += self.largura_texto(caractere, tamanho_fonte, negrito)
+            if usada > disponivel:
+                return texto[:posicao].rstrip() + "…"
+        return texto
+
+    def _texto(self, x, y, texto, tamanho, negrito=False, cor=(0, 0, 0), alinhamento="esquerda"):
+        if alinhamento == "centro":
+            x -= self.largura_texto(texto, tamanho, negrito) / 2
+        self.__atual.append(
+            f"BT /{'F2' if negrito else 'F1'} {tamanho} Tf {_cor(cor)} rg "
+            f"{x * _MM:.2f} {(self.ALTURA - y) * _MM:.2f} Td {_texto_pdf(texto)} Tj ET"
+        )
+
+    def _retangulo(self, x, y, largura, altura, cor):
+        self.__atual.append(
+            f"{_cor(cor)} rg {x * _MM:.2f} {(self.ALTURA - y - altura) * _MM:.2f} "
+            f"{largura * _MM:.2f} {altura * _MM:.2f} re f"
+        )
+
+    def _contorno(self, x, y, largura, altura):
+        self.__atual.append(
+            f"{_cor(self.COR_GRADE)} RG 0.28 w {x * _MM:.2f} {(self.ALTURA - y - altura) * _MM:.2f} "
+            f"{largura * _MM:.2f} {altura * _MM:.2f} re S"
+        )
+
+    def _linha(self, x1, y1, x2, y2, cor):
+        self.__atual.append(
+            f"{_cor(cor)} RG 0.28 w {x1 * _MM:.2f} {(self.ALTURA - y1) * _MM:.2f} m "
+            f"{x2 * _MM:.2f} {(self.ALTURA - y2) * _MM:.2f} l S"
+        )
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import sys
+
+try:
+    from greenlet import greenlet, getcurrent
+except ImportError:  # pragma: no cover - greenlet só é necessário no servidor ASGI
+    greenlet = None
+
+
+if greenlet is not None:
+    class _GreenletPonte(greenlet):
+        """Greenlet que executa código síncrono e sabe a quem devolver os awaitables"""
+
+        def __init__(self, funcao, condutor):
+            greenlet.__init__(self, funcao, condutor)
+            self.condutor = condutor
+
+
+def em_ponte() -> bool:
+    """Indica se o código atual roda dentro de executar_sincrono()"""
+    return greenlet is not None and isinstance(getcurrent(), _GreenletPonte)
+
+
+def await_only(awaitable):
+    """
+    Aguarda um awaitable a partir de código síncrono.
+
+    O greenlet atual é suspenso e o awaitable é entregue à corrotina que
+    chamou executar_sincrono(), que faz o await de verdade no event loop.
+    Enquanto isso o loop atende as outras requisições; quando o resultado
+    chega, o código síncrono continua do mesmo ponto.
+
+    :raises RuntimeError: fora de executar_sincrono()
+    """
+    if not em_ponte():
+        raise RuntimeError("await_only() chamado fora de executar_sincrono()")
+    return getcurrent().condutor.switch(awaitable)
+
+
+async def executar_sincrono(funcao, *args, **kwargs):
+    """
+    Executa uma função síncrona (DAOs, services, controls, a aplicação Flask)
+    em um greenlet próprio, atendendo cada await_only() que ela fizer.
+
+    É a mesma técnica da extensão asyncio do SQLAlchemy: o código existente
+    não muda, só as chamadas de E/S no fundo da pilha passam a ser awaits.
+    Exceções de um await são relançadas dentro da função, no ponto do
+    await_only(), para que os try/except existentes continuem valendo.
+    """
+    if greenlet is None:
+        raise RuntimeError("Pacote 'greenlet' não instalado (necessário para o servidor ASGI)")
+    contexto = _GreenletPonte(funcao, getcurrent())
+    resultado = contexto.switch(*args, **kwargs)
+    while not contexto.dead:
+        try:
+            valor = await resultado
+        except BaseException:
+            resultado = contexto.throw(*sys.exc_info())
+        else:
+            resultado = contexto.switch(valor)
+    return resultado
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+
+class Projecao:
+    """
+    Projeção de campos (?fields=) para consultas de listagem.
+
+    Cada campo público aponta para a expressão SQL que o produz e, se vier
+    de outra tabela, para o JOIN de que depende. Assim a consulta só lê as
+    colunas pedidas e só faz os JOINs necessários.
+
+    Exemplo:
+        PROJECAO = Projecao(
+            campos={
+                "id": ("t.id", None),
+                "projeto_nome": ("p.nome", "projeto"),
+            },
+            joins={"projeto": "LEFT JOIN projetos p ON t.projeto_id = p.id"}
+        )
+    """
+
+    def __init__(self, campos: dict, joins: dict = None, conversores: dict = None,
+                 obrigatorios: tuple = ("id",)):
+        """
+        :param campos: dict campo -> (expressão SQL, chave do JOIN ou None)
+        :param joins: dict chave -> cláusula JOIN
+        :param conversores: dict campo -> função aplicada ao valor lido
+        :param obrigatorios: Campos sempre incluídos na projeção
+        """
+        self.__campos = campos
+        self.__joins = joins or {}
+        self.__conversores = conversores or {}
+        self.__obrigatorios = obrigatorios
+
+    @property
+    def campos(self) -> tuple:
+        return tuple(self.__campos)
+
+    def parse(self, fields: str) -> tuple | None:
+        """
+        Lê o parâmetro fields ("id,titulo,status").
+
+        :return: tuple com os campos pedidos (na ordem de declaração), ou None se
+                 fields estiver vazio (todos os campos)
+        :raises ValueError: Se algum campo não existir
+        """
+        if not fields or not fields.strip():
+            return None
+        pedidos = {campo.strip() for campo in fields.split(",") if campo.strip()}
+        invalidos = sorted(pedidos - set(self.__campos))
+        if invalidos:
+            raise ValueError(
+                f"Campo(s) inválido(s) em 'fields': {', '.join(invalidos)}. "
+                f"Permitidos: {', '.join(self.__campos)}"
+            )
+        pedidos.update(self.__obrigatorios)
+        return tuple(campo for campo in self.__campos if campo in pedidos)
+
+    def select(self, campos: tuple = None) -> str:
+        """Lista do SELECT para os campos (todos, se None)"""
+        campos = campos or self.campos
+        return ",\n".join(f"{self.__campos[c][0]} as {c}" for c in campos)
+
+    def joins(self, campos: tuple = None) -> str:
+        """JOINs necessários para os campos, na ordem de declaração"""
+        campos = campos or self.campos
+        necessarios = {self.__campos[c][1] for c in campos if self.__campos[c][1]}
+        return "\n".join(join for chave, join in self.__joins.items() if chave in necessarios)
+
+    def converter(self, row: dict, campos: tuple = None) -> dict:
+        """Converte uma linha do banco no dicionário com apenas os campos pedidos"""
+        campos = campos or self.campos
+        resultado = {}
+        for campo in campos:
+            valor = row.get(campo)
+            # Datas seguem como objetos: o JsonProviderRapido as serializa em ISO 8601
+            if valor is not None and campo in self.__conversores:
+                valor = self.__conversores[campo](valor)
+            resultado[campo] = valor
+        return resultado
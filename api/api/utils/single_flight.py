@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import threading
+
+
+class _Voo:
+    """Execução em andamento de uma chave"""
+    __slots__ = ("concluido", "resultado", "erro", "seguidores")
+
+    def __init__(self):
+        self.concluido = threading.Event()
+        self.resultado = None
+        self.erro = None
+        self.seguidores = 0
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas idênticas e simultâneas: enquanto a primeira chamada de
+    uma chave está em andamento, as demais esperam e recebem o mesmo
+    resultado (ou a mesma exceção), em vez de repetir a consulta.
+
+    Nada é guardado depois que a chamada termina; isso é trabalho do cache.
+    Limitado: acima de `max_chaves` execuções em andamento, ou se a espera
+    passar de `espera_maxima` segundos, a chamada roda sozinha.
+    """
+
+    def __init__(self, max_chaves: int = 1024, espera_maxima: float = 30.0):
+        """
+        :param max_chaves: int - Máximo de chaves em andamento ao mesmo tempo
+        :param espera_maxima: float - Segundos que um seguidor espera pelo líder
+        """
+        if max_chaves <= 0:
+            raise ValueError("max_chaves deve ser maior que zero")
+        self.__max_chaves = max_chaves
+        self.__espera_maxima = espera_maxima
+        self.__voos = {}
+        self.__lock = threading.Lock()
+        self.execucoes = 0
+        self.agrupadas = 0
+        self.sem_agrupamento = 0
+
+    def executar(self, chave, funcao):
+        """
+        Executa funcao() uma vez por chave entre as chamadas simultâneas.
+
+        :param chave: Chave hashable (ex.: (consulta, args))
+        :return: O retorno de funcao()
+        """
+        with self.__lock:
+            voo = self.__voos.get(chave)
+            if voo is not None:
+                voo.seguidores += 1
+                self.agrupadas += 1
+                lider = False
+            elif len(self.__voos) >= self.__max_chaves:
+                self.sem_agrupamento += 1
+                voo = None
+            else:
+                voo = _Voo()
+                self.__voos[chave] = voo
+                self.execucoes += 1
+                lider = True
+
+        if voo is None:
+            return funcao()
+
+        if not lider:
+            if not voo.concluido.wait(self.__espera_maxima):
+                with self.__lock:
+                    self.sem_agrupamento += 1
+                return funcao()
+            if voo.erro is not None:
+                raise voo.erro
+            return voo.resultado
+
+        try:
+            voo.resultado = funcao()
+            return voo.resultado
+        except BaseException as e:
+            voo.erro = e
+            raise
+        finally:
+            with self.__lock:
+                self.__voos.pop(chave, None)
+            voo.concluido.set()
+
+    def estatisticas(self) -> dict:
+        """Contadores de execuções, chamadas agrupadas e chaves em andamento"""
+        with self.__lock:
+            return {
+                "execucoes": self.execucoes,
+                "agrupadas": self.agrupadas,
+                "sem_agrupamento": self.sem_agrupamento,
+                "em_andamento": len(self.__voos)
+            }
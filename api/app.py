@@ -1,54 +1,105 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import mysql.connector
-from mysql.connector import Error, pooling
+from mysql.connector import Error, PoolError, pooling
+from mysql.connector.constants import ClientFlag
 import os
+import time
 import traceback
-import smtplib
 import secrets
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime, timedelta
-from werkzeug.security import generate_password_hash, check_password_hash
 
 # Importações dos DAOs (Data Access Objects)
 from api.dao.usuario_dao import UsuarioDAO
+from api.dao.token_recuperacao_dao import TokenRecuperacaoDAO
+from api.dao.email_outbox_dao import EmailOutboxDAO
 from api.dao.projeto_dao import ProjetoDAO
 from api.dao.tarefa_dao import TarefaDAO
+from api.dao.versao_dao import VersaoDAO
 
 # Importações dos Services
 from api.service.usuario_service import UsuarioService
 from api.service.projeto_service import ProjetoService
 from api.service.tarefa_service import TarefaService
+from api.service.dashboard_service import DashboardService
+from api.service.relatorio_service import RelatorioService
+from api.service.email_service import EmailService
+from api.service.email_worker import EmailWorker
 
 # Importações dos Middlewares
 from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.usuario_middleware import UsuarioMiddleware
 from api.middleware.projeto_middleware import ProjetoMiddleware
 from api.middleware.tarefa_middleware import TarefaMiddleware
+from api.middleware.etag_middleware import EtagMiddleware
 
 # Importações dos Controls
 from api.control.usuario_control import UsuarioControl
 from api.control.projeto_control import ProjetoControl
 from api.control.tarefa_control import TarefaControl
+from api.control.dashboard_control import DashboardControl
+from api.control.exportacao_control import ExportacaoControl
+from api.control.relatorio_control import RelatorioControl
 
 # Importações dos Roteadores
 from api.router.usuario_roteador import UsuarioRoteador
 from api.router.projeto_roteador import ProjetoRoteador
 from api.router.tarefa_roteador import TarefaRoteador
+from api.router.dashboard_roteador import DashboardRoteador
+from api.router.exportacao_roteador import ExportacaoRoteador
+from api.router.relatorio_roteador import RelatorioRoteador
+
+from api.database.unit_of_work import UnitOfWork
+from api.database.mysql_database import tamanho_pool_padrao, descartar_conexao
+from api.utils.hash_executor import HashExecutor
+from api.utils.cache_lru import CacheLRU
+from api.utils.cache_redis import CacheRedis
+from api.utils.cache_leitura import CacheLeitura
+from api.utils.single_flight import SingleFlight
+from api.utils.json_provider import JsonProviderRapido
+from api.utils.error_response import ErrorResponse
+from api.utils.job_periodico import JobPeriodico
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 # Configurações de email (ajuste conforme suas credenciais)
 EMAIL_CONFIG = {
     'smtp_server': 'smtp.gmail.com',
     'smtp_port': 587,
     'email': 'mateus.todeschini.developer@gmail.com',  # ALTERE: Seu email Gmail
-    'password': 'mzgn ugkb iofo ilab'   # ALTERE: Senha de app do Gmail
+    'password': 'mzgn ugkb iofo ilab',   # ALTERE: Senha de app do Gmail
+    'starttls': True
 }
 
-# Dicionário temporário para armazenar tokens (em produção, use banco de dados)
-tokens_recuperacao = {}
+# ✅ NOVO: Tokens de recuperação ficam no banco (tabela tokens_recuperacao)
+VALIDADE_TOKEN_RECUPERACAO = 3600  # 1 hora
+INTERVALO_LIMPEZA_TOKENS = int(os.getenv('TOKENS_LIMPEZA_INTERVALO', 600))
+
+# ✅ NOVO: Cache de leitura das listagens (CACHE_REDIS_URL vazio = LRU em processo)
+CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+CACHE_CAPACIDADE = int(os.getenv('CACHE_CAPACIDADE', 2048))
+CACHE_TTL = int(os.getenv('CACHE_TTL', 300))
+# ✅ NOVO: Jobs e PDFs dos relatórios (mesmo backend do cache, com prefixo próprio)
+RELATORIO_CACHE_CAPACIDADE = int(os.getenv('RELATORIO_CACHE_CAPACIDADE', 128))
+# ✅ CORREÇÃO: Espera máxima por uma conexão livre quando o pool está esgotado
+MYSQL_POOL_TIMEOUT = float(os.getenv('MYSQL_POOL_TIMEOUT', 5))
+
+
+def criar_backend_cache(prefixo: str = "organizacao:", capacidade: int = CACHE_CAPACIDADE):
+    """CacheRedis se CACHE_REDIS_URL estiver definido (e o pacote redis instalado), senão CacheLRU"""
+    if CACHE_REDIS_URL:
+        try:
+            import redis
+            logger.info("🗄️  Cache (%s): Redis (%s)", prefixo, CACHE_REDIS_URL)
+            return CacheRedis(redis.Redis.from_url(CACHE_REDIS_URL), prefixo=prefixo)
+        except ImportError:
+            logger.warning("⚠️  Pacote 'redis' não instalado, usando cache LRU em processo")
+    return CacheLRU(capacidade=capacidade)
 
 class MySQLDatabase:
+    # ✅ NOVO: Os DAOs usam MATCH ... AGAINST quando o banco suporta FULLTEXT
+    suporta_fulltext = True
+
     def __init__(self):
         self.connection_pool = None
         self.config = {
@@ -61,36 +112,102 @@ class MySQLDatabase:
             'port': 3306,
             'autocommit': True,
             'pool_name': 'flask_pool',
-            'pool_size': 5,
+            # ✅ CORREÇÃO: Dimensionado pelas threads do processo (ou MYSQL_POOL_SIZE)
+            'pool_size': tamanho_pool_padrao(),
             'pool_reset_session': True,
+            # rowcount conta linhas encontradas pelo WHERE (UPDATE sem SELECT prévio)
+            'client_flags': [ClientFlag.FOUND_ROWS],
         }
+        # ✅ NOVO: Unidade de trabalho por requisição (ativada com init_app)
+        self.unit_of_work = UnitOfWork(self)
         self._create_pool()
     
     def _create_pool(self):
         """Cria o pool de conexões"""
         try:
             self.connection_pool = mysql.connector.pooling.MySQLConnectionPool(**self.config)
-            print("🚀 Pool de conexões MySQL criado com sucesso!")
+            logger.info("🚀 Pool de conexões MySQL criado com sucesso!")
         except Error as e:
-            print(f"❌ Erro ao criar pool de conexões: {e}")
+            logger.error("❌ Erro ao criar pool de conexões: %s", e)
             raise e
     
     def get_connection(self):
-        """Obtém uma conexão do pool"""
+        """
+        Obtém uma conexão do pool.
+        ✅ CORREÇÃO: Com o pool esgotado aguarda uma conexão ser devolvida
+        (até MYSQL_POOL_TIMEOUT segundos) em vez de falhar na hora.
+        """
+        limite = time.monotonic() + MYSQL_POOL_TIMEOUT
+        espera = 0.01
+        while True:
+            try:
+                if self.connection_pool:
+                    connection = self.connection_pool.get_connection()
+                    if connection.is_connected():
+                        return connection
+                raise Error("Pool de conexões não disponível")
+            except PoolError as e:
+                if time.monotonic() + espera > limite:
+                    logger.error("❌ Pool de conexões esgotado após %ss: %s", MYSQL_POOL_TIMEOUT, e)
+                    raise e
+                time.sleep(espera)
+                espera = min(espera * 2, 0.2)
+            except Error as e:
+                logger.error("❌ Erro ao obter conexão do pool: %s", e)
+                raise e
+    
+    def init_app(self, app):
+        """Ativa a unidade de trabalho por requisição (uma conexão e um commit por requisição)"""
+        self.unit_of_work.init_app(app)
+
+    def apos_commit(self, callback):
+        """✅ NOVO: Executa `callback` depois do commit da requisição (ver UnitOfWork.apos_commit)"""
+        self.unit_of_work.apos_commit(callback)
+
+    def _execute_in_unit_of_work(self, query, params=None, fetch=False):
+        """
+        Executa a query na conexão presa à requisição, sem commit.
+        O commit é feito uma única vez pela UnitOfWork no fim da requisição.
+        """
+        cursor = None
         try:
-            if self.connection_pool:
-                connection = self.connection_pool.get_connection()
-                if connection.is_connected():
-                    return connection
-            raise Error("Pool de conexões não disponível")
+            connection = self.unit_of_work.connection()
+            cursor = connection.cursor(dictionary=True)
+            self.unit_of_work.marcar_pendente()
+
+            logger.debug("📝 Executando query: %s...", query[:100])
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            if fetch:
+                return cursor.fetchall()
+            if query.strip().upper().startswith('INSERT'):
+                return cursor.lastrowid
+            return cursor.rowcount
+
         except Error as e:
-            print(f"❌ Erro ao obter conexão do pool: {e}")
+            logger.error("❌ Erro na query: %s", e)
+            self.unit_of_work.marcar_falha()
+            if "MySQL server has gone away" in str(e) or "Cursor is not connected" in str(e):
+                # Conexão perdida: a próxima query obtém outra do pool
+                self.unit_of_work.descartar()
             raise e
-    
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+
     def execute_query(self, query, params=None, fetch=False):
         """
         Executa uma query usando uma conexão do pool
         """
+        if self.unit_of_work.ativa():
+            return self._execute_in_unit_of_work(query, params, fetch)
+
         connection = None
         cursor = None
         
@@ -99,7 +216,7 @@ class MySQLDatabase:
             connection = self.get_connection()
             cursor = connection.cursor(dictionary=True)
             
-            print(f"📝 Executando query: {query[:100]}...")
+            logger.debug("📝 Executando query: %s...", query[:100])
             if params:
                 cursor.execute(query, params)
             else:
@@ -118,14 +235,14 @@ class MySQLDatabase:
             return result
             
         except Error as e:
-            print(f"❌ Erro na query: {e}")
-            print(f"🔍 Query: {query}")
+            logger.error("❌ Erro na query: %s", e)
+            logger.debug("🔍 Query: %s", query)
             if params:
-                print(f"🔍 Params: {params}")
+                logger.debug("🔍 Params: %s", params)
             
             # ✅ TENTA RECONEXÃO PARA ERROS DE CONEXÃO
             if "MySQL server has gone away" in str(e) or "Cursor is not connected" in str(e):
-                print("🔄 Tentando reconectar...")
+                logger.info("🔄 Tentando reconectar...")
                 try:
                     # Tenta recriar o pool
                     self._create_pool()
@@ -149,10 +266,10 @@ class MySQLDatabase:
                         else:
                             result = cursor.fetchall()
                         
-                        print("✅ Reconexão bem-sucedida!")
+                        logger.info("✅ Reconexão bem-sucedida!")
                         return result
                 except Error as retry_error:
-                    print(f"❌ Falha na reconexão: {retry_error}")
+                    logger.error("❌ Falha na reconexão: %s", retry_error)
             
             if connection and not connection.autocommit:
                 try:
@@ -175,85 +292,129 @@ class MySQLDatabase:
                 except:
                     pass
     
+    def execute_many(self, query, params_list):
+        """
+        ✅ NOVO: Executa a mesma query para vários conjuntos de parâmetros
+        (cursor.executemany) em uma única ida ao banco.
+        Dentro de uma requisição usa a conexão/transação da UnitOfWork.
+
+        :return: Total de linhas afetadas
+        """
+        if not params_list:
+            return 0
+
+        em_unidade = self.unit_of_work.ativa()
+        connection = self.unit_of_work.connection() if em_unidade else self.get_connection()
+        cursor = None
+        try:
+            if em_unidade:
+                self.unit_of_work.marcar_pendente()
+            cursor = connection.cursor(dictionary=True)
+            logger.debug("📝 Executando query em lote (%s): %s...", len(params_list), query[:100])
+            cursor.executemany(query, params_list)
+            if not em_unidade and not connection.autocommit:
+                connection.commit()
+            return cursor.rowcount
+
+        except Error as e:
+            logger.error("❌ Erro na query em lote: %s", e)
+            if em_unidade:
+                self.unit_of_work.marcar_falha()
+            elif not connection.autocommit:
+                try:
+                    connection.rollback()
+                except:
+                    pass
+            raise e
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except:
+                    pass
+            if not em_unidade:
+                try:
+                    connection.close()
+                except:
+                    pass
+
+    def stream_query(self, query, params=None, tamanho_lote=500):
+        """
+        ✅ NOVO: Gerador que entrega as linhas aos poucos (cursor sem buffer +
+        fetchmany), para exportações grandes em memória constante.
+
+        Usa uma conexão própria do pool, fora da UnitOfWork: a resposta em
+        streaming continua sendo lida depois que a requisição terminou.
+        """
+        connection = self.get_connection()
+        cursor = None
+        concluido = False
+        try:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            logger.debug("📝 Executando query em streaming: %s...", query[:100])
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(tamanho_lote)
+                if not rows:
+                    break
+                yield from rows
+            concluido = True
+        finally:
+            if not concluido:
+                # ✅ CORREÇÃO: Cliente desconectou no meio: não lê o resto do resultado
+                descartar_conexao(connection)
+            else:
+                try:
+                    cursor.close()
+                except Error:
+                    pass
+                try:
+                    connection.close()
+                except Error:
+                    pass
+
     def close(self):
         """Fecha todas as conexões do pool"""
         if self.connection_pool:
             try:
                 # O pool fecha automaticamente quando o programa termina
-                print("🔒 Pool de conexões MySQL será fechado...")
+                logger.info("🔒 Pool de conexões MySQL será fechado...")
             except:
                 pass
 
-def enviar_email_recuperacao(email_destino, token):
-    """
-    Envia email de recuperação de senha
-    """
-    try:
-        # Configurar mensagem
-        assunto = "Recuperação de Senha - Organização de Tarefas"
-        
-        # URL para redefinir senha (ajuste conforme sua estrutura)
-        url_redefinicao = f"http://localhost:5500/redefinir-senha.html?token={token}"
-        
-        mensagem_html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #ddd; border-radius: 10px;">
-                <h2 style="color: #667eea; text-align: center;">Recuperação de Senha</h2>
-                
-                <p>Olá,</p>
-                
-                <p>Você solicitou a redefinição de sua senha no sistema <strong>Organização de Tarefas</strong>.</p>
-                
-                <p>Clique no botão abaixo para redefinir sua senha:</p>
-                
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{url_redefinicao}" style="background-color: #667eea; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">
-                        Redefinir Senha
-                    </a>
-                </div>
-                
-                <p><strong>Este link expira em 1 hora.</strong></p>
-                
-                <p>Se você não solicitou esta redefinição, por favor ignore este email.</p>
-                
-                <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
-                
-                <p style="font-size: 12px; color: #666;">
-                    Equipe Organização de Tarefas<br>
-                    Este é um email automático, por favor não responda.
-                </p>
-            </div>
-        </body>
-        </html>
+    def fechar_pool(self):
         """
+        ✅ NOVO: Fecha as conexões ociosas do pool e o descarta.
+        Usado pelo processo mestre do servidor de produção antes do fork:
+        ele não atende requisições e não deve deixar conexões abertas.
+        """
+        if self.connection_pool:
+            try:
+                self.connection_pool._remove_connections()
+            except Error as e:
+                logger.warning("⚠️  Erro ao fechar conexões do pool: %s", e)
+            self.connection_pool = None
 
-        # Criar mensagem
-        msg = MIMEMultipart()
-        msg['From'] = EMAIL_CONFIG['email']
-        msg['To'] = email_destino
-        msg['Subject'] = assunto
-        msg.attach(MIMEText(mensagem_html, 'html'))
-
-        # Conectar e enviar email
-        server = smtplib.SMTP(EMAIL_CONFIG['smtp_server'], EMAIL_CONFIG['smtp_port'])
-        server.starttls()
-        server.login(EMAIL_CONFIG['email'], EMAIL_CONFIG['password'])
-        server.send_message(msg)
-        server.quit()
-
-        print(f"✅ Email de recuperação enviado para: {email_destino}")
-        return True
-
-    except Exception as e:
-        print(f"❌ Erro ao enviar email: {e}")
-        return False
+    def reiniciar_pool(self):
+        """
+        ✅ NOVO: Cria um pool novo no processo atual (hook pós-fork).
+        Os sockets herdados do processo pai não podem ser compartilhados:
+        o pool antigo é só abandonado (fechá-lo aqui mandaria COM_QUIT pelas
+        conexões do pai).
+        """
+        self.connection_pool = None
+        self._create_pool()
 
 def create_app():
     """
     Factory function para criar e configurar a aplicação Flask.
     """
+    # ✅ NOVO: Logging assíncrono e com níveis (LOG_LEVEL / LOG_LEVELS)
+    Logger.configure()
+
     app = Flask(__name__)
+    # ✅ NOVO: jsonify via orjson (datas em ISO 8601)
+    app.json = JsonProviderRapido(app)
     
     # ✅ CORREÇÃO: Configuração CORS ÚNICA
     CORS(app, 
@@ -272,17 +433,17 @@ def create_app():
         # Testa a conexão
         test_result = database_dependency.execute_query("SELECT 1 as test", fetch=True)
         if test_result and test_result[0]['test'] == 1:
-            print("✅ Conexão com MySQL testada e funcionando!")
+            logger.info("✅ Conexão com MySQL testada e funcionando!")
         else:
             raise Exception("Teste de conexão falhou")
             
     except Exception as e:
-        print(f"❌ Erro ao inicializar MySQL: {e}")
-        print("🔄 Usando MockDatabase...")
+        logger.error("❌ Erro ao inicializar MySQL: %s", e)
+        logger.info("🔄 Usando MockDatabase...")
         
         class MockDatabase:
             def __init__(self):
-                print("🔄 MockDatabase inicializado - usando dados de exemplo")
+                logger.info("🔄 MockDatabase inicializado - usando dados de exemplo")
                 self.mock_usuarios = [
                     {
                         "id": 1, 
@@ -297,7 +458,7 @@ def create_app():
                 self.last_id = 1
             
             def execute_query(self, query, params=None, fetch=False):
-                print(f"📝 MockDatabase.execute_query: {query[:100]}...")
+                logger.debug("📝 MockDatabase.execute_query: %s...", query[:100])
                 
                 if query.upper().startswith('INSERT'):
                     self.last_id += 1
@@ -312,6 +473,13 @@ def create_app():
                         return []
                     return self.mock_usuarios
                 return 1
+
+            def execute_many(self, query, params_list):
+                logger.debug("📝 MockDatabase.execute_many (%s): %s...", len(params_list), query[:100])
+                return len(params_list)
+
+            def stream_query(self, query, params=None, tamanho_lote=500):
+                yield from self.execute_query(query, params, fetch=True)
             
             def get_connection(self): 
                 return self
@@ -321,52 +489,119 @@ def create_app():
                 pass
         
         database_dependency = MockDatabase()
+
+    # ✅ NOVO: Uma conexão e um commit por requisição (quando o banco suporta)
+    if hasattr(database_dependency, 'init_app'):
+        database_dependency.init_app(app)
+    # ✅ NOVO: Usado pelos hooks de fork do servidor de produção (producao.py)
+    app.extensions['database'] = database_dependency
     
     # ✅ INICIALIZAÇÃO DOS COMPONENTES
     try:
         # DAOs
         usuario_dao = UsuarioDAO(database_dependency=database_dependency)
-        projeto_dao = ProjetoDAO(database_dependency=database_dependency)
-        tarefa_dao = TarefaDAO(database_dependency=database_dependency)
+        # ✅ NOVO: Versão por usuário (ETag), incrementada pelos DAOs a cada escrita
+        versao_dao = VersaoDAO(database_dependency=database_dependency)
+        projeto_dao = ProjetoDAO(database_dependency=database_dependency, versao_dao_dependency=versao_dao)
+        tarefa_dao = TarefaDAO(database_dependency=database_dependency, versao_dao_dependency=versao_dao)
+        token_recuperacao_dao = TokenRecuperacaoDAO(database_dependency=database_dependency)
+
+        # ✅ NOVO: Remove periodicamente os tokens de recuperação expirados
+        limpeza_tokens = JobPeriodico(
+            'limpeza-tokens-recuperacao',
+            INTERVALO_LIMPEZA_TOKENS,
+            token_recuperacao_dao.delete_expirados
+        )
+        limpeza_tokens.start()
+        app.extensions['limpeza_tokens'] = limpeza_tokens
+
+        # ✅ NOVO: Emails vão para a outbox e são enviados em segundo plano
+        email_outbox_dao = EmailOutboxDAO(database_dependency=database_dependency)
+        email_worker = None
+        if isinstance(database_dependency, MySQLDatabase):
+            email_worker = EmailWorker(email_outbox_dao, EMAIL_CONFIG)
+            email_worker.start()
+            app.extensions['email_worker'] = email_worker
+        else:
+            logger.warning("⚠️  EmailWorker desativado: banco de dados simulado")
+        email_service = EmailService(email_outbox_dao, email_worker)
         
+        # ✅ NOVO: bcrypt roda em um pool de processos, fora da thread da requisição
+        hash_executor = HashExecutor()
+        app.extensions['hash_executor'] = hash_executor
+
         # Services
-        usuario_service = UsuarioService(usuario_dao_dependency=usuario_dao)
+        usuario_service = UsuarioService(
+            usuario_dao_dependency=usuario_dao,
+            hash_executor_dependency=hash_executor
+        )
+        # ✅ NOVO: Cache de leitura por usuário entre os services e os DAOs
+        # ✅ NOVO: Leituras simultâneas iguais que não estão no cache viram uma consulta só
+        cache_leitura = CacheLeitura(criar_backend_cache(), versao_dao, ttl=CACHE_TTL,
+                                     single_flight=SingleFlight())
+        app.extensions['cache_leitura'] = cache_leitura
         projeto_service = ProjetoService(
             projeto_dao_dependency=projeto_dao,
-            usuario_dao_dependency=usuario_dao
+            usuario_dao_dependency=usuario_dao,
+            cache_leitura_dependency=cache_leitura
         )
         tarefa_service = TarefaService(
             tarefa_dao_dependency=tarefa_dao,
             projeto_dao_dependency=projeto_dao,
-            usuario_dao_dependency=usuario_dao
+            usuario_dao_dependency=usuario_dao,
+            cache_leitura_dependency=cache_leitura
+        )
+        dashboard_service = DashboardService(
+            usuario_dao_dependency=usuario_dao,
+            projeto_dao_dependency=projeto_dao,
+            tarefa_dao_dependency=tarefa_dao
+        )
+        # ✅ NOVO: Relatórios PDF renderizados em segundo plano, com cache por versão dos dados
+        relatorio_service = RelatorioService(
+            tarefa_service_dependency=tarefa_service,
+            projeto_service_dependency=projeto_service,
+            usuario_service_dependency=usuario_service,
+            versao_dao_dependency=versao_dao,
+            backend=criar_backend_cache("organizacao:relatorios:", RELATORIO_CACHE_CAPACIDADE)
         )
+        app.extensions['relatorio_service'] = relatorio_service
         
         # Controls
         usuario_control = UsuarioControl(usuario_service)
         projeto_control = ProjetoControl(projeto_service)
         tarefa_control = TarefaControl(tarefa_service)
+        dashboard_control = DashboardControl(dashboard_service)
+        exportacao_control = ExportacaoControl(tarefa_service, projeto_service, usuario_service)
+        relatorio_control = RelatorioControl(relatorio_service)
         
         # Middlewares
         jwt_middleware = JwtMiddleware()
         usuario_middleware = UsuarioMiddleware()
         projeto_middleware = ProjetoMiddleware()
         tarefa_middleware = TarefaMiddleware()
+        etag_middleware = EtagMiddleware(jwt_middleware, versao_dao)
         
         # Roteadores
         usuario_roteador = UsuarioRoteador(jwt_middleware, usuario_middleware, usuario_control)
-        projeto_roteador = ProjetoRoteador(jwt_middleware, projeto_middleware, projeto_control)
-        tarefa_roteador = TarefaRoteador(jwt_middleware, tarefa_middleware, tarefa_control)
+        projeto_roteador = ProjetoRoteador(jwt_middleware, projeto_middleware, projeto_control, etag_middleware)
+        tarefa_roteador = TarefaRoteador(jwt_middleware, tarefa_middleware, tarefa_control, etag_middleware)
+        dashboard_roteador = DashboardRoteador(jwt_middleware, dashboard_control)
+        exportacao_roteador = ExportacaoRoteador(jwt_middleware, exportacao_control)
+        relatorio_roteador = RelatorioRoteador(jwt_middleware, relatorio_control)
         
         # Blueprints
         app.register_blueprint(usuario_roteador.create_routes(), url_prefix='/api/usuario')
         app.register_blueprint(projeto_roteador.create_routes(), url_prefix='/api/projeto')
         app.register_blueprint(tarefa_roteador.create_routes(), url_prefix='/api/tarefa')
+        app.register_blueprint(dashboard_roteador.create_routes(), url_prefix='/api/dashboard')
+        app.register_blueprint(exportacao_roteador.create_routes(), url_prefix='/api/export')
+        app.register_blueprint(relatorio_roteador.create_routes(), url_prefix='/api/relatorios')
         
-        print("✅ Todos os componentes inicializados com sucesso!")
+        logger.info("✅ Todos os componentes inicializados com sucesso!")
         
     except Exception as e:
-        print(f"❌ Erro na inicialização dos componentes: {e}")
-        print(f"🔍 Stack trace: {traceback.format_exc()}")
+        logger.error("❌ Erro na inicialização dos componentes: %s", e)
+        logger.error("🔍 Stack trace", exc_info=True)
         raise e
 
     # ✅ ROTAS DE RECUPERAÇÃO DE SENHA
@@ -387,23 +622,16 @@ def create_app():
 
             # Gerar token único
             token = secrets.token_urlsafe(32)
-            expiracao = datetime.now() + timedelta(hours=1)  # Token válido por 1 hora
 
-            # Armazenar token (em produção, salve no banco de dados)
-            tokens_recuperacao[token] = {
-                'user_id': usuario['id'],
-                'email': email,
-                'expiracao': expiracao
-            }
+            # Armazenar token (somente o hash vai para o banco)
+            token_recuperacao_dao.create(token, usuario['id'], email, VALIDADE_TOKEN_RECUPERACAO)
 
-            # Enviar email
-            if enviar_email_recuperacao(email, token):
-                return jsonify({'success': True, 'message': 'Email de recuperação enviado com sucesso'})
-            else:
-                return jsonify({'success': False, 'error': {'message': 'Erro ao enviar email'}}), 500
+            # Enfileirar email (o envio acontece em segundo plano)
+            email_service.enviarRecuperacaoSenha(email, token)
+            return jsonify({'success': True, 'message': 'Email de recuperação enviado com sucesso'})
 
         except Exception as e:
-            print(f"❌ Erro em recuperar_senha: {e}")
+            logger.error("❌ Erro em recuperar_senha: %s", e)
             return jsonify({'success': False, 'error': {'message': str(e)}}), 500
 
     @app.route('/api/auth/redefinir-senha', methods=['POST'])
@@ -416,42 +644,39 @@ def create_app():
             if not token or not nova_senha:
                 return jsonify({'success': False, 'error': {'message': 'Token e nova senha são obrigatórios'}}), 400
 
-            # Verificar token
-            token_data = tokens_recuperacao.get(token)
+            # Verificar token (qualquer processo enxerga o mesmo registro)
+            token_data = token_recuperacao_dao.find_valido(token)
             if not token_data:
                 return jsonify({'success': False, 'error': {'message': 'Token inválido ou expirado'}}), 400
 
-            if datetime.now() > token_data['expiracao']:
-                del tokens_recuperacao[token]
-                return jsonify({'success': False, 'error': {'message': 'Token expirado'}}), 400
-
             # Buscar usuário
-            usuario = usuario_dao.buscar_por_id(token_data['user_id'])
+            usuario = usuario_dao.buscar_por_id(token_data['usuario_id'])
             if not usuario:
                 return jsonify({'success': False, 'error': {'message': 'Usuário não encontrado'}}), 404
 
-            # Atualizar senha
-            senha_hash = generate_password_hash(nova_senha)
-            usuario_dao.atualizar_senha(token_data['user_id'], senha_hash)
+            # Atualizar senha (bcrypt, o mesmo formato verificado no login)
+            try:
+                senha_hash = hash_executor.hash_senha(nova_senha)
+            except ErrorResponse as e:
+                return jsonify({'success': False, 'error': {'message': e.message, 'code': e.status_code}}), e.status_code, e.headers
 
-            # Remover token usado
-            del tokens_recuperacao[token]
+            # Consumir token (uso único, mesmo com requisições concorrentes)
+            if not token_recuperacao_dao.consumir(token):
+                return jsonify({'success': False, 'error': {'message': 'Token inválido ou expirado'}}), 400
+
+            usuario_dao.atualizar_senha(token_data['usuario_id'], senha_hash)
 
             return jsonify({'success': True, 'message': 'Senha redefinida com sucesso'})
 
         except Exception as e:
-            print(f"❌ Erro em redefinir_senha: {e}")
+            logger.error("❌ Erro em redefinir_senha: %s", e)
             return jsonify({'success': False, 'error': {'message': str(e)}}), 500
 
     # ✅ HANDLERS DE ERRO
     @app.errorhandler(Exception)
     def handle_global_exception(e):
-        print(f"❌ ERRO GLOBAL CAPTURADO: {e}")
-        print(f"🔍 Stack trace: {traceback.format_exc()}")
-        
-        import logging
-        logging.basicConfig(filename='app_errors.log', level=logging.ERROR)
-        logging.error(f"Erro global: {e}\n{traceback.format_exc()}")
+        logger.error("❌ ERRO GLOBAL CAPTURADO: %s", e)
+        logger.error("🔍 Stack trace", exc_info=True)
         
         return jsonify({
             "success": False,
@@ -487,6 +712,8 @@ def create_app():
                 "status": "healthy",
                 "message": "API está funcionando corretamente",
                 "database": db_status,
+                "cache": app.extensions['cache_leitura'].estatisticas() if 'cache_leitura' in app.extensions else None,
+                "relatorios": app.extensions['relatorio_service'].estatisticas() if 'relatorio_service' in app.extensions else None,
                 "timestamp": traceback.format_stack()[-1] if app.debug else None
             })
         except Exception as e:
@@ -510,7 +737,9 @@ def create_app():
                 "recuperar_senha": "POST /api/auth/recuperar-senha",
                 "redefinir_senha": "POST /api/auth/redefinir-senha",
                 "projetos": "/api/projeto/",
-                "tarefas": "/api/tarefa/"
+                "tarefas": "/api/tarefa/",
+                "exportacao": "/api/export/{tarefas,projetos,usuarios}.csv",
+                "relatorios": "POST /api/relatorios"
             },
             "documentation": "Consulte a documentação para mais detalhes"
         })
@@ -522,38 +751,38 @@ def create_app():
             try:
                 database_dependency.close()
             except Exception as e:
-                print(f"❌ Erro ao fechar conexões: {e}")
+                logger.error("❌ Erro ao fechar conexões: %s", e)
     
-    print("=" * 60)
-    print("🚀 FLASK APP INICIALIZADA COM SUCESSO!")
-    print("📍 URL: http://localhost:5000")
-    print("📊 Banco de dados: projeto (com pool de conexões)")
-    print("🔧 Modo: Debug" if app.debug else "🔧 Modo: Produção")
-    print("👤 Usuários: Isolados por ID")
-    print("📁 Projetos: Filtrados por usuário") 
-    print("✅ Tarefas: Filtradas por usuário")
-    print("✅ CORS configurado corretamente")
-    print("✅ Sistema de recuperação de senha ativo")
-    print("=" * 60)
+    logger.info("%s", "=" * 60)
+    logger.info("🚀 FLASK APP INICIALIZADA COM SUCESSO!")
+    logger.info("📍 URL: http://localhost:5000")
+    logger.debug("📊 Banco de dados: projeto (com pool de conexões)")
+    logger.info("%s", "🔧 Modo: Debug" if app.debug else "🔧 Modo: Produção")
+    logger.info("👤 Usuários: Isolados por ID")
+    logger.info("📁 Projetos: Filtrados por usuário") 
+    logger.info("✅ Tarefas: Filtradas por usuário")
+    logger.info("✅ CORS configurado corretamente")
+    logger.info("✅ Sistema de recuperação de senha ativo")
+    logger.info("%s", "=" * 60)
     
     return app
 
 if __name__ == '__main__':
     app = create_app()
-    print("🔥 Iniciando servidor Flask...")
+    logger.info("🔥 Iniciando servidor Flask...")
     
     try:
         app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
     except Exception as e:
-        print(f"❌ ERRO CRÍTICO: {e}")
-        print("🔄 Reiniciando servidor em 5 segundos...")
+        logger.error("❌ ERRO CRÍTICO: %s", e)
+        logger.info("🔄 Reiniciando servidor em 5 segundos...")
         import time
         time.sleep(5)
         try:
             app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
         except Exception as e2:
-            print(f"❌ ERRO CRÍTICO NOVAMENTE: {e2}")
-            print("💡 O servidor não conseguiu reiniciar. Verifique:")
-            print("   - XAMPP MySQL está rodando?")
-            print("   - Porta 5000 está livre?")
-            print("   - Banco 'projeto' existe?")
\ No newline at end of file
+            logger.error("❌ ERRO CRÍTICO NOVAMENTE: %s", e2)
+            logger.info("💡 O servidor não conseguiu reiniciar. Verifique:")
+            logger.info("   - XAMPP MySQL está rodando?")
+            logger.info("   - Porta 5000 está livre?")
+            logger.info("   - Banco 'projeto' existe?")
\ No newline at end of file
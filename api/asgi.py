@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Ponto de entrada ASGI da API (usuário, projeto e tarefa).
+
+Uso:
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+
+As rotas são as mesmas dos roteadores de UsuarioRoteador, ProjetoRoteador
+e TarefaRoteador, com os mesmos DAOs, services e controls do server.py.
+A diferença está embaixo: o banco é o AsyncMysqlDatabase (aiomysql) e cada
+requisição roda em um greenlet no event loop (AsgiWsgi). Enquanto uma
+requisição espera o MySQL, o processo atende as outras, então milhares de
+conexões simultâneas não precisam de milhares de threads.
+
+Variáveis de ambiente: as mesmas de create_database_instance() (MYSQL_*),
+além de ASGI_DB_POOL (conexões no pool, padrão 20) e ASGI_DB_TIMEOUT
+(segundos de espera por uma conexão livre, padrão 10).
+"""
+import sys
+import os
+from datetime import datetime
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import Server
+from api.database.async_mysql_database import create_async_database_instance
+from api.http.meu_token_jwt import MeuTokenJWT
+from api.middleware.jwt_middleware import JwtMiddleware
+from api.middleware.usuario_middleware import UsuarioMiddleware
+from api.middleware.projeto_middleware import ProjetoMiddleware
+from api.middleware.tarefa_middleware import TarefaMiddleware
+from api.middleware.etag_middleware import EtagMiddleware
+
+from api.dao.usuario_dao import UsuarioDAO
+from api.dao.projeto_dao import ProjetoDAO
+from api.dao.tarefa_dao import TarefaDAO
+from api.dao.versao_dao import VersaoDAO
+
+from api.service.usuario_service import UsuarioService
+from api.service.projeto_service import ProjetoService
+from api.service.tarefa_service import TarefaService
+from api.utils.hash_executor import HashExecutor
+from api.utils.cache_lru import CacheLRU
+from api.utils.cache_leitura import CacheLeitura
+
+from api.control.usuario_control import UsuarioControl
+from api.control.projeto_control import ProjetoControl
+from api.control.tarefa_control import TarefaControl
+
+from api.router.usuario_roteador import UsuarioRoteador
+from api.router.projeto_roteador import ProjetoRoteador
+from api.router.tarefa_roteador import TarefaRoteador
+
+from api.utils.asgi_wsgi import AsgiWsgi
+from api.utils.ponte_async import executar_sincrono
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class AsgiServer(Server):
+    """
+    Servidor da API sobre ASGI. Reaproveita a montagem do Server (CORS,
+    preflight, error handlers) trocando o banco e registrando só as rotas
+    de usuário, projeto e tarefa.
+    """
+
+    def __init__(self, database):
+        super().__init__()
+        self.database = database
+
+    async def iniciar(self):
+        """Startup do ASGI: abre o pool e monta a aplicação Flask"""
+        await self.database.iniciar()
+        # Os construtores dos DAOs criam as tabelas: precisam rodar dentro da ponte
+        await executar_sincrono(self.init)
+        return self.app.wsgi_app
+
+    async def encerrar(self):
+        """Shutdown do ASGI"""
+        logger.info("🔒 Encerrando servidor ASGI...")
+        if self.dependencies.get('hash_executor'):
+            self.dependencies['hash_executor'].shutdown()
+        await self.database.encerrar()
+        logger.info("✅ Servidor ASGI encerrado")
+
+    def _init_database(self):
+        """O pool assíncrono já foi aberto em iniciar(); só ativa a UnitOfWork."""
+        if not self.database.test_connection():
+            raise Exception("Falha ao conectar com o banco de dados")
+        self.database.init_app(self.app)
+
+    def _configure_dependencies(self):
+        """Mesmas dependências do Server para usuário, projeto e tarefa."""
+        logger.info("🔗 Configurando dependências (ASGI)...")
+
+        jwt_instance = MeuTokenJWT()
+        jwt_middleware = JwtMiddleware(jwt_instance)
+
+        usuario_dao = UsuarioDAO(self.database)
+        versao_dao = VersaoDAO(self.database)
+        projeto_dao = ProjetoDAO(self.database, versao_dao)
+        tarefa_dao = TarefaDAO(self.database, versao_dao)
+
+        hash_executor = HashExecutor()
+        usuario_service = UsuarioService(usuario_dao, hash_executor)
+        # Sem SingleFlight: ele espera em threading.Event, o que travaria o event loop
+        cache_leitura = CacheLeitura(CacheLRU(capacidade=2048), versao_dao, single_flight=None)
+        projeto_service = ProjetoService(projeto_dao, usuario_dao, cache_leitura)
+        tarefa_service = TarefaService(tarefa_dao, projeto_dao, cache_leitura_dependency=cache_leitura)
+
+        etag_middleware = EtagMiddleware(jwt_middleware, versao_dao)
+
+        self.dependencies = {
+            'jwt_middleware': jwt_middleware,
+            'hash_executor': hash_executor,
+            'cache_leitura': cache_leitura,
+            'usuario_roteador': UsuarioRoteador(jwt_middleware, UsuarioMiddleware(),
+                                                UsuarioControl(usuario_service)),
+            'projeto_roteador': ProjetoRoteador(jwt_middleware, ProjetoMiddleware(),
+                                                ProjetoControl(projeto_service), etag_middleware),
+            'tarefa_roteador': TarefaRoteador(jwt_middleware, TarefaMiddleware(),
+                                              TarefaControl(tarefa_service), etag_middleware)
+        }
+        logger.info("✅ Dependências configuradas com sucesso")
+
+    def _register_routes(self):
+        """Registra os blueprints de usuário, projeto e tarefa."""
+        logger.info("🛣️  Registrando rotas (ASGI)...")
+
+        self.app.register_blueprint(self.dependencies['usuario_roteador'].create_routes(),
+                                    url_prefix='/api/usuario')
+        self.app.register_blueprint(self.dependencies['projeto_roteador'].create_routes(),
+                                    url_prefix='/api/projeto')
+        self.app.register_blueprint(self.dependencies['tarefa_roteador'].create_routes(),
+                                    url_prefix='/api/tarefa')
+
+        @self.app.route('/api/health')
+        def health_check():
+            return {
+                "status": "healthy",
+                "message": "Servidor ASGI funcionando corretamente",
+                "database": self.database.get_pool_status(),
+                "cache": self.dependencies['cache_leitura'].estatisticas(),
+                "timestamp": datetime.now().isoformat() + "Z"
+            }
+
+        @self.app.route('/')
+        def index():
+            return {
+                "message": "Bem-vindo ao Sistema de Gerenciamento de Projetos",
+                "version": "1.0.0",
+                "endpoints": {
+                    "usuario": "/api/usuario",
+                    "projeto": "/api/projeto",
+                    "tarefa": "/api/tarefa",
+                    "health": "/api/health"
+                }
+            }
+
+        logger.info("✅ Rotas registradas com sucesso")
+
+    def run(self):
+        raise Exception("Use um servidor ASGI: uvicorn asgi:app")
+
+
+def create_asgi_app():
+    """Factory da aplicação ASGI (uvicorn --factory asgi:create_asgi_app)."""
+    server = AsgiServer(create_async_database_instance())
+    return AsgiWsgi(server.iniciar, server.encerrar)
+
+
+app = create_asgi_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")), loop="auto", http="auto")
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark da serialização das listagens de tarefas.
+
+Compara, sobre linhas no formato que o MySQL devolve para TarefaDAO.findAll():
+- antigo: _row_to_dict com isoformat() por campo + provider JSON padrão do Flask
+- novo:   _row_to_dict com datas como objetos + JsonProviderRapido (orjson)
+
+Uso:
+    python benchmark_json.py [linhas ...]     (padrão: 5000 20000)
+"""
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from api.dao.tarefa_dao import TarefaDAO
+from api.utils.json_provider import JsonProviderRapido, orjson
+
+REPETICOES = 5
+
+
+def gerar_linhas(total: int) -> list[dict]:
+    """Linhas como as do SELECT de TarefaDAO.findAll (com JOINs de nomes)"""
+    aleatorio = random.Random(42)
+    hoje = datetime(2025, 11, 1, 9, 30)
+    linhas = []
+    for i in range(1, total + 1):
+        inicio = hoje - timedelta(days=aleatorio.randint(0, 90), minutes=aleatorio.randint(0, 600))
+        linhas.append({
+            "id": i,
+            "titulo": f"Tarefa {i} - revisar módulo de relatórios",
+            "descricao": "Descrição com acentuação e detalhes da atividade " * aleatorio.randint(1, 4),
+            "status": aleatorio.choice(["pendente", "andamento", "concluida"]),
+            "prioridade": aleatorio.choice(["baixa", "media", "alta"]),
+            "concluida": aleatorio.randint(0, 1),
+            "data_limite": (hoje + timedelta(days=aleatorio.randint(-10, 60))).date() if i % 5 else None,
+            "data_inicio": inicio,
+            "data_fim": inicio + timedelta(hours=aleatorio.randint(1, 72)) if i % 3 == 0 else None,
+            "projeto_id": aleatorio.randint(1, 40),
+            "projeto_nome": f"Projeto {aleatorio.randint(1, 40)}",
+            "usuario_responsavel_id": aleatorio.randint(1, 200),
+            "usuario_atribuidor_id": aleatorio.randint(1, 200),
+            "responsavel_nome": "Ana Silva",
+            "atribuidor_nome": "Bruno Costa",
+        })
+    return linhas
+
+
+def row_to_dict_antigo(row: dict) -> dict:
+    """_row_to_dict de antes do JsonProviderRapido (isoformat por campo)"""
+    tarefa_data = TarefaDAO._row_to_dict(None, row)
+    for field in ("data_limite", "data_inicio", "data_fim"):
+        if row.get(field):
+            tarefa_data[field] = row[field].isoformat()
+    return tarefa_data
+
+
+def medir(app: Flask, linhas: list[dict], mapear) -> float:
+    """Melhor tempo (s) de mapear + jsonify da listagem"""
+    def executar():
+        tarefas = [mapear(row) for row in linhas]
+        app.json.response({"success": True, "data": {"tarefas": tarefas}}).get_data()
+
+    with app.app_context():
+        return min(timeit.repeat(executar, number=1, repeat=REPETICOES))
+
+
+def main():
+    tamanhos = [int(arg) for arg in sys.argv[1:]] or [5000, 20000]
+
+    app_antigo = Flask("antigo")
+    app_antigo.json = DefaultJSONProvider(app_antigo)
+    app_antigo.json.compact = True
+    app_novo = Flask("novo")
+    app_novo.json = JsonProviderRapido(app_novo)
+
+    print(f"orjson: {'sim' if orjson else 'não (usando json da biblioteca padrão)'}")
+    print(f"{'linhas':>8} {'antigo (ms)':>12} {'novo (ms)':>10} {'ganho':>7}")
+    for total in tamanhos:
+        linhas = gerar_linhas(total)
+        antigo = medir(app_antigo, linhas, row_to_dict_antigo)
+        novo = medir(app_novo, linhas, lambda row: TarefaDAO._row_to_dict(None, row))
+        print(f"{total:>8} {antigo * 1000:>12.1f} {novo * 1000:>10.1f} {antigo / novo:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de throughput HTTP de um servidor da API já em execução.
+
+Abre N conexões keep-alive simultâneas e repete GETs na URL durante o
+tempo pedido; mede requisições por segundo e latências (p50/p99).
+Usa só a biblioteca padrão (asyncio), para rodar em qualquer máquina.
+
+Uso:
+    python benchmark_servidor.py URL [conexoes] [segundos]
+    python benchmark_servidor.py http://127.0.0.1:5000/ 64 10
+
+Para comparar os servidores, suba um de cada vez e rode o mesmo comando:
+    python app.py                                         (desenvolvimento)
+    WEB_THREADS=4 python producao.py                      (pre-fork, gthread)
+    uvicorn asgi:app --port 5000                          (ASGI)
+"""
+import asyncio
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+
+async def _requisicao(leitor, escritor, pedido: bytes) -> tuple:
+    """Envia o pedido e lê a resposta inteira: (status, conexão precisa ser fechada)"""
+    escritor.write(pedido)
+    await escritor.drain()
+    status_linha = await leitor.readline()
+    if not status_linha:
+        raise ConnectionError("conexão fechada pelo servidor")
+    status = int(status_linha.split()[1])
+    # HTTP/1.0 (servidor de desenvolvimento) fecha a conexão a cada resposta
+    fechar = status_linha.startswith(b"HTTP/1.0")
+
+    tamanho, chunked = None, False
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        nome, valor = nome.strip().lower(), valor.strip().lower()
+        if nome == "content-length":
+            tamanho = int(valor)
+        elif nome == "connection" and valor == "close":
+            fechar = True
+        elif nome == "transfer-encoding" and "chunked" in valor:
+            chunked = True
+
+    if chunked:
+        while True:
+            bloco = int((await leitor.readline()).strip(), 16)
+            await leitor.readexactly(bloco + 2)
+            if bloco == 0:
+                break
+    elif tamanho is not None:
+        await leitor.readexactly(tamanho)
+    else:
+        await leitor.read()
+        fechar = True
+    return status, fechar
+
+
+async def _cliente(host: str, porta: int, pedido: bytes, fim: float, latencias: list, erros: list):
+    leitor = escritor = None
+    while time.perf_counter() < fim:
+        try:
+            if escritor is None:
+                leitor, escritor = await asyncio.open_connection(host, porta)
+            inicio = time.perf_counter()
+            status, fechar = await _requisicao(leitor, escritor, pedido)
+            latencias.append(time.perf_counter() - inicio)
+            if status >= 500:
+                erros.append(status)
+            if fechar:
+                # Sem keep-alive a reconexão faz parte do custo medido
+                escritor.close()
+                leitor = escritor = None
+        except (OSError, ConnectionError, ValueError, asyncio.IncompleteReadError):
+            if escritor is not None:
+                escritor.close()
+            leitor = escritor = None
+            erros.append("conexão")
+            await asyncio.sleep(0.01)
+    if escritor is not None:
+        escritor.close()
+
+
+async def medir(url: str, conexoes: int = 64, segundos: float = 10) -> dict:
+    partes = urlsplit(url)
+    host, porta = partes.hostname, partes.port or 80
+    caminho = (partes.path or "/") + (f"?{partes.query}" if partes.query else "")
+    pedido = (f"GET {caminho} HTTP/1.1\r\nHost: {host}:{porta}\r\n"
+              f"Connection: keep-alive\r\nAccept: application/json\r\n\r\n").encode("latin-1")
+
+    latencias, erros = [], []
+    inicio = time.perf_counter()
+    fim = inicio + segundos
+    await asyncio.gather(*[_cliente(host, porta, pedido, fim, latencias, erros) for _ in range(conexoes)])
+    duracao = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "requisicoes": len(latencias),
+        "req_s": round(len(latencias) / duracao, 1),
+        "p50_ms": round(statistics.median(latencias) * 1000, 1) if latencias else None,
+        "p99_ms": round(latencias[int(len(latencias) * 0.99) - 1] * 1000, 1) if latencias else None,
+        "erros": len(erros)
+    }
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    url = sys.argv[1]
+    conexoes = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    segundos = float(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    print(f"{url} - {conexoes} conexões, {segundos:g}s")
+    resultado = asyncio.run(medir(url, conexoes, segundos))
+    print(f"  {resultado['requisicoes']} requisições | {resultado['req_s']} req/s | "
+          f"p50 {resultado['p50_ms']} ms | p99 {resultado['p99_ms']} ms | erros: {resultado['erros']}")
+
+
+if __name__ == "__main__":
+    main()
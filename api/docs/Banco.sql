@@ -59,6 +59,43 @@ CREATE TABLE IF NOT EXISTS tarefas (
     INDEX idx_prioridade (prioridade)
 );
 
+-- Tokens de recuperação de senha (somente o SHA-256 do token é gravado)
+CREATE TABLE IF NOT EXISTS tokens_recuperacao (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    token_hash CHAR(64) NOT NULL,
+    usuario_id INT NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    expira_em DATETIME NOT NULL,
+    data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_tokens_recuperacao_hash_expira (token_hash, expira_em),
+    INDEX idx_tokens_recuperacao_expira (expira_em)
+);
+
+-- Outbox de emails (enviados em segundo plano pelo EmailWorker)
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    destinatario VARCHAR(255) NOT NULL,
+    assunto VARCHAR(255) NOT NULL,
+    corpo_html MEDIUMTEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pendente',  -- pendente | enviando | enviado | falhou
+    tentativas INT NOT NULL DEFAULT 0,
+    proxima_tentativa DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    reservado_por CHAR(32) NULL,
+    reservado_em DATETIME NULL,
+    ultimo_erro TEXT NULL,
+    data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    data_envio DATETIME NULL,
+    INDEX idx_email_outbox_fila (status, proxima_tentativa),
+    INDEX idx_email_outbox_reserva (reservado_por)
+);
+
+-- Versão dos dados de cada usuário (ETag das listagens); incrementada a cada escrita
+CREATE TABLE IF NOT EXISTS versoes_usuario (
+    usuario_id INT PRIMARY KEY,
+    versao BIGINT NOT NULL,
+    data_atualizacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
 -- Inserir dados de exemplo (ATUALIZADO)
 INSERT INTO usuarios (nome, email, senha_hash, empresa) VALUES
 ('Ana Silva', 'ana.silva@email.com', '$2b$12$LQv3c1yqBWVHxkd0g8f/sOe1e8QGk5R5Vc8Vv7v8B8k8kX8v8B8k8', 'Tech Solutions'),
@@ -108,8 +145,34 @@ INSERT INTO tarefas (titulo, descricao, status, prioridade, concluida, data_limi
 
 -- Adicionar índices para melhor performance
 CREATE INDEX idx_projetos_usuario_id ON projetos(usuario_id);
+-- Projetos recentes do usuário (ORDER BY data_criacao DESC LIMIT n) sem filesort
+CREATE INDEX idx_projetos_usuario_data ON projetos(usuario_id, data_criacao);
 CREATE INDEX idx_tarefas_usuario_responsavel ON tarefas(usuario_responsavel_id);
 CREATE INDEX idx_tarefas_usuario_atribuidor ON tarefas(usuario_atribuidor_id);
+-- Índice de cobertura para as estatísticas do dashboard (GROUP BY status, prioridade, concluida)
+CREATE INDEX idx_tarefas_estatisticas ON tarefas(usuario_responsavel_id, status, prioridade, concluida);
+-- Filtros combinados das listagens de tarefas (ex.: abertas com prazo na semana, por projeto)
+CREATE INDEX idx_tarefas_responsavel_prazo ON tarefas(usuario_responsavel_id, concluida, data_limite);
+CREATE INDEX idx_tarefas_responsavel_projeto ON tarefas(usuario_responsavel_id, projeto_id, status);
+CREATE INDEX idx_tarefas_atribuidor_status ON tarefas(usuario_atribuidor_id, status, data_limite);
+-- Índices FULLTEXT para a busca textual (MATCH ... AGAINST em modo booleano)
+ALTER TABLE projetos ADD FULLTEXT INDEX ft_projetos_nome_descricao (nome, descricao);
+ALTER TABLE tarefas ADD FULLTEXT INDEX ft_tarefas_titulo_descricao (titulo, descricao);
+-- Chaves de ordenação da paginação por cursor (TarefaDAO.findPage), gravadas
+-- como colunas geradas para o keyset e o ORDER BY usarem idx_tarefas_pagina
+ALTER TABLE tarefas
+    ADD COLUMN ordem_status TINYINT AS (
+        CASE
+            WHEN concluida = TRUE THEN 3
+            WHEN status = 'andamento' THEN 1
+            WHEN status = 'pendente' THEN 2
+            ELSE 4
+        END
+    ) STORED NOT NULL,
+    ADD COLUMN prioridade_ord VARCHAR(50) AS (COALESCE(prioridade, '')) STORED NOT NULL,
+    ADD COLUMN data_limite_ord DATETIME AS (COALESCE(data_limite, CAST('1000-01-01 00:00:00' AS DATETIME))) STORED NOT NULL;
+-- prioridade_ord DESC igual ao ORDER BY (índices descendentes: MySQL 8.0+)
+CREATE INDEX idx_tarefas_pagina ON tarefas(usuario_responsavel_id, ordem_status, prioridade_ord DESC, data_limite_ord, id);
 
 -- Atualizar a view de tarefas para incluir informações do usuário
 CREATE OR REPLACE VIEW vw_tarefas_completa AS
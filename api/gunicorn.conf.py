@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Configuração do servidor de produção (gunicorn, modelo pre-fork).
+
+Usada por producao.py e também por `gunicorn -c gunicorn.conf.py`.
+Tudo é configurável por variáveis de ambiente:
+
+- WEB_APP: aplicação WSGI (padrão: "app:create_app()"; ou "server:create_app()")
+- WEB_BIND: endereço (padrão: 0.0.0.0:5000)
+- WEB_WORKERS: processos (padrão: 2 x núcleos + 1 com CACHE_REDIS_URL, senão 1)
+- WEB_THREADS: threads por processo (padrão: 4)
+- WEB_PRELOAD: carrega a aplicação no mestre antes do fork (padrão: 1)
+- WEB_TIMEOUT / WEB_GRACEFUL_TIMEOUT: segundos (padrão: 30 / 30)
+- WEB_MAX_REQUESTS: recicla o worker após N requisições (padrão: 0 = nunca)
+- WEB_ACCESS_LOG: arquivo do log de acesso ("-" = stdout; padrão: desligado)
+
+Com preload, o mestre monta a aplicação uma vez (DAOs, tabelas, caches)
+e os workers nascem por fork. Os hooks abaixo garantem que nada ligado
+ao processo atravesse o fork: o mestre fecha o pool MySQL e para as
+threads de segundo plano; cada worker cria o próprio pool, a thread de
+logging e os jobs (api/utils/ciclo_fork.py).
+"""
+import multiprocessing
+import os
+
+wsgi_app = os.getenv("WEB_APP", "app:create_app()")
+chdir = os.path.dirname(os.path.abspath(__file__))
+
+bind = os.getenv("WEB_BIND", "0.0.0.0:5000")
+# ✅ CORREÇÃO: Sem Redis os jobs de relatório são por processo (ver when_ready):
+# o padrão é um único worker, para `python producao.py` subir sem configuração
+workers = int(os.getenv("WEB_WORKERS", 0)) or (
+    multiprocessing.cpu_count() * 2 + 1 if os.getenv("CACHE_REDIS_URL") else 1
+)
+threads = int(os.getenv("WEB_THREADS", 4))
+# Com threads > 1 cada worker atende várias requisições em paralelo (gthread)
+worker_class = "gthread" if threads > 1 else "sync"
+preload_app = os.getenv("WEB_PRELOAD", "1").lower() in ("1", "true")
+
+timeout = int(os.getenv("WEB_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("WEB_GRACEFUL_TIMEOUT", 30))
+keepalive = 5
+max_requests = int(os.getenv("WEB_MAX_REQUESTS", 0))
+max_requests_jitter = max_requests // 10
+
+# Heartbeat dos workers em memória (evita travar em disco lento)
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = os.getenv("WEB_ACCESS_LOG") or None
+errorlog = "-"
+proc_name = "organizacao-tarefas"
+
+
+def _aplicacao(server):
+    """Aplicação Flask carregada no mestre (só existe com preload)"""
+    return server.app.wsgi() if server.cfg.preload_app else None
+
+
+def when_ready(server):
+    """Mestre: aplicação carregada, workers ainda não criados."""
+    from api.utils.ciclo_fork import verificar_workers, preparar_fork, MENSAGEM_RELATORIO_LOCAL
+
+    app = _aplicacao(server)
+    if app is not None:
+        verificar_workers(app, server.cfg.workers)
+        preparar_fork(app)
+    elif server.cfg.workers > 1 and not os.getenv("CACHE_REDIS_URL"):
+        # Sem preload a aplicação só existe nos workers: decide pela configuração
+        raise RuntimeError(MENSAGEM_RELATORIO_LOCAL % server.cfg.workers)
+    server.log.info("Workers: %s x %s threads (%s), preload=%s",
+                    server.cfg.workers, server.cfg.threads, server.cfg.worker_class_str, server.cfg.preload_app)
+
+
+def post_fork(server, worker):
+    """Worker recém-criado: pool MySQL, logging e jobs próprios."""
+    app = _aplicacao(server)
+    if app is not None:
+        from api.utils.ciclo_fork import apos_fork
+        apos_fork(app)
+
+
+def worker_exit(server, worker):
+    """Worker encerrando (fim gracioso, HUP ou max_requests)."""
+    app = getattr(worker, "wsgi", None)
+    if hasattr(app, "extensions"):
+        from api.utils.ciclo_fork import encerrar_worker
+        encerrar_worker(app)
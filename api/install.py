@@ -5,7 +5,12 @@ from mysql.connector import errorcode
 
 # --------- Passo 1: Instalar bibliotecas ---------
 def install_packages():
-    packages = ["flask", "mysql-connector-python", "bcrypt", "pyjwt", "flask-cors"]
+    packages = ["flask", "mysql-connector-python", "bcrypt", "pyjwt", "flask-cors",
+                # Servidor ASGI (asgi.py)
+                "aiomysql", "greenlet", "uvicorn",
+                # Servidor de produção (producao.py); redis: jobs de relatório
+                # compartilhados entre os workers (CACHE_REDIS_URL)
+                "gunicorn", "redis"]
     for pkg in packages:
         subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
 
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor de produção da API (gunicorn, modelo pre-fork).
+
+O `python app.py` e o `python server.py` continuam sendo o servidor de
+desenvolvimento (um processo, debug). Em produção use:
+
+    python producao.py                       # configuração de gunicorn.conf.py
+    CACHE_REDIS_URL=redis://localhost:6379/0 WEB_WORKERS=4 python producao.py
+    python producao.py --bind 0.0.0.0:8080   # qualquer opção do gunicorn
+
+Sinais para o processo mestre:
+- HUP:  relê a configuração e troca os workers sem derrubar conexões
+        (os novos sobem antes de os antigos terminarem as requisições)
+- USR2: sobe um mestre novo com o código atualizado; depois envie
+        WINCH e QUIT ao mestre antigo (deploy sem downtime)
+- TTIN / TTOU: mais um / menos um worker (TTIN só com CACHE_REDIS_URL)
+- TERM: parada graciosa (espera WEB_GRACEFUL_TIMEOUT)
+
+Com mais de um worker é obrigatório CACHE_REDIS_URL: os jobs de relatório
+ficam no backend de cache e, em memória (CacheLRU), um job criado em um
+worker não existe nos outros. Sem CACHE_REDIS_URL o padrão é 1 worker e o
+mestre recusa subir com WEB_WORKERS maior.
+
+Com WEB_PRELOAD=1 (padrão) o código é carregado uma vez no mestre, por
+isso o HUP não relê o código: use USR2, ou WEB_PRELOAD=0.
+
+Throughput medido com benchmark_servidor.py: ver README.md.
+"""
+import os
+import sys
+
+from gunicorn.app.wsgiapp import WSGIApplication
+
+CONFIGURACAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gunicorn.conf.py")
+
+
+def main():
+    argumentos = sys.argv[1:]
+    if not any(arg in ("-c", "--config") or arg.startswith("--config=") for arg in argumentos):
+        argumentos = ["--config", CONFIGURACAO] + argumentos
+    sys.argv = [sys.argv[0]] + argumentos
+    WSGIApplication("%(prog)s [OPTIONS] [APP_MODULE]", prog="producao.py").run()
+
+
+if __name__ == "__main__":
+    main()
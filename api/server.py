@@ -14,22 +14,40 @@ from api.middleware.jwt_middleware import JwtMiddleware
 from api.middleware.usuario_middleware import UsuarioMiddleware
 from api.middleware.projeto_middleware import ProjetoMiddleware
 from api.middleware.tarefa_middleware import TarefaMiddleware
+from api.middleware.etag_middleware import EtagMiddleware
 
 from api.dao.usuario_dao import UsuarioDAO
 from api.dao.projeto_dao import ProjetoDAO
 from api.dao.tarefa_dao import TarefaDAO
+from api.dao.versao_dao import VersaoDAO
 
 from api.service.usuario_service import UsuarioService
+from api.utils.hash_executor import HashExecutor
+from api.utils.cache_lru import CacheLRU
+from api.utils.cache_leitura import CacheLeitura
+from api.utils.single_flight import SingleFlight
+from api.utils.json_provider import JsonProviderRapido
 from api.service.projeto_service import ProjetoService
 from api.service.tarefa_service import TarefaService
+from api.service.dashboard_service import DashboardService
+from api.service.relatorio_service import RelatorioService
 
 from api.control.usuario_control import UsuarioControl
 from api.control.projeto_control import ProjetoControl
 from api.control.tarefa_control import TarefaControl
+from api.control.dashboard_control import DashboardControl
+from api.control.exportacao_control import ExportacaoControl
+from api.control.relatorio_control import RelatorioControl
 
 from api.router.usuario_roteador import UsuarioRoteador
 from api.router.projeto_roteador import ProjetoRoteador
 from api.router.tarefa_roteador import TarefaRoteador
+from api.router.dashboard_roteador import DashboardRoteador
+from api.router.exportacao_roteador import ExportacaoRoteador
+from api.router.relatorio_roteador import RelatorioRoteador
+from api.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
 
 
 class Server:
@@ -49,10 +67,15 @@ class Server:
         """
         Inicializa todas as dependências do servidor.
         """
-        print("🔄 Inicializando servidor...")
+        # ✅ NOVO: Logging assíncrono e com níveis (LOG_LEVEL / LOG_LEVELS)
+        Logger.configure()
+
+        logger.info("🔄 Inicializando servidor...")
 
         # 1. Criar aplicação Flask
         self.app = Flask(__name__)
+        # ✅ NOVO: jsonify via orjson (datas em ISO 8601)
+        self.app.json = JsonProviderRapido(self.app)
         self.app.config['SECRET_KEY'] = 'chave_secreta_projeto_mvcs'
 
         # 2. ✅ CORREÇÃO CORS - CONFIGURAÇÃO COMPLETA E FUNCIONAL
@@ -100,30 +123,34 @@ class Server:
         # 8. Configurar error handlers
         self._configure_error_handlers()
 
-        print("✅ Servidor inicializado com sucesso!")
+        logger.info("✅ Servidor inicializado com sucesso!")
 
     def _init_database(self):
         """Inicializa e testa a conexão com o banco de dados."""
-        print("🗄️  Inicializando banco de dados...")
+        logger.info("🗄️  Inicializando banco de dados...")
         try:
             self.database = create_database_instance()
             
             if self.database.test_connection():
-                print("✅ Conexão com banco de dados estabelecida")
+                logger.info("✅ Conexão com banco de dados estabelecida")
+                # ✅ NOVO: Uma conexão e um commit por requisição
+                self.database.init_app(self.app)
+                # ✅ NOVO: Usado pelos hooks de fork do servidor de produção (producao.py)
+                self.app.extensions['database'] = self.database
             else:
                 raise Exception("Falha ao conectar com o banco de dados")
                 
         except Exception as e:
-            print(f"❌ Erro ao inicializar banco de dados: {e}")
-            print("💡 Soluções possíveis:")
-            print("   - Inicie o MySQL no XAMPP")
-            print("   - Verifique se a senha está correta")
-            print("   - Crie o banco 'projeto' manualmente se necessário")
+            logger.error("❌ Erro ao inicializar banco de dados: %s", e)
+            logger.info("💡 Soluções possíveis:")
+            logger.info("   - Inicie o MySQL no XAMPP")
+            logger.info("   - Verifique se a senha está correta")
+            logger.info("   - Crie o banco 'projeto' manualmente se necessário")
             raise
 
     def _configure_dependencies(self):
         """Configura todas as dependências do sistema."""
-        print("🔗 Configurando dependências...")
+        logger.info("🔗 Configurando dependências...")
         
         try:
             # JWT
@@ -132,46 +159,67 @@ class Server:
             
             # DAOs
             usuario_dao = UsuarioDAO(self.database)
-            projeto_dao = ProjetoDAO(self.database)
-            tarefa_dao = TarefaDAO(self.database)
+            versao_dao = VersaoDAO(self.database)
+            projeto_dao = ProjetoDAO(self.database, versao_dao)
+            tarefa_dao = TarefaDAO(self.database, versao_dao)
             
             # Services
-            usuario_service = UsuarioService(usuario_dao)
-            projeto_service = ProjetoService(projeto_dao, usuario_dao)
-            tarefa_service = TarefaService(tarefa_dao, projeto_dao)
+            hash_executor = HashExecutor()
+            usuario_service = UsuarioService(usuario_dao, hash_executor)
+            cache_leitura = CacheLeitura(CacheLRU(capacidade=2048), versao_dao, single_flight=SingleFlight())
+            projeto_service = ProjetoService(projeto_dao, usuario_dao, cache_leitura)
+            tarefa_service = TarefaService(tarefa_dao, projeto_dao, cache_leitura_dependency=cache_leitura)
+            dashboard_service = DashboardService(usuario_dao, projeto_dao, tarefa_dao)
+            relatorio_service = RelatorioService(tarefa_service, projeto_service, usuario_service, versao_dao,
+                                                 CacheLRU(capacidade=128))
             
             # Middlewares
             usuario_middleware = UsuarioMiddleware()
             projeto_middleware = ProjetoMiddleware()
             tarefa_middleware = TarefaMiddleware()
+            etag_middleware = EtagMiddleware(jwt_middleware, versao_dao)
             
             # Controls
             usuario_control = UsuarioControl(usuario_service)
             projeto_control = ProjetoControl(projeto_service)
             tarefa_control = TarefaControl(tarefa_service)
+            dashboard_control = DashboardControl(dashboard_service)
+            exportacao_control = ExportacaoControl(tarefa_service, projeto_service, usuario_service)
+            relatorio_control = RelatorioControl(relatorio_service)
             
             # Roteadores
             usuario_roteador = UsuarioRoteador(jwt_middleware, usuario_middleware, usuario_control)
-            projeto_roteador = ProjetoRoteador(jwt_middleware, projeto_middleware, projeto_control)
-            tarefa_roteador = TarefaRoteador(jwt_middleware, tarefa_middleware, tarefa_control)
+            projeto_roteador = ProjetoRoteador(jwt_middleware, projeto_middleware, projeto_control, etag_middleware)
+            tarefa_roteador = TarefaRoteador(jwt_middleware, tarefa_middleware, tarefa_control, etag_middleware)
+            dashboard_roteador = DashboardRoteador(jwt_middleware, dashboard_control)
+            exportacao_roteador = ExportacaoRoteador(jwt_middleware, exportacao_control)
+            relatorio_roteador = RelatorioRoteador(jwt_middleware, relatorio_control)
             
+            self.app.extensions['hash_executor'] = hash_executor
+
             # Salvar dependências
             self.dependencies = {
                 'jwt_middleware': jwt_middleware,
+                'hash_executor': hash_executor,
+                'cache_leitura': cache_leitura,
+                'relatorio_service': relatorio_service,
                 'usuario_roteador': usuario_roteador,
                 'projeto_roteador': projeto_roteador,
-                'tarefa_roteador': tarefa_roteador
+                'tarefa_roteador': tarefa_roteador,
+                'dashboard_roteador': dashboard_roteador,
+                'exportacao_roteador': exportacao_roteador,
+                'relatorio_roteador': relatorio_roteador
             }
             
-            print("✅ Dependências configuradas com sucesso")
+            logger.info("✅ Dependências configuradas com sucesso")
             
         except Exception as e:
-            print(f"❌ Erro ao configurar dependências: {e}")
+            logger.error("❌ Erro ao configurar dependências: %s", e)
             raise
 
     def _register_routes(self):
         """Registra todos os blueprints (rotas) na aplicação Flask."""
-        print("🛣️  Registrando rotas...")
+        logger.info("🛣️  Registrando rotas...")
         
         try:
             self.app.register_blueprint(
@@ -186,6 +234,18 @@ class Server:
                 self.dependencies['tarefa_roteador'].create_routes(),
                 url_prefix='/api/tarefa'
             )
+            self.app.register_blueprint(
+                self.dependencies['dashboard_roteador'].create_routes(),
+                url_prefix='/api/dashboard'
+            )
+            self.app.register_blueprint(
+                self.dependencies['exportacao_roteador'].create_routes(),
+                url_prefix='/api/export'
+            )
+            self.app.register_blueprint(
+                self.dependencies['relatorio_roteador'].create_routes(),
+                url_prefix='/api/relatorios'
+            )
             
             # Rota de health check
             @self.app.route('/api/health')
@@ -193,6 +253,8 @@ class Server:
                 return {
                     "status": "healthy",
                     "message": "Servidor funcionando corretamente",
+                    "cache": self.dependencies['cache_leitura'].estatisticas(),
+                    "relatorios": self.dependencies['relatorio_service'].estatisticas(),
                     "timestamp": datetime.now().isoformat() + "Z"
                 }
             
@@ -210,10 +272,10 @@ class Server:
                     }
                 }
             
-            print("✅ Rotas registradas com sucesso")
+            logger.info("✅ Rotas registradas com sucesso")
             
         except Exception as e:
-            print(f"❌ Erro ao registrar rotas: {e}")
+            logger.error("❌ Erro ao registrar rotas: %s", e)
             raise
 
     def _configure_error_handlers(self):
@@ -246,13 +308,13 @@ class Server:
         if not self.app:
             raise Exception("Servidor não inicializado. Chame init() primeiro.")
         
-        print(f"🌐 Servidor iniciado em http://{self.host}:{self.porta}")
-        print("📋 Endpoints disponíveis:")
-        print("   👥 /api/usuario/*")
-        print("   📁 /api/projeto/*")
-        print("   ✅ /api/tarefa/*")
-        print("   ❤️  /api/health")
-        print("\n⏹️  Pressione CTRL+C para parar o servidor")
+        logger.info("🌐 Servidor iniciado em http://%s:%s", self.host, self.porta)
+        logger.info("📋 Endpoints disponíveis:")
+        logger.info("   👥 /api/usuario/*")
+        logger.info("   📁 /api/projeto/*")
+        logger.info("   ✅ /api/tarefa/*")
+        logger.info("   ❤️  /api/health")
+        logger.info("\n⏹️  Pressione CTRL+C para parar o servidor")
         
         self.app.run(
             host=self.host,
@@ -263,10 +325,14 @@ class Server:
 
     def shutdown(self):
         """Desliga o servidor gracefulmente."""
-        print("🔒 Encerrando servidor...")
+        logger.info("🔒 Encerrando servidor...")
         if self.database:
             self.database.close_pool()
-        print("✅ Servidor encerrado")
+        if self.dependencies.get('hash_executor'):
+            self.dependencies['hash_executor'].shutdown()
+        if self.dependencies.get('relatorio_service'):
+            self.dependencies['relatorio_service'].shutdown()
+        logger.info("✅ Servidor encerrado")
 
 
 def create_app():
@@ -39,6 +39,8 @@ export default class ApiService {
         this.patch = this.patch.bind(this);
         this.getById = this.getById.bind(this);
         this.simpleGet = this.simpleGet.bind(this);
+        this.download = this.download.bind(this);
+        this.gerarRelatorio = this.gerarRelatorio.bind(this);
     }
 
     /**
@@ -144,6 +146,89 @@ export default class ApiService {
         }
     }
 
+    /**
+     * ✅ NOVO: Baixa um arquivo gerado pelo servidor (ex.: /api/export/tarefas.csv)
+     * com o token no header Authorization e dispara o download no navegador.
+     * @param {string} uri - URL do arquivo.
+     * @param {string} filename - Nome do arquivo salvo.
+     * @returns {Promise<boolean>} true se o download foi iniciado.
+     */
+    async download(uri, filename) {
+        try {
+            const cleanUri = uri.startsWith('/') ? uri : `/${uri}`;
+            const headers = {};
+            if (this.#token) {
+                headers["Authorization"] = `Bearer ${this.#token}`;
+            }
+
+            const response = await fetch(`${this.#baseURL}${cleanUri}`, {
+                method: "GET",
+                headers: headers,
+                mode: 'cors'
+            });
+            if (!response.ok) {
+                throw new Error(`HTTP Error: ${response.status} ${response.statusText}`);
+            }
+
+            const blob = await response.blob();
+            const url = window.URL.createObjectURL(blob);
+            const link = document.createElement('a');
+            link.href = url;
+            link.setAttribute('download', filename);
+            document.body.appendChild(link);
+            link.click();
+            document.body.removeChild(link);
+            window.URL.revokeObjectURL(url);
+            return true;
+
+        } catch (error) {
+            console.error("❌ Erro ao baixar arquivo:", error.message);
+            return false;
+        }
+    }
+
+    /**
+     * ✅ NOVO: Gera um relatório PDF no servidor (POST /api/relatorios),
+     * acompanha o status até ficar pronto e baixa o arquivo.
+     * @param {string} tipo - "tarefas", "projetos" ou "usuarios".
+     * @param {Object} parametros - Filtros do relatório (ex.: { status: "pendente" }).
+     * @param {string} filename - Nome do arquivo salvo.
+     * @param {number} tempoMaximo - Milissegundos de espera antes de desistir.
+     * @returns {Promise<boolean>} true se o download foi iniciado.
+     */
+    async gerarRelatorio(tipo, parametros, filename, tempoMaximo = 120000) {
+        const resposta = await this.post("/api/relatorios", { tipo: tipo, parametros: parametros || {} });
+        let relatorio = resposta?.data?.relatorio;
+        if (!resposta.success || !relatorio) {
+            console.error("❌ Erro ao solicitar relatório:", resposta?.error?.message);
+            return false;
+        }
+
+        const limite = Date.now() + tempoMaximo;
+        let intervalo = 500;
+        while (relatorio.status === "pendente" || relatorio.status === "processando") {
+            if (Date.now() > limite) {
+                console.error("❌ Tempo esgotado aguardando o relatório", relatorio.id);
+                return false;
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalo));
+            intervalo = Math.min(intervalo * 2, 2000);
+
+            const status = await this.get(relatorio.links.status);
+            if (!status.success || !status.data?.relatorio) {
+                console.error("❌ Erro ao consultar relatório:", status?.error?.message);
+                return false;
+            }
+            relatorio = status.data.relatorio;
+        }
+
+        if (relatorio.status !== "concluido") {
+            console.error("❌ Relatório não gerado:", relatorio.erro);
+            return false;
+        }
+        return this.download(relatorio.links.arquivo, filename);
+    }
+
     /**
      * Método para buscar um recurso específico pelo ID via GET.
      * Monta a URL com o ID no final e faz a requisição.
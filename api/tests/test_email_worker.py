@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+EmailWorker.processar_lote contra um servidor SMTP local (aiosmtpd).
+"""
+import socket
+
+import pytest
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+from api.service.email_worker import EmailWorker, SessaoSMTP
+
+RECUSADO = "recusado@exemplo.com"
+
+
+class Caixa:
+    """Handler do aiosmtpd: guarda as mensagens e recusa RECUSADO com 550"""
+
+    def __init__(self):
+        self.mensagens = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address == RECUSADO:
+            return "550 5.1.1 Destinatário inexistente"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.mensagens.append((envelope.rcpt_tos, envelope.content))
+        return "250 Message accepted for delivery"
+
+
+class OutboxFalsa:
+    """Mesma interface de EmailOutboxDAO, em memória"""
+
+    def __init__(self, destinatarios):
+        self.pendentes = [
+            {"id": i, "destinatario": d, "assunto": f"Assunto {i}", "corpo_html": "<p>Olá</p>", "tentativas": 0}
+            for i, d in enumerate(destinatarios, start=1)
+        ]
+        self.enviados = []
+        self.falhas = []
+        self.liberados = []
+        self.reservadas = []
+
+    def reservar_lote(self, limite=20):
+        self.reservadas, self.pendentes = self.pendentes[:limite], self.pendentes[limite:]
+        return self.reservadas
+
+    def marcar_enviados(self, ids):
+        self.enviados.extend(ids)
+        return len(ids)
+
+    def marcar_falha(self, id, erro, atraso_segundos, max_tentativas):
+        self.falhas.append(id)
+        return 1
+
+    def liberar(self, ids):
+        # Voltam para a fila, como o status 'pendente' no banco
+        self.liberados.extend(ids)
+        self.pendentes = [m for m in self.reservadas if m["id"] in ids] + self.pendentes
+        return len(ids)
+
+
+def porta_livre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def iniciar_servidor(caixa, porta):
+    controller = aiosmtpd_controller.Controller(caixa, hostname="127.0.0.1", port=porta)
+    controller.start()
+    return controller
+
+
+@pytest.fixture
+def servidor():
+    caixa = Caixa()
+    porta = porta_livre()
+    controllers = [iniciar_servidor(caixa, porta)]
+    yield caixa, porta, controllers
+    for controller in controllers:
+        try:
+            controller.stop()
+        except Exception:
+            pass
+
+
+def criar_worker(outbox, porta, lote=20, sessao=None):
+    config = {"smtp_server": "127.0.0.1", "smtp_port": porta, "email": "api@exemplo.com",
+              "password": None, "starttls": False, "timeout": 5}
+    return EmailWorker(outbox, config, lote=lote, sessao_smtp=sessao or SessaoSMTP(config))
+
+
+def test_envia_lote_pela_mesma_sessao(servidor):
+    caixa, porta, _ = servidor
+    outbox = OutboxFalsa(["a@exemplo.com", "b@exemplo.com"])
+    worker = criar_worker(outbox, porta)
+
+    assert worker.processar_lote() == 2
+    assert outbox.enviados == [1, 2]
+    assert [rcpt for rcpt, _ in caixa.mensagens] == [["a@exemplo.com"], ["b@exemplo.com"]]
+    worker.stop()
+
+
+def test_destinatario_recusado_nao_interrompe_o_lote(servidor):
+    caixa, porta, _ = servidor
+    outbox = OutboxFalsa([RECUSADO, "b@exemplo.com", "c@exemplo.com"])
+    worker = criar_worker(outbox, porta)
+
+    assert worker.processar_lote() == 2
+    assert outbox.falhas == [1]
+    assert outbox.liberados == []
+    assert outbox.enviados == [2, 3]
+    assert len(caixa.mensagens) == 2
+    worker.stop()
+
+
+def test_reconecta_depois_de_reiniciar_o_servidor(servidor):
+    caixa, porta, controllers = servidor
+    outbox = OutboxFalsa(["a@exemplo.com", "b@exemplo.com", "c@exemplo.com", "d@exemplo.com", "e@exemplo.com"])
+    sessao = SessaoSMTP({"smtp_server": "127.0.0.1", "smtp_port": porta, "email": "api@exemplo.com",
+                         "starttls": False, "timeout": 5})
+    worker = criar_worker(outbox, porta, lote=1, sessao=sessao)
+    assert worker.processar_lote() == 1
+
+    # Reinício com a sessão aberta: o envio reconecta e repete a mensagem
+    controllers.pop().stop()
+    controllers.append(iniciar_servidor(caixa, porta))
+    assert worker.processar_lote() == 1
+    assert outbox.enviados == [1, 2]
+
+    # Servidor fora do ar: a mensagem volta com backoff e o resto do lote é liberado
+    controllers.pop().stop()
+    worker = criar_worker(outbox, porta, lote=2, sessao=sessao)
+    assert worker.processar_lote() == 0
+    assert outbox.falhas == [3]
+    assert outbox.liberados == [4]
+
+    # Servidor de volta: a mensagem liberada sai no próximo lote
+    controllers.append(iniciar_servidor(caixa, porta))
+    assert worker.processar_lote() == 2
+    assert outbox.enviados == [1, 2, 4, 5]
+    assert len(caixa.mensagens) == 4
+    worker.stop()